@@ -57,8 +57,19 @@ MESSAGE_BROKER_URL = _require_env("MESSAGE_BROKER_URL")
 CELERY_RESULT_BACKEND = _require_env("CELERY_RESULT_BACKEND")
 INGESTION_TASK_STRING = _require_env("INGESTION_TASK_STRING")
 INGESTION_QUEUE = _require_env("INGESTION_QUEUE", "ingestion")
+# Deletes (single notes and folder fan-outs) use their own lane so they neither
+# delay nor are delayed by live edits. Must match the agent's setting.
+INGESTION_DELETE_QUEUE = _require_env("INGESTION_DELETE_QUEUE", "ingestion_delete")
+# Upsert tasks are delayed by this window. Each dispatch also bumps a per-note
+# sequence in Redis under this prefix; the agent skips a task whose sequence has
+# been superseded before it starts chunking. The prefix must match the agent's.
+INGESTION_DEBOUNCE_SECONDS = float(_require_env("INGESTION_DEBOUNCE_SECONDS", "3"))
+INGESTION_DISPATCH_KEY_PREFIX = _require_env("INGESTION_DISPATCH_KEY_PREFIX", "ingestion:dispatch:")
 
 # Shared secret for service-to-service calls from the notelite_agent.
 AGENT_API_KEY = _require_env("AGENT_API_KEY")
 AGENT_INTERNAL_URL = _require_env("AGENT_INTERNAL_URL", "http://localhost:3002")
+# PostgreSQL NOTIFY channel the agent listens on to drop cached per-user settings
+# (e.g. timezone) when a profile changes. Must match the agent's setting.
+USER_SETTINGS_CHANNEL = _require_env("USER_SETTINGS_CHANNEL", "user_settings_changed")
 
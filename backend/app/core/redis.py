@@ -0,0 +1,7 @@
+from redis import Redis
+
+from app.core.config import MESSAGE_BROKER_URL
+
+# The Celery broker doubles as the store for small coordination keys shared
+# with the agent (see INGESTION_DISPATCH_KEY_PREFIX).
+redis_client = Redis.from_url(MESSAGE_BROKER_URL, socket_connect_timeout=1, socket_timeout=1)
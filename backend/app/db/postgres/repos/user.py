@@ -2,9 +2,10 @@ from __future__ import annotations
 
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import select, text
 from sqlalchemy.orm import Session
 
+from app.core.config import USER_SETTINGS_CHANNEL
 from app.db.postgres.models.user import User
 from app.schema.users import UserCreate, UserUpdate
 
@@ -50,3 +51,10 @@ class UserRepository:
 
     def delete(self, db: Session, user: User) -> None:
         db.delete(user)
+
+    def notify_settings_changed(self, db: Session, user_id: UUID) -> None:
+        """Queue a NOTIFY for the agent's settings cache; delivered on commit."""
+        db.execute(
+            text("SELECT pg_notify(:channel, :user_id)"),
+            {"channel": USER_SETTINGS_CHANNEL, "user_id": str(user_id)},
+        )
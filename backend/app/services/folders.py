@@ -1,12 +1,13 @@
 from __future__ import annotations
 
+import time
 from typing import Optional
 from uuid import UUID
 
 from sqlalchemy.orm import Session
 
 from app.core.celery import celery_app
-from app.core.config import INGESTION_TASK_STRING
+from app.core.config import INGESTION_DELETE_QUEUE, INGESTION_TASK_STRING
 from app.db.postgres.repos.folder import FolderRepository
 from app.db.postgres.repos.note import NoteRepository
 from app.exceptions.base import AppException
@@ -81,8 +82,10 @@ class FolderService:
         self.repo.delete(db, folder)
         db.commit()
 
+        enqueued_at = time.time()
         for payload in del_payloads:
             celery_app.send_task(
                 INGESTION_TASK_STRING,
-                kwargs={"action": "delete", **payload},
+                kwargs={"action": "delete", "enqueued_at": enqueued_at, **payload},
+                queue=INGESTION_DELETE_QUEUE,
             )
@@ -1,12 +1,21 @@
 from __future__ import annotations
 
+import time
 from typing import Optional
 from uuid import UUID
 
+import structlog
+from redis.exceptions import RedisError
 from sqlalchemy.orm import Session
 
 from app.core.celery import celery_app
-from app.core.config import INGESTION_TASK_STRING
+from app.core.config import (
+    INGESTION_DEBOUNCE_SECONDS,
+    INGESTION_DELETE_QUEUE,
+    INGESTION_DISPATCH_KEY_PREFIX,
+    INGESTION_TASK_STRING,
+)
+from app.core.redis import redis_client
 from app.core.tiptap import extract_text
 from app.db.postgres.repos.folder import FolderRepository
 from app.db.postgres.repos.note import NoteRepository
@@ -16,24 +25,66 @@ from app.logger import get_trace_id
 from app.schema.base import ErrorCode
 from app.schema.note import NoteCreate, NoteMoveRequest, NoteUpdate
 
+logger = structlog.get_logger()
+
+# Long enough to outlive any realistic queue backlog; an expired marker just
+# means the agent processes the task and relies on the version checks.
+_DISPATCH_SEQ_TTL_SECONDS = 24 * 3600
+
 
 def _dispatch_ingest(payload: dict) -> None:
     """Send an upsert ingestion task to the notelite_agent queue.
 
     trace_id carries the originating request's correlation id into the worker,
     which binds it before processing (see agent ingestion_tasks).
+
+    Tasks are delayed by INGESTION_DEBOUNCE_SECONDS and stamped with a per-note
+    dispatch sequence, so during an autosave burst every task but the newest
+    is skipped by the agent before chunking.
     """
+    kwargs = {
+        "action": "upsert",
+        "trace_id": get_trace_id(),
+        # The agent measures lane wait from when the debounce window closes.
+        "enqueued_at": time.time() + INGESTION_DEBOUNCE_SECONDS,
+        **payload,
+    }
+    dispatch_seq = _next_dispatch_seq(payload.get("note_id"))
+    if dispatch_seq is not None:
+        kwargs["dispatch_seq"] = dispatch_seq
     celery_app.send_task(
         INGESTION_TASK_STRING,
-        kwargs={"action": "upsert", "trace_id": get_trace_id(), **payload},
+        kwargs=kwargs,
+        countdown=INGESTION_DEBOUNCE_SECONDS,
     )
 
 
+def _next_dispatch_seq(note_id: str | None) -> int | None:
+    """Bump the note's "latest pending dispatch" marker; None when Redis is unavailable.
+
+    Without a sequence the agent simply processes the task, so a Redis outage
+    only loses the coalescing, never an ingestion.
+    """
+    if not note_id:
+        return None
+    key = f"{INGESTION_DISPATCH_KEY_PREFIX}{note_id}"
+    try:
+        with redis_client.pipeline() as pipeline:
+            pipeline.incr(key)
+            pipeline.expire(key, _DISPATCH_SEQ_TTL_SECONDS)
+            dispatch_seq, _ = pipeline.execute()
+    except RedisError:
+        logger.warning("ingestion.dispatch_seq_unavailable", note_id=note_id, exc_info=True)
+        return None
+    return int(dispatch_seq)
+
+
 def _dispatch_delete(payload: dict) -> None:
-    """Send a delete ingestion task to remove the vector from the store."""
+    """Send a delete ingestion task, on the delete lane, to remove the vector from the store."""
     celery_app.send_task(
         INGESTION_TASK_STRING,
-        kwargs={"action": "delete", "trace_id": get_trace_id(), **payload},
+        kwargs={"action": "delete", "trace_id": get_trace_id(), "enqueued_at": time.time(), **payload},
+        queue=INGESTION_DELETE_QUEUE,
     )
 
 
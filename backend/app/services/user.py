@@ -55,6 +55,7 @@ class UserService:
     def update_user(self, db: Session, user_id, payload: UserUpdate):
         user = self._get_user_or_404(db, self._parse_uuid(user_id))
         self.user_repo.update(db, user, payload)
+        self.user_repo.notify_settings_changed(db, user.id)
         db.commit()
         db.refresh(user)
         return user
@@ -62,6 +63,7 @@ class UserService:
     def delete_user(self, db: Session, user_id):
         user = self._get_user_or_404(db, self._parse_uuid(user_id))
         self.user_repo.delete(db, user)
+        self.user_repo.notify_settings_changed(db, user.id)
         db.commit()
 
     # ── password ─────────────────────────────────────────────────────────
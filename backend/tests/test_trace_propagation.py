@@ -4,7 +4,7 @@ Public clients must not be able to inject trace ids; internal callers (valid
 X-Internal-Key) keep theirs, and ingestion dispatches carry the bound trace id
 so agent worker logs correlate with the originating request.
 """
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 from structlog.contextvars import bind_contextvars, clear_contextvars
@@ -50,7 +50,8 @@ class TestDispatchTracePropagation:
         from app.services import notes
 
         bind_contextvars(trace_id="trace-note-save")
-        with patch.object(notes, "celery_app") as celery_app:
+        with patch.object(notes, "celery_app") as celery_app, \
+             patch.object(notes, "_next_dispatch_seq", return_value=None):
             notes._dispatch_ingest({"note_id": "n"})
 
         kwargs = celery_app.send_task.call_args.kwargs["kwargs"]
@@ -67,3 +68,34 @@ class TestDispatchTracePropagation:
         kwargs = celery_app.send_task.call_args.kwargs["kwargs"]
         assert kwargs["trace_id"] == "trace-note-delete"
         assert kwargs["action"] == "delete"
+        assert celery_app.send_task.call_args.kwargs["queue"] == notes.INGESTION_DELETE_QUEUE
+
+
+class TestDispatchDebounce:
+    def test_ingest_dispatch_is_delayed_and_sequenced(self):
+        from app.services import notes
+
+        redis_client = MagicMock()
+        redis_client.pipeline.return_value.__enter__.return_value.execute.return_value = [7, True]
+        with patch.object(notes, "celery_app") as celery_app, \
+             patch.object(notes, "redis_client", redis_client):
+            notes._dispatch_ingest({"note_id": "n"})
+
+        call = celery_app.send_task.call_args.kwargs
+        assert call["countdown"] == notes.INGESTION_DEBOUNCE_SECONDS
+        assert call["kwargs"]["dispatch_seq"] == 7
+        pipeline = redis_client.pipeline.return_value.__enter__.return_value
+        pipeline.incr.assert_called_once_with(f"{notes.INGESTION_DISPATCH_KEY_PREFIX}n")
+
+    def test_redis_outage_still_dispatches_without_a_sequence(self):
+        from redis.exceptions import ConnectionError as RedisConnectionError
+
+        from app.services import notes
+
+        redis_client = MagicMock()
+        redis_client.pipeline.side_effect = RedisConnectionError("down")
+        with patch.object(notes, "celery_app") as celery_app, \
+             patch.object(notes, "redis_client", redis_client):
+            notes._dispatch_ingest({"note_id": "n"})
+
+        assert "dispatch_seq" not in celery_app.send_task.call_args.kwargs["kwargs"]
@@ -48,6 +48,7 @@ class TestUserServiceUpdateUser:
         payload = UserUpdate(name="Updated Name")
         user_service.update_user(mock_db, u.id, payload)
         user_service.user_repo.update.assert_called_once_with(mock_db, u, payload)
+        user_service.user_repo.notify_settings_changed.assert_called_once_with(mock_db, u.id)
 
     def test_update_nonexistent_raises_404(self, user_service, mock_db):
         user_service.user_repo.get_by_id.return_value = None
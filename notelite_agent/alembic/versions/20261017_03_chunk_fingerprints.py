@@ -0,0 +1,43 @@
+"""Store per-chunk fingerprints for diff-aware re-ingestion.
+
+Each row caches the keywords and entities extracted for one chunk of a
+document, keyed by a SHA-256 of the chunk content plus its heading context.
+Re-ingesting an edited note reuses rows whose fingerprint is unchanged instead
+of re-running spaCy and the LLM keyword batches. The table starts empty, so
+existing documents simply take the full path once.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261017_03"
+down_revision = "20260703_02"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "agent_chunk_fingerprints",
+        sa.Column(
+            "doc_id",
+            sa.Text(),
+            sa.ForeignKey("agent_documents.doc_id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("fingerprint", sa.String(64), primary_key=True),
+        sa.Column("keywords", sa.JSON(), nullable=False),
+        sa.Column("entities", sa.JSON(), nullable=False),
+        sa.Column("entity_labels", sa.JSON(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("agent_chunk_fingerprints")
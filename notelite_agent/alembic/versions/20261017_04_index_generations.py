@@ -0,0 +1,33 @@
+"""Track a per-user index generation for retrieval result caching.
+
+Every replace or delete of a user's document bumps that user's counter in the
+same transaction as the artifact write. Cached retrieval results are keyed by
+the generation, so any index change makes the user's older entries unreachable.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261017_04"
+down_revision = "20261017_03"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "agent_index_generations",
+        sa.Column("user_id", sa.Text(), primary_key=True),
+        sa.Column("generation", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("agent_index_generations")
@@ -0,0 +1,42 @@
+"""Keep chunk embed texts in PostgreSQL instead of every Qdrant point payload.
+
+Qdrant chunk points no longer carry ``embed_text``; it is only needed to
+re-embed a chunk (blue/green re-embedding), never at retrieval time. Rows are
+written only when the embed text differs from the chunk content (heading
+context, table augmentation); otherwise the content is the embed text. The
+table starts empty: points written before this change still hold their
+``embed_text`` payload, which takes precedence.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261017_05"
+down_revision = "20261017_04"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "agent_chunk_embed_texts",
+        sa.Column(
+            "doc_id",
+            sa.Text(),
+            sa.ForeignKey("agent_documents.doc_id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("chunk_id", sa.Text(), primary_key=True),
+        sa.Column("embed_text", sa.Text(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("agent_chunk_embed_texts")
@@ -75,6 +75,21 @@ INDEX_CODE_CHUNKS = require_env("INDEX_CODE_CHUNKS", "false").lower() == "true"
 INDEX_JSON_CHUNKS = require_env("INDEX_JSON_CHUNKS", "false").lower() == "true"
 MIN_INDEXABLE_TOKENS = int(require_env("MIN_INDEXABLE_TOKENS", "10"))
 MIN_SUMMARY_CHUNK_TOKENS = int(require_env("MIN_SUMMARY_CHUNK_TOKENS", "10"))
+# Diff-aware re-ingestion: unchanged chunks (same content + heading context) reuse
+# stored keywords/entities and Qdrant vectors; only changed points are written.
+INCREMENTAL_INGESTION = require_env("INCREMENTAL_INGESTION", "true").lower() == "true"
+# Run chunk indexing, summarization, and date extraction concurrently once the
+# chunk artifacts are built; the later summary/Postgres writes still wait for all three.
+INGESTION_PARALLEL_STAGES = require_env("INGESTION_PARALLEL_STAGES", "false").lower() == "true"
+# Date extraction: chunk contents go through spaCy DATE_EXTRACTION_BATCH_SIZE at a
+# time, and documents with at least DATE_EXTRACTION_PARALLEL_MIN_CHUNKS uncached
+# chunks fan out to DATE_EXTRACTION_PROCESSES processes (1 disables; prefork
+# Celery children cannot start processes and fall back to one). Phrases parsed by
+# dateparser are cached per (text, day, timezone), DATE_PARSE_CACHE_SIZE per process.
+DATE_EXTRACTION_BATCH_SIZE = int(require_env("DATE_EXTRACTION_BATCH_SIZE", "64"))
+DATE_EXTRACTION_PROCESSES = int(require_env("DATE_EXTRACTION_PROCESSES", "1"))
+DATE_EXTRACTION_PARALLEL_MIN_CHUNKS = int(require_env("DATE_EXTRACTION_PARALLEL_MIN_CHUNKS", "256"))
+DATE_PARSE_CACHE_SIZE = int(require_env("DATE_PARSE_CACHE_SIZE", "4096"))
 
 
 # Embeddings — always served remotely from RunPod (no local GPU on EC2)
@@ -84,11 +99,46 @@ EMBEDDING_API_KEY = require_env("EMBEDDING_API_KEY", "")
 EMBEDDING_TIMEOUT = float(require_env("EMBEDDING_TIMEOUT", "120"))
 SEMANTIC_CHUNKING_TIMEOUT = float(require_env("SEMANTIC_CHUNKING_TIMEOUT", "8"))
 SEMANTIC_CHUNKING_FAILURE_COOLDOWN = float(require_env("SEMANTIC_CHUNKING_FAILURE_COOLDOWN", "60"))
+# Content-addressed embedding cache keyed by (model, kind, sha256(text)). The LRU
+# tier is per process; set EMBEDDING_CACHE_DIR to share float32/float16 blobs on
+# disk across workers and restarts.
+EMBEDDING_CACHE_ENABLED = require_env("EMBEDDING_CACHE_ENABLED", "true").lower() == "true"
+EMBEDDING_CACHE_SIZE = int(require_env("EMBEDDING_CACHE_SIZE", "20000"))
+EMBEDDING_CACHE_DIR = require_env("EMBEDDING_CACHE_DIR", "")
+EMBEDDING_CACHE_DTYPE = require_env("EMBEDDING_CACHE_DTYPE", "float16")
+# Process-wide /embed micro-batching: small requests arriving within the window
+# are coalesced into one call of at most EMBEDDING_BATCH_MAX_TEXTS texts, with up
+# to EMBEDDING_BATCH_MAX_IN_FLIGHT calls outstanding at once, so one slow call
+# does not hold back the next window. Larger requests (ingestion batches) bypass
+# the queue.
+EMBEDDING_BATCH_ENABLED = require_env("EMBEDDING_BATCH_ENABLED", "true").lower() == "true"
+EMBEDDING_BATCH_WINDOW_MS = float(require_env("EMBEDDING_BATCH_WINDOW_MS", "5"))
+EMBEDDING_BATCH_MAX_TEXTS = int(require_env("EMBEDDING_BATCH_MAX_TEXTS", "64"))
+EMBEDDING_BATCH_MAX_IN_FLIGHT = int(require_env("EMBEDDING_BATCH_MAX_IN_FLIGHT", "4"))
 
 
 # Vector database
 QDRANT_URL = require_env("QDRANT_URL")
 QDRANT_COLLECTION = require_env("QDRANT_COLLECTION")
+# Dense vector storage for newly created collections (docs/vector-storage.md).
+# QDRANT_QUANTIZATION is "none", "scalar" (int8) or "binary"; quantized searches
+# fetch QDRANT_QUANTIZATION_OVERSAMPLING x limit candidates and rescore them with
+# the original vectors. On-disk vectors/payloads trade latency for memory.
+# QDRANT_HNSW_EF of 0 keeps the server's per-query default.
+QDRANT_QUANTIZATION = require_env("QDRANT_QUANTIZATION", "none").lower()
+QDRANT_QUANTIZATION_ALWAYS_RAM = require_env("QDRANT_QUANTIZATION_ALWAYS_RAM", "true").lower() == "true"
+QDRANT_QUANTIZATION_RESCORE = require_env("QDRANT_QUANTIZATION_RESCORE", "true").lower() == "true"
+QDRANT_QUANTIZATION_OVERSAMPLING = float(require_env("QDRANT_QUANTIZATION_OVERSAMPLING", "2.0"))
+QDRANT_VECTORS_ON_DISK = require_env("QDRANT_VECTORS_ON_DISK", "false").lower() == "true"
+QDRANT_PAYLOAD_ON_DISK = require_env("QDRANT_PAYLOAD_ON_DISK", "false").lower() == "true"
+QDRANT_HNSW_M = int(require_env("QDRANT_HNSW_M", "16"))
+QDRANT_HNSW_EF_CONSTRUCT = int(require_env("QDRANT_HNSW_EF_CONSTRUCT", "100"))
+QDRANT_HNSW_EF = int(require_env("QDRANT_HNSW_EF", "0"))
+# Multitenancy mode (docs/vector-storage.md): metadata.user_id becomes a Qdrant
+# tenant index and HNSW graphs are built per user (m=0, payload_m) instead of
+# globally, so a user's search only touches that user's points.
+QDRANT_MULTITENANCY = require_env("QDRANT_MULTITENANCY", "false").lower() == "true"
+QDRANT_TENANT_PAYLOAD_M = int(require_env("QDRANT_TENANT_PAYLOAD_M", "16"))
 
 
 # LLM — served remotely from RunPod
@@ -109,6 +159,11 @@ SUMMARY_GROUP_TOKEN_BUFFER = int(require_env("SUMMARY_GROUP_TOKEN_BUFFER", "128"
 GROUP_SUMMARY_MAX_TOKENS = int(require_env("GROUP_SUMMARY_MAX_TOKENS", "150"))
 FINAL_SUMMARY_MAX_TOKENS = int(require_env("FINAL_SUMMARY_MAX_TOKENS", "384"))
 FALLBACK_SUMMARY_CHAR_CAP = int(require_env("FALLBACK_SUMMARY_CHAR_CAP", "1400"))
+# Hierarchical summarization runs group calls on up to SUMMARY_GROUP_CONCURRENCY
+# threads; groups still unfinished SUMMARY_DEADLINE_SECONDS after group summarization
+# starts are recorded as failed and the merge proceeds with the rest.
+SUMMARY_GROUP_CONCURRENCY = int(require_env("SUMMARY_GROUP_CONCURRENCY", "4"))
+SUMMARY_DEADLINE_SECONDS = float(require_env("SUMMARY_DEADLINE_SECONDS", "120"))
 
 
 # Queues and workers
@@ -116,7 +171,20 @@ MESSAGE_BROKER_URL = require_env("MESSAGE_BROKER_URL")
 CELERY_RESULT_BACKEND = require_env("CELERY_RESULT_BACKEND", MESSAGE_BROKER_URL)
 INGESTION_TASK_STRING = require_env("INGESTION_TASK_STRING")
 INGESTION_QUEUE = require_env("INGESTION_QUEUE", "ingestion")
+# Ingestion lanes, consumed in priority order: interactive edits (INGESTION_QUEUE),
+# note/folder deletes, then reconciliation backfill. Within a lane one user may
+# hold at most INGESTION_USER_MAX_ACTIVE workers while other users have work
+# queued (0 disables the cap); an over-cap task is retried after
+# INGESTION_USER_DEFER_SECONDS under the same task id.
+INGESTION_DELETE_QUEUE = require_env("INGESTION_DELETE_QUEUE", "ingestion_delete")
+INGESTION_BACKFILL_QUEUE = require_env("INGESTION_BACKFILL_QUEUE", "ingestion_backfill")
+INGESTION_USER_MAX_ACTIVE = int(require_env("INGESTION_USER_MAX_ACTIVE", "1"))
+INGESTION_USER_DEFER_SECONDS = float(require_env("INGESTION_USER_DEFER_SECONDS", "5"))
 CONVERSATION_QUEUE = require_env("CONVERSATION_QUEUE", "conversation")
+# Per-note "latest pending dispatch" sequence the backend bumps in Redis on every
+# upsert dispatch; tasks carrying an older dispatch_seq exit before chunking.
+# Must match the backend's setting.
+INGESTION_DISPATCH_KEY_PREFIX = require_env("INGESTION_DISPATCH_KEY_PREFIX", "ingestion:dispatch:")
 
 # Postgres<->Qdrant reconciliation (celery beat): re-ingests notes whose index is
 # missing/stale and removes documents whose note is gone. Batch cap keeps a large
@@ -124,9 +192,32 @@ CONVERSATION_QUEUE = require_env("CONVERSATION_QUEUE", "conversation")
 RECONCILE_INTERVAL_SECONDS = int(require_env("RECONCILE_INTERVAL_SECONDS", "3600"))
 RECONCILE_BATCH_LIMIT = int(require_env("RECONCILE_BATCH_LIMIT", "200"))
 
+# Bulk ingestion (onboarding imports, re-embedding, reconciliation): up to
+# INGESTION_BULK_MAX_NOTES notes per task, freshness-checked in one query. Their
+# texts are embedded INGESTION_EMBED_BATCH_SIZE per request and written to Qdrant
+# QDRANT_UPSERT_BATCH_SIZE points per upsert.
+INGESTION_BULK_MAX_NOTES = int(require_env("INGESTION_BULK_MAX_NOTES", "50"))
+INGESTION_EMBED_BATCH_SIZE = int(require_env("INGESTION_EMBED_BATCH_SIZE", "256"))
+QDRANT_UPSERT_BATCH_SIZE = int(require_env("QDRANT_UPSERT_BATCH_SIZE", "512"))
+
+# Blue/green re-embedding (docs/embedding-migration.md). The active and shadow
+# collection sets live in Redis under EMBEDDING_ROUTING_KEY and are re-read every
+# EMBEDDING_ROUTING_REFRESH_SECONDS. The background copy re-embeds
+# EMBEDDING_MIGRATION_BATCH_SIZE points per page, one page per task, and queues
+# the next page's task EMBEDDING_MIGRATION_THROTTLE_SECONDS later.
+EMBEDDING_ROUTING_KEY = require_env("EMBEDDING_ROUTING_KEY", "embedding:routing")
+EMBEDDING_ROUTING_REFRESH_SECONDS = float(require_env("EMBEDDING_ROUTING_REFRESH_SECONDS", "5"))
+EMBEDDING_MIGRATION_BATCH_SIZE = int(require_env("EMBEDDING_MIGRATION_BATCH_SIZE", "128"))
+EMBEDDING_MIGRATION_THROTTLE_SECONDS = float(require_env("EMBEDDING_MIGRATION_THROTTLE_SECONDS", "1"))
+
 
 # Database — read-only version guard checks, one query per upsert task
 POSTGRES_DB_URL = require_env("POSTGRES_DB_URL")
+# Per-user settings (timezone) are cached per process. The backend NOTIFYs this
+# channel with the user id on profile changes; the TTL bounds staleness if a
+# notification is missed.
+USER_SETTINGS_CACHE_TTL_SECONDS = float(require_env("USER_SETTINGS_CACHE_TTL_SECONDS", "300"))
+USER_SETTINGS_CHANNEL = require_env("USER_SETTINGS_CHANNEL", "user_settings_changed")
 
 
 # Reranker — optional remote cross-encoder (Cohere-compatible API).
@@ -147,6 +238,11 @@ RERANKER_MIN_RELEVANCE_SCORE = float(
 HYDE_ENABLED = require_env("HYDE_ENABLED", "true").lower() == "true"
 HYDE_TIMEOUT = float(require_env("HYDE_TIMEOUT", "4"))
 HYDE_MAX_TOKENS = int(require_env("HYDE_MAX_TOKENS", "80"))
+# Speculative HyDE (async retrieval path): the first-pass searches start on the
+# original query right away while HyDE runs alongside; the HyDE dense search is
+# merged into RRF only if the passage is generated and embedded within the budget.
+HYDE_SPECULATIVE = require_env("HYDE_SPECULATIVE", "false").lower() == "true"
+HYDE_SPECULATIVE_BUDGET_MS = int(require_env("HYDE_SPECULATIVE_BUDGET_MS", "1500"))
 RETRIEVAL_SEARCH_WORKERS = int(require_env("RETRIEVAL_SEARCH_WORKERS", "5"))
 RETRIEVAL_RRF_K = int(require_env("RETRIEVAL_RRF_K", "60"))
 RETRIEVAL_RRF_TOP_K = int(require_env("RETRIEVAL_RRF_TOP_K", "30"))
@@ -156,6 +252,12 @@ RETRIEVAL_NEIGHBOR_SEED_LIMIT = int(require_env("RETRIEVAL_NEIGHBOR_SEED_LIMIT",
 RETRIEVAL_SUMMARY_BUDGET = int(require_env("RETRIEVAL_SUMMARY_BUDGET", "600"))
 RETRIEVAL_HISTORY_BUDGET = int(require_env("RETRIEVAL_HISTORY_BUDGET", "400"))
 RETRIEVAL_MAX_SUMMARIES = int(require_env("RETRIEVAL_MAX_SUMMARIES", "2"))
+# Retrieval result cache (per process). Entries are keyed by the user's index
+# generation, which ingestion bumps on every document replace/delete, so a
+# changed index is never served stale; the TTL only bounds memory churn.
+RETRIEVAL_CACHE_ENABLED = require_env("RETRIEVAL_CACHE_ENABLED", "true").lower() == "true"
+RETRIEVAL_CACHE_SIZE = int(require_env("RETRIEVAL_CACHE_SIZE", "1024"))
+RETRIEVAL_CACHE_TTL_SECONDS = float(require_env("RETRIEVAL_CACHE_TTL_SECONDS", "600"))
 RETRIEVAL_RRF_WEIGHTS = {
     "chunk_dense_original": float(require_env("RRF_WEIGHT_CHUNK_DENSE_ORIGINAL", "1.0")),
     "chunk_dense_hyde": float(require_env("RRF_WEIGHT_CHUNK_DENSE_HYDE", "0.8")),
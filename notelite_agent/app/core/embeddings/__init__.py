@@ -1,11 +1,17 @@
 from app.core.embeddings.remote import EmbeddingBatch, RemoteEmbeddingService
+from app.core.embeddings.cache import EmbeddingCache, default_embedding_cache
+from app.core.embeddings.dispatcher import EmbeddingDispatcher, default_embedding_dispatcher
 from app.core.embeddings.llama_index_adapter import RemoteOpenAIEmbedding
 from app.core.embeddings.client import SharedEmbeddingClient, REMOTE_EMBEDDINGS_FLAG
 
 __all__ = [
     "EmbeddingBatch",
+    "EmbeddingCache",
+    "EmbeddingDispatcher",
     "RemoteEmbeddingService",
     "RemoteOpenAIEmbedding",
     "SharedEmbeddingClient",
     "REMOTE_EMBEDDINGS_FLAG",
+    "default_embedding_cache",
+    "default_embedding_dispatcher",
 ]
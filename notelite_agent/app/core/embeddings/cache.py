@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Literal
+
+import numpy as np
+
+from app.core.config import (
+    EMBEDDING_CACHE_DIR,
+    EMBEDDING_CACHE_DTYPE,
+    EMBEDDING_CACHE_ENABLED,
+    EMBEDDING_CACHE_SIZE,
+)
+
+
+log = logging.getLogger(__name__)
+
+# "dense" vectors come from /v1/embeddings; "hybrid" entries hold the dense and
+# sparse pair returned together by /embed. The two endpoints are cached apart
+# because nothing guarantees their dense vectors are identical.
+EmbeddingKind = Literal["dense", "hybrid"]
+CacheKey = tuple[str, EmbeddingKind, str]
+
+
+@dataclass(frozen=True)
+class CachedEmbedding:
+    dense: np.ndarray
+    sparse_indices: np.ndarray | None = None
+    sparse_values: np.ndarray | None = None
+
+    def dense_list(self) -> list[float]:
+        return self.dense.astype(np.float32).tolist()
+
+    def sparse_dict(self) -> dict[str, list[float] | list[int]]:
+        if self.sparse_indices is None or self.sparse_values is None:
+            return {"indices": [], "values": []}
+        return {
+            "indices": self.sparse_indices.tolist(),
+            "values": self.sparse_values.astype(np.float32).tolist(),
+        }
+
+    @classmethod
+    def from_vectors(
+        cls,
+        dense: list[float],
+        sparse: dict | None = None,
+        dtype: str = "float32",
+    ) -> CachedEmbedding:
+        if sparse is None:
+            return cls(dense=np.asarray(dense, dtype=dtype))
+        return cls(
+            dense=np.asarray(dense, dtype=dtype),
+            sparse_indices=np.asarray(sparse.get("indices") or [], dtype=np.int32),
+            sparse_values=np.asarray(sparse.get("values") or [], dtype=np.float32),
+        )
+
+
+def cache_key(model: str, kind: EmbeddingKind, text: str) -> CacheKey:
+    return model, kind, hashlib.sha256((text or "").encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """Content-addressed embedding cache: bounded in-process LRU plus optional disk tier.
+
+    Disk entries are uncompressed ``.npz`` blobs under
+    ``<directory>/<model>/<kind>/<hash[:2]>/<hash>.npz`` stored as float32 or
+    float16. Disk errors are logged and treated as misses; the cache never
+    fails an embedding call.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = EMBEDDING_CACHE_SIZE,
+        directory: str | os.PathLike | None = EMBEDDING_CACHE_DIR or None,
+        dtype: str = EMBEDDING_CACHE_DTYPE,
+    ):
+        if dtype not in ("float32", "float16"):
+            raise ValueError(f"Unsupported embedding cache dtype: {dtype}")
+        self.max_entries = max_entries
+        self.directory = Path(directory) if directory else None
+        self.dtype = dtype
+        self._entries: OrderedDict[CacheKey, CachedEmbedding] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_many(self, keys: list[CacheKey]) -> dict[CacheKey, CachedEmbedding]:
+        found: dict[CacheKey, CachedEmbedding] = {}
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                    found[key] = entry
+        for key in keys:
+            if key in found:
+                continue
+            entry = self._read_disk(key)
+            if entry is not None:
+                found[key] = entry
+                self._remember(key, entry)
+        return found
+
+    def put_many(self, entries: dict[CacheKey, CachedEmbedding]) -> None:
+        for key, entry in entries.items():
+            self._remember(key, entry)
+            self._write_disk(key, entry)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remember(self, key: CacheKey, entry: CachedEmbedding) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _path(self, key: CacheKey) -> Path:
+        model, kind, digest = key
+        model_dir = hashlib.sha256(model.encode("utf-8")).hexdigest()[:16]
+        return self.directory / model_dir / kind / digest[:2] / f"{digest}.npz"
+
+    def _read_disk(self, key: CacheKey) -> CachedEmbedding | None:
+        if self.directory is None:
+            return None
+        path = self._path(key)
+        if not path.exists():
+            return None
+        try:
+            with np.load(path) as blob:
+                return CachedEmbedding(
+                    dense=blob["dense"],
+                    sparse_indices=blob["sparse_indices"] if "sparse_indices" in blob else None,
+                    sparse_values=blob["sparse_values"] if "sparse_values" in blob else None,
+                )
+        except Exception:
+            log.warning("Unreadable embedding cache entry: %s", path, exc_info=True)
+            return None
+
+    def _write_disk(self, key: CacheKey, entry: CachedEmbedding) -> None:
+        if self.directory is None:
+            return
+        path = self._path(key)
+        arrays = {"dense": entry.dense.astype(self.dtype)}
+        if entry.sparse_indices is not None and entry.sparse_values is not None:
+            arrays["sparse_indices"] = entry.sparse_indices
+            arrays["sparse_values"] = entry.sparse_values
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, "wb") as handle:
+                np.savez(handle, **arrays)
+            os.replace(tmp_path, path)
+        except OSError:
+            log.warning("Could not write embedding cache entry: %s", path, exc_info=True)
+
+
+_default_cache: EmbeddingCache | None = None
+
+
+def default_embedding_cache() -> EmbeddingCache | None:
+    """Process-wide cache shared by every SharedEmbeddingClient; None when disabled."""
+    global _default_cache
+    if not EMBEDDING_CACHE_ENABLED:
+        return None
+    if _default_cache is None:
+        _default_cache = EmbeddingCache()
+    return _default_cache
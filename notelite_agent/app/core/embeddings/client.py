@@ -2,6 +2,15 @@ from __future__ import annotations
 
 from typing import Sequence
 
+from app.core.embeddings.cache import (
+    CacheKey,
+    CachedEmbedding,
+    EmbeddingCache,
+    EmbeddingKind,
+    cache_key,
+    default_embedding_cache,
+)
+from app.core.embeddings.dispatcher import EmbeddingDispatcher, default_embedding_dispatcher
 from app.core.embeddings.remote import EmbeddingBatch, RemoteEmbeddingService
 from app.core.feature_flags import is_enabled
 
@@ -12,8 +21,20 @@ REMOTE_EMBEDDINGS_FLAG = "ingestion.remote_embeddings"
 class SharedEmbeddingClient:
     """Embedding facade that routes all calls to the remote RunPod embedding service."""
 
-    def __init__(self, remote_service: RemoteEmbeddingService | None = None):
-        self.remote_service = remote_service or RemoteEmbeddingService()
+    def __init__(
+        self,
+        remote_service: RemoteEmbeddingService | None = None,
+        cache: EmbeddingCache | None = None,
+        dispatcher: EmbeddingDispatcher | None = None,
+    ):
+        # Clients on the default service share the process-wide dispatcher so
+        # concurrent small /embed calls are coalesced; injected services opt in
+        # by passing their own dispatcher.
+        if remote_service is None and dispatcher is None:
+            dispatcher = default_embedding_dispatcher()
+        self.dispatcher = dispatcher
+        self.remote_service = remote_service or (dispatcher.service if dispatcher else RemoteEmbeddingService())
+        self.cache = cache if cache is not None else default_embedding_cache()
         self.events: list[str] = []
 
     @property
@@ -34,20 +55,107 @@ class SharedEmbeddingClient:
 
     def embed_documents(self, texts: Sequence[str]) -> EmbeddingBatch:
         self._assert_remote()
-        self.events.append(f"embedding documents: remote batch {len(texts)}")
-        return self.remote_service.embed_hybrid(texts)
+        return self._embed_hybrid_cached(texts, "documents")
 
     def embed_queries(self, texts: Sequence[str]) -> EmbeddingBatch:
         self._assert_remote()
-        self.events.append(f"embedding queries: remote batch {len(texts)}")
-        return self.remote_service.embed_hybrid(texts)
+        return self._embed_hybrid_cached(texts, "queries")
 
     def embed_dense_documents(self, texts: Sequence[str]) -> list[list[float]]:
         self._assert_remote()
-        self.events.append(f"embedding dense documents: remote batch {len(texts)}")
-        return self.remote_service.embed_dense(texts)
+        return self._embed_dense_cached(texts, "dense documents")
 
     def embed_dense_queries(self, texts: Sequence[str]) -> list[list[float]]:
         self._assert_remote()
-        self.events.append(f"embedding dense queries: remote batch {len(texts)}")
-        return self.remote_service.embed_dense(texts)
+        return self._embed_dense_cached(texts, "dense queries")
+
+    async def aembed_queries(self, texts: Sequence[str]) -> EmbeddingBatch:
+        """Event-loop variant of ``embed_queries``; shares the cache and the dispatcher."""
+        self._assert_remote()
+        if self.cache is None:
+            self.events.append(f"embedding queries: remote batch {len(texts)}")
+            return await self._aembed_hybrid(texts)
+
+        keys, found, missing = self._cache_lookup(texts, "hybrid", "queries")
+        if missing:
+            batch = await self._aembed_hybrid(list(missing.values()))
+            self._cache_store(found, missing, self._hybrid_entries(batch))
+        return self._hybrid_batch([found[key] for key in keys])
+
+    def _embed_hybrid_cached(self, texts: Sequence[str], label: str) -> EmbeddingBatch:
+        if self.cache is None:
+            self.events.append(f"embedding {label}: remote batch {len(texts)}")
+            return self._embed_hybrid(texts)
+
+        keys, found, missing = self._cache_lookup(texts, "hybrid", label)
+        if missing:
+            batch = self._embed_hybrid(list(missing.values()))
+            self._cache_store(found, missing, self._hybrid_entries(batch))
+        return self._hybrid_batch([found[key] for key in keys])
+
+    def _embed_hybrid(self, texts: Sequence[str]) -> EmbeddingBatch:
+        if self.dispatcher is not None:
+            return self.dispatcher.embed_hybrid(texts)
+        return self.remote_service.embed_hybrid(texts)
+
+    async def _aembed_hybrid(self, texts: Sequence[str]) -> EmbeddingBatch:
+        if self.dispatcher is not None:
+            return await self.dispatcher.aembed_hybrid(texts)
+        return await self.remote_service.aembed_hybrid(texts)
+
+    def _embed_dense_cached(self, texts: Sequence[str], label: str) -> list[list[float]]:
+        if self.cache is None:
+            self.events.append(f"embedding {label}: remote batch {len(texts)}")
+            return self.remote_service.embed_dense(texts)
+
+        keys, found, missing = self._cache_lookup(texts, "dense", label)
+        if missing:
+            dense = self.remote_service.embed_dense(list(missing.values()))
+            self._cache_store(found, missing, [CachedEmbedding.from_vectors(vector) for vector in dense])
+        return [found[key].dense_list() for key in keys]
+
+    def _cache_lookup(
+        self,
+        texts: Sequence[str],
+        kind: EmbeddingKind,
+        label: str,
+    ) -> tuple[list[CacheKey], dict[CacheKey, CachedEmbedding], dict[CacheKey, str]]:
+        """Split texts into cache hits and the deduplicated misses to fetch in one batch."""
+        clean_texts = [text or "" for text in texts]
+        keys = [cache_key(self.remote_service.model, kind, text) for text in clean_texts]
+        found = self.cache.get_many(list(dict.fromkeys(keys)))
+        missing: dict[CacheKey, str] = {}
+        for key, text in zip(keys, clean_texts):
+            if key not in found and key not in missing:
+                missing[key] = text
+        self.events.append(
+            f"embedding cache {label}: hits={sum(key in found for key in keys)} "
+            f"misses={len(missing)}"
+        )
+        if missing:
+            self.events.append(f"embedding {label}: remote batch {len(missing)}")
+        return keys, found, missing
+
+    def _cache_store(
+        self,
+        found: dict[CacheKey, CachedEmbedding],
+        missing: dict[CacheKey, str],
+        entries: list[CachedEmbedding],
+    ) -> None:
+        fetched = dict(zip(missing, entries))
+        self.cache.put_many(fetched)
+        found.update(fetched)
+
+    @staticmethod
+    def _hybrid_entries(batch: EmbeddingBatch) -> list[CachedEmbedding]:
+        return [
+            CachedEmbedding.from_vectors(dense, sparse)
+            for dense, sparse in zip(batch.dense, batch.sparse)
+        ]
+
+    @staticmethod
+    def _hybrid_batch(entries: list[CachedEmbedding]) -> EmbeddingBatch:
+        return EmbeddingBatch(
+            dense=[entry.dense_list() for entry in entries],
+            sparse=[entry.sparse_dict() for entry in entries],
+        )
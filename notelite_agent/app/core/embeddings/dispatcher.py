@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from typing import Sequence
+
+from app.core.config import (
+    EMBEDDING_BATCH_ENABLED,
+    EMBEDDING_BATCH_MAX_IN_FLIGHT,
+    EMBEDDING_BATCH_MAX_TEXTS,
+    EMBEDDING_BATCH_WINDOW_MS,
+)
+from app.core.embeddings.remote import EmbeddingBatch, RemoteEmbeddingService
+from app.metrics import (
+    EMBEDDING_BATCH_REQUESTS,
+    EMBEDDING_BATCH_SIZE,
+    EMBEDDING_DISPATCH_TIMEOUTS,
+    EMBEDDING_QUEUE_WAIT,
+)
+
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class _PendingRequest:
+    texts: list[str]
+    future: Future = field(default_factory=Future)
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+class EmbeddingDispatcher:
+    """Coalesce concurrent small ``embed_hybrid`` calls into shared ``/embed`` requests.
+
+    The first queued request opens a window of ``window_ms``; everything that
+    arrives before it closes (or until ``max_texts`` is reached) goes out in one
+    call and the vectors are fanned back to each waiting caller. Up to
+    ``max_in_flight`` calls are outstanding at once, so a slow call does not
+    hold back the next window; past that, requests keep coalescing until a call
+    returns. Requests of ``max_texts`` or more are sent directly. A caller that
+    times out is dropped from the queue if its batch has not started yet.
+    """
+
+    def __init__(
+        self,
+        service: RemoteEmbeddingService,
+        window_ms: float = EMBEDDING_BATCH_WINDOW_MS,
+        max_texts: int = EMBEDDING_BATCH_MAX_TEXTS,
+        timeout: float | None = None,
+        max_in_flight: int = EMBEDDING_BATCH_MAX_IN_FLIGHT,
+    ):
+        self.service = service
+        self.window = max(window_ms, 0.0) / 1000
+        self.max_texts = max(max_texts, 1)
+        self.max_in_flight = max(max_in_flight, 1)
+        self.timeout = timeout if timeout is not None else service.timeout + self.window
+        self._condition = threading.Condition()
+        self._queue: deque[_PendingRequest] = deque()
+        self._worker: threading.Thread | None = None
+        self._senders: ThreadPoolExecutor | None = None
+        self._slots = threading.BoundedSemaphore(self.max_in_flight)
+        self._pid = os.getpid()
+
+    def embed_hybrid(self, texts: Sequence[str], timeout: float | None = None) -> EmbeddingBatch:
+        texts = list(texts)
+        if not texts:
+            return EmbeddingBatch(dense=[], sparse=[])
+        if len(texts) >= self.max_texts:
+            self._observe_direct(len(texts))
+            return self.service.embed_hybrid(texts)
+
+        request = self._enqueue(texts)
+        try:
+            return request.future.result(timeout=timeout if timeout is not None else self.timeout)
+        except FutureTimeoutError:
+            request.future.cancel()
+            raise self._timed_out(texts) from None
+
+    async def aembed_hybrid(self, texts: Sequence[str], timeout: float | None = None) -> EmbeddingBatch:
+        """Event-loop variant of ``embed_hybrid``: waits on the shared queue without blocking the loop."""
+        texts = list(texts)
+        if not texts:
+            return EmbeddingBatch(dense=[], sparse=[])
+        if len(texts) >= self.max_texts:
+            self._observe_direct(len(texts))
+            return await self.service.aembed_hybrid(texts)
+
+        request = self._enqueue(texts)
+        try:
+            # Cancelling the wrapper (timeout or caller cancellation) cancels the
+            # request, which drops it from the queue if its batch has not started.
+            return await asyncio.wait_for(
+                asyncio.wrap_future(request.future), timeout if timeout is not None else self.timeout
+            )
+        except asyncio.TimeoutError:
+            raise self._timed_out(texts) from None
+
+    @staticmethod
+    def _observe_direct(size: int) -> None:
+        EMBEDDING_BATCH_SIZE.observe(size)
+        EMBEDDING_BATCH_REQUESTS.observe(1)
+        EMBEDDING_QUEUE_WAIT.observe(0)
+
+    def _enqueue(self, texts: list[str]) -> _PendingRequest:
+        request = _PendingRequest(texts)
+        with self._condition:
+            self._ensure_worker()
+            self._queue.append(request)
+            self._condition.notify()
+        return request
+
+    @staticmethod
+    def _timed_out(texts: list[str]) -> TimeoutError:
+        EMBEDDING_DISPATCH_TIMEOUTS.inc()
+        return TimeoutError(f"Embedding dispatch timed out for {len(texts)} texts")
+
+    def _ensure_worker(self) -> None:
+        # Celery prefork children inherit the parent's state but not its threads.
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._queue.clear()
+            self._worker = None
+            self._senders = None
+            self._slots = threading.BoundedSemaphore(self.max_in_flight)
+        if self._worker is None or not self._worker.is_alive():
+            self._senders = ThreadPoolExecutor(
+                max_workers=self.max_in_flight, thread_name_prefix="embedding-dispatch"
+            )
+            self._worker = threading.Thread(
+                target=self._run, args=(self._senders, self._slots), name="embedding-dispatcher", daemon=True
+            )
+            self._worker.start()
+
+    def _run(self, senders: ThreadPoolExecutor, slots: threading.BoundedSemaphore) -> None:
+        while True:
+            # Claim a send slot before opening the next window: with every slot
+            # busy, arriving requests keep joining the queue instead.
+            slots.acquire()
+            batch = self._next_batch()
+            if batch:
+                senders.submit(self._send, batch, slots)
+            else:
+                slots.release()
+
+    def _send(self, batch: list[_PendingRequest], slots: threading.BoundedSemaphore) -> None:
+        try:
+            self._dispatch(batch)
+        finally:
+            slots.release()
+
+    def _next_batch(self) -> list[_PendingRequest]:
+        with self._condition:
+            while not self._queue:
+                self._condition.wait()
+            deadline = self._queue[0].enqueued_at + self.window
+            while self._queued_texts() < self.max_texts:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+
+            batch: list[_PendingRequest] = []
+            size = 0
+            while self._queue and (not batch or size + len(self._queue[0].texts) <= self.max_texts):
+                request = self._queue.popleft()
+                if not request.future.set_running_or_notify_cancel():
+                    continue
+                batch.append(request)
+                size += len(request.texts)
+            return batch
+
+    def _queued_texts(self) -> int:
+        return sum(len(request.texts) for request in self._queue)
+
+    def _dispatch(self, batch: list[_PendingRequest]) -> None:
+        started = time.monotonic()
+        texts = [text for request in batch for text in request.texts]
+        EMBEDDING_BATCH_SIZE.observe(len(texts))
+        EMBEDDING_BATCH_REQUESTS.observe(len(batch))
+        for request in batch:
+            EMBEDDING_QUEUE_WAIT.observe(started - request.enqueued_at)
+        try:
+            result = self.service.embed_hybrid(texts)
+        except Exception as exc:
+            log.warning("Coalesced embedding call failed for %d requests", len(batch), exc_info=True)
+            for request in batch:
+                request.future.set_exception(exc)
+            return
+
+        offset = 0
+        for request in batch:
+            end = offset + len(request.texts)
+            request.future.set_result(EmbeddingBatch(
+                dense=result.dense[offset:end],
+                sparse=result.sparse[offset:end],
+            ))
+            offset = end
+
+
+_default_dispatcher: EmbeddingDispatcher | None = None
+_default_lock = threading.Lock()
+
+
+def default_embedding_dispatcher() -> EmbeddingDispatcher | None:
+    """Process-wide dispatcher over the default remote service; None when disabled."""
+    global _default_dispatcher
+    if not EMBEDDING_BATCH_ENABLED:
+        return None
+    with _default_lock:
+        if _default_dispatcher is None:
+            _default_dispatcher = EmbeddingDispatcher(RemoteEmbeddingService())
+    return _default_dispatcher
@@ -12,15 +12,15 @@ class RemoteOpenAIEmbedding(BaseEmbedding):
     """LlamaIndex BaseEmbedding adapter that routes to the remote RunPod endpoint.
 
     Why this adapter exists:
-        SemanticSplitterNodeParser requires a BaseEmbedding subclass assigned to
-        Settings.embed_model. The adapter is a thin bridge — it adds no overhead
-        beyond the HTTP round-trip to RunPod, which is unavoidable regardless.
+        LlamaIndex components read Settings.embed_model, which must be a
+        BaseEmbedding subclass. The adapter is a thin bridge — it adds no
+        overhead beyond the HTTP round-trip to RunPod, which is unavoidable regardless.
 
     Batching behaviour (optimal):
-        SemanticSplitterNodeParser calls get_text_embedding_batch(sentences) which
-        resolves to _get_text_embeddings (plural). That method sends all sentences
-        in a single HTTP POST to /v1/embeddings, so a document with N sentences
-        triggers exactly one network call during semantic splitting.
+        get_text_embedding_batch(texts) resolves to _get_text_embeddings (plural),
+        which sends all texts in a single HTTP POST to /v1/embeddings. Semantic
+        chunking bypasses the adapter when it is the configured model and calls
+        the cached SharedEmbeddingClient directly.
     """
 
     _service: RemoteEmbeddingService = PrivateAttr()
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import weakref
 from dataclasses import dataclass
 from typing import Sequence
 
@@ -27,6 +29,28 @@ def _http_client() -> httpx.Client:
     return _http
 
 
+# Async pools are per event loop: httpx.AsyncClient connections belong to the
+# loop that opened them.
+_async_http: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _async_http_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _async_http.get(loop)
+    if client is None:
+        client = _async_http[loop] = httpx.AsyncClient()
+    return client
+
+
+async def aclose_async_http_client() -> None:
+    """Close the running loop's async pool; called from the API lifespan shutdown."""
+    client = _async_http.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
 class RemoteEmbeddingService:
     """HTTP client for the RunPod embedding service."""
 
@@ -59,20 +83,36 @@ class RemoteEmbeddingService:
             timeout=self.timeout,
         )
         response.raise_for_status()
-        data = response.json()
+        return self._parse_hybrid_embeddings(response.json(), len(clean_texts))
+
+    async def aembed_hybrid(self, texts: Sequence[str]) -> EmbeddingBatch:
+        clean_texts = [text or "" for text in texts]
+        if not clean_texts:
+            return EmbeddingBatch(dense=[], sparse=[])
+
+        response = await _async_http_client().post(
+            f"{self.base_url}/embed",
+            headers=self._headers(),
+            json={"texts": clean_texts},
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        return self._parse_hybrid_embeddings(response.json(), len(clean_texts))
 
+    @staticmethod
+    def _parse_hybrid_embeddings(data: dict, expected_count: int) -> EmbeddingBatch:
         dense = data.get("dense_embeddings") or data.get("embeddings") or []
         sparse = data.get("sparse_embeddings") or []
-        if len(dense) != len(clean_texts):
+        if len(dense) != expected_count:
             raise ValueError(
-                f"Embedding endpoint returned {len(dense)} dense vectors for {len(clean_texts)} texts."
+                f"Embedding endpoint returned {len(dense)} dense vectors for {expected_count} texts."
             )
-        if sparse and len(sparse) != len(clean_texts):
+        if sparse and len(sparse) != expected_count:
             raise ValueError(
-                f"Embedding endpoint returned {len(sparse)} sparse vectors for {len(clean_texts)} texts."
+                f"Embedding endpoint returned {len(sparse)} sparse vectors for {expected_count} texts."
             )
         if not sparse:
-            sparse = [{"indices": [], "values": []} for _ in clean_texts]
+            sparse = [{"indices": [], "values": []} for _ in range(expected_count)]
 
         return EmbeddingBatch(dense=dense, sparse=sparse)
 
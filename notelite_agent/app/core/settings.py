@@ -24,7 +24,7 @@ def init_llama_index_settings() -> None:
     if _SETTINGS_INITIALIZED:
         return
 
-    # Settings.embed_model is required by SemanticSplitterNodeParser (semantic chunking).
+    # Settings.embed_model selects the embedding backend for semantic chunking.
     # The adapter bridges the remote HTTP embedding service to LlamaIndex's BaseEmbedding interface.
     Settings.embed_model = RemoteOpenAIEmbedding(service=RemoteEmbeddingService())
 
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Any
 
-from sqlalchemy import DateTime, ForeignKey, Integer, JSON, String, Text
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Integer, JSON, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.postgres import Base
@@ -64,3 +64,45 @@ class SkippedChunkRecord(Base):
     skip_reason: Mapped[str] = mapped_column(Text)
     metadata_json: Mapped[dict[str, Any]] = mapped_column("metadata", JSON, default=dict)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now)
+
+
+class ChunkFingerprintRecord(Base):
+    """Reusable per-chunk extraction output keyed by content fingerprint."""
+
+    __tablename__ = "agent_chunk_fingerprints"
+
+    doc_id: Mapped[str] = mapped_column(
+        Text,
+        ForeignKey("agent_documents.doc_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    fingerprint: Mapped[str] = mapped_column(String(64), primary_key=True)
+    keywords: Mapped[list[str]] = mapped_column(JSON, default=list)
+    entities: Mapped[list[str]] = mapped_column(JSON, default=list)
+    entity_labels: Mapped[dict[str, list[str]]] = mapped_column(JSON, default=dict)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now)
+
+
+class ChunkEmbedTextRecord(Base):
+    """Embed text of an indexed chunk, kept only where it differs from the content."""
+
+    __tablename__ = "agent_chunk_embed_texts"
+
+    doc_id: Mapped[str] = mapped_column(
+        Text,
+        ForeignKey("agent_documents.doc_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    chunk_id: Mapped[str] = mapped_column(Text, primary_key=True)
+    embed_text: Mapped[str] = mapped_column(Text)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now)
+
+
+class IndexGenerationRecord(Base):
+    """Per-user counter bumped whenever that user's retrieval index changes."""
+
+    __tablename__ = "agent_index_generations"
+
+    user_id: Mapped[str] = mapped_column(Text, primary_key=True)
+    generation: Mapped[int] = mapped_column(BigInteger, default=0)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now)
@@ -1,4 +1,5 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 from sqlalchemy.engine import Engine
 
@@ -11,6 +12,10 @@ Base = declarative_base()
 class DatabaseManager:
     _engine: Engine | None = None
     _session_factory: sessionmaker | None = None
+    # Async engine for the event-loop retrieval path. POSTGRES_DB_URL uses the
+    # psycopg (v3) driver, which serves both the sync and the async dialect.
+    _async_engine: AsyncEngine | None = None
+    _async_session_factory: async_sessionmaker | None = None
 
     @classmethod
     def get_engine(cls) -> Engine:
@@ -35,6 +40,29 @@ class DatabaseManager:
 
         return cls._session_factory
 
+    @classmethod
+    def get_async_engine(cls) -> AsyncEngine:
+        if cls._async_engine is None:
+            cls._async_engine = create_async_engine(
+                POSTGRES_DB_URL,
+                pool_size=10,
+                max_overflow=20,
+                pool_pre_ping=True,
+            )
+
+        return cls._async_engine
+
+    @classmethod
+    def get_async_session_factory(cls) -> async_sessionmaker:
+        if cls._async_session_factory is None:
+            cls._async_session_factory = async_sessionmaker(
+                autoflush=False,
+                bind=cls.get_async_engine(),
+                expire_on_commit=False,
+            )
+
+        return cls._async_session_factory
+
     @classmethod
     def get_session(cls):
         session = cls.get_session_factory()()
@@ -49,4 +77,11 @@ class DatabaseManager:
         if cls._engine is not None:
             cls._engine.dispose()
             cls._engine = None
-            cls._session_factory = None
\ No newline at end of file
+            cls._session_factory = None
+
+    @classmethod
+    async def adispose(cls):
+        if cls._async_engine is not None:
+            await cls._async_engine.dispose()
+            cls._async_engine = None
+            cls._async_session_factory = None
@@ -1,9 +1,10 @@
-from qdrant_client import QdrantClient
+from qdrant_client import AsyncQdrantClient, QdrantClient
 from app.core.config import QDRANT_URL
 
 
 class QdrantClientManager:
     _client: QdrantClient | None = None
+    _async_client: AsyncQdrantClient | None = None
 
     @classmethod
     def get_client(cls) -> QdrantClient:
@@ -14,8 +15,23 @@ class QdrantClientManager:
 
         return cls._client
 
+    @classmethod
+    def get_async_client(cls) -> AsyncQdrantClient:
+        if cls._async_client is None:
+            cls._async_client = AsyncQdrantClient(
+                url=QDRANT_URL,
+            )
+
+        return cls._async_client
+
     @classmethod
     def close(cls) -> None:
         if cls._client is not None:
             cls._client.close()
-            cls._client = None
\ No newline at end of file
+            cls._client = None
+
+    @classmethod
+    async def aclose(cls) -> None:
+        if cls._async_client is not None:
+            await cls._async_client.close()
+            cls._async_client = None
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from redis import Redis
+
+from app.core.config import MESSAGE_BROKER_URL
+
+
+_client: Redis | None = None
+
+
+def redis_client() -> Redis:
+    """Shared client on the Celery broker, used for small coordination keys."""
+    global _client
+    if _client is None:
+        _client = Redis.from_url(MESSAGE_BROKER_URL, socket_connect_timeout=1, socket_timeout=1)
+    return _client
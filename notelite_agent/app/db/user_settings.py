@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from typing import Any
+
+from sqlalchemy.engine import make_url
+
+from app.core.config import (
+    POSTGRES_DB_URL,
+    USER_SETTINGS_CACHE_TTL_SECONDS,
+    USER_SETTINGS_CHANNEL,
+)
+
+
+log = logging.getLogger(__name__)
+
+_RECONNECT_DELAY_SECONDS = 5.0
+
+
+class UserSettingsCache:
+    """Process-wide TTL cache of per-user settings read from the backend's users table.
+
+    Entries expire after ``ttl_seconds``; the backend also NOTIFYs
+    ``USER_SETTINGS_CHANNEL`` with the user id when a profile changes, and
+    ``UserSettingsListener`` evicts that user immediately.
+    """
+
+    def __init__(self, ttl_seconds: float = USER_SETTINGS_CACHE_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._entries: dict[tuple[str, str], tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, user_id: str, name: str) -> Any | None:
+        key = (str(user_id), name)
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            stored_at, value = item
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            return value
+
+    def put(self, user_id: str, name: str, value: Any) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._entries[(str(user_id), name)] = (time.monotonic(), value)
+
+    def invalidate(self, user_id: str) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == str(user_id)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_cache = UserSettingsCache()
+
+
+def user_settings_cache() -> UserSettingsCache:
+    return _cache
+
+
+class UserSettingsListener:
+    """Background LISTEN on the settings channel that evicts changed users.
+
+    Reconnects after failures and clears the whole cache on every (re)connect,
+    since notifications sent while disconnected are lost.
+    """
+
+    def __init__(
+        self,
+        cache: UserSettingsCache,
+        url: str = POSTGRES_DB_URL,
+        channel: str = USER_SETTINGS_CHANNEL,
+    ):
+        self.cache = cache
+        # The SQLAlchemy URL names the driver (postgresql+psycopg); libpq wants plain postgresql.
+        self.dsn = make_url(url).set(drivername="postgresql").render_as_string(hide_password=False)
+        self.channel = channel
+        self._thread: threading.Thread | None = None
+        self._pid = os.getpid()
+
+    def start(self) -> None:
+        # Forked children (Celery prefork, gunicorn workers) inherit the object but not the thread.
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._thread = None
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run, name="user-settings-listener", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        import psycopg
+        from psycopg import sql
+
+        while True:
+            try:
+                with psycopg.connect(self.dsn, autocommit=True) as connection:
+                    connection.execute(sql.SQL("LISTEN {}").format(sql.Identifier(self.channel)))
+                    self.cache.clear()
+                    for notification in connection.notifies():
+                        self.cache.invalidate(notification.payload)
+            except Exception:
+                log.warning("User settings listener disconnected; retrying", exc_info=True)
+            time.sleep(_RECONNECT_DELAY_SECONDS)
+
+
+_listener: UserSettingsListener | None = None
+_listener_lock = threading.Lock()
+
+
+def start_user_settings_listener() -> None:
+    """Start (or restart after fork) the process-wide settings invalidation listener."""
+    global _listener
+    with _listener_lock:
+        if _listener is None:
+            _listener = UserSettingsListener(_cache)
+        _listener.start()
@@ -7,26 +7,36 @@ from structlog.contextvars import bind_contextvars, clear_contextvars
 from fastapi import FastAPI, Request, Response, HTTPException
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
+from prometheus_client import REGISTRY
 
 import anyio.to_thread
 
 from app.core.config import AGENT_API_KEY, SYNC_WORKER_LIMIT
+from app.core.embeddings import remote as remote_embeddings
 from app.core.internal_auth import internal_key_matches
 from app.services.ingestion.routes import router as ingestion_router
 from app.services.ingestion.actions.routes import router as actions_router
+from app.services.chat import reranker
 from app.services.chat.routes import router as chat_router
 from app.core.openapi import OPENAPI_TAGS, configure_openapi
 from app.core.settings import init_llama_index_settings
+from app.db.postgres import DatabaseManager
+from app.db.qdrant import QdrantClientManager
+from app.db.user_settings import start_user_settings_listener
+from app.services.ingestion.storage.collection_routing import RoutingUnavailable
 from app.services.ingestion.storage.vector_store import QdrantVectorStore
+from app.shared import llm as shared_llm
 from app.shared.api_models import HealthData
 from app.shared.routes import router as shared_router
 from app.shared.schema import ApiResponse
 from app.logger import logger, setup_logging
 from app.metrics import REQUEST_COUNT, REQUEST_LATENCY, render_metrics
+from app.services.ingestion.workers.lanes import IngestionLaneCollector
 
 
 setup_logging(service="agent")
 log = logger
+REGISTRY.register(IngestionLaneCollector())
 
 
 @asynccontextmanager
@@ -35,8 +45,17 @@ async def lifespan(app: FastAPI):
     # the anyio default (40) is the hard cap on concurrent chat streams.
     anyio.to_thread.current_default_thread_limiter().total_tokens = SYNC_WORKER_LIMIT
     init_llama_index_settings()
-    QdrantVectorStore().validate_collection_dimensions()
+    vector_store = QdrantVectorStore()
+    vector_store.validate_collection_dimensions()
+    vector_store.ensure_collections()
+    start_user_settings_listener()
     yield
+    await QdrantClientManager.aclose()
+    await DatabaseManager.adispose()
+    # The async HTTP pools are per event loop; this is the serving loop's.
+    await remote_embeddings.aclose_async_http_client()
+    await shared_llm.aclose_async_http_client()
+    await reranker.aclose_async_http_client()
 
 
 app = FastAPI(
@@ -63,6 +82,15 @@ async def http_exception_handler(request: Request, exc: HTTPException):
     )
 
 
+@app.exception_handler(RoutingUnavailable)
+async def routing_unavailable_handler(request: Request, exc: RoutingUnavailable):
+    log.warning("embedding_routing.unavailable", path=request.url.path, error=str(exc))
+    return JSONResponse(
+        status_code=503,
+        content=ApiResponse.fail("Embedding routing is unavailable; retry shortly").model_dump(),
+    )
+
+
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     errors = "; ".join(
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import importlib
 import os
 import math
@@ -424,6 +425,29 @@ def _run_note_retrieval(
     )
 
 
+async def _arun_note_retrieval(
+    *,
+    query: str,
+    user_id: str,
+    k: int,
+    role: str,
+    history: Sequence[Mapping[str, Any]] | None,
+) -> Any:
+    from app.services.chat.retriever import aretrieve_context_result
+    from app.services.ingestion.storage.vector_store import QdrantVectorStore
+
+    # The store reads the embedding routing from Redis (a blocking call) when built.
+    store = await asyncio.to_thread(QdrantVectorStore)
+    return await aretrieve_context_result(
+        store,
+        _require_query(query),
+        _require_user_id(user_id),
+        _bounded_k(k, 12),
+        str(role or "user"),
+        _history_items(history),
+    )
+
+
 def _chunk_preview(text: str, max_chars: int = 700) -> str:
     normalized = re.sub(r"\s+", " ", str(text or "")).strip()
     if len(normalized) <= max_chars:
@@ -546,7 +570,7 @@ def semantic_tool_search(query: str, limit: int = 8) -> dict[str, Any]:
 
 
 @mcp.tool()
-def search_notes(
+async def search_notes(
     query: str,
     user_id: str,
     k: int = 12,
@@ -556,7 +580,7 @@ def search_notes(
     include_diagnostics: bool = False,
 ) -> dict[str, Any]:
     """Gather answer-ready evidence from notes using the full retrieval pipeline."""
-    result = _run_note_retrieval(
+    result = await _arun_note_retrieval(
         query=query,
         user_id=user_id,
         k=k,
@@ -578,7 +602,7 @@ def search_notes(
 
 
 @mcp.tool()
-def locate_notes(
+async def locate_notes(
     query: str,
     user_id: str,
     k: int = 10,
@@ -586,7 +610,7 @@ def locate_notes(
     history: list[dict[str, Any]] | None = None,
 ) -> dict[str, Any]:
     """Find relevant note locations and snippets without asking the LLM to answer."""
-    result = _run_note_retrieval(
+    result = await _arun_note_retrieval(
         query=query,
         user_id=user_id,
         k=k,
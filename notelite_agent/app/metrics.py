@@ -1,6 +1,9 @@
 """Prometheus metrics for HTTP request throughput, latency, and errors.
 
 Recorded from the request middleware in app.main and exposed at GET /metrics.
+Embedding dispatcher metrics are recorded from app.core.embeddings.dispatcher.
+Ingestion lane depth and wait are read from Redis at scrape time by the
+collector in app.services.ingestion.workers.lanes, registered in app.main.
 """
 
 from prometheus_client import CONTENT_TYPE_LATEST, Counter, Histogram, generate_latest
@@ -15,6 +18,25 @@ REQUEST_LATENCY = Histogram(
     "HTTP request latency in seconds.",
     ["method", "path"],
 )
+EMBEDDING_BATCH_SIZE = Histogram(
+    "embedding_dispatch_batch_texts",
+    "Texts per coalesced /embed call.",
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256),
+)
+EMBEDDING_BATCH_REQUESTS = Histogram(
+    "embedding_dispatch_batch_requests",
+    "Caller requests coalesced into one /embed call.",
+    buckets=(1, 2, 4, 8, 16, 32, 64),
+)
+EMBEDDING_QUEUE_WAIT = Histogram(
+    "embedding_dispatch_queue_wait_seconds",
+    "Time a request waited in the dispatcher queue before its /embed call started.",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0),
+)
+EMBEDDING_DISPATCH_TIMEOUTS = Counter(
+    "embedding_dispatch_timeouts_total",
+    "Dispatcher requests that timed out before receiving vectors.",
+)
 
 
 def render_metrics() -> tuple[bytes, str]:
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Hashable
+
+from app.core.config import (
+    RETRIEVAL_CACHE_ENABLED,
+    RETRIEVAL_CACHE_SIZE,
+    RETRIEVAL_CACHE_TTL_SECONDS,
+)
+
+
+@dataclass(frozen=True)
+class CachedRetrieval:
+    context_texts: list[str]
+    references: list[dict[str, Any]]
+    diagnostics: dict[str, Any]
+
+
+def retrieval_cache_key(
+    user_id: str,
+    generation: int,
+    search_query: str,
+    k: int,
+    date_start: datetime | None,
+    date_end: datetime | None,
+    hyde_mode: str,
+) -> tuple[Hashable, ...]:
+    """Key one retrieval by user, index generation, and everything that shapes its result.
+
+    ``hyde_mode`` is how the retrieval path that fills the entry used HyDE:
+    "off", "sequential", or "speculative".
+    """
+    normalized_query = " ".join(search_query.casefold().split())
+    return (
+        str(user_id),
+        generation,
+        normalized_query,
+        k,
+        date_start.isoformat() if date_start else None,
+        date_end.isoformat() if date_end else None,
+        hyde_mode,
+    )
+
+
+class RetrievalCache:
+    """Bounded in-process LRU of retrieval results with a TTL.
+
+    Invalidation comes from the key: it embeds the user's index generation,
+    which ``PostgresArtifactStore`` bumps on every document replace/delete, so
+    entries for an older generation are simply never looked up again and age
+    out of the LRU. Values are copied in and out so callers may mutate them.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = RETRIEVAL_CACHE_SIZE,
+        ttl_seconds: float = RETRIEVAL_CACHE_TTL_SECONDS,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[tuple[Hashable, ...], tuple[float, CachedRetrieval]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[Hashable, ...]) -> CachedRetrieval | None:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            stored_at, value = item
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return copy.deepcopy(value)
+
+    def put(self, key: tuple[Hashable, ...], value: CachedRetrieval) -> None:
+        if self.max_entries <= 0:
+            return
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_default_cache: RetrievalCache | None = None
+
+
+def default_retrieval_cache() -> RetrievalCache | None:
+    """Process-wide retrieval result cache; None when disabled."""
+    global _default_cache
+    if not RETRIEVAL_CACHE_ENABLED:
+        return None
+    if _default_cache is None:
+        _default_cache = RetrievalCache()
+    return _default_cache
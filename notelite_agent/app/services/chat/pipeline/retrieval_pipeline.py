@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 import re
 import unicodedata
 from collections import defaultdict
-from collections.abc import Callable, Mapping, Sequence
+from collections.abc import Awaitable, Callable, Mapping, Sequence
 from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
@@ -15,6 +16,8 @@ from llama_index.core import Document as LlamaDocument
 from app.core.config import (
     HYDE_ENABLED,
     HYDE_MAX_TOKENS,
+    HYDE_SPECULATIVE,
+    HYDE_SPECULATIVE_BUDGET_MS,
     HYDE_TIMEOUT,
     LLM_SUMMARIZER_MODEL,
     RETRIEVAL_CHUNK_BUDGET,
@@ -28,16 +31,32 @@ from app.core.config import (
     RETRIEVAL_SEARCH_WORKERS,
     RETRIEVAL_SUMMARY_BUDGET,
 )
-from app.services.chat.reranker import rerank
+from app.services.chat.pipeline.retrieval_cache import (
+    CachedRetrieval,
+    RetrievalCache,
+    default_retrieval_cache,
+    retrieval_cache_key,
+)
+from app.services.chat.reranker import arerank, rerank, rerank_enabled
 from app.services.ingestion.storage.postgres_store import PostgresArtifactStore
-from app.services.ingestion.storage.vector_store import QdrantVectorStore
-from app.shared.llm import llm_call_general
+from app.services.ingestion.storage.vector_store import (
+    DENSE_VECTOR,
+    SPARSE_VECTOR,
+    TEXT_PENDING,
+    QdrantVectorStore,
+)
+from app.shared.llm import allm_call_general, llm_call_general
 from app.shared.utils import count_tokens
 
 
 SearchHit = tuple[LlamaDocument, float]
 SearchResults = list[SearchHit]
-SearchTask = Callable[[], SearchResults]
+# Names of the sources one search task produces; batched chunk searches yield several.
+SearchGroup = tuple[str, ...]
+SearchTask = Callable[[], Mapping[str, SearchResults]]
+AsyncSearchTask = Callable[[], Awaitable[Mapping[str, SearchResults]]]
+# (status, dense vector) of a HyDE passage generated alongside the first-pass searches.
+SpeculativeHyde = Awaitable[tuple[str, list[float] | None]]
 
 _SHORT_FOLLOWUP_MAX_TERMS = 3
 _FRAGMENT_TOKEN_THRESHOLD = 80
@@ -109,7 +128,33 @@ def preprocess_query(
     search_query = contextualize_query(original_query, history)
     user_timezone = postgres.user_timezone(user_id)
     date_start, date_end = _date_range(original_query, user_timezone)
+    return _prepared_query(original_query, search_query, user_timezone, date_start, date_end)
+
 
+async def apreprocess_query(
+    query: str,
+    user_id: str,
+    history: Sequence[Mapping[str, str]] | None,
+    postgres: PostgresArtifactStore,
+) -> PreparedQuery:
+    """Async variant of ``preprocess_query``."""
+    original_query = unicodedata.normalize("NFKC", query).strip()
+    search_query = contextualize_query(original_query, history)
+    user_timezone = await postgres.auser_timezone(user_id)
+    date_start, date_end = None, None
+    if _TEMPORAL_PATTERN.search(original_query):
+        # dateparser is CPU-bound; keep it off the event loop.
+        date_start, date_end = await asyncio.to_thread(_date_range, original_query, user_timezone)
+    return _prepared_query(original_query, search_query, user_timezone, date_start, date_end)
+
+
+def _prepared_query(
+    original_query: str,
+    search_query: str,
+    user_timezone: str,
+    date_start: datetime | None,
+    date_end: datetime | None,
+) -> PreparedQuery:
     return PreparedQuery(
         original_query=original_query,
         search_query=search_query,
@@ -127,22 +172,69 @@ def generate_hyde(prepared: PreparedQuery) -> tuple[str | None, str]:
     """Generate a hypothetical note passage, falling back cleanly on failure."""
     if not HYDE_ENABLED:
         return None, "disabled"
-    prompt = (
-        "Write a brief note excerpt that would directly answer this question. "
-        "Write as a note excerpt, not a letter. Do not include a salutation, signature, "
-        "reminders, links, or unsupported details. Use concise note-like prose.\n\n"
-        f"Question: {prepared.original_query}"
-    )
     try:
         value = llm_call_general(
-            [{"role": "user", "content": prompt}],
+            _hyde_messages(prepared),
             model=LLM_SUMMARIZER_MODEL,
             max_tokens=HYDE_MAX_TOKENS,
             timeout=HYDE_TIMEOUT,
         ).strip()
     except Exception as exc:
         return None, f"fallback:{type(exc).__name__}"
+    return _hyde_outcome(value, prepared)
+
+
+async def agenerate_hyde(prepared: PreparedQuery) -> tuple[str | None, str]:
+    """Async variant of ``generate_hyde``."""
+    if not HYDE_ENABLED:
+        return None, "disabled"
+    try:
+        value = (await allm_call_general(
+            _hyde_messages(prepared),
+            model=LLM_SUMMARIZER_MODEL,
+            max_tokens=HYDE_MAX_TOKENS,
+            timeout=HYDE_TIMEOUT,
+        )).strip()
+    except Exception as exc:
+        return None, f"fallback:{type(exc).__name__}"
+    return _hyde_outcome(value, prepared)
+
+
+async def aspeculative_hyde(
+    store: QdrantVectorStore,
+    prepared: PreparedQuery,
+    budget_seconds: float | None = None,
+) -> tuple[str, list[float] | None]:
+    """Generate and embed a HyDE passage, giving up once the budget is spent."""
+    async def generate() -> tuple[str, list[float] | None]:
+        hyde, status = await agenerate_hyde(prepared)
+        if hyde is None:
+            return status, None
+        embeddings = await store.aembed_query_texts([hyde])
+        return status, embeddings.dense[0]
+
+    try:
+        return await asyncio.wait_for(
+            generate(),
+            timeout=budget_seconds if budget_seconds is not None else HYDE_SPECULATIVE_BUDGET_MS / 1000,
+        )
+    except asyncio.TimeoutError:
+        return "late", None
+    except Exception as exc:
+        return f"fallback:{type(exc).__name__}", None
+
+
+def _hyde_messages(prepared: PreparedQuery) -> list[dict[str, str]]:
+    prompt = (
+        "Write a brief note excerpt that would directly answer this question. "
+        "Write as a note excerpt, not a letter. Do not include a salutation, signature, "
+        "reminders, links, or unsupported details. Use concise note-like prose.\n\n"
+        f"Question: {prepared.original_query}"
+    )
+    return [{"role": "user", "content": prompt}]
+
 
+def _hyde_outcome(value: str, prepared: PreparedQuery) -> tuple[str | None, str]:
     if not value:
         return None, "empty"
     if _invented_numbers(value, prepared.original_query):
@@ -156,11 +248,25 @@ def embed_query(
     hyde: str | None,
 ) -> QueryEmbeddings:
     """Embed the original query and optional HyDE passage in one request."""
-    texts = [prepared.search_query]
-    if hyde:
-        texts.append(hyde)
+    embeddings = store.embed_query_texts(_query_texts(prepared, hyde))
+    return _query_embeddings(embeddings, hyde)
+
+
+async def aembed_query(
+    store: QdrantVectorStore,
+    prepared: PreparedQuery,
+    hyde: str | None,
+) -> QueryEmbeddings:
+    """Async variant of ``embed_query``."""
+    embeddings = await store.aembed_query_texts(_query_texts(prepared, hyde))
+    return _query_embeddings(embeddings, hyde)
+
+
+def _query_texts(prepared: PreparedQuery, hyde: str | None) -> list[str]:
+    return [prepared.search_query, hyde] if hyde else [prepared.search_query]
 
-    embeddings = store.embed_query_texts(texts)
+
+def _query_embeddings(embeddings: Any, hyde: str | None) -> QueryEmbeddings:
     return QueryEmbeddings(
         original_dense=embeddings.dense[0],
         original_sparse=embeddings.sparse[0],
@@ -219,15 +325,8 @@ def multi_collection_search(
     )
     global_results, errors = _run_search_tasks(global_tasks, RETRIEVAL_SEARCH_WORKERS)
 
-    doc_ids = []
-    if not date_filter_active or identities:
-        doc_ids = _document_ids(global_results.get("summary", []), global_results.get("question", []))
-
-    sources = {
-        name: hits
-        for name, hits in global_results.items()
-        if name.startswith("chunk_")
-    }
+    doc_ids = _summary_doc_ids(global_results, date_filter_active, identities)
+    sources = _chunk_sources(global_results)
     if doc_ids:
         filtered_tasks = _filtered_search_tasks(
             store,
@@ -240,7 +339,117 @@ def multi_collection_search(
         sources.update(filtered_results)
         errors.update(filtered_errors)
 
-    return sources, {
+    return sources, _search_diagnostics(doc_ids, identities, errors)
+
+
+async def amulti_collection_search(
+    store: QdrantVectorStore,
+    prepared: PreparedQuery,
+    embeddings: QueryEmbeddings,
+    metadata_filter: Mapping[str, Any] | None,
+    postgres: PostgresArtifactStore,
+    speculative_hyde: SpeculativeHyde | None = None,
+) -> tuple[dict[str, SearchResults], dict[str, Any]]:
+    """Async variant of ``multi_collection_search``; searches run concurrently on the event loop.
+
+    With ``speculative_hyde`` the HyDE dense search runs as soon as its vector
+    arrives, without holding back the original-query passes; it is added as
+    ``chunk_dense_hyde`` only if the vector arrived in time.
+    """
+    identities = await _adate_identities(prepared, metadata_filter, postgres)
+    date_filter_active = prepared.date_start is not None and prepared.date_end is not None
+    chunk_search_allowed = not date_filter_active or bool(identities)
+    hyde_pass = None
+    if speculative_hyde is not None:
+        hyde_pass = asyncio.ensure_future(_aspeculative_hyde_search(
+            store,
+            speculative_hyde,
+            metadata_filter,
+            identities,
+            chunk_search_allowed,
+        ))
+
+    global_results, errors = await _arun_search_tasks(_aglobal_search_tasks(
+        store,
+        embeddings,
+        metadata_filter,
+        identities,
+        chunk_search_allowed,
+    ))
+
+    doc_ids = _summary_doc_ids(global_results, date_filter_active, identities)
+    sources = _chunk_sources(global_results)
+    if doc_ids:
+        filtered_results, filtered_errors = await _arun_search_tasks(_afiltered_search_tasks(
+            store,
+            embeddings,
+            metadata_filter,
+            doc_ids,
+            identities,
+        ))
+        sources.update(filtered_results)
+        errors.update(filtered_errors)
+
+    diagnostics = _search_diagnostics(doc_ids, identities, errors)
+    if hyde_pass is not None:
+        hyde_status, hyde_hits, hyde_error = await hyde_pass
+        if hyde_hits is not None:
+            sources["chunk_dense_hyde"] = hyde_hits
+        if hyde_error is not None:
+            errors["chunk_dense_hyde"] = hyde_error
+        diagnostics["speculative_hyde"] = {
+            "status": hyde_status,
+            "merged": hyde_hits is not None,
+        }
+    return sources, diagnostics
+
+
+async def _aspeculative_hyde_search(
+    store: QdrantVectorStore,
+    speculative_hyde: SpeculativeHyde,
+    metadata_filter: Mapping[str, Any] | None,
+    identities: Sequence[tuple[str, str]] | None,
+    chunk_search_allowed: bool,
+) -> tuple[str, SearchResults | None, str | None]:
+    status, hyde_dense = await speculative_hyde
+    if hyde_dense is None or not chunk_search_allowed:
+        return status, None, None
+    try:
+        hits = await store.asearch_chunk_dense(
+            hyde_dense,
+            limit=50,
+            metadata_filter=metadata_filter,
+            identities=identities,
+        )
+    except Exception as exc:
+        return status, None, type(exc).__name__
+    return status, hits, None
+
+
+def _summary_doc_ids(
+    global_results: Mapping[str, SearchResults],
+    date_filter_active: bool,
+    identities: Sequence[tuple[str, str]] | None,
+) -> list[str]:
+    if date_filter_active and not identities:
+        return []
+    return _document_ids(global_results.get("summary", []), global_results.get("question", []))
+
+
+def _chunk_sources(global_results: Mapping[str, SearchResults]) -> dict[str, SearchResults]:
+    return {
+        name: hits
+        for name, hits in global_results.items()
+        if name.startswith("chunk_")
+    }
+
+
+def _search_diagnostics(
+    doc_ids: Sequence[str],
+    identities: Sequence[tuple[str, str]] | None,
+    errors: dict[str, str],
+) -> dict[str, Any]:
+    return {
         "summary_doc_ids": doc_ids,
         "date_identity_count": len(identities or []),
         "source_errors": errors,
@@ -254,24 +463,80 @@ def assemble_context(
 ) -> tuple[list[str], list[dict[str, Any]], dict[str, Any]]:
     """Expand seed chunks with neighbors and selectively attach summaries."""
     selected_seeds = list(seeds[:RETRIEVAL_CONTEXT_SEED_LIMIT])
+    expandable = _expandable_seeds(selected_seeds)
+    wanted = _neighbor_identities(expandable)
+    neighbors = store.fetch_chunks(wanted) if wanted else {}
+    missing = [identity for identity in wanted if identity not in neighbors]
+    if missing:
+        neighbors.update(_skipped_documents(postgres.skipped_chunks(missing)))
+    expansions = _expansions(expandable, neighbors)
+    context_documents, remaining_budget, neighbor_count = _budget_context(selected_seeds, expansions)
+    ordered_context_documents = _order_context_documents(context_documents, selected_seeds)
+    document_ids = _document_ids(selected_seeds)
+    summaries = []
+    if _should_attach_summaries(selected_seeds, document_ids):
+        summaries = postgres.summaries(document_ids, RETRIEVAL_MAX_SUMMARIES)
+    return _context_result(
+        selected_seeds, ordered_context_documents, summaries, remaining_budget, neighbor_count
+    )
+
+
+async def aassemble_context(
+    store: QdrantVectorStore,
+    postgres: PostgresArtifactStore,
+    seeds: Sequence[SearchHit],
+) -> tuple[list[str], list[dict[str, Any]], dict[str, Any]]:
+    """Async variant of ``assemble_context``."""
+    selected_seeds = list(seeds[:RETRIEVAL_CONTEXT_SEED_LIMIT])
+    expandable = _expandable_seeds(selected_seeds)
+    wanted = _neighbor_identities(expandable)
+    neighbors = await store.afetch_chunks(wanted) if wanted else {}
+    missing = [identity for identity in wanted if identity not in neighbors]
+    if missing:
+        neighbors.update(_skipped_documents(await postgres.askipped_chunks(missing)))
+    expansions = _expansions(expandable, neighbors)
+    context_documents, remaining_budget, neighbor_count = _budget_context(selected_seeds, expansions)
+    ordered_context_documents = _order_context_documents(context_documents, selected_seeds)
+    document_ids = _document_ids(selected_seeds)
+    summaries = []
+    if _should_attach_summaries(selected_seeds, document_ids):
+        summaries = await postgres.asummaries(document_ids, RETRIEVAL_MAX_SUMMARIES)
+    return _context_result(
+        selected_seeds, ordered_context_documents, summaries, remaining_budget, neighbor_count
+    )
+
+
+def _expandable_seeds(selected_seeds: Sequence[SearchHit]) -> list[tuple[int, LlamaDocument]]:
+    """Seeds small enough to be expanded with their prev/next neighbors."""
+    return [
+        (index, seed)
+        for index, (seed, _score) in enumerate(selected_seeds)
+        if index < RETRIEVAL_NEIGHBOR_SEED_LIMIT
+        and _document_tokens(seed) < _FRAGMENT_TOKEN_THRESHOLD
+    ]
+
+
+def _document_tokens(document: LlamaDocument) -> int:
+    """Chunk token count, preferring the count stored with the chunk at ingestion."""
+    stored = document.metadata.get("token_count")
+    return stored if isinstance(stored, int) else count_tokens(document.text)
+
+
+def _budget_context(
+    selected_seeds: Sequence[SearchHit],
+    expansions: Mapping[int, Sequence[LlamaDocument | None]],
+) -> tuple[list[LlamaDocument], int, int]:
     context_documents: list[LlamaDocument] = []
     seen: set[tuple[str, str]] = set()
     remaining_budget = RETRIEVAL_CHUNK_BUDGET
     neighbor_count = 0
 
     for index, (seed, _score) in enumerate(selected_seeds):
-        documents = [seed]
-        if (
-            index < RETRIEVAL_NEIGHBOR_SEED_LIMIT
-            and count_tokens(seed.text) < _FRAGMENT_TOKEN_THRESHOLD
-        ):
-            documents = _seed_with_neighbors(store, postgres, seed)
-
-        for document in documents:
+        for document in expansions.get(index, [seed]):
             if document is None:
                 continue
             identity = _document_identity(document)
-            token_count = count_tokens(document.text)
+            token_count = _document_tokens(document)
             if identity in seen or token_count > remaining_budget:
                 continue
             seen.add(identity)
@@ -279,14 +544,20 @@ def assemble_context(
             remaining_budget -= token_count
             if document is not seed:
                 neighbor_count += 1
+    return context_documents, remaining_budget, neighbor_count
 
-    ordered_context_documents = _order_context_documents(context_documents, selected_seeds)
+
+def _context_result(
+    selected_seeds: Sequence[SearchHit],
+    ordered_context_documents: Sequence[LlamaDocument],
+    summaries: Sequence[str],
+    remaining_budget: int,
+    neighbor_count: int,
+) -> tuple[list[str], list[dict[str, Any]], dict[str, Any]]:
     context_texts = [document.text for document in ordered_context_documents]
-    document_ids = _document_ids(selected_seeds)
-    if _should_attach_summaries(selected_seeds, document_ids):
-        for summary in postgres.summaries(document_ids, RETRIEVAL_MAX_SUMMARIES):
-            if count_tokens(summary) <= RETRIEVAL_SUMMARY_BUDGET:
-                context_texts.append(f"Document summary:\n{summary}")
+    for summary in summaries:
+        if count_tokens(summary) <= RETRIEVAL_SUMMARY_BUDGET:
+            context_texts.append(f"Document summary:\n{summary}")
 
     references = _references(selected_seeds, ordered_context_documents)
     diagnostics = {
@@ -316,6 +587,13 @@ def run_retrieval(
         f"retrieval preprocess completed: temporal={prepared.date_start is not None}"
     )
 
+    cache = default_retrieval_cache()
+    generation = artifact_store.index_generation(user_id) if cache is not None else None
+    cache_key = _cache_key(user_id, generation, prepared, k, _hyde_mode(speculative=False))
+    cached = cache.get(cache_key) if cache is not None and cache_key is not None else None
+    if cached is not None:
+        return _cached_result(events, history, prepared, cached)
+
     hyde, hyde_status = generate_hyde(prepared)
     events.append(f"retrieval hyde {hyde_status}")
 
@@ -332,26 +610,218 @@ def run_retrieval(
         metadata_filter,
         artifact_store,
     )
-    search_candidate_count = sum(len(hits) for hits in sources.values())
+    _search_events(events, sources, search_diagnostics)
+
+    fused, rrf_diagnostics = weighted_rrf(sources)
+    events.append(f"retrieval rrf completed: candidates={len(fused)}")
+
+    candidates = _rerank_candidates(fused, k)
+    if _text_pending(candidates):
+        hydrated = store.hydrate_chunks(candidates)
+        events.append(f"retrieval hydrate completed: chunks={hydrated}")
+
+    seeds = rerank(prepared.original_query, fused, top_k=k)
+    events.append(f"retrieval rerank completed: seeds={len(seeds)}")
+
+    context_texts, references, context_diagnostics = assemble_context(
+        store,
+        artifact_store,
+        seeds,
+    )
+    result = _retrieval_result(
+        events, history, prepared, hyde_status, search_diagnostics, rrf_diagnostics,
+        seeds, context_texts, references, context_diagnostics,
+    )
+    _remember_result(cache, cache_key, result)
+    return result
+
+
+async def arun_retrieval(
+    store: QdrantVectorStore,
+    query: str,
+    user_id: str,
+    k: int,
+    role: str,
+    history: Sequence[Mapping[str, str]] | None = None,
+    postgres: PostgresArtifactStore | None = None,
+) -> RetrievalResult:
+    """Async variant of ``run_retrieval``.
+
+    Same stages, events, and diagnostics, but Qdrant, PostgreSQL, embedding,
+    HyDE, and reranker I/O are awaited on the event loop instead of holding a
+    worker thread (plus a per-query search thread pool) for the whole request.
+    """
+    events = ["retrieval started"]
+    artifact_store = postgres or PostgresArtifactStore()
+
+    cache = default_retrieval_cache()
+    if cache is not None:
+        # The generation read rides along with preprocessing instead of after it.
+        prepared, generation = await asyncio.gather(
+            apreprocess_query(query, user_id, history, artifact_store),
+            artifact_store.aindex_generation(user_id),
+        )
+    else:
+        prepared, generation = await apreprocess_query(query, user_id, history, artifact_store), None
     events.append(
-        f"retrieval search completed: sources={len(sources)} candidates={search_candidate_count}"
+        f"retrieval preprocess completed: temporal={prepared.date_start is not None}"
     )
-    if search_diagnostics["source_errors"]:
-        events.append(
-            f"retrieval search partial failure: sources={len(search_diagnostics['source_errors'])}"
+
+    hyde_mode = _hyde_mode(speculative=HYDE_SPECULATIVE)
+    cache_key = _cache_key(user_id, generation, prepared, k, hyde_mode)
+    cached = cache.get(cache_key) if cache is not None and cache_key is not None else None
+    if cached is not None:
+        return _cached_result(events, history, prepared, cached)
+
+    speculative_hyde = None
+    if hyde_mode == "speculative":
+        # HyDE runs alongside the first-pass searches instead of ahead of them.
+        speculative_hyde = asyncio.create_task(aspeculative_hyde(store, prepared))
+        embeddings = await aembed_query(store, prepared, None)
+        events.append("retrieval embedding completed: hyde=speculative")
+    else:
+        hyde, hyde_status = await agenerate_hyde(prepared)
+        events.append(f"retrieval hyde {hyde_status}")
+
+        embeddings = await aembed_query(store, prepared, hyde)
+        events.append(f"retrieval embedding completed: hyde={hyde is not None}")
+
+    # Always scope retrieval to the requesting user (see run_retrieval).
+    metadata_filter = {"user_id": user_id}
+    try:
+        sources, search_diagnostics = await amulti_collection_search(
+            store,
+            prepared,
+            embeddings,
+            metadata_filter,
+            artifact_store,
+            speculative_hyde=speculative_hyde,
         )
+    finally:
+        if speculative_hyde is not None:
+            speculative_hyde.cancel()
+    _search_events(events, sources, search_diagnostics)
+    if speculative_hyde is not None:
+        speculative = search_diagnostics["speculative_hyde"]
+        hyde_status = f"speculative:{speculative['status']}"
+        events.append(f"retrieval hyde {hyde_status} merged={speculative['merged']}")
 
     fused, rrf_diagnostics = weighted_rrf(sources)
     events.append(f"retrieval rrf completed: candidates={len(fused)}")
 
-    seeds = rerank(prepared.original_query, fused, top_k=k)
+    candidates = _rerank_candidates(fused, k)
+    if _text_pending(candidates):
+        hydrated = await store.ahydrate_chunks(candidates)
+        events.append(f"retrieval hydrate completed: chunks={hydrated}")
+
+    seeds = await arerank(prepared.original_query, fused, top_k=k)
     events.append(f"retrieval rerank completed: seeds={len(seeds)}")
 
-    context_texts, references, context_diagnostics = assemble_context(
+    context_texts, references, context_diagnostics = await aassemble_context(
         store,
         artifact_store,
         seeds,
     )
+    result = _retrieval_result(
+        events, history, prepared, hyde_status, search_diagnostics, rrf_diagnostics,
+        seeds, context_texts, references, context_diagnostics,
+    )
+    _remember_result(cache, cache_key, result)
+    return result
+
+
+def _rerank_candidates(fused: Sequence[SearchHit], k: int) -> Sequence[SearchHit]:
+    """Hits whose text is needed: all of them for the cross-encoder, else the top k."""
+    return fused if rerank_enabled() else fused[:k]
+
+
+def _text_pending(hits: Sequence[SearchHit]) -> bool:
+    return any(document.metadata.get(TEXT_PENDING) for document, _score in hits)
+
+
+def _hyde_mode(speculative: bool) -> str:
+    """How a retrieval path uses HyDE; only the async path can run it speculatively."""
+    if not HYDE_ENABLED:
+        return "off"
+    return "speculative" if speculative else "sequential"
+
+
+def _cache_key(
+    user_id: str,
+    generation: int | None,
+    prepared: PreparedQuery,
+    k: int,
+    hyde_mode: str,
+) -> tuple | None:
+    if generation is None:
+        return None
+    return retrieval_cache_key(
+        user_id, generation, prepared.search_query, k, prepared.date_start, prepared.date_end, hyde_mode,
+    )
+
+
+def _cached_result(
+    events: list[str],
+    history: Sequence[Mapping[str, str]] | None,
+    prepared: PreparedQuery,
+    cached: CachedRetrieval,
+) -> RetrievalResult:
+    events.append("retrieval cache hit")
+    events.append(
+        f"retrieval context completed: chunks={len(cached.context_texts)} sources={len(cached.references)}"
+    )
+    events.append("retrieval completed")
+    return RetrievalResult(
+        context_texts=cached.context_texts,
+        references=cached.references,
+        bounded_history=_bounded_history(history),
+        events=events,
+        diagnostics={**cached.diagnostics, "prepared": prepared.diagnostics, "cache": "hit"},
+    )
+
+
+def _remember_result(
+    cache: RetrievalCache | None,
+    cache_key: tuple | None,
+    result: RetrievalResult,
+) -> None:
+    # Partial search failures are not cached; the next attempt may see every source.
+    if cache is None or cache_key is None or result.diagnostics["search"]["source_errors"]:
+        return
+    cache.put(cache_key, CachedRetrieval(
+        context_texts=result.context_texts,
+        references=result.references,
+        diagnostics=result.diagnostics,
+    ))
+
+
+def _search_events(
+    events: list[str],
+    sources: Mapping[str, SearchResults],
+    search_diagnostics: Mapping[str, Any],
+) -> None:
+    search_candidate_count = sum(len(hits) for hits in sources.values())
+    events.append(
+        f"retrieval search completed: sources={len(sources)} candidates={search_candidate_count}"
+    )
+    if search_diagnostics["source_errors"]:
+        events.append(
+            f"retrieval search partial failure: sources={len(search_diagnostics['source_errors'])}"
+        )
+
+
+def _retrieval_result(
+    events: list[str],
+    history: Sequence[Mapping[str, str]] | None,
+    prepared: PreparedQuery,
+    hyde_status: str,
+    search_diagnostics: dict[str, Any],
+    rrf_diagnostics: dict[str, Any],
+    seeds: Sequence[SearchHit],
+    context_texts: list[str],
+    references: list[dict[str, Any]],
+    context_diagnostics: dict[str, Any],
+) -> RetrievalResult:
     events.append(
         f"retrieval context completed: chunks={len(context_texts)} sources={len(references)}"
     )
@@ -408,45 +878,99 @@ def _date_identities(
     return postgres.matching_identities(user_id, prepared.date_start, prepared.date_end)
 
 
+async def _adate_identities(
+    prepared: PreparedQuery,
+    metadata_filter: Mapping[str, Any] | None,
+    postgres: PostgresArtifactStore,
+) -> list[tuple[str, str]] | None:
+    if prepared.date_start is None or prepared.date_end is None:
+        return None
+    user_id = str(metadata_filter["user_id"]) if metadata_filter else None
+    return await postgres.amatching_identities(user_id, prepared.date_start, prepared.date_end)
+
+
+def _global_chunk_queries(embeddings: QueryEmbeddings) -> dict[str, tuple[str, Any]]:
+    chunk_queries = {
+        "chunk_dense_original": (DENSE_VECTOR, embeddings.original_dense),
+        "chunk_sparse_bm25": (SPARSE_VECTOR, embeddings.original_sparse),
+    }
+    if embeddings.hyde_dense:
+        chunk_queries["chunk_dense_hyde"] = (DENSE_VECTOR, embeddings.hyde_dense)
+    return chunk_queries
+
+
+def _filtered_chunk_queries(embeddings: QueryEmbeddings) -> dict[str, tuple[str, Any]]:
+    return {
+        "chunk_filtered_dense": (DENSE_VECTOR, embeddings.original_dense),
+        "chunk_filtered_sparse": (SPARSE_VECTOR, embeddings.original_sparse),
+    }
+
+
 def _global_search_tasks(
     store: QdrantVectorStore,
     embeddings: QueryEmbeddings,
     metadata_filter: Mapping[str, Any] | None,
     identities: Sequence[tuple[str, str]] | None,
     chunk_search_allowed: bool,
-) -> dict[str, SearchTask]:
-    tasks: dict[str, SearchTask] = {
-        "chunk_dense_original": lambda: store.search_chunk_dense(
-            embeddings.original_dense,
-            limit=50,
-            metadata_filter=metadata_filter,
-            identities=identities,
-        ) if chunk_search_allowed else [],
-        "chunk_sparse_bm25": lambda: store.search_chunk_sparse(
-            embeddings.original_sparse,
+) -> dict[SearchGroup, SearchTask]:
+    chunk_queries = _global_chunk_queries(embeddings)
+    # Chunk searches share one filter and go out as a single batch request.
+    # Summaries and questions live in separate collections, so each is its own call.
+    return {
+        tuple(chunk_queries): lambda: store.search_chunks(
+            chunk_queries,
             limit=50,
             metadata_filter=metadata_filter,
             identities=identities,
-        ) if chunk_search_allowed else [],
-        "summary": lambda: store.search_summary_dense(
+        ) if chunk_search_allowed else {name: [] for name in chunk_queries},
+        ("summary",): lambda: {"summary": store.search_summary_dense(
             embeddings.original_dense,
             limit=10,
             metadata_filter=metadata_filter,
-        ),
-        "question": lambda: store.search_question_dense(
+        )},
+        ("question",): lambda: {"question": store.search_question_dense(
             embeddings.original_dense,
             limit=10,
             metadata_filter=metadata_filter,
-        ),
+        )},
     }
-    if embeddings.hyde_dense:
-        tasks["chunk_dense_hyde"] = lambda: store.search_chunk_dense(
-            embeddings.hyde_dense,
+
+
+def _aglobal_search_tasks(
+    store: QdrantVectorStore,
+    embeddings: QueryEmbeddings,
+    metadata_filter: Mapping[str, Any] | None,
+    identities: Sequence[tuple[str, str]] | None,
+    chunk_search_allowed: bool,
+) -> dict[SearchGroup, AsyncSearchTask]:
+    """``_global_search_tasks`` on the store's async searches."""
+    chunk_queries = _global_chunk_queries(embeddings)
+
+    async def chunks() -> Mapping[str, SearchResults]:
+        if not chunk_search_allowed:
+            return {name: [] for name in chunk_queries}
+        return await store.asearch_chunks(
+            chunk_queries,
             limit=50,
             metadata_filter=metadata_filter,
             identities=identities,
-        ) if chunk_search_allowed else []
-    return tasks
+        )
+
+    async def summaries() -> Mapping[str, SearchResults]:
+        return {"summary": await store.asearch_summary_dense(
+            embeddings.original_dense,
+            limit=10,
+            metadata_filter=metadata_filter,
+        )}
+
+    async def questions() -> Mapping[str, SearchResults]:
+        return {"question": await store.asearch_question_dense(
+            embeddings.original_dense,
+            limit=10,
+            metadata_filter=metadata_filter,
+        )}
+
+    return {tuple(chunk_queries): chunks, ("summary",): summaries, ("question",): questions}
 
 
 def _filtered_search_tasks(
@@ -455,82 +979,132 @@ def _filtered_search_tasks(
     metadata_filter: Mapping[str, Any] | None,
     doc_ids: Sequence[str],
     identities: Sequence[tuple[str, str]] | None,
-) -> dict[str, SearchTask]:
+) -> dict[SearchGroup, SearchTask]:
+    chunk_queries = _filtered_chunk_queries(embeddings)
     return {
-        "chunk_filtered_dense": lambda: store.search_chunk_dense(
-            embeddings.original_dense,
+        tuple(chunk_queries): lambda: store.search_chunks(
+            chunk_queries,
             limit=50,
             metadata_filter=metadata_filter,
             doc_ids=doc_ids,
             identities=identities,
         ),
-        "chunk_filtered_sparse": lambda: store.search_chunk_sparse(
-            embeddings.original_sparse,
+    }
+
+
+def _afiltered_search_tasks(
+    store: QdrantVectorStore,
+    embeddings: QueryEmbeddings,
+    metadata_filter: Mapping[str, Any] | None,
+    doc_ids: Sequence[str],
+    identities: Sequence[tuple[str, str]] | None,
+) -> dict[SearchGroup, AsyncSearchTask]:
+    """``_filtered_search_tasks`` on the store's async searches."""
+    chunk_queries = _filtered_chunk_queries(embeddings)
+
+    async def chunks() -> Mapping[str, SearchResults]:
+        return await store.asearch_chunks(
+            chunk_queries,
             limit=50,
             metadata_filter=metadata_filter,
             doc_ids=doc_ids,
             identities=identities,
-        ),
-    }
+        )
+
+    return {tuple(chunk_queries): chunks}
 
 
 def _run_search_tasks(
-    tasks: Mapping[str, SearchTask],
+    tasks: Mapping[SearchGroup, SearchTask],
     max_workers: int,
 ) -> tuple[dict[str, SearchResults], dict[str, str]]:
     results: dict[str, SearchResults] = {}
     errors: dict[str, str] = {}
     with ThreadPoolExecutor(max_workers=max_workers) as pool:
-        futures: dict[str, Future[SearchResults]] = {
-            name: pool.submit(task)
-            for name, task in tasks.items()
+        futures: dict[SearchGroup, Future[Mapping[str, SearchResults]]] = {
+            names: pool.submit(task)
+            for names, task in tasks.items()
         }
-        for name, future in futures.items():
+        for names, future in futures.items():
             try:
-                results[name] = future.result()
+                _collect_group(results, errors, names, future.result())
             except Exception as exc:
-                results[name] = []
-                errors[name] = type(exc).__name__
+                _collect_group(results, errors, names, exc)
     return results, errors
 
 
-def _seed_with_neighbors(
-    store: QdrantVectorStore,
-    postgres: PostgresArtifactStore,
-    seed: LlamaDocument,
-) -> list[LlamaDocument | None]:
-    document_id = str(seed.metadata.get("doc_id") or "")
-    return [
-        _neighbor(store, postgres, document_id, seed.metadata.get("prev_chunk_id")),
-        seed,
-        _neighbor(store, postgres, document_id, seed.metadata.get("next_chunk_id")),
-    ]
-
-
-def _neighbor(
-    store: QdrantVectorStore,
-    postgres: PostgresArtifactStore,
-    document_id: str,
-    chunk_id: Any,
-) -> LlamaDocument | None:
-    if not chunk_id:
-        return None
+async def _arun_search_tasks(
+    tasks: Mapping[SearchGroup, AsyncSearchTask],
+) -> tuple[dict[str, SearchResults], dict[str, str]]:
+    outcomes = await asyncio.gather(
+        *(task() for task in tasks.values()),
+        return_exceptions=True,
+    )
+    results: dict[str, SearchResults] = {}
+    errors: dict[str, str] = {}
+    for names, outcome in zip(tasks, outcomes):
+        if isinstance(outcome, BaseException) and not isinstance(outcome, Exception):
+            raise outcome
+        _collect_group(results, errors, names, outcome)
+    return results, errors
 
-    neighbor = store.fetch_neighbor(document_id, chunk_id)
-    if neighbor is not None:
-        return neighbor
 
-    skipped = postgres.skipped_chunk(document_id, str(chunk_id))
-    if skipped is None:
-        return None
-    return LlamaDocument(
-        text=skipped.content,
-        metadata={
-            **skipped.metadata_json,
-            "doc_id": document_id,
-            "chunk_id": skipped.chunk_id,
-        },
-    )
+def _collect_group(
+    results: dict[str, SearchResults],
+    errors: dict[str, str],
+    names: SearchGroup,
+    outcome: Mapping[str, SearchResults] | Exception,
+) -> None:
+    # A batched request fails as a unit, so every source in the group is marked failed.
+    for name in names:
+        if isinstance(outcome, Exception):
+            results[name] = []
+            errors[name] = type(outcome).__name__
+        else:
+            results[name] = list(outcome.get(name, []))
+
+
+def _neighbor_identities(expandable: Sequence[tuple[int, LlamaDocument]]) -> list[tuple[str, str]]:
+    """Every (doc_id, chunk_id) neighbor needed by the expandable seeds, deduplicated."""
+    identities: dict[tuple[str, str], None] = {}
+    for _index, seed in expandable:
+        document_id = str(seed.metadata.get("doc_id") or "")
+        for key in ("prev_chunk_id", "next_chunk_id"):
+            chunk_id = seed.metadata.get(key)
+            if document_id and chunk_id:
+                identities[(document_id, str(chunk_id))] = None
+    return list(identities)
+
+
+def _expansions(
+    expandable: Sequence[tuple[int, LlamaDocument]],
+    neighbors: Mapping[tuple[str, str], LlamaDocument],
+) -> dict[int, list[LlamaDocument | None]]:
+    expansions: dict[int, list[LlamaDocument | None]] = {}
+    for index, seed in expandable:
+        document_id = str(seed.metadata.get("doc_id") or "")
+        previous_id = seed.metadata.get("prev_chunk_id")
+        next_id = seed.metadata.get("next_chunk_id")
+        expansions[index] = [
+            neighbors.get((document_id, str(previous_id))) if previous_id else None,
+            seed,
+            neighbors.get((document_id, str(next_id))) if next_id else None,
+        ]
+    return expansions
+
+
+def _skipped_documents(skipped: Mapping[tuple[str, str], Any]) -> dict[tuple[str, str], LlamaDocument]:
+    return {
+        (document_id, chunk_id): LlamaDocument(
+            text=record.content,
+            metadata={
+                **record.metadata_json,
+                "doc_id": document_id,
+                "chunk_id": record.chunk_id,
+            },
+        )
+        for (document_id, chunk_id), record in skipped.items()
+    }
 
 
 def _bounded_history(history: Sequence[Mapping[str, str]] | None) -> list[dict[str, str]]:
@@ -603,7 +1177,7 @@ def _references(
 
 def _should_attach_summaries(seeds: Sequence[SearchHit], document_ids: Sequence[str]) -> bool:
     return len(document_ids) > 1 or bool(
-        seeds and count_tokens(seeds[0][0].text) < _FRAGMENT_TOKEN_THRESHOLD
+        seeds and _document_tokens(seeds[0][0]) < _FRAGMENT_TOKEN_THRESHOLD
     )
 
 
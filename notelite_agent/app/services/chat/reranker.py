@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import weakref
 from typing import Any
 
 import httpx
@@ -28,6 +30,32 @@ def _http_client() -> httpx.Client:
     return _http
 
 
+# Async pools are per event loop: httpx.AsyncClient connections belong to the
+# loop that opened them.
+_async_http: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _async_http_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _async_http.get(loop)
+    if client is None:
+        client = _async_http[loop] = httpx.AsyncClient()
+    return client
+
+
+async def aclose_async_http_client() -> None:
+    """Close the running loop's async pool; called from the API lifespan shutdown."""
+    client = _async_http.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def rerank_enabled() -> bool:
+    return bool(RERANKER_API_BASE)
+
+
 def rerank(
     query: str,
     chunks: list[tuple[LlamaDocument, float]],
@@ -47,37 +75,80 @@ def rerank(
     if not RERANKER_API_BASE or len(chunks) <= 1:
         return chunks[:top_k]
 
-    texts = [doc.text for doc, _ in chunks]
     try:
         resp = _http_client().post(
             f"{RERANKER_API_BASE}/rerank",
-            json={"query": query, "documents": texts, "top_n": top_k},
-            headers={"Authorization": f"Bearer {RERANKER_API_KEY}", "Content-Type": "application/json"},
+            json=_request_body(query, chunks, top_k),
+            headers=_headers(),
+            timeout=_TIMEOUT,
+        )
+        resp.raise_for_status()
+        return _ranked(resp.json(), chunks, top_k)
+    except Exception:
+        log.warning("reranker failed, using RRF ranking", exc_info=True)
+        return chunks[:top_k]
+
+
+async def arerank(
+    query: str,
+    chunks: list[tuple[LlamaDocument, float]],
+    *,
+    top_k: int,
+) -> list[tuple[LlamaDocument, float]]:
+    """Event-loop variant of ``rerank`` with the same fallbacks."""
+    if not RERANKER_API_BASE or len(chunks) <= 1:
+        return chunks[:top_k]
+
+    try:
+        resp = await _async_http_client().post(
+            f"{RERANKER_API_BASE}/rerank",
+            json=_request_body(query, chunks, top_k),
+            headers=_headers(),
             timeout=_TIMEOUT,
         )
         resp.raise_for_status()
-        results = _valid_results(resp.json().get("results", []), len(chunks))
-        relevant = [
-            result
-            for result in results
-            if result["score"] >= RERANKER_MIN_RELEVANCE_SCORE
-        ]
-        if not relevant:
-            log.info(
-                "reranker found no candidates above relevance threshold; using RRF ranking"
-            )
-            return chunks[:top_k]
-
-        ranked = sorted(relevant, key=lambda result: result["score"], reverse=True)
-        return [
-            (chunks[result["index"]][0], result["score"])
-            for result in ranked[:top_k]
-        ]
+        return _ranked(resp.json(), chunks, top_k)
     except Exception:
         log.warning("reranker failed, using RRF ranking", exc_info=True)
         return chunks[:top_k]
 
 
+def _request_body(
+    query: str,
+    chunks: list[tuple[LlamaDocument, float]],
+    top_k: int,
+) -> dict[str, Any]:
+    return {"query": query, "documents": [doc.text for doc, _ in chunks], "top_n": top_k}
+
+
+def _headers() -> dict[str, str]:
+    return {"Authorization": f"Bearer {RERANKER_API_KEY}", "Content-Type": "application/json"}
+
+
+def _ranked(
+    data: Any,
+    chunks: list[tuple[LlamaDocument, float]],
+    top_k: int,
+) -> list[tuple[LlamaDocument, float]]:
+    results = _valid_results(data.get("results", []), len(chunks))
+    relevant = [
+        result
+        for result in results
+        if result["score"] >= RERANKER_MIN_RELEVANCE_SCORE
+    ]
+    if not relevant:
+        log.info(
+            "reranker found no candidates above relevance threshold; using RRF ranking"
+        )
+        return chunks[:top_k]
+
+    ranked = sorted(relevant, key=lambda result: result["score"], reverse=True)
+    return [
+        (chunks[result["index"]][0], result["score"])
+        for result in ranked[:top_k]
+    ]
+
+
 def _valid_results(results: Any, chunk_count: int) -> list[dict[str, int | float]]:
     valid: list[dict[str, int | float]] = []
     if not isinstance(results, list):
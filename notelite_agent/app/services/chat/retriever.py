@@ -3,7 +3,11 @@ from __future__ import annotations
 from collections.abc import Mapping, Sequence
 from typing import Any
 
-from app.services.chat.pipeline.retrieval_pipeline import RetrievalResult, run_retrieval
+from app.services.chat.pipeline.retrieval_pipeline import (
+    RetrievalResult,
+    arun_retrieval,
+    run_retrieval,
+)
 from app.services.ingestion.storage.vector_store import QdrantVectorStore
 
 
@@ -19,6 +23,18 @@ def retrieve_context_result(
     return run_retrieval(vector_store, query, user_id, k, role, history)
 
 
+async def aretrieve_context_result(
+    vector_store: QdrantVectorStore,
+    query: str,
+    user_id: str,
+    k: int,
+    role: str,
+    history: Sequence[Mapping[str, str]] | None = None,
+) -> RetrievalResult:
+    """Async variant of ``retrieve_context_result`` for event-loop callers."""
+    return await arun_retrieval(vector_store, query, user_id, k, role, history)
+
+
 def retrieve_context(
     vector_store: QdrantVectorStore,
     query: str,
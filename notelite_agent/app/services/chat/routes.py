@@ -60,9 +60,9 @@ def get_conversation_history(request: ConversationHistoryRequest):
     description="Streams Server-Sent Events: meta, delta, error, and done.",
     responses={200: {"description": "SSE chat stream", "content": {"text/event-stream": {}}}},
 )
-def chat_stream(
+async def chat_stream(
     request: ChatRequest,
     vector_store: QdrantVectorStore = Depends(get_qdrant_store),
 ) -> StreamingResponse:
     """Stream assistant output as SSE with RAG context from the user's notes."""
-    return _streaming_service.stream(request, vector_store=vector_store)
+    return await _streaming_service.astream(request, vector_store=vector_store)
@@ -4,12 +4,14 @@ import json
 import logging
 import os
 import time
+from dataclasses import dataclass, field
 from pathlib import Path
 from collections.abc import Iterator
 from typing import Any
 
 import httpx
 from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import StreamingResponse
 
 from app.core.config import ACTIVE_CHAT_SYSTEM_VERSION, LLM_REASONER_MODEL
@@ -17,6 +19,7 @@ from app.core.feature_flags import is_enabled
 from app.logger import logger
 from app.services.chat import conversation, llm_client, retriever
 from app.shared.prompts import prompt
+from app.services.chat.pipeline.retrieval_pipeline import RetrievalResult
 from app.services.chat.schema import ChatRequest
 from app.agent_workflow.adapters.orchestrator import engine_event_to_sse
 from app.agent_workflow.engine import AgentEngine
@@ -37,6 +40,37 @@ def _elapsed_ms(started_at: float) -> int:
     return int((time.perf_counter() - started_at) * 1000)
 
 
+@dataclass
+class _ChatTurn:
+    """Per-turn state shared by the setup, retrieval, and response phases."""
+
+    query: str
+    started_at: float
+    events: list[str]
+    latencies_ms: dict[str, int]
+    conversation_client: BackendConversationClient
+    conversation_id: str
+    user_message_id: str
+    assistant_message_id: str
+    history: list[dict[str, Any]]
+    context_texts: list[str] = field(default_factory=list)
+    references: list[dict[str, Any]] = field(default_factory=list)
+
+
+def _apply_retrieval(turn: _ChatTurn, retrieval_result: RetrievalResult, retrieval_started: float) -> None:
+    turn.context_texts = retrieval_result.context_texts
+    turn.references = retrieval_result.references
+    turn.history = retrieval_result.bounded_history
+    turn.events.extend(retrieval_result.events)
+    turn.latencies_ms["retrieval_ms"] = _elapsed_ms(retrieval_started)
+
+
+def _retrieval_failed(turn: _ChatTurn, retrieval_started: float) -> None:
+    turn.latencies_ms["retrieval_ms"] = _elapsed_ms(retrieval_started)
+    turn.events.append("retrieval.failed")
+    logger.exception("retrieval.failed", retrieval_ms=turn.latencies_ms["retrieval_ms"])
+
+
 class StreamingService:
     """Orchestrates a single streaming chat turn.
 
@@ -218,12 +252,7 @@ class StreamingService:
             },
         )
 
-    def stream(
-        self,
-        request: ChatRequest,
-        *,
-        vector_store: QdrantVectorStore | None = None,
-    ) -> StreamingResponse:
+    def _start_turn(self, request: ChatRequest) -> _ChatTurn:
         query = request.query.strip()
         if not query:
             raise HTTPException(status_code=400, detail="Query cannot be empty.")
@@ -252,37 +281,91 @@ class StreamingService:
         except RuntimeError as exc:
             raise HTTPException(status_code=502, detail=str(exc)) from exc
 
+        return _ChatTurn(
+            query=query,
+            started_at=started_at,
+            events=events,
+            latencies_ms=latencies_ms,
+            conversation_client=conversation_client,
+            conversation_id=conversation_id,
+            user_message_id=user_message_id,
+            assistant_message_id=assistant_message_id,
+            history=history,
+        )
+
+    def _agent_workflow_response(self, request: ChatRequest, turn: _ChatTurn) -> StreamingResponse:
+        return self._stream_agent_workflow(
+            request=request,
+            query=turn.query,
+            conversation_id=turn.conversation_id,
+            user_message_id=turn.user_message_id,
+            assistant_message_id=turn.assistant_message_id,
+            history=turn.history,
+            conversation_client=turn.conversation_client,
+            events=turn.events,
+            started_at=turn.started_at,
+        )
+
+    def stream(
+        self,
+        request: ChatRequest,
+        *,
+        vector_store: QdrantVectorStore | None = None,
+    ) -> StreamingResponse:
+        turn = self._start_turn(request)
+        if is_enabled("chat.agent_workflow"):
+            return self._agent_workflow_response(request, turn)
+
+        # ── Retrieval ─────────────────────────────────────────────────────────
+        if vector_store is not None:
+            retrieval_started = time.perf_counter()
+            try:
+                _apply_retrieval(turn, retriever.retrieve_context_result(
+                    vector_store, turn.query, request.user_id, request.k, request.role, turn.history,
+                ), retrieval_started)
+            except Exception:
+                _retrieval_failed(turn, retrieval_started)
+
+        return self._turn_response(request, turn)
+
+    async def astream(
+        self,
+        request: ChatRequest,
+        *,
+        vector_store: QdrantVectorStore | None = None,
+    ) -> StreamingResponse:
+        """Async variant of ``stream``: retrieval I/O is awaited on the event loop.
+
+        Conversation setup still talks to the backend through the blocking
+        client, so it runs in the threadpool.
+        """
+        turn = await run_in_threadpool(self._start_turn, request)
         if is_enabled("chat.agent_workflow"):
-            return self._stream_agent_workflow(
-                request=request,
-                query=query,
-                conversation_id=conversation_id,
-                user_message_id=user_message_id,
-                assistant_message_id=assistant_message_id,
-                history=history,
-                conversation_client=conversation_client,
-                events=events,
-                started_at=started_at,
-            )
+            return self._agent_workflow_response(request, turn)
 
         # ── Retrieval ─────────────────────────────────────────────────────────
-        context_texts: list[str] = []
-        references: list[dict[str, Any]] = []
         if vector_store is not None:
             retrieval_started = time.perf_counter()
             try:
-                retrieval_result = retriever.retrieve_context_result(
-                    vector_store, query, request.user_id, request.k, request.role, history,
-                )
-                context_texts = retrieval_result.context_texts
-                references = retrieval_result.references
-                history = retrieval_result.bounded_history
-                events.extend(retrieval_result.events)
-                latencies_ms["retrieval_ms"] = _elapsed_ms(retrieval_started)
+                _apply_retrieval(turn, await retriever.aretrieve_context_result(
+                    vector_store, turn.query, request.user_id, request.k, request.role, turn.history,
+                ), retrieval_started)
             except Exception:
-                latencies_ms["retrieval_ms"] = _elapsed_ms(retrieval_started)
-                events.append("retrieval.failed")
-                logger.exception("retrieval.failed", retrieval_ms=latencies_ms["retrieval_ms"])
+                _retrieval_failed(turn, retrieval_started)
+
+        return self._turn_response(request, turn)
+
+    def _turn_response(self, request: ChatRequest, turn: _ChatTurn) -> StreamingResponse:
+        query = turn.query
+        started_at = turn.started_at
+        events = turn.events
+        latencies_ms = turn.latencies_ms
+        conversation_id = turn.conversation_id
+        user_message_id = turn.user_message_id
+        assistant_message_id = turn.assistant_message_id
+        history = turn.history
+        context_texts = turn.context_texts
+        references = turn.references
 
         # ── Prompt assembly ───────────────────────────────────────────────────
         prompt_started = time.perf_counter()
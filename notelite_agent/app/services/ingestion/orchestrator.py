@@ -1,24 +1,59 @@
+import contextvars
 import time
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Optional
 
 from app.services.ingestion.processors.chunking.chunk_processor import ChunkProcessor
 from app.services.ingestion.processors.keywords import KeywordProcessor
 from app.services.ingestion.processors.ingest import ChunkBuilder, SummaryBuilder
+from app.services.ingestion.processors.ingest.models import DocumentSummary, IndexChunk, SummaryArtifacts
 from app.services.ingestion.processors.summary.summarization_pipeline import SummarizationPipeline
-from app.core.config import ACTIVE_SUMMARIZER_VERSION
+from app.core.config import (
+    ACTIVE_SUMMARIZER_VERSION,
+    INCREMENTAL_INGESTION,
+    INGESTION_PARALLEL_STAGES,
+)
 from app.logger import logger
 from app.services.ingestion.storage.vector_store import QdrantVectorStore
 from app.shared.utils import count_tokens
 from app.services.ingestion.processors.date_extractor import DateExtractor
-from app.services.ingestion.storage.postgres_store import PostgresArtifactStore
+from app.services.ingestion.storage.postgres_store import DocumentArtifacts, PostgresArtifactStore
 from app.db.postgres import DatabaseManager
+from app.services.ingestion.validators.dispatch_sequence import is_superseded_dispatch
 from app.services.ingestion.validators.request_version_validator import (
     fetch_note_version,
     is_stale_ingestion,
+    stale_ingestions,
 )
 
 
+@dataclass
+class _IndependentStages:
+    """Outputs and wall-clock timings of the stages that only read the chunk artifacts."""
+
+    chunk_events: list[str] = field(default_factory=list)
+    document_summary: DocumentSummary | None = None
+    dates: list[dict] = field(default_factory=list)
+    date_events: list[str] = field(default_factory=list)
+    chunk_indexing_ms: float = 0.0
+    summarization_ms: float = 0.0
+    date_extraction_ms: float = 0.0
+    overlap_ms: float = 0.0
+
+
+@dataclass
+class _PreparedDocument:
+    """A bulk-ingested note after its per-note stages, waiting for the batched writes."""
+
+    artifacts: DocumentArtifacts
+    index_chunks: list[IndexChunk]
+    summary_artifacts: SummaryArtifacts
+    api_calls: int = 0
+
+
 class IngestionOrchestrator:
     def __init__(self, vector_store: Optional[QdrantVectorStore] = None):
         self.chunk_processor = ChunkProcessor()
@@ -34,6 +69,10 @@ class IngestionOrchestrator:
         if action == "delete":
             return self.delete_action(payload)
 
+        # A newer dispatch for this note is already queued (autosave burst): exit
+        # before any chunking or LLM work and let that task do the ingestion.
+        if is_superseded_dispatch(payload):
+            return self._skipped_result(action, payload, reason="superseded_dispatch")
         if self._is_stale_upsert(payload):
             return self._skipped_result(action, payload)
 
@@ -53,8 +92,12 @@ class IngestionOrchestrator:
         chunking_end = time.perf_counter()
         events.extend(self.chunk_processor.events)
 
-        # Step 2: Extract keywords and entities from chunks
-        chunks_with_kw_ent, top_kw, top_ent = self.keyword_processor.process(chunks)
+        # Step 2: Extract keywords and entities from chunks. In incremental mode,
+        # chunks whose content fingerprint is unchanged reuse the stored terms.
+        cached_terms = self.postgres_store.chunk_terms(doc_id) if INCREMENTAL_INGESTION else None
+        chunks_with_kw_ent, top_kw, top_ent = self.keyword_processor.process(
+            chunks, cached_terms=cached_terms
+        )
         keywords_end = time.perf_counter()
         events.extend(self.keyword_processor.events)
 
@@ -64,19 +107,16 @@ class IngestionOrchestrator:
         document_build_end = time.perf_counter()
         events.extend(chunk_builder.events)
 
-        # Step 4: Replace and index chunk vectors before note-level summarization.
-        # Re-check freshness right before writing: steps 1-3 take seconds of LLM
-        # work, long enough for a newer version's task to have completed.
+        # Steps 4-5: index chunk vectors, summarize, and extract dates. The three
+        # only read the chunk artifacts, so INGESTION_PARALLEL_STAGES runs them
+        # concurrently. Re-check freshness before any of them starts: steps 1-3
+        # take seconds of LLM work, long enough for a newer version's task to
+        # have completed, and a stale task must not pay for summarization too.
         if self._is_stale_upsert(payload):
             return self._skipped_result(action, payload, stage="pre_chunk_write")
-        self.vector_store.replace_index_chunks(doc_id, index_chunks)
-        chunk_ingestion_end = time.perf_counter()
-        events.extend(self.vector_store.events)
-        self.vector_store.events = []
-
-        # Step 5: Summarize enriched chunk text and generate questions
-        document_summary = self.summarization_pipeline.run(index_chunks)
-        summary_end = time.perf_counter()
+        stages = self._run_independent_stages(payload, doc_id, index_chunks)
+        document_summary = stages.document_summary
+        events.extend(stages.chunk_events)
         events.extend(document_summary.events)
 
         # Step 6: Build and index summary/question artifacts. Re-check freshness
@@ -85,17 +125,21 @@ class IngestionOrchestrator:
         # replace overwrites them — so stop before writing summary artifacts.
         if self._is_stale_upsert(payload):
             return self._skipped_result(action, payload, stage="pre_summary_write")
+        summary_build_start = time.perf_counter()
         summary_builder = SummaryBuilder(payload, doc_id, top_kw, top_ent)
         summary_artifacts = summary_builder.build(document_summary)
         events.extend(summary_builder.events)
         summary_build_end = time.perf_counter()
         self.vector_store.upsert_summary_artifacts(summary_artifacts)
-        created_at = payload.get("created_at") or datetime.now(timezone.utc)
-        timezone_name = self.postgres_store.user_timezone(str(payload.get("user_id")))
-        date_extractor = DateExtractor()
-        dates = date_extractor.extract(index_chunks, created_at, timezone_name)
-        self.postgres_store.replace_document(payload, doc_id, index_chunks, document_summary.summary, dates)
-        events.extend(date_extractor.events)
+        self.postgres_store.replace_document(
+            payload,
+            doc_id,
+            index_chunks,
+            document_summary.summary,
+            stages.dates,
+            chunk_terms=self.keyword_processor.chunk_terms if INCREMENTAL_INGESTION else None,
+        )
+        events.extend(stages.date_events)
         events.append("postgres retrieval artifacts replaced")
         doc_ingestion_end = time.perf_counter()
         events.extend(self.vector_store.events)
@@ -127,8 +171,11 @@ class IngestionOrchestrator:
                 "keyword_extraction": round((keywords_end - chunking_end) * 1000, 2),
                 "summary": self.summarization_pipeline.summary_ms,
                 "questions": self.summarization_pipeline.questions_ms,
-                "document_build": round(((document_build_end - keywords_end) + (summary_build_end - summary_end)) * 1000, 2),
-                "document_ingestion": round(((chunk_ingestion_end - document_build_end) + (doc_ingestion_end - summary_build_end)) * 1000, 2),
+                "document_build": round(((document_build_end - keywords_end) + (summary_build_end - summary_build_start)) * 1000, 2),
+                "document_ingestion": round(stages.chunk_indexing_ms + (doc_ingestion_end - summary_build_end) * 1000, 2),
+                "chunk_indexing": stages.chunk_indexing_ms,
+                "date_extraction": stages.date_extraction_ms,
+                "overlap": stages.overlap_ms,
                 "total": round((doc_ingestion_end - start) * 1000, 2),
             },
             "summary": document_summary.summary
@@ -155,11 +202,212 @@ class IngestionOrchestrator:
             questions_ms=stages_ms["questions"],
             document_build_ms=stages_ms["document_build"],
             document_ingestion_ms=stages_ms["document_ingestion"],
+            chunk_indexing_ms=stages_ms["chunk_indexing"],
+            date_extraction_ms=stages_ms["date_extraction"],
+            stage_overlap_ms=stages_ms["overlap"],
             total_ms=stages_ms["total"],
             events=events,
         )
         return result
 
+    def _run_independent_stages(
+        self, payload: dict, doc_id: str, index_chunks: list[IndexChunk]
+    ) -> _IndependentStages:
+        """Run chunk indexing, summarization, and date extraction, in parallel when enabled."""
+        stages = _IndependentStages()
+        branches = (
+            lambda: self._index_chunks(doc_id, index_chunks, stages),
+            lambda: self._summarize(index_chunks, stages),
+            lambda: self._extract_dates(payload, index_chunks, stages),
+        )
+        section_start = time.perf_counter()
+        if INGESTION_PARALLEL_STAGES:
+            with ThreadPoolExecutor(max_workers=len(branches), thread_name_prefix="ingestion-stage") as executor:
+                # Copy the context per branch so trace ids bound by the task reach their logs.
+                futures = [executor.submit(contextvars.copy_context().run, branch) for branch in branches]
+            for future in futures:
+                future.result()
+        else:
+            for branch in branches:
+                branch()
+        section_ms = (time.perf_counter() - section_start) * 1000
+        stages.overlap_ms = round(
+            max(0.0, stages.chunk_indexing_ms + stages.summarization_ms + stages.date_extraction_ms - section_ms), 2
+        )
+        return stages
+
+    def _index_chunks(self, doc_id: str, index_chunks: list[IndexChunk], stages: _IndependentStages) -> None:
+        started = time.perf_counter()
+        self.vector_store.replace_index_chunks(doc_id, index_chunks)
+        stages.chunk_events = list(self.vector_store.events)
+        self.vector_store.events = []
+        stages.chunk_indexing_ms = round((time.perf_counter() - started) * 1000, 2)
+
+    def _summarize(self, index_chunks: list[IndexChunk], stages: _IndependentStages) -> None:
+        started = time.perf_counter()
+        stages.document_summary = self.summarization_pipeline.run(index_chunks)
+        stages.summarization_ms = round((time.perf_counter() - started) * 1000, 2)
+
+    def _extract_dates(
+        self, payload: dict, index_chunks: list[IndexChunk], stages: _IndependentStages
+    ) -> None:
+        started = time.perf_counter()
+        created_at = payload.get("created_at") or datetime.now(timezone.utc)
+        timezone_name = self.postgres_store.user_timezone(str(payload.get("user_id")))
+        date_extractor = DateExtractor()
+        stages.dates = date_extractor.extract(index_chunks, created_at, timezone_name)
+        stages.date_events = list(date_extractor.events)
+        stages.date_extraction_ms = round((time.perf_counter() - started) * 1000, 2)
+
+    def run_bulk(self, payloads: Sequence[dict]) -> dict:
+        """Ingest many notes with batched freshness checks and storage writes.
+
+        Chunking, keyword extraction, summarization, and date extraction still
+        run per note. Freshness is checked with one version query for the whole
+        batch before and after that work, then the surviving notes share
+        embedding requests, Qdrant upserts, and one multi-row PostgreSQL
+        transaction. Delete payloads go through ``delete_action``; a payload
+        with invalid identity fields fails alone without failing the batch.
+        """
+        start = time.perf_counter()
+        events = [f"bulk ingestion started: {len(payloads)} notes"]
+        skipped: list[dict] = []
+        failed: list[dict] = []
+        deleted = 0
+        upserts = []
+        for payload in self._latest_per_note([self._payload(item) for item in payloads], skipped):
+            if payload.get("action", "upsert") == "delete":
+                if self.delete_action(payload)["status"] == "deleted":
+                    deleted += 1
+            elif is_superseded_dispatch(payload):
+                skipped.append(self._skipped_result("upsert", payload, reason="superseded_dispatch"))
+            else:
+                upserts.append(payload)
+
+        prepared = []
+        for payload in self._fresh_upserts(upserts, skipped, stage="pre_pipeline"):
+            try:
+                prepared.append(self._prepare_document(payload))
+            except ValueError as exc:
+                logger.warning("ingestion.failed", action="upsert", note_id=payload.get("note_id"), error_type=type(exc).__name__)
+                failed.append({"note_id": payload.get("note_id"), "error": str(exc)})
+        preparation_end = time.perf_counter()
+
+        # The per-note stages take seconds of LLM work each, so re-check the
+        # whole batch once before writing anything.
+        fresh_payloads = self._fresh_upserts([document.artifacts.payload for document in prepared], skipped, stage="pre_write")
+        fresh_ids = {id(payload) for payload in fresh_payloads}
+        prepared = [document for document in prepared if id(document.artifacts.payload) in fresh_ids]
+
+        self.vector_store.replace_index_chunks_bulk(
+            {document.artifacts.doc_id: document.index_chunks for document in prepared}
+        )
+        chunk_indexing_end = time.perf_counter()
+        events.extend(self.vector_store.events)
+        self.vector_store.events = []
+        self.vector_store.upsert_summary_artifacts_bulk([document.summary_artifacts for document in prepared])
+        summary_indexing_end = time.perf_counter()
+        events.extend(self.vector_store.events)
+        self.postgres_store.replace_documents([document.artifacts for document in prepared])
+        end = time.perf_counter()
+        events.append(f"postgres retrieval artifacts replaced: {len(prepared)} documents")
+        events.append("bulk ingestion completed")
+
+        total_seconds = end - start
+        result = {
+            "action": "bulk_upsert",
+            "status": "processed",
+            "requested": len(payloads),
+            "processed": len(prepared),
+            "deleted": deleted,
+            "skipped": skipped,
+            "failed": failed,
+            "chunk_count": sum(len(document.index_chunks) for document in prepared),
+            "api_calls": sum(document.api_calls for document in prepared),
+            "notes_per_second": round((len(prepared) + deleted) / total_seconds, 2) if total_seconds > 0 else 0.0,
+            "events": events,
+            "stages_ms": {
+                "preparation": round((preparation_end - start) * 1000, 2),
+                "chunk_indexing": round((chunk_indexing_end - preparation_end) * 1000, 2),
+                "summary_indexing": round((summary_indexing_end - chunk_indexing_end) * 1000, 2),
+                "postgres": round((end - summary_indexing_end) * 1000, 2),
+                "total": round(total_seconds * 1000, 2),
+            },
+        }
+        logger.info(
+            "ingestion.bulk_completed",
+            requested=result["requested"],
+            processed=result["processed"],
+            deleted=deleted,
+            skipped=len(skipped),
+            failed=len(failed),
+            chunk_count=result["chunk_count"],
+            llm_calls_total=result["api_calls"],
+            notes_per_second=result["notes_per_second"],
+            **{f"{stage}_ms": value for stage, value in result["stages_ms"].items()},
+        )
+        return result
+
+    def _prepare_document(self, payload: dict) -> _PreparedDocument:
+        """Run the per-note stages of ``run`` without writing anything."""
+        doc_id = self._doc_id(payload)
+        chunks = self.chunk_processor.process(payload.get("text") or "")
+        cached_terms = self.postgres_store.chunk_terms(doc_id) if INCREMENTAL_INGESTION else None
+        chunks_with_kw_ent, top_kw, top_ent = self.keyword_processor.process(chunks, cached_terms=cached_terms)
+        index_chunks = ChunkBuilder(payload, doc_id).build(chunks_with_kw_ent)
+        stages = _IndependentStages()
+        self._summarize(index_chunks, stages)
+        self._extract_dates(payload, index_chunks, stages)
+        document_summary = stages.document_summary
+        return _PreparedDocument(
+            artifacts=DocumentArtifacts(
+                payload=payload,
+                doc_id=doc_id,
+                chunks=index_chunks,
+                summary=document_summary.summary,
+                dates=stages.dates,
+                chunk_terms=dict(self.keyword_processor.chunk_terms) if INCREMENTAL_INGESTION else None,
+            ),
+            index_chunks=index_chunks,
+            summary_artifacts=SummaryBuilder(payload, doc_id, top_kw, top_ent).build(document_summary),
+            api_calls=(
+                self.keyword_processor.api_calls
+                + document_summary.summary_api_calls
+                + document_summary.question_api_calls
+            ),
+        )
+
+    def _fresh_upserts(self, payloads: list[dict], skipped: list[dict], stage: str) -> list[dict]:
+        """Drop stale upserts (recording them in ``skipped``) with one version query."""
+        versioned = [payload for payload in payloads if self._has_version_keys(payload)]
+        stale_ids = set()
+        if versioned:
+            with DatabaseManager.get_session_factory()() as session:
+                stale = stale_ingestions(versioned, session)
+            stale_ids = {id(payload) for payload, is_stale in zip(versioned, stale) if is_stale}
+        fresh = []
+        for payload in payloads:
+            if id(payload) in stale_ids:
+                skipped.append(self._skipped_result("upsert", payload, stage=stage))
+            else:
+                fresh.append(payload)
+        return fresh
+
+    def _latest_per_note(self, payloads: list[dict], skipped: list[dict]) -> list[dict]:
+        """Keep one payload per note: the highest version, the later one on a tie."""
+        latest: dict[tuple, dict] = {}
+        for payload in payloads:
+            key = (payload.get("user_id"), payload.get("note_id"))
+            current = latest.get(key)
+            if current is not None and (current.get("version") or -1) > (payload.get("version") or -1):
+                payload, current = current, payload
+            if current is not None:
+                skipped.append(self._skipped_result(
+                    current.get("action", "upsert"), current, reason="duplicate_in_batch"
+                ))
+            latest[key] = payload
+        return list(latest.values())
+
     def delete_action(self, payload: dict) -> dict:
         if self._is_stale_delete(payload):
             return self._skipped_result("delete", payload)
@@ -175,19 +423,21 @@ class IngestionOrchestrator:
         logger.info("ingestion.deleted", note_id=result["note_id"])
         return result
 
-    def _skipped_result(self, action: str, payload: dict, stage: str = "pre_pipeline") -> dict:
+    def _skipped_result(
+        self, action: str, payload: dict, stage: str = "pre_pipeline", reason: str = "stale_version"
+    ) -> dict:
         logger.info(
             "ingestion.skipped",
             action=action,
             note_id=payload.get("note_id"),
-            reason="stale_version",
+            reason=reason,
             stage=stage,
         )
         return {
             "action": action,
             "status": "skipped",
             "note_id": payload.get("note_id"),
-            "reason": "stale_version",
+            "reason": reason,
             "stage": stage,
         }
 
@@ -33,8 +33,8 @@ def _split_leading_heading_prefix(text: str) -> tuple[str, str]:
     return "\n\n".join(headings), "\n".join(lines[body_start:]).strip()
 
 
-def _keyword_skip_reason(content: str) -> str:
-    if token_count(content) < KEYWORD_MIN_CHUNK_TOKENS:
+def _keyword_skip_reason(tokens: int) -> str:
+    if tokens < KEYWORD_MIN_CHUNK_TOKENS:
         return "short_chunk"
     return ""
 
@@ -73,11 +73,19 @@ class ChunkProcessor:
         chunks = split_into_typed_chunks(normalized_text)
         self.events.append(f"chunking structural split: {len(chunks)} chunks")
 
+        # Every content chunk's prose is embedded in one request before splitting.
+        prose_chunks = {
+            index: _split_leading_heading_prefix(chunk)
+            for index, (chunk, chunk_type) in enumerate(chunks)
+            if chunk_type == ChunkType.CONTENT.value
+        }
+        self.semantic_chunker.prepare([prose for _, prose in prose_chunks.values() if prose])
+
         expanded: list[tuple[str, str]] = []
         semantic_split_count = 0
-        for chunk, chunk_type in chunks:
-            if chunk_type == ChunkType.CONTENT.value:
-                heading_prefix, prose = _split_leading_heading_prefix(chunk)
+        for index, (chunk, chunk_type) in enumerate(chunks):
+            if index in prose_chunks:
+                heading_prefix, prose = prose_chunks[index]
                 parts = self.semantic_chunker.split_prose(prose) if prose else []
                 if not parts:
                     expanded.append((chunk, chunk_type))
@@ -175,7 +183,8 @@ class ChunkProcessor:
         total_chunks = len(merged)
         final_chunks = []
         for index, chunk in enumerate(merged):
-            skip_keywords_reason = _keyword_skip_reason(chunk.content)
+            tokens = token_count(chunk.content)
+            skip_keywords_reason = _keyword_skip_reason(tokens)
             final_chunks.append(
                 TextChunk(
                     content=chunk.content,
@@ -184,7 +193,7 @@ class ChunkProcessor:
                     metadata={
                         **chunk.metadata,
                         "has_heading_context": bool(chunk.metadata.get("heading_context")),
-                        "token_count": token_count(chunk.content),
+                        "token_count": tokens,
                         "char_count": len(chunk.content),
                         "skip_keywords": bool(skip_keywords_reason),
                         "skip_keywords_reason": skip_keywords_reason,
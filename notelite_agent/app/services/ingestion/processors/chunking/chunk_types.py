@@ -3,24 +3,25 @@ from __future__ import annotations
 from collections.abc import Callable
 from dataclasses import dataclass
 from enum import StrEnum
+from functools import lru_cache
 
 from app.services.ingestion.processors.chunking.chunk_type_rules import (
-    is_address_type,
-    is_appendix_type,
-    is_contact_type,
-    is_faq_type,
-    is_fenced_code_type,
-    is_fenced_json_type,
-    is_glossary_type,
-    is_heading_only_type,
-    is_json_type,
-    is_list_type,
-    is_quote_type,
-    is_raw_code_type,
-    is_structured_list_type,
-    is_table_type,
-    is_transcript_type,
-    without_leading_heading,
+    ChunkLines,
+    address,
+    appendix,
+    bullet_list,
+    contact,
+    faq,
+    fenced_code,
+    fenced_json,
+    glossary,
+    heading_only,
+    json_block,
+    quote,
+    raw_code,
+    structured_list,
+    table,
+    transcript,
 )
 
 
@@ -41,7 +42,10 @@ class ChunkType(StrEnum):
     STRUCTURED_LIST = "structured_list"
 
 
-RulePredicate = Callable[[str, str], bool]
+RulePredicate = Callable[[ChunkLines], bool]
+
+# Chunkers classify the same text several times (document, block, emitted chunk).
+CLASSIFICATION_CACHE_SIZE = 4096
 
 
 @dataclass(frozen=True)
@@ -51,39 +55,41 @@ class ChunkTypeRule:
 
 
 CHUNK_TYPE_RULES: tuple[ChunkTypeRule, ...] = (
-    ChunkTypeRule(ChunkType.HEADING_ONLY, is_heading_only_type),
-    ChunkTypeRule(ChunkType.JSON, is_fenced_json_type),
-    ChunkTypeRule(ChunkType.CODE, is_fenced_code_type),
-    ChunkTypeRule(ChunkType.JSON, is_json_type),
-    ChunkTypeRule(ChunkType.CODE, is_raw_code_type),
-    ChunkTypeRule(ChunkType.TABLE, is_table_type),
-    ChunkTypeRule(ChunkType.FAQ, is_faq_type),
-    ChunkTypeRule(ChunkType.TRANSCRIPT, is_transcript_type),
+    ChunkTypeRule(ChunkType.HEADING_ONLY, heading_only),
+    ChunkTypeRule(ChunkType.JSON, fenced_json),
+    ChunkTypeRule(ChunkType.CODE, fenced_code),
+    ChunkTypeRule(ChunkType.JSON, json_block),
+    ChunkTypeRule(ChunkType.CODE, raw_code),
+    ChunkTypeRule(ChunkType.TABLE, table),
+    ChunkTypeRule(ChunkType.FAQ, faq),
+    ChunkTypeRule(ChunkType.TRANSCRIPT, transcript),
     # Quote before glossary — em-dash attribution lines overlap
-    ChunkTypeRule(ChunkType.QUOTE, is_quote_type),
+    ChunkTypeRule(ChunkType.QUOTE, quote),
     # Contact before address — address handler excludes contact internally
-    ChunkTypeRule(ChunkType.CONTACT, is_contact_type),
-    ChunkTypeRule(ChunkType.ADDRESS, is_address_type),
-    ChunkTypeRule(ChunkType.APPENDIX, is_appendix_type),
-    ChunkTypeRule(ChunkType.GLOSSARY, is_glossary_type),
-    ChunkTypeRule(ChunkType.STRUCTURED_LIST, is_structured_list_type),
-    ChunkTypeRule(ChunkType.LIST, is_list_type),
+    ChunkTypeRule(ChunkType.CONTACT, contact),
+    ChunkTypeRule(ChunkType.ADDRESS, address),
+    ChunkTypeRule(ChunkType.APPENDIX, appendix),
+    ChunkTypeRule(ChunkType.GLOSSARY, glossary),
+    ChunkTypeRule(ChunkType.STRUCTURED_LIST, structured_list),
+    ChunkTypeRule(ChunkType.LIST, bullet_list),
 )
 
 
+@lru_cache(maxsize=CLASSIFICATION_CACHE_SIZE)
 def classify_chunk_type(chunk: str) -> ChunkType:
     """
     Classify a chunk of text into a ChunkType.
+    Lines are split once and shared by every rule; the first matching rule wins.
     Returns ChunkType.CONTENT as the default fallback.
     """
     text = chunk.strip()
     if not text:
         return ChunkType.CONTENT
 
-    body = without_leading_heading(text)
+    lines = ChunkLines(text)
 
     for rule in CHUNK_TYPE_RULES:
-        if rule.matches(text, body):
+        if lines.check(rule.matches):
             return rule.chunk_type
 
-    return ChunkType.CONTENT
\ No newline at end of file
+    return ChunkType.CONTENT
@@ -3,9 +3,9 @@ from __future__ import annotations
 import logging
 import time
 
-from llama_index.core import Document as LlamaDocument
+from collections.abc import Sequence
+
 from llama_index.core import Settings
-from llama_index.core.node_parser import SemanticSplitterNodeParser
 
 from app.core.config import (
     BREAKPOINT_PERCENTILE,
@@ -13,7 +13,8 @@ from app.core.config import (
     SEMANTIC_CHUNKING_FAILURE_COOLDOWN,
     SEMANTIC_CHUNKING_TIMEOUT,
 )
-from app.core.embeddings import RemoteEmbeddingService, RemoteOpenAIEmbedding
+from app.core.embeddings import RemoteEmbeddingService, RemoteOpenAIEmbedding, SharedEmbeddingClient
+from app.services.ingestion.processors.chunking.semantic_splitter import SemanticSplitter, sentence_pieces
 from app.services.ingestion.processors.chunking.token_budget import token_count, within_chunk_budget
 from app.services.ingestion.processors.chunking.validators import (
     is_fenced_code_block,
@@ -31,10 +32,22 @@ class SemanticChunker:
     _remote_disabled_until = 0.0
 
     def __init__(self, window_chunker: WindowChunker | None = None):
-        self._splitter: SemanticSplitterNodeParser | None = None
+        self._splitter: SemanticSplitter | None = None
         self._window_chunker = window_chunker or WindowChunker()
+        self._prepared: dict[str, tuple[list[str], list[str]]] = {}
         self.events: list[str] = []
 
+    def prepare(self, texts: Sequence[str]) -> None:
+        """Semantically split every prose text ``split_prose`` will receive, in one embedding request."""
+        pending: dict[str, list[str]] = {}
+        for text in texts:
+            clean = text.strip()
+            if clean not in pending and (sentences := self._prose_sentences(clean)):
+                pending[clean] = sentences
+        sections = [sentence_pieces(clean, sentences) for clean, sentences in pending.items()]
+        groups = self._semantic_split_many(sections) if sections else []
+        self._prepared = {clean: (sentences, parts) for (clean, sentences), parts in zip(pending.items(), groups)}
+
     def split(self, text: str) -> list[str]:
         clean = text.strip()
         if not clean:
@@ -48,7 +61,8 @@ class SemanticChunker:
                 parts.append(segment.strip())
                 continue
 
-            semantic_parts = self._semantic_split(segment)
+            sentences = self._window_chunker._split_sentences(segment)
+            semantic_parts = self._semantic_split_many([sentence_pieces(segment, sentences)])[0]
             if not semantic_parts:
                 semantic_parts = [segment]
 
@@ -63,19 +77,18 @@ class SemanticChunker:
         if not clean:
             return []
 
-        soft_limit = max(1, MAX_CHUNK_SIZE // 16)
-        if token_count(clean) <= soft_limit:
-            return [clean]
-
-        sentences = self._window_chunker._split_sentences(clean)
-        minimum_semantic_sentences = max(6, MAX_CHUNK_SIZE // 120)
-        if len(sentences) < minimum_semantic_sentences:
-            return [clean]
-
-        semantic_parts = self._semantic_split(clean)
+        prepared = self._prepared.pop(clean, None)
+        if prepared is not None:
+            sentences, semantic_parts = prepared
+        else:
+            sentences = self._prose_sentences(clean)
+            if not sentences:
+                return [clean]
+            semantic_parts = self._semantic_split_many([sentence_pieces(clean, sentences)])[0]
         if len(semantic_parts) > 1:
             return semantic_parts
 
+        soft_limit = max(1, MAX_CHUNK_SIZE // 16)
         local_limit = max(soft_limit, (token_count(clean) + 2) // 3)
         parts: list[str] = []
         current: list[str] = []
@@ -96,19 +109,35 @@ class SemanticChunker:
                 parts[-2:] = [candidate]
         return parts
 
-    def _semantic_split(self, text: str) -> list[str]:
+    def _prose_sentences(self, clean: str) -> list[str]:
+        """Sentences of prose substantial enough to split semantically, else an empty list."""
+        if not clean or token_count(clean) <= max(1, MAX_CHUNK_SIZE // 16):
+            return []
+        sentences = self._window_chunker._split_sentences(clean)
+        minimum_semantic_sentences = max(6, MAX_CHUNK_SIZE // 120)
+        if len(sentences) < minimum_semantic_sentences:
+            return []
+        return sentences
+
+    def _semantic_split_many(self, sections: list[list[str]]) -> list[list[str]]:
         if time.monotonic() < type(self)._remote_disabled_until:
             event = "semantic chunking skipped: failure cooldown"
             if event not in self.events:
                 self.events.append(event)
-            return []
+            return [[] for _ in sections]
 
         try:
             splitter = self._get_splitter()
-            nodes = splitter.get_nodes_from_documents([LlamaDocument(text=text)])
-            parts = [node.get_content().strip() for node in nodes if node.get_content().strip()]
-            self.events.append(f"semantic chunking completed: {len(parts)} parts")
-            return parts
+            groups = splitter.split(sections)
+            self.events.append(
+                f"semantic chunking embedded: {sum(map(len, sections))} sentences from {len(sections)} sections"
+            )
+            results = []
+            for parts in groups:
+                parts = [part.strip() for part in parts if part.strip()]
+                self.events.append(f"semantic chunking completed: {len(parts)} parts")
+                results.append(parts)
+            return results
         except Exception as exc:
             type(self)._remote_disabled_until = time.monotonic() + SEMANTIC_CHUNKING_FAILURE_COOLDOWN
             self.events.append(f"semantic chunking failed: {type(exc).__name__}; local fallback")
@@ -117,23 +146,25 @@ class SemanticChunker:
                 type(exc).__name__,
                 SEMANTIC_CHUNKING_FAILURE_COOLDOWN,
             )
-            return []
+            return [[] for _ in sections]
 
-    def _get_splitter(self) -> SemanticSplitterNodeParser:
+    def _get_splitter(self) -> SemanticSplitter:
         if self._splitter is None:
             configured_model = getattr(Settings, "embed_model", None)
             if not configured_model:
                 raise RuntimeError("No initialized embedding model is available for semantic chunking.")
 
-            service = RemoteEmbeddingService(timeout=SEMANTIC_CHUNKING_TIMEOUT)
-            embed_model = (
-                RemoteOpenAIEmbedding(service=service)
-                if service.enabled and isinstance(configured_model, RemoteOpenAIEmbedding)
-                else configured_model
+            # The remote path goes through the shared embedding cache, so
+            # re-ingesting an unchanged section costs no embedding call.
+            client = SharedEmbeddingClient(remote_service=RemoteEmbeddingService(timeout=SEMANTIC_CHUNKING_TIMEOUT))
+            embed = (
+                client.embed_dense_documents
+                if client.use_remote and isinstance(configured_model, RemoteOpenAIEmbedding)
+                else configured_model.get_text_embedding_batch
             )
-            self._splitter = SemanticSplitterNodeParser(
-                embed_model=embed_model,
-                breakpoint_percentile_threshold=BREAKPOINT_PERCENTILE,
+            self._splitter = SemanticSplitter(
+                embed,
+                breakpoint_percentile=BREAKPOINT_PERCENTILE,
                 buffer_size=1,
             )
         return self._splitter
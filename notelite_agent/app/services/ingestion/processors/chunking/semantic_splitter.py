@@ -0,0 +1,104 @@
+"""Percentile-breakpoint semantic splitting over sentence-window embeddings.
+
+Same method as LlamaIndex's ``SemanticSplitterNodeParser``: every sentence is
+embedded together with ``buffer_size`` neighbours on each side, consecutive
+windows are compared by cosine distance, and a section breaks after every
+distance above its ``breakpoint_percentile``. The difference is cost: the
+windows of every section in a document go to the embedding backend in one
+call, and all distances come from one NumPy pass over the stacked matrix.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+
+import numpy as np
+
+from app.core.config import BREAKPOINT_PERCENTILE
+
+
+EmbedBatch = Callable[[list[str]], Sequence[Sequence[float]]]
+
+
+def sentence_pieces(text: str, sentences: Sequence[str]) -> list[str]:
+    """``sentences`` as consecutive slices of ``text``, each with the whitespace after it.
+
+    Groups of pieces join back with "" into the section's own text, line and
+    paragraph breaks included. A sentence not found in ``text`` falls back to
+    single spaces between sentences.
+    """
+    starts: list[int] = []
+    position = 0
+    for sentence in sentences:
+        start = text.find(sentence, position)
+        if start < 0:
+            return [f"{sentence} " for sentence in sentences]
+        starts.append(start)
+        position = start + len(sentence)
+    return [text[start:stop] for start, stop in zip(starts, [*starts[1:], len(text)])]
+
+
+def sentence_windows(sentences: Sequence[str], buffer_size: int = 1) -> list[str]:
+    """Each sentence joined with up to ``buffer_size`` neighbours on either side."""
+    stripped = [sentence.strip() for sentence in sentences]
+    return [
+        " ".join(stripped[max(0, index - buffer_size): index + buffer_size + 1])
+        for index in range(len(stripped))
+    ]
+
+
+def neighbour_distances(vectors: np.ndarray) -> np.ndarray:
+    """Cosine distance between each row and the next one."""
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    unit = vectors / np.where(norms == 0, 1, norms)
+    return 1.0 - np.einsum("ij,ij->i", unit[:-1], unit[1:])
+
+
+def breakpoint_groups(sentences: Sequence[str], distances: np.ndarray, percentile: float) -> list[str]:
+    """Join sentence pieces into groups, breaking after distances above the percentile.
+
+    Pieces are joined as they are, so pieces from ``sentence_pieces`` keep the
+    section's original whitespace.
+    """
+    if not sentences:
+        return []
+    if len(distances) == 0:
+        return ["".join(sentences)]
+    threshold = np.percentile(distances, percentile)
+    cuts = [0, *(np.flatnonzero(distances > threshold) + 1).tolist(), len(sentences)]
+    return ["".join(sentences[start:stop]) for start, stop in zip(cuts, cuts[1:])]
+
+
+class SemanticSplitter:
+    """Split many sentence lists with one embedding request."""
+
+    def __init__(
+        self,
+        embed: EmbedBatch,
+        breakpoint_percentile: float = BREAKPOINT_PERCENTILE,
+        buffer_size: int = 1,
+    ):
+        self.embed = embed
+        self.breakpoint_percentile = breakpoint_percentile
+        self.buffer_size = buffer_size
+
+    def split(self, sections: Sequence[Sequence[str]]) -> list[list[str]]:
+        """Semantic groups for each section's sentence pieces, in input order."""
+        windows = [sentence_windows(sentences, self.buffer_size) for sentences in sections]
+        texts = [window for section in windows for window in section]
+        if not texts:
+            return [[] for _ in sections]
+
+        vectors = np.asarray(self.embed(texts), dtype=np.float32)
+        if vectors.ndim != 2 or len(vectors) != len(texts):
+            raise ValueError(f"Embedding backend returned {len(vectors)} vectors for {len(texts)} sentence windows.")
+
+        # Distances across the seam between two sections are computed and skipped.
+        distances = neighbour_distances(vectors)
+        groups: list[list[str]] = []
+        offset = 0
+        for sentences in sections:
+            count = len(sentences)
+            section_distances = distances[offset: offset + max(0, count - 1)]
+            groups.append(breakpoint_groups(sentences, section_distances, self.breakpoint_percentile))
+            offset += count
+        return groups
@@ -17,6 +17,10 @@ def within_chunk_budget(text: str) -> bool:
     return token_count(text) <= MAX_CHUNK_SIZE
 
 
+def encode(text: str) -> list[int]:
+    return _ENCODER.encode(text)
+
+
 def split_by_token_window(text: str, overlap_tokens: int | None = None) -> list[str]:
     clean = text.strip()
     if not clean:
@@ -25,7 +29,11 @@ def split_by_token_window(text: str, overlap_tokens: int | None = None) -> list[
     tokens = _ENCODER.encode(clean)
     if len(tokens) <= MAX_CHUNK_SIZE:
         return [clean]
+    return split_token_ids(tokens, overlap_tokens)
+
 
+def split_token_ids(tokens: list[int], overlap_tokens: int | None = None) -> list[str]:
+    """Decode ``MAX_CHUNK_SIZE`` windows of already encoded text."""
     requested_overlap = CHUNK_OVERLAP if overlap_tokens is None else overlap_tokens
     overlap = max(0, min(requested_overlap, max(0, MAX_CHUNK_SIZE - 1)))
     step = max(1, MAX_CHUNK_SIZE - overlap)
@@ -1,8 +1,10 @@
 import re
 
 from app.core.config import MAX_CHUNK_SIZE
+from app.services.ingestion.processors import nlp_models
 from app.services.ingestion.processors.chunking.token_budget import (
-    split_by_token_window,
+    encode,
+    split_token_ids,
     token_count,
     within_chunk_budget,
 )
@@ -14,9 +16,6 @@ from app.services.ingestion.processors.chunking.validators import (
 )
 
 
-_sentencizer = None
-
-
 class WindowChunker:
     """Final size splitter using sentence-aware and table-aware boundaries."""
 
@@ -51,33 +50,25 @@ class WindowChunker:
         return parts
 
     def _merge_sentence_windows(self, sentences: list[str]) -> list[str]:
+        """Greedily pack sentences into windows, counting one token per joining space."""
         parts = []
         current = []
         current_len = 0
 
         for sentence in sentences:
-            sentence_len = token_count(sentence)
-            separator_len = 1 if current else 0
+            sentence_len = len(encode(sentence))
 
-            if current and current_len + separator_len + sentence_len > MAX_CHUNK_SIZE:
+            if current and current_len + 1 + sentence_len > MAX_CHUNK_SIZE:
                 parts.append(" ".join(current).strip())
                 current = []
                 current_len = 0
 
-            if not current:
-                current = [sentence]
-                current_len = sentence_len
-            elif current_len + 1 + sentence_len <= MAX_CHUNK_SIZE:
+            if current:
                 current.append(sentence)
                 current_len += 1 + sentence_len
             else:
-                if sentence_len <= MAX_CHUNK_SIZE:
-                    current = [sentence]
-                    current_len = sentence_len
-                else:
-                    parts.extend(self._hard_split(sentence))
-                    current = []
-                    current_len = 0
+                current = [sentence]
+                current_len = sentence_len
 
         if current:
             parts.append(" ".join(current).strip())
@@ -85,28 +76,59 @@ class WindowChunker:
         return [part for part in parts if part]
 
     def _split_table_rows(self, text: str) -> list[str]:
-        parts: list[str] = []
-        current: list[str] = []
+        """Pack rows into budgeted windows, repeating the header after each break.
+
+        Each window's token count is a running total of its rows, each row
+        encoded once alone and once with its line break. A row starting with
+        a non-space character always starts a new cl100k pre-token, so a
+        joined window has exactly the tokens of its rows with line breaks
+        plus those of its last row alone. Tables with indented rows break
+        that identity and fall back to counting the joined window.
+        """
+        rows = [line.rstrip() for line in text.splitlines() if line.strip()]
         header_context = self._table_header_context(text)
+        additive = not any(row[:1].isspace() for row in rows)
+        row_tokens: dict[str, tuple[int, int]] = {}
+
+        def measure(row: str) -> tuple[int, int]:
+            """Tokens of the row alone and followed by a line break."""
+            if row not in row_tokens:
+                row_tokens[row] = (len(encode(row)), len(encode(row + "\n")))
+            return row_tokens[row]
 
-        for line in [line.rstrip() for line in text.splitlines() if line.strip()]:
-            candidate_lines = [*current, line]
-            candidate = "\n".join(candidate_lines).strip()
-            if current and not within_chunk_budget(candidate):
-                parts.append("\n".join(current).strip())
+        def window_tokens(window: list[str]) -> int:
+            if not additive:
+                return token_count("\n".join(window).strip())
+            return sum(measure(row)[1] for row in window[:-1]) + measure(window[-1])[0]
+
+        parts: list[tuple[str, int]] = []
+        current: list[str] = []
+        # Tokens of every row in ``current`` followed by its line break.
+        prefix_tokens = 0
+
+        for line in rows:
+            if additive:
+                candidate_tokens = prefix_tokens + measure(line)[0]
+            else:
+                candidate_tokens = window_tokens([*current, line])
+            if current and candidate_tokens > MAX_CHUNK_SIZE:
+                parts.append(("\n".join(current).strip(), window_tokens(current)))
                 current = [*header_context]
                 if line not in current:
                     current.append(line)
+                prefix_tokens = sum(measure(row)[1] for row in current) if additive else 0
                 continue
 
-            current = candidate_lines
+            current.append(line)
+            if additive:
+                prefix_tokens += measure(line)[1]
 
         if current:
-            parts.append("\n".join(current).strip())
+            parts.append(("\n".join(current).strip(), window_tokens(current)))
 
         output: list[str] = []
-        for part in parts:
-            if within_chunk_budget(part) or is_table_rowish_chunk(part):
+        for part, tokens in parts:
+            if tokens <= MAX_CHUNK_SIZE or is_table_rowish_chunk(part):
                 output.append(part)
             else:
                 output.extend(self._merge_sentence_windows(self._split_sentences(part)))
@@ -123,7 +145,7 @@ class WindowChunker:
 
     @staticmethod
     def _split_sentences(text: str) -> list[str]:
-        nlp = _get_sentencizer()
+        nlp = nlp_models.sentencizer()
         if nlp is not None:
             doc = nlp(text)
             sentences = [sent.text.strip() for sent in doc.sents if sent.text.strip()]
@@ -140,21 +162,8 @@ class WindowChunker:
         clean = text.strip()
         if not clean:
             return []
-        if within_chunk_budget(clean):
+        tokens = encode(clean)
+        if len(tokens) <= MAX_CHUNK_SIZE:
             return [clean]
 
-        return split_by_token_window(clean, overlap_tokens=0)
-
-
-def _get_sentencizer():
-    global _sentencizer
-    if _sentencizer is None:
-        try:
-            import spacy
-
-            _sentencizer = spacy.blank("en")
-            _sentencizer.add_pipe("sentencizer")
-        except Exception:
-            _sentencizer = False
-
-    return _sentencizer if _sentencizer is not False else None
+        return split_token_ids(tokens, overlap_tokens=0)
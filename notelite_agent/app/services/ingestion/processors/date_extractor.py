@@ -2,12 +2,19 @@ from __future__ import annotations
 
 import re
 from collections.abc import Sequence
-from datetime import datetime, timezone
+from datetime import date, datetime, time, timezone
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
 import dateparser
-import spacy
 
+from app.core.config import (
+    DATE_EXTRACTION_BATCH_SIZE,
+    DATE_EXTRACTION_PARALLEL_MIN_CHUNKS,
+    DATE_EXTRACTION_PROCESSES,
+    DATE_PARSE_CACHE_SIZE,
+)
+from app.services.ingestion.processors import nlp_models
 from app.services.ingestion.processors.ingest.models import IndexChunk
 
 
@@ -16,12 +23,31 @@ _RELATIVE_DATE_PATTERN = re.compile(
     re.IGNORECASE,
 )
 
+# Unambiguous absolute formats resolved without dateparser: ISO-like
+# year-month-day (optionally with a time), "March 3rd, 2024" and "3 March 2024".
+_ISO_DATE_PATTERN = re.compile(
+    r"(\d{4})[-/](\d{1,2})[-/](\d{1,2})(?:[ T](\d{1,2}):(\d{2})(?::(\d{2}))?)?"
+)
+_MONTH_DAY_YEAR_PATTERN = re.compile(r"([A-Za-z]+)\.?\s+(\d{1,2})(?:st|nd|rd|th)?,?\s+(\d{4})")
+_DAY_MONTH_YEAR_PATTERN = re.compile(r"(\d{1,2})(?:st|nd|rd|th)?\s+(?:of\s+)?([A-Za-z]+)\.?,?\s+(\d{4})")
+_MONTHS = {
+    name: number
+    for number, names in enumerate((
+        ("january", "jan"), ("february", "feb"), ("march", "mar"), ("april", "apr"),
+        ("may",), ("june", "jun"), ("july", "jul"), ("august", "aug"),
+        ("september", "sep", "sept"), ("october", "oct"), ("november", "nov"), ("december", "dec"),
+    ), start=1)
+    for name in names
+}
+# Marks a phrase the fast path recognized as an impossible date ("Feb 30, 2024").
+_INVALID = object()
+
 
 class DateExtractor:
     """Extract normalized content dates independently from search entities."""
 
     def __init__(self):
-        self.nlp = spacy.load("en_core_web_sm")
+        self.nlp = nlp_models.ner_pipeline()
         self.events: list[str] = []
 
     def extract(
@@ -30,29 +56,43 @@ class DateExtractor:
         created_at: datetime,
         user_timezone: str,
     ) -> list[dict]:
-        """Return every unique DATE entity normalized to UTC."""
+        """Return every unique DATE entity normalized to UTC.
+
+        Relative phrases resolve against the start of the note's creation day
+        in the user's timezone. DATE spans are day-granular (spaCy labels
+        times as TIME), and this makes each parse a pure function of
+        (text, day, timezone), the key of the parse cache.
+        """
         timezone_info = self._timezone(user_timezone)
-        relative_base = created_at.astimezone(timezone_info)
+        relative_day = created_at.astimezone(timezone_info).date()
         results: list[dict] = []
         seen: set[tuple[str, datetime, str]] = set()
-
-        for chunk in chunks:
-            for entity in self.nlp(chunk.content).ents:
-                if entity.label_ != "DATE":
+        if self.nlp is None:
+            self.events.append("date extraction skipped: spaCy model unavailable")
+            return results
+
+        # Chunks whose text entity extraction already annotated come from the cache.
+        annotations = nlp_models.annotate(
+            [chunk.content for chunk in chunks],
+            self.nlp,
+            batch_size=DATE_EXTRACTION_BATCH_SIZE,
+            n_process=DATE_EXTRACTION_PROCESSES if len(chunks) >= DATE_EXTRACTION_PARALLEL_MIN_CHUNKS else 1,
+        )
+        fast_path = parsed_phrases = 0
+        for chunk, spans in zip(chunks, annotations):
+            for entity in spans:
+                if entity.label != "DATE":
                     continue
 
-                parsed = dateparser.parse(
-                    entity.text,
-                    settings={
-                        "RELATIVE_BASE": relative_base,
-                        "TIMEZONE": str(timezone_info),
-                        "RETURN_AS_TIMEZONE_AWARE": True,
-                    },
-                )
-                if parsed is None:
+                value = _parse_absolute_date(entity.text, timezone_info)
+                if value is None:
+                    parsed_phrases += 1
+                    value = _parse_date(entity.text, relative_day, str(timezone_info))
+                else:
+                    fast_path += 1
+                if value is None or value is _INVALID:
                     continue
 
-                value = parsed.astimezone(timezone.utc)
                 key = (chunk.chunk_id, value, entity.text)
                 if key in seen:
                     continue
@@ -66,6 +106,7 @@ class DateExtractor:
                     "date_type": "relative" if _RELATIVE_DATE_PATTERN.search(entity.text) else "absolute",
                 })
 
+        self.events.append(f"date parsing: fast_path={fast_path} dateparser={parsed_phrases}")
         self.events.append(f"date extraction completed: {len(results)} dates")
         return results
 
@@ -85,3 +126,42 @@ class DateExtractor:
         if re.search(r"\b\d{4}\b", text):
             return "year"
         return "month"
+
+
+def _parse_absolute_date(text: str, timezone_info: ZoneInfo):
+    """UTC value of an unambiguous absolute date, ``_INVALID`` for an impossible one, else None."""
+    clean = text.strip()
+    fields = None
+    if match := _ISO_DATE_PATTERN.fullmatch(clean):
+        year, month, day, hour, minute, second = match.groups()
+        fields = (year, month, day, hour or 0, minute or 0, second or 0)
+    elif match := _MONTH_DAY_YEAR_PATTERN.fullmatch(clean):
+        month_name, day, year = match.groups()
+        if month_name.lower() in _MONTHS:
+            fields = (year, _MONTHS[month_name.lower()], day, 0, 0, 0)
+    elif match := _DAY_MONTH_YEAR_PATTERN.fullmatch(clean):
+        day, month_name, year = match.groups()
+        if month_name.lower() in _MONTHS:
+            fields = (year, _MONTHS[month_name.lower()], day, 0, 0, 0)
+    if fields is None:
+        return None
+    try:
+        local = datetime(*(int(value) for value in fields), tzinfo=timezone_info)
+    except ValueError:
+        return _INVALID
+    return local.astimezone(timezone.utc)
+
+
+@lru_cache(maxsize=DATE_PARSE_CACHE_SIZE)
+def _parse_date(text: str, relative_day: date, timezone_name: str) -> datetime | None:
+    """dateparser result in UTC, relative to the start of ``relative_day``; cached per process."""
+    timezone_info = ZoneInfo(timezone_name)
+    parsed = dateparser.parse(
+        text,
+        settings={
+            "RELATIVE_BASE": datetime.combine(relative_day, time(), tzinfo=timezone_info),
+            "TIMEZONE": timezone_name,
+            "RETURN_AS_TIMEZONE_AWARE": True,
+        },
+    )
+    return parsed.astimezone(timezone.utc) if parsed is not None else None
@@ -0,0 +1,35 @@
+"""Stable content fingerprints for diff-aware re-ingestion.
+
+Fingerprints are hex SHA-256 digests. They are compared across ingestion runs
+of the same note to decide which chunks can reuse previously computed
+keywords, entities, vectors, and summaries.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Mapping
+from typing import Any
+
+
+def _digest(*parts: str) -> str:
+    hasher = hashlib.sha256()
+    for part in parts:
+        hasher.update(part.encode("utf-8"))
+        hasher.update(b"\x00")
+    return hasher.hexdigest()
+
+
+def content_fingerprint(content: str, heading_context: str = "") -> str:
+    """Fingerprint a chunk by its text plus the heading path it sits under."""
+    return _digest(str(heading_context or "").strip(), content.strip())
+
+
+def text_fingerprint(text: str, namespace: str = "") -> str:
+    """Fingerprint a single text, e.g. the exact string sent to an embedding model."""
+    return _digest(namespace, text)
+
+
+def payload_fingerprint(payload: Mapping[str, Any]) -> str:
+    """Fingerprint a JSON-serializable payload independent of key order."""
+    return _digest(json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str))
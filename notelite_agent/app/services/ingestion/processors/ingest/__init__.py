@@ -1,10 +1,10 @@
 from app.services.ingestion.processors.ingest.chunk_builder import ChunkBuilder
 from app.services.ingestion.processors.ingest.models import (
-    DocumentSummary, IndexChunk, QuestionDocument, SummaryArtifacts, SummaryDocument,
+    ChunkTerms, DocumentSummary, IndexChunk, QuestionDocument, SummaryArtifacts, SummaryDocument,
 )
 from app.services.ingestion.processors.ingest.summary_builder import SummaryBuilder
 
 __all__ = [
-    "ChunkBuilder", "DocumentSummary", "IndexChunk", "QuestionDocument",
+    "ChunkBuilder", "ChunkTerms", "DocumentSummary", "IndexChunk", "QuestionDocument",
     "SummaryArtifacts", "SummaryBuilder", "SummaryDocument",
 ]
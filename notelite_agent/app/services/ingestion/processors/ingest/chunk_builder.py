@@ -2,18 +2,21 @@ from __future__ import annotations
 
 import re
 from dataclasses import replace
-from typing import Any, Sequence
+from typing import TYPE_CHECKING, Any, Sequence
 
 from app.core.config import INDEX_CODE_CHUNKS, INDEX_JSON_CHUNKS, MIN_INDEXABLE_TOKENS
 from app.services.ingestion.processors.chunking.chunk_types import ChunkType
 from app.services.ingestion.processors.chunking.token_budget import token_count
 from app.services.ingestion.processors.ingest.models import IndexChunk
-from app.services.ingestion.processors.keywords.keyword_processor import ChunkKeywordResult
 from app.services.ingestion.processors.text_normalization import (
     augment_markdown_table,
     normalize_markdown_tables_for_terms,
 )
 
+if TYPE_CHECKING:
+    # keyword_processor imports ingest.models, which loads this package.
+    from app.services.ingestion.processors.keywords.keyword_processor import ChunkKeywordResult
+
 
 class ChunkBuilder:
     """Build ordered, vendor-neutral index chunks from keyword-enriched chunks."""
@@ -43,7 +46,8 @@ class ChunkBuilder:
     def _build_chunk(self, chunk: ChunkKeywordResult, index: int, total: int) -> IndexChunk:
         metadata = {**self._shared_metadata(), **chunk.metadata}
         metadata.setdefault("has_heading_context", bool(metadata.get("heading_context")))
-        metadata.setdefault("token_count", token_count(chunk.content))
+        if "token_count" not in metadata:
+            metadata["token_count"] = token_count(chunk.content)
         metadata.setdefault("char_count", len(chunk.content))
         embed_text = self._embedding_text(chunk, metadata)
         metadata["embed_text_token_count"] = token_count(embed_text) if embed_text else 0
@@ -22,6 +22,15 @@ class IndexChunk:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass(frozen=True)
+class ChunkTerms:
+    """Keywords/entities of one chunk, reusable by any chunk with the same fingerprint."""
+    fingerprint: str
+    keywords: list[str] = field(default_factory=list)
+    entities: list[str] = field(default_factory=list)
+    entity_labels: dict[str, list[str]] = field(default_factory=dict)
+
+
 @dataclass(frozen=True)
 class DocumentSummary:
     summary: str
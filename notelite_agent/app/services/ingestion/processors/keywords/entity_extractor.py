@@ -4,6 +4,7 @@ import logging
 import re
 from dataclasses import dataclass
 
+from app.services.ingestion.processors import nlp_models
 from app.services.ingestion.processors.keywords.terms import clean_term
 
 
@@ -13,8 +14,6 @@ ENTITY_LABELS = frozenset({"PERSON", "ORG", "GPE", "LOC", "PRODUCT"})
 ENTITY_NOISE = frozenset({"api", "doc", "eta", "gpu", "llm", "max", "metadata", "ram", "three", "utc"})
 SYNTHETIC_PREFIXES = ("description ", "operation ", "pipeline message ", "resolution ", "variable ")
 
-_spacy_nlp = None
-
 
 @dataclass(frozen=True)
 class EntityMention:
@@ -23,16 +22,7 @@ class EntityMention:
 
 
 def get_spacy_nlp():
-    global _spacy_nlp
-    if _spacy_nlp is None:
-        try:
-            import spacy
-
-            _spacy_nlp = spacy.load("en_core_web_sm")
-        except (ImportError, OSError):
-            log.warning("spaCy entity model is unavailable", exc_info=True)
-            _spacy_nlp = False
-    return _spacy_nlp if _spacy_nlp is not False else None
+    return nlp_models.ner_pipeline()
 
 
 def extract_entities(text: str) -> list[str]:
@@ -52,23 +42,22 @@ def extract_entity_mentions_batch(texts: list[str]) -> list[list[EntityMention]]
         return [[] for _ in texts]
 
     try:
-        docs = nlp.pipe(text[: nlp.max_length] for text in texts)
-        return [_entities_from_doc(doc) for doc in docs]
+        return [_entities_from_spans(spans) for spans in nlp_models.annotate(texts, nlp)]
     except Exception:
         log.warning("spaCy entity extraction failed", exc_info=True)
         return [[] for _ in texts]
 
 
-def _entities_from_doc(doc) -> list[EntityMention]:
+def _entities_from_spans(spans) -> list[EntityMention]:
     seen = set()
     entities = []
-    for entity in doc.ents:
-        if entity.label_ not in ENTITY_LABELS:
+    for span in spans:
+        if span.label not in ENTITY_LABELS:
             continue
-        cleaned = _clean_entity(entity.text, entity.label_)
+        cleaned = _clean_entity(span.text, span.label)
         if cleaned and not _is_entity_noise(cleaned) and cleaned.lower() not in seen:
             seen.add(cleaned.lower())
-            entities.append(EntityMention(cleaned, entity.label_))
+            entities.append(EntityMention(cleaned, span.label))
     return entities
 
 
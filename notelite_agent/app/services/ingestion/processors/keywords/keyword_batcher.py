@@ -262,9 +262,9 @@ def _extract_batch(
 
 
 def _truncate_item(item: KeywordBatchItem, max_tokens: int) -> KeywordBatchItem:
-    tokens = _token_encoder.encode(item.text)
-    if len(tokens) <= max_tokens:
+    if count_tokens(item.text) <= max_tokens:
         return item
+    tokens = _token_encoder.encode(item.text)
     return KeywordBatchItem(
         chunk_id=item.chunk_id,
         chunk_type=item.chunk_type,
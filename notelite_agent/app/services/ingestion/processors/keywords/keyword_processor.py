@@ -4,7 +4,7 @@ import logging
 import re
 from collections import Counter
 from dataclasses import dataclass, field
-from typing import Any, Literal, Sequence
+from typing import Any, Literal, Mapping, Sequence
 
 from app.core.config import (
     KEYWORD_EXTRACTION_CONCURRENCY,
@@ -18,6 +18,8 @@ from app.shared.prompts.prompt import (
 )
 from app.services.ingestion.processors.chunking import TextChunk
 from app.services.ingestion.processors.chunking.chunk_types import ChunkType
+from app.services.ingestion.processors.fingerprints import content_fingerprint
+from app.services.ingestion.processors.ingest.models import ChunkTerms
 from app.services.ingestion.processors.keywords.entity_extractor import extract_entity_mentions_batch
 from app.services.ingestion.processors.keywords.keyword_batcher import (
     KeywordBatchItem,
@@ -103,8 +105,19 @@ class KeywordProcessor:
             "entity_dedup": 0,
         }
         self.events: list[str] = []
+        self.chunk_terms: dict[str, ChunkTerms] = {}
 
-    def process(self, chunks: Sequence[TextChunk | str]) -> tuple[list[ChunkKeywordResult], list[str], list[str]]:
+    def process(
+        self,
+        chunks: Sequence[TextChunk | str],
+        cached_terms: Mapping[str, ChunkTerms] | None = None,
+    ) -> tuple[list[ChunkKeywordResult], list[str], list[str]]:
+        """Extract chunk terms, reusing ``cached_terms`` entries keyed by content fingerprint.
+
+        Chunks whose fingerprint is cached skip both spaCy entity extraction and the
+        LLM keyword batches. ``self.chunk_terms`` holds the reusable terms of this run
+        for the caller to persist.
+        """
         self.api_calls = 0
         self.api_call_counts = {
             "keyword_extraction": 0,
@@ -113,9 +126,14 @@ class KeywordProcessor:
             "entity_dedup": 0,
         }
         self.events = [f"keywords started: {len(chunks)} chunks"]
+        self.chunk_terms = {}
+        cached_terms = cached_terms or {}
         prepared_chunks = []
         keyword_items = []
         entities_by_chunk: dict[str, list[str]] = {}
+        labels_by_chunk: dict[str, dict[str, list[str]]] = {}
+        cached_keywords: dict[str, list[str]] = {}
+        fingerprints: dict[str, str] = {}
         entity_items: list[tuple[str, str, str, str]] = []
         entity_evidence: dict[str, dict[str, set[str] | list[str]]] = {}
 
@@ -123,6 +141,20 @@ class KeywordProcessor:
             chunk_id, content, chunk_type, metadata = self._chunk_data(chunk, index)
             extraction_text = self._extraction_text(content, chunk_type, metadata)
             entities_by_chunk[chunk_id] = []
+            fingerprint = content_fingerprint(content, metadata.get("heading_context", ""))
+            fingerprints[chunk_id] = fingerprint
+            cached = cached_terms.get(fingerprint)
+            if cached is not None:
+                cached_keywords[chunk_id] = list(cached.keywords)
+                entities_by_chunk[chunk_id] = list(cached.entities)
+                labels_by_chunk[chunk_id] = dict(cached.entity_labels)
+                text = without_markdown_heading_lines(extraction_text)
+                for entity in cached.entities:
+                    self._add_entity_evidence(
+                        entity_evidence, text, entity, cached.entity_labels.get(entity, [])
+                    )
+                prepared_chunks.append((chunk, index, chunk_id, content, chunk_type, metadata))
+                continue
             if self._should_extract_entities(extraction_text, chunk_type):
                 entity_items.append((
                     chunk_id,
@@ -150,14 +182,15 @@ class KeywordProcessor:
         for (chunk_id, text, content, chunk_type), mentions in zip(entity_items, entity_results):
             mentions = self._filter_table_header_mentions(mentions, content, chunk_type)
             entities_by_chunk[chunk_id] = [mention.text for mention in mentions]
+            chunk_labels = labels_by_chunk.setdefault(chunk_id, {})
             for mention in mentions:
-                key = mention.text.lower()
-                evidence = entity_evidence.setdefault(key, {"labels": set(), "contexts": []})
-                evidence["labels"].add(mention.label)
-                context = self._entity_context(text, mention.text)
-                if context and context not in evidence["contexts"] and len(evidence["contexts"]) < 2:
-                    evidence["contexts"].append(context)
+                chunk_labels.setdefault(mention.text, [])
+                if mention.label not in chunk_labels[mention.text]:
+                    chunk_labels[mention.text].append(mention.label)
+                self._add_entity_evidence(entity_evidence, text, mention.text, [mention.label])
         self.events.append(f"entity extraction completed: {len(entity_items)} chunks")
+        if cached_keywords:
+            self.events.append(f"keyword cache reused: {len(cached_keywords)} chunks")
         try:
             keyword_result = extract_keywords_batched(
                 keyword_items,
@@ -180,12 +213,25 @@ class KeywordProcessor:
         self.api_call_counts["keyword_extraction_retries"] = keyword_result.retries
 
         chunk_results = []
+        extracted_ids = {item.chunk_id for item in keyword_items}
         for chunk, index, chunk_id, content, chunk_type, metadata in prepared_chunks:
             keywords = self._filter_table_header_terms(
-                keyword_result.keywords_by_chunk.get(chunk_id, []),
+                cached_keywords[chunk_id]
+                if chunk_id in cached_keywords
+                else keyword_result.keywords_by_chunk.get(chunk_id, []),
                 content,
                 chunk_type,
             )
+            # An empty extraction result is indistinguishable from a failed batch,
+            # so only chunks that produced keywords (or never needed the LLM) are
+            # reusable by the next ingestion.
+            if keywords or chunk_id not in extracted_ids:
+                self.chunk_terms[fingerprints[chunk_id]] = ChunkTerms(
+                    fingerprint=fingerprints[chunk_id],
+                    keywords=keywords,
+                    entities=entities_by_chunk.get(chunk_id, []),
+                    entity_labels=labels_by_chunk.get(chunk_id, {}),
+                )
             chunk_results.append(
                 ChunkKeywordResult(
                     chunk_id=chunk_id,
@@ -251,6 +297,20 @@ class KeywordProcessor:
     def _should_extract_entities(text: str, chunk_type: str) -> bool:
         return chunk_type not in NON_TEXT_TERM_TYPES and any(char.isalpha() for char in text)
 
+    @classmethod
+    def _add_entity_evidence(
+        cls,
+        entity_evidence: dict[str, dict[str, set[str] | list[str]]],
+        text: str,
+        entity: str,
+        labels: Sequence[str],
+    ) -> None:
+        evidence = entity_evidence.setdefault(entity.lower(), {"labels": set(), "contexts": []})
+        evidence["labels"].update(labels)
+        context = cls._entity_context(text, entity)
+        if context and context not in evidence["contexts"] and len(evidence["contexts"]) < 2:
+            evidence["contexts"].append(context)
+
     @staticmethod
     def _entity_context(text: str, entity: str, radius: int = 100) -> str:
         lowered = text.lower()
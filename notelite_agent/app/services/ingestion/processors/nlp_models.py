@@ -0,0 +1,129 @@
+"""Process-wide spaCy pipelines shared by entity, date, and sentence processing.
+
+Each pipeline is loaded once per process (Celery workers preload them in
+``worker_process_init``) instead of once per ingestion. The NER pipeline
+excludes the components nothing here reads (tagger, parser, lemmatizer), which
+cuts both load time and per-document cost. ``annotate`` memoizes entity spans
+per text, so a chunk that both entity and date extraction annotate goes
+through the model once.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+
+log = logging.getLogger(__name__)
+
+NER_MODEL = "en_core_web_sm"
+NER_EXCLUDED_COMPONENTS = ("tagger", "parser", "attribute_ruler", "lemmatizer", "senter")
+ANNOTATION_CACHE_SIZE = 4096
+
+
+@dataclass(frozen=True)
+class EntitySpan:
+    text: str
+    label: str
+
+
+_lock = threading.Lock()
+_pipelines: dict[str, Any] = {}
+# Entity spans per text, per pipeline object, most recently used last.
+_annotations: weakref.WeakKeyDictionary[Any, OrderedDict[str, tuple[EntitySpan, ...]]] = weakref.WeakKeyDictionary()
+
+
+def ner_pipeline():
+    """The shared NER pipeline, or None when spaCy or the model is unavailable."""
+    return _load("ner", _load_ner)
+
+
+def sentencizer():
+    """A blank English pipeline that only splits sentences, or None without spaCy."""
+    return _load("sentencizer", _load_sentencizer)
+
+
+def preload() -> None:
+    ner_pipeline()
+    sentencizer()
+
+
+def annotate(
+    texts: Sequence[str],
+    nlp=None,
+    batch_size: int | None = None,
+    n_process: int = 1,
+) -> list[tuple[EntitySpan, ...]]:
+    """Entity spans of every text; uncached texts share one ``nlp.pipe`` pass.
+
+    ``n_process`` > 1 fans the pass out to worker processes. Where the caller
+    cannot start processes (a daemonic Celery prefork child) it runs in-process.
+    """
+    nlp = nlp if nlp is not None else ner_pipeline()
+    if nlp is None:
+        return [() for _ in texts]
+    texts = [text[: nlp.max_length] for text in texts]
+    with _lock:
+        cache = _annotations.setdefault(nlp, OrderedDict())
+        found = {text: cache[text] for text in set(texts) if text in cache}
+        for text in found:
+            cache.move_to_end(text)
+    missing = [text for text in dict.fromkeys(texts) if text not in found]
+    if missing:
+        annotated = _pipe(nlp, missing, batch_size, n_process)
+        found.update(annotated)
+        with _lock:
+            cache.update(annotated)
+            while len(cache) > ANNOTATION_CACHE_SIZE:
+                cache.popitem(last=False)
+    return [found[text] for text in texts]
+
+
+def _pipe(nlp, texts: list[str], batch_size: int | None, n_process: int) -> dict[str, tuple[EntitySpan, ...]]:
+    options = {"batch_size": batch_size} if batch_size else {}
+    if n_process > 1:
+        try:
+            return _spans(texts, nlp.pipe(texts, n_process=n_process, **options))
+        except (AssertionError, OSError, RuntimeError):
+            log.warning("spaCy multiprocess pipe unavailable; annotating in-process", exc_info=True)
+    return _spans(texts, nlp.pipe(texts, **options))
+
+
+def _spans(texts: list[str], docs) -> dict[str, tuple[EntitySpan, ...]]:
+    return {
+        text: tuple(EntitySpan(entity.text, entity.label_) for entity in doc.ents)
+        for text, doc in zip(texts, docs)
+    }
+
+
+def _load(name: str, loader):
+    pipeline = _pipelines.get(name)
+    if pipeline is None:
+        with _lock:
+            pipeline = _pipelines.get(name)
+            if pipeline is None:
+                try:
+                    pipeline = loader()
+                except Exception:
+                    log.warning("spaCy pipeline is unavailable: %s", name, exc_info=True)
+                    pipeline = False
+                _pipelines[name] = pipeline
+    return pipeline if pipeline is not False else None
+
+
+def _load_ner():
+    import spacy
+
+    return spacy.load(NER_MODEL, exclude=list(NER_EXCLUDED_COMPONENTS))
+
+
+def _load_sentencizer():
+    import spacy
+
+    pipeline = spacy.blank("en")
+    pipeline.add_pipe("sentencizer")
+    return pipeline
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import contextvars
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from typing import Sequence
 
+from app.core.config import SUMMARY_DEADLINE_SECONDS, SUMMARY_GROUP_CONCURRENCY
 from app.shared.prompts.prompt import get_final_summary_system_prompt, get_group_summary_system_prompt
 from app.services.ingestion.processors.chunking import TextChunk
 from app.services.ingestion.processors.chunking.chunk_types import ChunkType
@@ -47,6 +51,17 @@ class SummaryResult:
     events: list[str] = field(default_factory=list)
 
 
+@dataclass(frozen=True)
+class _GroupOutcome:
+    summary: str
+    api_calls: int
+    events: list[str]
+
+    @classmethod
+    def deadline(cls, index: int, api_calls: int) -> _GroupOutcome:
+        return cls(summary="", api_calls=api_calls, events=[f"summary failed: group {index} (deadline)"])
+
+
 class SummaryProcessor:
     def __init__(self):
         self.api_calls = 0
@@ -130,31 +145,11 @@ class SummaryProcessor:
         api_calls = 0
 
         group_prompt = get_group_summary_system_prompt()
-        for index, group in enumerate(groups, start=1):
-            text = "\n\n".join(chunk_text(chunk) for chunk in group)
-            prompt_tokens = estimate_summary_request_tokens(group_prompt, text)
-            try:
-                events.append(
-                    f"summary api call: group {index}, estimated prompt tokens: {prompt_tokens}, "
-                    f"max output tokens: {GROUP_SUMMARY_MAX_TOKENS}"
-                )
-                summary = llm_call_general(
-                    build_llm_messages(group_prompt, text),
-                    max_tokens=GROUP_SUMMARY_MAX_TOKENS,
-                )
-                api_calls += 1
-                if summary.strip() == "SKIP":
-                    events.append(f"summary skipped: group {index}")
-                    continue
-            except Exception as exc:
-                log.warning("summary group failed", exc_info=True)
-                api_calls += 1
-                events.append(f"summary failed: group {index} ({self._failure_label(exc)})")
-                continue
-
-            summary = valid_summary(summary)
-            if summary:
-                summaries.append(summary)
+        for outcome in self._summarize_groups(group_prompt, groups):
+            api_calls += outcome.api_calls
+            events.extend(outcome.events)
+            if outcome.summary:
+                summaries.append(outcome.summary)
 
         if not summaries:
             events.append("summary failed: no usable group summaries")
@@ -243,6 +238,66 @@ class SummaryProcessor:
         events.append("summary completed: chunk" if summary else "summary discarded: low quality")
         return SummaryResult(summary=summary, api_calls=1, events=events)
 
+    def _summarize_groups(
+        self, group_prompt: str, groups: Sequence[Sequence[TextChunk | str]]
+    ) -> list[_GroupOutcome]:
+        """Summarize groups on a bounded pool; outcomes keep group order.
+
+        Groups still pending at the document deadline are reported as failed.
+        A call already in flight then counts as an API call and is left to
+        finish in the background.
+        """
+        numbered = list(enumerate(groups, start=1))
+        deadline = time.monotonic() + SUMMARY_DEADLINE_SECONDS
+        if SUMMARY_GROUP_CONCURRENCY <= 1 or len(groups) <= 1:
+            return [
+                self._summarize_group(group_prompt, index, group)
+                if time.monotonic() < deadline
+                else _GroupOutcome.deadline(index, api_calls=0)
+                for index, group in numbered
+            ]
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(SUMMARY_GROUP_CONCURRENCY, len(groups)),
+            thread_name_prefix="summary-group",
+        )
+        futures = [
+            executor.submit(contextvars.copy_context().run, self._summarize_group, group_prompt, index, group)
+            for index, group in numbered
+        ]
+        wait(futures, timeout=max(0.0, deadline - time.monotonic()))
+        outcomes = []
+        for (index, _group), future in zip(numbered, futures):
+            if future.done():
+                outcomes.append(future.result())
+            else:
+                outcomes.append(_GroupOutcome.deadline(index, api_calls=0 if future.cancel() else 1))
+        executor.shutdown(wait=False, cancel_futures=True)
+        return outcomes
+
+    def _summarize_group(
+        self, group_prompt: str, index: int, group: Sequence[TextChunk | str]
+    ) -> _GroupOutcome:
+        text = "\n\n".join(chunk_text(chunk) for chunk in group)
+        prompt_tokens = estimate_summary_request_tokens(group_prompt, text)
+        events = [
+            f"summary api call: group {index}, estimated prompt tokens: {prompt_tokens}, "
+            f"max output tokens: {GROUP_SUMMARY_MAX_TOKENS}"
+        ]
+        try:
+            summary = llm_call_general(
+                build_llm_messages(group_prompt, text),
+                max_tokens=GROUP_SUMMARY_MAX_TOKENS,
+            )
+        except Exception as exc:
+            log.warning("summary group failed", exc_info=True)
+            events.append(f"summary failed: group {index} ({self._failure_label(exc)})")
+            return _GroupOutcome(summary="", api_calls=1, events=events)
+        if summary.strip() == "SKIP":
+            events.append(f"summary skipped: group {index}")
+            return _GroupOutcome(summary="", api_calls=1, events=events)
+        return _GroupOutcome(summary=valid_summary(summary), api_calls=1, events=events)
+
     def group_chunks(
         self,
         chunks: Sequence[TextChunk | str],
@@ -255,20 +310,27 @@ class SummaryProcessor:
         if prompt_limit <= 0:
             raise ValueError("summary context window leaves no prompt budget")
 
+        # Sum per-chunk counts instead of re-encoding the growing group text on
+        # every step; chunk texts are stripped, so the "\n\n" joins tokenize alone.
+        system_tokens = count_tokens(system_prompt)
+        separator_tokens = count_tokens("\n\n")
+        current_tokens = 0
         for chunk in chunks:
-            candidate = [*current_group, chunk]
-            candidate_text = "\n\n".join(chunk_text(item) for item in candidate)
-            candidate_tokens = estimate_summary_request_tokens(system_prompt, candidate_text)
+            chunk_tokens = count_tokens(chunk_text(chunk))
+            joined_tokens = current_tokens + separator_tokens + chunk_tokens if current_group else chunk_tokens
+            candidate_tokens = system_tokens + joined_tokens
             if candidate_tokens > prompt_limit and current_group:
                 groups.append(current_group)
                 current_group = [chunk]
-                single_tokens = estimate_summary_request_tokens(system_prompt, chunk_text(chunk))
+                current_tokens = chunk_tokens
+                single_tokens = system_tokens + chunk_tokens
                 if single_tokens > prompt_limit:
                     raise ValueError(f"summary chunk exceeds safe prompt limit ({single_tokens} tokens)")
             elif candidate_tokens > prompt_limit:
                 raise ValueError(f"summary chunk exceeds safe prompt limit ({candidate_tokens} tokens)")
             else:
                 current_group.append(chunk)
+                current_tokens = joined_tokens
 
         if current_group:
             groups.append(current_group)
@@ -1,23 +1,35 @@
 import logging
+import time
+from dataclasses import asdict
+
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
-from app.core.config import ENABLE_DIRECT_INGEST
+from app.core.config import ENABLE_DIRECT_INGEST, INGESTION_BULK_MAX_NOTES
 from app.core.dependencies import get_postgres_db, get_qdrant_store, require_api_key
 from app.logger import get_trace_id, logger
 from app.services.ingestion.orchestrator import IngestionOrchestrator
 from app.services.ingestion.schema import (
+    EmbeddingMigrationData,
+    EmbeddingMigrationRequest,
+    IngestionBulkQueuedData,
+    IngestionBulkRequest,
     IngestionDeletedData,
     IngestionHealthData,
     IngestionJobStatusData,
     IngestionProcessedData,
     IngestionQueuedData,
     IngestionRequest,
+    TenantLayoutData,
 )
+from app.services.ingestion.storage import embedding_migration
+from app.services.ingestion.storage.collection_routing import MIGRATION_RUNNING
+from app.services.ingestion.storage.embedding_migration import MigrationError
 from app.services.ingestion.storage.vector_store import QdrantVectorStore
 from app.services.ingestion.workers.celery_app import celery_app
-from app.services.ingestion.workers.ingestion_tasks import ingest_in_background
+from app.services.ingestion.workers.ingestion_tasks import ingest_bulk, ingest_in_background
+from app.services.ingestion.workers.reembedding import reembed_collections
 from app.shared.schema import ApiResponse
 
 
@@ -57,11 +69,31 @@ def ingest_note(payload: IngestionRequest):
     Poll GET /api/ingest/status/{job_id} for the result.
     """
     task = ingest_in_background.delay(
-        {**payload.model_dump(exclude_none=True), "trace_id": get_trace_id()}
+        {**payload.model_dump(exclude_none=True), "trace_id": get_trace_id(), "enqueued_at": time.time()}
     )
     return ApiResponse.ok({"job_id": task.id, "status": "queued"})
 
 
+@router.post("/bulk", response_model=ApiResponse[IngestionBulkQueuedData], summary="Queue bulk note ingestion")
+def ingest_notes_bulk(payload: IngestionBulkRequest):
+    """Queue many notes (imports, re-embedding) for batched background ingestion.
+
+    Notes are split into tasks of INGESTION_BULK_MAX_NOTES on the backfill lane;
+    each task shares embedding requests and storage writes across its notes.
+    Poll GET /api/ingest/status/{job_id} per job; results report notes_per_second.
+    """
+    notes = [note.model_dump(exclude_none=True) for note in payload.notes]
+    batch_size = max(1, INGESTION_BULK_MAX_NOTES)
+    job_ids = [
+        ingest_bulk.apply_async(
+            args=(notes[start:start + batch_size],),
+            kwargs={"trace_id": get_trace_id(), "enqueued_at": time.time()},
+        ).id
+        for start in range(0, len(notes), batch_size)
+    ]
+    return ApiResponse.ok({"job_ids": job_ids, "notes": len(notes), "status": "queued"})
+
+
 @router.post("/direct", response_model=ApiResponse[IngestionProcessedData | IngestionDeletedData], summary="Run note ingestion synchronously")
 def ingest_note_direct(
     payload: IngestionRequest,
@@ -95,3 +127,67 @@ def ingestion_job_status(job_id: str):
         "status": result.state,
         "result": result.result if result.ready() else None,
     })
+
+
+@router.get("/migration", response_model=ApiResponse[EmbeddingMigrationData], summary="Get re-embedding progress")
+def embedding_migration_status():
+    """Progress and ETA of the current (or last) blue/green re-embedding."""
+    return ApiResponse.ok(asdict(embedding_migration.migration_progress()))
+
+
+@router.post("/migration", response_model=ApiResponse[EmbeddingMigrationData], summary="Start a blue/green re-embedding")
+def start_embedding_migration(
+    payload: EmbeddingMigrationRequest,
+    vector_store: QdrantVectorStore = Depends(get_qdrant_store),
+):
+    """Create shadow collections for a new embedding model and queue the background copy.
+
+    New ingestions are written to both collection sets until cutover.
+    """
+    progress = _migration_step(embedding_migration.start_migration, payload.model, payload.base_url, vector_store)
+    reembed_collections.delay(trace_id=get_trace_id())
+    return ApiResponse.ok(asdict(progress))
+
+
+@router.post("/migration/resume", response_model=ApiResponse[EmbeddingMigrationData], summary="Resume the re-embedding copy")
+def resume_embedding_migration():
+    """Re-queue the background copy, e.g. after a worker restart; it continues from its checkpoint."""
+    progress = embedding_migration.migration_progress()
+    if progress.status != MIGRATION_RUNNING:
+        raise HTTPException(status_code=409, detail="No re-embedding is running.")
+    reembed_collections.delay(trace_id=get_trace_id())
+    return ApiResponse.ok(asdict(progress))
+
+
+@router.post("/migration/cutover", response_model=ApiResponse[EmbeddingMigrationData], summary="Cut retrieval over to the re-embedded collections")
+def cutover_embedding_migration(vector_store: QdrantVectorStore = Depends(get_qdrant_store)):
+    return ApiResponse.ok(asdict(_migration_step(embedding_migration.cutover, vector_store)))
+
+
+@router.post("/migration/abort", response_model=ApiResponse[EmbeddingMigrationData], summary="Abort the re-embedding")
+def abort_embedding_migration():
+    return ApiResponse.ok(asdict(_migration_step(embedding_migration.abort_migration)))
+
+
+@router.post("/migration/finalize", response_model=ApiResponse[EmbeddingMigrationData], summary="Drop the retired collections")
+def finalize_embedding_migration(vector_store: QdrantVectorStore = Depends(get_qdrant_store)):
+    return ApiResponse.ok(asdict(_migration_step(embedding_migration.finalize_migration, vector_store)))
+
+
+@router.post("/migration/tenant-layout", response_model=ApiResponse[TenantLayoutData], summary="Apply the tenant layout in place")
+def apply_tenant_layout(vector_store: QdrantVectorStore = Depends(get_qdrant_store)):
+    """Bring existing collections' user index and HNSW graphs in line with QDRANT_MULTITENANCY.
+
+    Qdrant rebuilds the graphs in the background; searches keep working meanwhile.
+    """
+    return ApiResponse.ok({
+        "multitenancy": vector_store.storage_settings.multitenancy,
+        "collections": vector_store.apply_tenant_layout(),
+    })
+
+
+def _migration_step(step, *args):
+    try:
+        return step(*args)
+    except MigrationError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
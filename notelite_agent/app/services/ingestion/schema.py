@@ -30,6 +30,19 @@ class IngestionRequest(BaseModel):
         return self
 
 
+class IngestionBulkRequest(BaseModel):
+    """Notes for bulk ingestion; queued as tasks of INGESTION_BULK_MAX_NOTES notes each."""
+
+    notes: list[IngestionRequest] = Field(..., min_length=1)
+
+
+class EmbeddingMigrationRequest(BaseModel):
+    """New embedding model to re-embed into; base_url defaults to the active service's."""
+
+    model: str = Field(..., min_length=1)
+    base_url: str | None = None
+
+
 class IngestionHealthData(BaseModel):
     postgresql: Literal["active", "inactive"]
     qdrant: Literal["active", "inactive"]
@@ -40,6 +53,12 @@ class IngestionQueuedData(BaseModel):
     status: Literal["queued"]
 
 
+class IngestionBulkQueuedData(BaseModel):
+    job_ids: list[str]
+    notes: int
+    status: Literal["queued"]
+
+
 class IngestionApiCalls(BaseModel):
     keyword_extraction: int
     keyword_extraction_retries: int
@@ -57,6 +76,9 @@ class IngestionStagesMs(BaseModel):
     questions: float
     document_build: float
     document_ingestion: float
+    chunk_indexing: float = 0.0
+    date_extraction: float = 0.0
+    overlap: float = 0.0
     total: float
 
 
@@ -86,3 +108,22 @@ class IngestionJobStatusData(BaseModel):
     job_id: str
     status: str
     result: Any | None = None
+
+
+class EmbeddingMigrationData(BaseModel):
+    status: str
+    active_version: int | None
+    active_model: str
+    target_version: int | None
+    target_model: str | None
+    total: int
+    migrated: int
+    percent: float
+    points_per_second: float
+    eta_seconds: float | None
+    cleanup_pending: bool
+
+
+class TenantLayoutData(BaseModel):
+    multitenancy: bool
+    collections: list[str]
@@ -0,0 +1,152 @@
+"""Which Qdrant collections and embedding service each process reads and writes.
+
+Outside a migration every process uses one *active* target: an embedding
+service (base URL + model) and the collection set embedded with it. During a
+blue/green re-embedding (see ``embedding_migration``) a *shadow* target is also
+set; ingestion then writes both sets so the shadow stays current while the
+background copy catches up.
+
+The routing lives in one Redis hash, so a cutover is a single HSET seen by
+every process within EMBEDDING_ROUTING_REFRESH_SECONDS. A vector store pins
+one snapshot for its lifetime, so a request never embeds with one model and
+searches collections built with another.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from redis.exceptions import RedisError
+
+from app.core.config import (
+    EMBEDDING_MODEL,
+    EMBEDDING_MODEL_BASE,
+    EMBEDDING_ROUTING_KEY,
+    EMBEDDING_ROUTING_REFRESH_SECONDS,
+)
+from app.db.redis import redis_client
+
+
+log = logging.getLogger(__name__)
+
+MIGRATION_IDLE = "idle"
+MIGRATION_RUNNING = "running"
+MIGRATION_READY = "ready"
+MIGRATION_COMPLETED = "completed"
+MIGRATION_ABORTED = "aborted"
+# States in which ingestion double-writes to the shadow collections.
+SHADOW_STATES = (MIGRATION_RUNNING, MIGRATION_READY)
+
+
+class RoutingUnavailable(ConnectionError):
+    """Redis is unreachable and this process has never read the routing."""
+
+
+@dataclass(frozen=True)
+class EmbeddingTarget:
+    """An embedding service and the collection set embedded with it.
+
+    ``version`` None is the original, unversioned set named after
+    QDRANT_COLLECTION; version N uses ``{name}_vN``.
+    """
+
+    version: int | None
+    model: str
+    base_url: str
+
+    def collection(self, logical_name: str) -> str:
+        return logical_name if self.version is None else f"{logical_name}_v{self.version}"
+
+    @property
+    def is_default_service(self) -> bool:
+        return (self.model, self.base_url.rstrip("/")) == (EMBEDDING_MODEL, EMBEDDING_MODEL_BASE)
+
+
+DEFAULT_TARGET = EmbeddingTarget(version=None, model=EMBEDDING_MODEL, base_url=EMBEDDING_MODEL_BASE)
+
+
+@dataclass(frozen=True)
+class CollectionRouting:
+    active: EmbeddingTarget = DEFAULT_TARGET
+    shadow: EmbeddingTarget | None = None
+
+
+def _version(value: Any) -> int | None:
+    return int(value) if value not in (None, "", b"") else None
+
+
+def _text(value: Any) -> str:
+    return value.decode() if isinstance(value, bytes) else str(value or "")
+
+
+def decode_state(raw: dict) -> dict[str, str]:
+    return {_text(key): _text(value) for key, value in (raw or {}).items()}
+
+
+def routing_from_state(state: dict[str, str]) -> CollectionRouting:
+    if not state.get("active_model"):
+        return CollectionRouting()
+    active = EmbeddingTarget(
+        version=_version(state.get("active_version")),
+        model=state["active_model"],
+        base_url=state.get("active_base_url") or EMBEDDING_MODEL_BASE,
+    )
+    shadow = None
+    if state.get("status") in SHADOW_STATES and state.get("target_model"):
+        shadow = EmbeddingTarget(
+            version=_version(state.get("target_version")),
+            model=state["target_model"],
+            base_url=state.get("target_base_url") or active.base_url,
+        )
+    return CollectionRouting(active=active, shadow=shadow)
+
+
+def load_state() -> dict[str, str]:
+    """The raw routing/migration hash; raises RedisError when Redis is down."""
+    return decode_state(redis_client().hgetall(EMBEDDING_ROUTING_KEY))
+
+
+def save_state(fields: dict[str, Any]) -> None:
+    """Write several routing fields atomically (one HSET) and drop the local cache."""
+    redis_client().hset(EMBEDDING_ROUTING_KEY, mapping={key: "" if value is None else str(value) for key, value in fields.items()})
+    invalidate_routing()
+
+
+_cached: tuple[float, CollectionRouting] | None = None
+_lock = threading.Lock()
+
+
+def collection_routing() -> CollectionRouting:
+    """The process's current routing, re-read at most every EMBEDDING_ROUTING_REFRESH_SECONDS.
+
+    A Redis failure keeps the last known routing rather than failing the
+    request. Before the first successful read there is nothing safe to fall
+    back on: after a migration the unversioned default pairs the wrong model
+    with the wrong collections, so ``RoutingUnavailable`` is raised instead.
+    """
+    global _cached
+    with _lock:
+        if _cached is not None and time.monotonic() - _cached[0] < EMBEDDING_ROUTING_REFRESH_SECONDS:
+            return _cached[1]
+        previous = _cached[1] if _cached is not None else None
+    try:
+        routing = routing_from_state(load_state())
+    except RedisError as exc:
+        if previous is None:
+            raise RoutingUnavailable(f"embedding routing has never been read: {exc}") from exc
+        log.warning("embedding routing read failed; keeping previous routing: %s", exc)
+        routing = previous
+    with _lock:
+        _cached = (time.monotonic(), routing)
+    return routing
+
+
+def invalidate_routing() -> None:
+    """Re-read the routing on next use; it stays the fallback if that read fails."""
+    global _cached
+    with _lock:
+        if _cached is not None:
+            _cached = (float("-inf"), _cached[1])
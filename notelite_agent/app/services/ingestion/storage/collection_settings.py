@@ -0,0 +1,136 @@
+"""Dense vector storage layout for Qdrant collections: quantization, on-disk, HNSW, tenancy.
+
+Settings apply when a collection is created. Existing collections keep their
+layout until they are rebuilt, e.g. by a blue/green re-embedding
+(``embedding_migration``), which creates fresh collections with the current
+settings; the tenant layout can also be applied in place
+(``QdrantVectorStore.apply_tenant_layout``). Search parameters (``hnsw_ef``,
+rescoring) apply per query.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from qdrant_client import models
+
+from app.core.config import (
+    QDRANT_HNSW_EF,
+    QDRANT_HNSW_EF_CONSTRUCT,
+    QDRANT_HNSW_M,
+    QDRANT_MULTITENANCY,
+    QDRANT_PAYLOAD_ON_DISK,
+    QDRANT_QUANTIZATION,
+    QDRANT_QUANTIZATION_ALWAYS_RAM,
+    QDRANT_QUANTIZATION_OVERSAMPLING,
+    QDRANT_QUANTIZATION_RESCORE,
+    QDRANT_TENANT_PAYLOAD_M,
+    QDRANT_VECTORS_ON_DISK,
+)
+
+
+QUANTIZATION_NONE = "none"
+QUANTIZATION_SCALAR = "scalar"
+QUANTIZATION_BINARY = "binary"
+QUANTIZATION_MODES = (QUANTIZATION_NONE, QUANTIZATION_SCALAR, QUANTIZATION_BINARY)
+
+# Every search is scoped to one user, so the user id is the tenant key.
+TENANT_FIELD = "metadata.user_id"
+
+
+@dataclass(frozen=True)
+class VectorStorageSettings:
+    quantization: str = QUANTIZATION_NONE
+    quantization_always_ram: bool = True
+    rescore: bool = True
+    oversampling: float = 2.0
+    vectors_on_disk: bool = False
+    payload_on_disk: bool = False
+    hnsw_m: int = 16
+    hnsw_ef_construct: int = 100
+    hnsw_ef: int | None = None
+    multitenancy: bool = False
+    tenant_payload_m: int = 16
+
+    def __post_init__(self) -> None:
+        if self.quantization not in QUANTIZATION_MODES:
+            raise ValueError(
+                f"Unsupported Qdrant quantization {self.quantization!r}; expected one of {', '.join(QUANTIZATION_MODES)}"
+            )
+
+    @classmethod
+    def from_config(cls) -> "VectorStorageSettings":
+        return cls(
+            quantization=QDRANT_QUANTIZATION,
+            quantization_always_ram=QDRANT_QUANTIZATION_ALWAYS_RAM,
+            rescore=QDRANT_QUANTIZATION_RESCORE,
+            oversampling=QDRANT_QUANTIZATION_OVERSAMPLING,
+            vectors_on_disk=QDRANT_VECTORS_ON_DISK,
+            payload_on_disk=QDRANT_PAYLOAD_ON_DISK,
+            hnsw_m=QDRANT_HNSW_M,
+            hnsw_ef_construct=QDRANT_HNSW_EF_CONSTRUCT,
+            hnsw_ef=QDRANT_HNSW_EF or None,
+            multitenancy=QDRANT_MULTITENANCY,
+            tenant_payload_m=QDRANT_TENANT_PAYLOAD_M,
+        )
+
+    def dense_vector_params(self, size: int) -> models.VectorParams:
+        return models.VectorParams(
+            size=size,
+            distance=models.Distance.COSINE,
+            on_disk=self.vectors_on_disk,
+        )
+
+    def sparse_vector_params(self) -> models.SparseVectorParams:
+        return models.SparseVectorParams(
+            modifier=models.Modifier.IDF,
+            index=models.SparseIndexParams(on_disk=self.vectors_on_disk),
+        )
+
+    def hnsw_config(self) -> models.HnswConfigDiff:
+        """Global graph by default; per-tenant graphs only in multitenancy mode.
+
+        ``m=0`` skips the collection-wide graph, which no user-scoped search
+        needs, and ``payload_m`` builds one graph per tenant index value.
+        """
+        if self.multitenancy:
+            return models.HnswConfigDiff(
+                m=0, payload_m=self.tenant_payload_m, ef_construct=self.hnsw_ef_construct
+            )
+        return models.HnswConfigDiff(m=self.hnsw_m, ef_construct=self.hnsw_ef_construct)
+
+    def payload_index_schema(
+        self, field_name: str, schema_type: models.PayloadSchemaType
+    ) -> models.PayloadSchemaType | models.KeywordIndexParams:
+        if self.multitenancy and field_name == TENANT_FIELD:
+            return models.KeywordIndexParams(type=models.KeywordIndexType.KEYWORD, is_tenant=True)
+        return schema_type
+
+    def quantization_config(self) -> models.QuantizationConfig | None:
+        if self.quantization == QUANTIZATION_SCALAR:
+            return models.ScalarQuantization(
+                scalar=models.ScalarQuantizationConfig(
+                    type=models.ScalarType.INT8,
+                    quantile=0.99,
+                    always_ram=self.quantization_always_ram,
+                )
+            )
+        if self.quantization == QUANTIZATION_BINARY:
+            return models.BinaryQuantization(
+                binary=models.BinaryQuantizationConfig(always_ram=self.quantization_always_ram)
+            )
+        return None
+
+    def search_params(self) -> models.SearchParams | None:
+        """Per-query parameters for dense searches; None keeps the server defaults."""
+        quantization = None
+        if self.quantization != QUANTIZATION_NONE:
+            quantization = models.QuantizationSearchParams(
+                rescore=self.rescore,
+                oversampling=self.oversampling if self.rescore else None,
+            )
+        if quantization is None and self.hnsw_ef is None:
+            return None
+        return models.SearchParams(hnsw_ef=self.hnsw_ef, quantization=quantization)
+
+
+STORAGE_SETTINGS = VectorStorageSettings.from_config()
@@ -0,0 +1,268 @@
+"""Blue/green re-embedding of the Qdrant collections onto a new embedding model.
+
+Lifecycle, driven from ``/api/ingest/migration``:
+
+1. ``start_migration`` creates the shadow collection set (``{name}_vN``) sized
+   for the new embedding service and marks the migration running. From then on
+   ingestion writes both sets (see ``QdrantVectorStore._upsert_points``).
+2. ``tasks.reembed_collections`` copies every active point into the shadow set,
+   re-embedding its stored ``embed_text`` one page per task, each task queueing
+   the next after a throttle. The scroll cursor is checkpointed in the routing
+   hash, so a re-queued chain resumes.
+3. ``cutover`` points the Qdrant aliases at the shadow set and switches the
+   routing to it, each in a single request.
+4. ``finalize_migration`` drops the retired set (or an aborted shadow set) once
+   every process has picked up the new routing. ``abort_migration`` stops the
+   double writes without touching the active set.
+"""
+from __future__ import annotations
+
+import json
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from qdrant_client import models
+
+from app.core.config import EMBEDDING_MIGRATION_BATCH_SIZE, EMBEDDING_ROUTING_REFRESH_SECONDS
+from app.services.ingestion.storage.collection_routing import (
+    MIGRATION_ABORTED,
+    MIGRATION_COMPLETED,
+    MIGRATION_IDLE,
+    MIGRATION_READY,
+    MIGRATION_RUNNING,
+    SHADOW_STATES,
+    EmbeddingTarget,
+    load_state,
+    routing_from_state,
+    save_state,
+)
+from app.services.ingestion.storage.vector_store import COLLECTIONS, QdrantVectorStore
+
+
+class MigrationError(RuntimeError):
+    """The requested migration step does not apply in the current state."""
+
+
+@dataclass
+class MigrationProgress:
+    status: str
+    active_version: int | None
+    active_model: str
+    target_version: int | None
+    target_model: str | None
+    total: int
+    migrated: int
+    percent: float
+    points_per_second: float
+    eta_seconds: float | None
+    cleanup_pending: bool
+
+    @classmethod
+    def from_state(cls, state: dict[str, str]) -> "MigrationProgress":
+        routing = routing_from_state(state)
+        total = int(state.get("total") or 0)
+        migrated = int(state.get("migrated") or 0)
+        elapsed = float(state.get("updated_at") or 0) - float(state.get("started_at") or 0)
+        rate = migrated / elapsed if elapsed > 0 else 0.0
+        status = state.get("status") or MIGRATION_IDLE
+        eta = None
+        if status == MIGRATION_RUNNING and rate > 0:
+            eta = round(max(0, total - migrated) / rate, 1)
+        elif status == MIGRATION_READY:
+            eta = 0.0
+        return cls(
+            status=status,
+            active_version=routing.active.version,
+            active_model=routing.active.model,
+            target_version=int(state["target_version"]) if state.get("target_version") else None,
+            target_model=state.get("target_model") or None,
+            total=total,
+            migrated=migrated,
+            percent=round(min(100.0, 100.0 * migrated / total), 1) if total else (100.0 if status == MIGRATION_READY else 0.0),
+            points_per_second=round(rate, 2),
+            eta_seconds=eta,
+            cleanup_pending=bool(state.get("cleanup_pending")),
+        )
+
+
+def migration_progress() -> MigrationProgress:
+    return MigrationProgress.from_state(load_state())
+
+
+def start_migration(
+    model: str, base_url: str | None = None, store: QdrantVectorStore | None = None
+) -> MigrationProgress:
+    """Create the shadow collection set for ``model`` and start double-writing to it."""
+    state = load_state()
+    if state.get("status") in SHADOW_STATES:
+        raise MigrationError("A re-embedding is already in progress; cut over or abort it first.")
+    if state.get("cleanup_pending"):
+        raise MigrationError("Finalize the previous migration before starting a new one.")
+    routing = routing_from_state(state)
+    active = routing.active
+    target = EmbeddingTarget(
+        version=(active.version or 1) + 1,
+        model=model,
+        base_url=(base_url or active.base_url).rstrip("/"),
+    )
+    store = store or QdrantVectorStore(routing=routing)
+    store.create_collection_set(target, store.embedding_client_for(target))
+    now = time.time()
+    fields: dict[str, Any] = {
+        "status": MIGRATION_RUNNING,
+        "active_version": active.version,
+        "active_model": active.model,
+        "active_base_url": active.base_url,
+        "target_version": target.version,
+        "target_model": target.model,
+        "target_base_url": target.base_url,
+        "total": store.count_points(active),
+        "migrated": 0,
+        "started_at": now,
+        "updated_at": now,
+        "ended_at": None,
+    }
+    for logical_name in COLLECTIONS:
+        fields[f"cursor:{logical_name}"] = None
+        fields[f"done:{logical_name}"] = None
+    save_state(fields)
+    return migration_progress()
+
+
+def reembed_next_page(store: QdrantVectorStore | None = None) -> bool:
+    """Copy one page of active points into the shadow set; True once nothing is left.
+
+    Points already in the shadow set were double-written by live ingestion,
+    which is at least as new as this copy, so they are not overwritten: they
+    are skipped before re-embedding, and the write is insert-only so a double
+    write landing after that check still wins. Copies of points deleted after
+    the scroll are removed again once written.
+    """
+    state = load_state()
+    if state.get("status") != MIGRATION_RUNNING:
+        return True
+    routing = routing_from_state(state)
+    store = store or QdrantVectorStore(routing=routing)
+    for logical_name in COLLECTIONS:
+        if state.get(f"done:{logical_name}"):
+            continue
+        source = routing.active.collection(logical_name)
+        shadow = routing.shadow.collection(logical_name)
+        cursor = state.get(f"cursor:{logical_name}")
+        records, next_offset = [], None
+        if store.client.collection_exists(source):
+            records, next_offset = store.client.scroll(
+                collection_name=source,
+                limit=EMBEDDING_MIGRATION_BATCH_SIZE,
+                offset=json.loads(cursor) if cursor else None,
+                with_payload=True,
+                with_vectors=False,
+            )
+        if records:
+            present = {
+                str(record.id)
+                for record in store.client.retrieve(
+                    collection_name=shadow,
+                    ids=[record.id for record in records],
+                    with_payload=False,
+                    with_vectors=False,
+                )
+            }
+            pending = [(record.id, record.payload) for record in records if str(record.id) not in present]
+            copies = store.retarget_points(pending, routing.shadow, store.shadow_embedding_client)
+            store.insert_physical(shadow, copies)
+            _drop_deleted_copies(store, source, shadow, [point.id for point in copies])
+        fields: dict[str, Any] = {
+            f"cursor:{logical_name}": json.dumps(next_offset) if next_offset is not None else None,
+            "migrated": int(state.get("migrated") or 0) + len(records),
+            "updated_at": time.time(),
+        }
+        if next_offset is None:
+            fields[f"done:{logical_name}"] = 1
+        save_state(fields)
+        return False
+    save_state({"status": MIGRATION_READY, "updated_at": time.time()})
+    return True
+
+
+def _drop_deleted_copies(store: QdrantVectorStore, source: str, shadow: str, point_ids: list[Any]) -> None:
+    """Delete copies whose source point was deleted while their page was in flight.
+
+    Live writes and deletes reach the active set before the shadow set, so a
+    copied point the source no longer has was deleted after the scroll, and
+    that delete may already have missed the shadow set.
+    """
+    if not point_ids:
+        return
+    kept = {
+        str(record.id)
+        for record in store.client.retrieve(
+            collection_name=source, ids=point_ids, with_payload=False, with_vectors=False
+        )
+    }
+    deleted = [point_id for point_id in point_ids if str(point_id) not in kept]
+    if deleted:
+        store.client.delete(collection_name=shadow, points_selector=models.PointIdsList(points=deleted))
+
+
+def cutover(store: QdrantVectorStore | None = None) -> MigrationProgress:
+    """Make the fully copied shadow set the active one: aliases first, then routing."""
+    state = load_state()
+    if state.get("status") != MIGRATION_READY:
+        raise MigrationError("The shadow collections are not fully re-embedded yet.")
+    routing = routing_from_state(state)
+    store = store or QdrantVectorStore(routing=routing)
+    store.point_aliases(routing.shadow)
+    # Processes still on the previous routing keep writing both sets until
+    # they refresh, so the new set misses nothing while they catch up.
+    save_state({
+        "status": MIGRATION_COMPLETED,
+        "active_version": routing.shadow.version,
+        "active_model": routing.shadow.model,
+        "active_base_url": routing.shadow.base_url,
+        "cleanup_version": routing.active.version,
+        "cleanup_pending": 1,
+        "ended_at": time.time(),
+    })
+    return migration_progress()
+
+
+def abort_migration() -> MigrationProgress:
+    """Stop double-writing; the shadow set is dropped by ``finalize_migration``."""
+    state = load_state()
+    if state.get("status") not in SHADOW_STATES:
+        raise MigrationError("No re-embedding is in progress.")
+    save_state({
+        "status": MIGRATION_ABORTED,
+        "cleanup_version": state.get("target_version"),
+        "cleanup_pending": 1,
+        "ended_at": time.time(),
+    })
+    return migration_progress()
+
+
+def finalize_migration(store: QdrantVectorStore | None = None) -> MigrationProgress:
+    """Drop the retired (or aborted) collection set and claim the aliases it held."""
+    state = load_state()
+    if not state.get("cleanup_pending"):
+        raise MigrationError("There is no retired collection set to drop.")
+    waited = time.time() - float(state.get("ended_at") or 0)
+    if waited < EMBEDDING_ROUTING_REFRESH_SECONDS:
+        raise MigrationError(
+            f"Retry in {EMBEDDING_ROUTING_REFRESH_SECONDS - waited:.0f}s, once every process has left the retired collections."
+        )
+    routing = routing_from_state(state)
+    store = store or QdrantVectorStore(routing=routing)
+    cleanup_version = state.get("cleanup_version")
+    retired = EmbeddingTarget(
+        version=int(cleanup_version) if cleanup_version else None,
+        model="",
+        base_url="",
+    )
+    if retired.version == routing.active.version:
+        raise MigrationError("Refusing to drop the active collection set.")
+    store.drop_collection_set(retired)
+    store.point_aliases(routing.active)
+    save_state({"cleanup_version": None, "cleanup_pending": None})
+    return migration_progress()
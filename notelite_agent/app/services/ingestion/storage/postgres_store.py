@@ -1,15 +1,44 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+import uuid
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any
 
-from sqlalchemy import delete, or_, select, text
+from sqlalchemy import Uuid, bindparam, delete, or_, select, text, tuple_
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import ProgrammingError
+from sqlalchemy.orm import Session
 
-from app.db.models import ChunkDateRecord, DocumentRecord, SkippedChunkRecord
+from app.db.models import (
+    ChunkDateRecord,
+    ChunkEmbedTextRecord,
+    ChunkFingerprintRecord,
+    DocumentRecord,
+    IndexGenerationRecord,
+    SkippedChunkRecord,
+)
 from app.db.postgres import DatabaseManager
-from app.services.ingestion.processors.ingest.models import IndexChunk
+from app.db.user_settings import user_settings_cache
+from app.services.ingestion.processors.ingest.models import ChunkTerms, IndexChunk
+
+
+_USER_TIMEZONE_QUERY = text("SELECT timezone FROM users WHERE id = :user_id").bindparams(
+    bindparam("user_id", type_=Uuid)
+)
+
+
+@dataclass
+class DocumentArtifacts:
+    """One document's PostgreSQL artifacts, as passed to ``replace_documents``."""
+
+    payload: dict[str, Any]
+    doc_id: str
+    chunks: Sequence[IndexChunk]
+    summary: str
+    dates: Sequence[dict[str, Any]]
+    chunk_terms: Mapping[str, ChunkTerms] | None = None
 
 
 class PostgresArtifactStore:
@@ -17,16 +46,53 @@ class PostgresArtifactStore:
 
     def user_timezone(self, user_id: str) -> str:
         """Return the user's IANA timezone, falling back to UTC."""
-        with DatabaseManager.get_session_factory()() as session:
-            try:
-                value = session.execute(
-                    text("SELECT timezone FROM users WHERE id::text = :user_id"),
-                    {"user_id": user_id},
-                ).scalar_one_or_none()
-            except Exception:
-                session.rollback()
-                return "UTC"
-        return str(value or "UTC")
+        cached = user_settings_cache().get(user_id, "timezone")
+        if cached is not None:
+            return cached
+        user_uuid = self._user_uuid(user_id)
+        value = None
+        if user_uuid is not None:
+            with DatabaseManager.get_session_factory()() as session:
+                try:
+                    value = session.execute(_USER_TIMEZONE_QUERY, {"user_id": user_uuid}).scalar_one_or_none()
+                except Exception:
+                    session.rollback()
+                    return "UTC"
+        return self._remember_timezone(user_id, value)
+
+    async def auser_timezone(self, user_id: str) -> str:
+        """Async variant of ``user_timezone`` for the event-loop retrieval path."""
+        cached = user_settings_cache().get(user_id, "timezone")
+        if cached is not None:
+            return cached
+        user_uuid = self._user_uuid(user_id)
+        value = None
+        if user_uuid is not None:
+            async with DatabaseManager.get_async_session_factory()() as session:
+                try:
+                    value = (await session.execute(
+                        _USER_TIMEZONE_QUERY, {"user_id": user_uuid}
+                    )).scalar_one_or_none()
+                except Exception:
+                    await session.rollback()
+                    return "UTC"
+        return self._remember_timezone(user_id, value)
+
+    @staticmethod
+    def _user_uuid(user_id: str) -> uuid.UUID | None:
+        # users.id is a uuid primary key; comparing it as uuid (not id::text) uses the index.
+        try:
+            return uuid.UUID(str(user_id))
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def _remember_timezone(user_id: str, value: Any) -> str:
+        # Only completed lookups get here: a user without a row (or a timezone)
+        # caches UTC; a failed query falls back uncached and is retried next turn.
+        timezone_name = str(value or "UTC")
+        user_settings_cache().put(user_id, "timezone", timezone_name)
+        return timezone_name
 
     def replace_document(
         self,
@@ -35,36 +101,209 @@ class PostgresArtifactStore:
         chunks: Sequence[IndexChunk],
         summary: str,
         dates: Sequence[dict[str, Any]],
+        chunk_terms: Mapping[str, ChunkTerms] | None = None,
     ) -> None:
-        """Transactionally replace all PostgreSQL retrieval artifacts for a document."""
-        now = datetime.now(timezone.utc)
-        created_at = payload.get("created_at") or now
-        updated_at = payload.get("updated_at") or now
-        timestamp_fallback = not payload.get("created_at") or not payload.get("updated_at")
+        """Transactionally replace all PostgreSQL retrieval artifacts for a document.
 
+        ``chunk_terms`` (fingerprint -> terms) replaces the document's reusable
+        keyword cache; ``None`` leaves the stored fingerprints untouched.
+        """
+        now = datetime.now(timezone.utc)
         with DatabaseManager.get_session_factory().begin() as session:
-            session.merge(DocumentRecord(
-                doc_id=doc_id,
-                user_id=str(payload["user_id"]),
-                folder_id=str(payload["folder_id"]),
-                note_id=str(payload["note_id"]),
-                summary=summary,
-                summary_generated_at=now if summary else None,
-                created_at=created_at,
-                updated_at=updated_at,
-                timestamp_fallback=timestamp_fallback,
-                # -1 when the producer sent no version (e.g. dev ingest routes);
-                # such rows stay eligible for reconciliation re-ingest.
-                indexed_version=int(payload.get("version") or -1),
-            ))
+            session.merge(DocumentRecord(**self._document_row(payload, doc_id, summary, now)))
             session.execute(delete(ChunkDateRecord).where(ChunkDateRecord.doc_id == doc_id))
             session.execute(delete(SkippedChunkRecord).where(SkippedChunkRecord.doc_id == doc_id))
+            session.execute(delete(ChunkEmbedTextRecord).where(ChunkEmbedTextRecord.doc_id == doc_id))
             session.add_all(ChunkDateRecord(doc_id=doc_id, **date) for date in dates)
             session.add_all(self._skipped_record(doc_id, chunk) for chunk in chunks if chunk.skip_indexing)
+            session.add_all(
+                ChunkEmbedTextRecord(doc_id=doc_id, chunk_id=chunk.chunk_id, embed_text=chunk.embed_text)
+                for chunk in self._side_stored_embed_texts(chunks)
+            )
+            if chunk_terms is not None:
+                session.execute(delete(ChunkFingerprintRecord).where(ChunkFingerprintRecord.doc_id == doc_id))
+                session.add_all(
+                    ChunkFingerprintRecord(
+                        doc_id=doc_id,
+                        fingerprint=terms.fingerprint,
+                        keywords=terms.keywords,
+                        entities=terms.entities,
+                        entity_labels=terms.entity_labels,
+                    )
+                    for terms in chunk_terms.values()
+                )
+            self._bump_index_generation(session, str(payload["user_id"]))
+
+    def replace_documents(self, documents: Sequence[DocumentArtifacts]) -> None:
+        """``replace_document`` for a batch in one transaction with multi-row statements.
+
+        Documents are upserted with a single ``INSERT ... ON CONFLICT``, the
+        dependent rows are cleared with one ``DELETE ... WHERE doc_id IN`` per
+        table and re-inserted as multi-row VALUES, and each user's index
+        generation is bumped once. Doc ids must be unique within the batch.
+        """
+        if not documents:
+            return
+        now = datetime.now(timezone.utc)
+        doc_ids = [document.doc_id for document in documents]
+        document_rows = [
+            self._document_row(document.payload, document.doc_id, document.summary, now)
+            for document in documents
+        ]
+        date_rows = [
+            {"doc_id": document.doc_id, "created_at": now, **date}
+            for document in documents
+            for date in document.dates
+        ]
+        skipped_rows = [
+            self._skipped_row(document.doc_id, chunk, now)
+            for document in documents
+            for chunk in document.chunks
+            if chunk.skip_indexing
+        ]
+        embed_text_rows = [
+            {"doc_id": document.doc_id, "chunk_id": chunk.chunk_id, "embed_text": chunk.embed_text, "created_at": now}
+            for document in documents
+            for chunk in self._side_stored_embed_texts(document.chunks)
+        ]
+        cached = [document for document in documents if document.chunk_terms is not None]
+        fingerprint_rows = [
+            {
+                "doc_id": document.doc_id,
+                "fingerprint": terms.fingerprint,
+                "keywords": terms.keywords,
+                "entities": terms.entities,
+                "entity_labels": terms.entity_labels,
+                "created_at": now,
+            }
+            for document in cached
+            for terms in document.chunk_terms.values()
+        ]
+
+        statement = insert(DocumentRecord)
+        upsert = statement.on_conflict_do_update(
+            index_elements=[DocumentRecord.doc_id],
+            set_={
+                column: statement.excluded[column]
+                for column in document_rows[0]
+                if column != "doc_id"
+            },
+        )
+        with DatabaseManager.get_session_factory().begin() as session:
+            session.execute(upsert, document_rows)
+            session.execute(delete(ChunkDateRecord).where(ChunkDateRecord.doc_id.in_(doc_ids)))
+            session.execute(delete(SkippedChunkRecord).where(SkippedChunkRecord.doc_id.in_(doc_ids)))
+            session.execute(delete(ChunkEmbedTextRecord).where(ChunkEmbedTextRecord.doc_id.in_(doc_ids)))
+            if date_rows:
+                session.execute(insert(ChunkDateRecord), date_rows)
+            if skipped_rows:
+                session.execute(insert(SkippedChunkRecord), skipped_rows)
+            if embed_text_rows:
+                session.execute(insert(ChunkEmbedTextRecord), embed_text_rows)
+            if cached:
+                session.execute(
+                    delete(ChunkFingerprintRecord).where(
+                        ChunkFingerprintRecord.doc_id.in_([document.doc_id for document in cached])
+                    )
+                )
+                if fingerprint_rows:
+                    session.execute(insert(ChunkFingerprintRecord), fingerprint_rows)
+            for user_id in sorted({str(document.payload["user_id"]) for document in documents}):
+                self._bump_index_generation(session, user_id)
+
+    @staticmethod
+    def _document_row(payload: Mapping[str, Any], doc_id: str, summary: str, now: datetime) -> dict[str, Any]:
+        created_at = payload.get("created_at") or now
+        updated_at = payload.get("updated_at") or now
+        return {
+            "doc_id": doc_id,
+            "user_id": str(payload["user_id"]),
+            "folder_id": str(payload["folder_id"]),
+            "note_id": str(payload["note_id"]),
+            "summary": summary,
+            "summary_generated_at": now if summary else None,
+            "created_at": created_at,
+            "updated_at": updated_at,
+            "timestamp_fallback": not payload.get("created_at") or not payload.get("updated_at"),
+            # -1 when the producer sent no version (e.g. dev ingest routes);
+            # such rows stay eligible for reconciliation re-ingest.
+            "indexed_version": int(payload.get("version") or -1),
+        }
+
+    def chunk_terms(self, doc_id: str) -> dict[str, ChunkTerms]:
+        """Return the document's cached chunk terms keyed by content fingerprint.
+
+        Lookup failures (e.g. the table not migrated yet) degrade to an empty
+        cache so ingestion falls back to full extraction.
+        """
+        with DatabaseManager.get_session_factory()() as session:
+            try:
+                records = session.execute(
+                    select(ChunkFingerprintRecord).where(ChunkFingerprintRecord.doc_id == doc_id)
+                ).scalars().all()
+            except Exception:
+                session.rollback()
+                return {}
+            return {
+                record.fingerprint: ChunkTerms(
+                    fingerprint=record.fingerprint,
+                    keywords=list(record.keywords or []),
+                    entities=list(record.entities or []),
+                    entity_labels=dict(record.entity_labels or {}),
+                )
+                for record in records
+            }
 
     def delete_document(self, doc_id: str) -> None:
         with DatabaseManager.get_session_factory().begin() as session:
-            session.execute(delete(DocumentRecord).where(DocumentRecord.doc_id == doc_id))
+            user_ids = session.execute(
+                delete(DocumentRecord)
+                .where(DocumentRecord.doc_id == doc_id)
+                .returning(DocumentRecord.user_id)
+            ).scalars().all()
+            for user_id in set(user_ids):
+                self._bump_index_generation(session, user_id)
+
+    @staticmethod
+    def _bump_index_generation(session: Session, user_id: str) -> None:
+        """Invalidate the user's cached retrieval results inside the write transaction."""
+        now = datetime.now(timezone.utc)
+        session.execute(
+            insert(IndexGenerationRecord)
+            .values(user_id=user_id, generation=1, updated_at=now)
+            .on_conflict_do_update(
+                index_elements=[IndexGenerationRecord.user_id],
+                set_={
+                    "generation": IndexGenerationRecord.generation + 1,
+                    "updated_at": now,
+                },
+            )
+        )
+
+    def index_generation(self, user_id: str) -> int | None:
+        """Return the user's index generation; None when it cannot be read."""
+        with DatabaseManager.get_session_factory()() as session:
+            try:
+                value = session.execute(self._index_generation_query(user_id)).scalar_one_or_none()
+            except Exception:
+                session.rollback()
+                return None
+        return int(value or 0)
+
+    async def aindex_generation(self, user_id: str) -> int | None:
+        async with DatabaseManager.get_async_session_factory()() as session:
+            try:
+                value = (await session.execute(self._index_generation_query(user_id))).scalar_one_or_none()
+            except Exception:
+                await session.rollback()
+                return None
+        return int(value or 0)
+
+    @staticmethod
+    def _index_generation_query(user_id: str):
+        return select(IndexGenerationRecord.generation).where(
+            IndexGenerationRecord.user_id == str(user_id)
+        )
 
     def matching_identities(
         self,
@@ -73,6 +312,32 @@ class PostgresArtifactStore:
         end: datetime,
     ) -> list[tuple[str, str]]:
         """Return chunk identities matching content, created, or updated dates."""
+        content_query, document_query = self._identity_queries(user_id, start, end)
+        try:
+            with DatabaseManager.get_session_factory()() as session:
+                content_rows = session.execute(content_query).all()
+                document_ids = session.execute(document_query).scalars().all()
+        except ProgrammingError as exc:
+            raise self._schema_error(exc) from exc
+        return self._identities(content_rows, document_ids)
+
+    async def amatching_identities(
+        self,
+        user_id: str | None,
+        start: datetime,
+        end: datetime,
+    ) -> list[tuple[str, str]]:
+        content_query, document_query = self._identity_queries(user_id, start, end)
+        try:
+            async with DatabaseManager.get_async_session_factory()() as session:
+                content_rows = (await session.execute(content_query)).all()
+                document_ids = (await session.execute(document_query)).scalars().all()
+        except ProgrammingError as exc:
+            raise self._schema_error(exc) from exc
+        return self._identities(content_rows, document_ids)
+
+    @staticmethod
+    def _identity_queries(user_id: str | None, start: datetime, end: datetime):
         content_conditions = [ChunkDateRecord.date_value.between(start, end)]
         document_conditions = [or_(
             DocumentRecord.created_at.between(start, end),
@@ -81,20 +346,15 @@ class PostgresArtifactStore:
         if user_id:
             content_conditions.append(DocumentRecord.user_id == user_id)
             document_conditions.append(DocumentRecord.user_id == user_id)
+        return (
+            select(ChunkDateRecord.doc_id, ChunkDateRecord.chunk_id)
+            .join(DocumentRecord, DocumentRecord.doc_id == ChunkDateRecord.doc_id)
+            .where(*content_conditions),
+            select(DocumentRecord.doc_id).where(*document_conditions),
+        )
 
-        try:
-            with DatabaseManager.get_session_factory()() as session:
-                content_rows = session.execute(
-                    select(ChunkDateRecord.doc_id, ChunkDateRecord.chunk_id)
-                    .join(DocumentRecord, DocumentRecord.doc_id == ChunkDateRecord.doc_id)
-                    .where(*content_conditions)
-                ).all()
-                document_ids = session.execute(
-                    select(DocumentRecord.doc_id).where(*document_conditions)
-                ).scalars().all()
-        except ProgrammingError as exc:
-            raise self._schema_error(exc) from exc
-
+    @staticmethod
+    def _identities(content_rows, document_ids) -> list[tuple[str, str]]:
         identities = [*(tuple(row) for row in content_rows), *((doc_id, "*") for doc_id in document_ids)]
         return list(dict.fromkeys(identities))
 
@@ -103,14 +363,27 @@ class PostgresArtifactStore:
             return []
         try:
             with DatabaseManager.get_session_factory()() as session:
-                return list(session.execute(
-                    select(DocumentRecord.summary)
-                    .where(DocumentRecord.doc_id.in_(doc_ids), DocumentRecord.summary != "")
-                    .limit(limit)
-                ).scalars())
+                return list(session.execute(self._summaries_query(doc_ids, limit)).scalars())
+        except ProgrammingError as exc:
+            raise self._schema_error(exc) from exc
+
+    async def asummaries(self, doc_ids: Sequence[str], limit: int) -> list[str]:
+        if not doc_ids:
+            return []
+        try:
+            async with DatabaseManager.get_async_session_factory()() as session:
+                return list((await session.execute(self._summaries_query(doc_ids, limit))).scalars())
         except ProgrammingError as exc:
             raise self._schema_error(exc) from exc
 
+    @staticmethod
+    def _summaries_query(doc_ids: Sequence[str], limit: int):
+        return (
+            select(DocumentRecord.summary)
+            .where(DocumentRecord.doc_id.in_(doc_ids), DocumentRecord.summary != "")
+            .limit(limit)
+        )
+
     def skipped_chunk(self, doc_id: str, chunk_id: str) -> SkippedChunkRecord | None:
         try:
             with DatabaseManager.get_session_factory()() as session:
@@ -118,6 +391,62 @@ class PostgresArtifactStore:
         except ProgrammingError as exc:
             raise self._schema_error(exc) from exc
 
+    def skipped_chunks(
+        self,
+        identities: Sequence[tuple[str, str]],
+    ) -> dict[tuple[str, str], SkippedChunkRecord]:
+        """Load skipped chunks for many (doc_id, chunk_id) pairs in one query."""
+        if not identities:
+            return {}
+        try:
+            with DatabaseManager.get_session_factory()() as session:
+                records = session.scalars(self._skipped_chunks_query(identities)).all()
+        except ProgrammingError as exc:
+            raise self._schema_error(exc) from exc
+        return {(record.doc_id, record.chunk_id): record for record in records}
+
+    async def askipped_chunks(
+        self,
+        identities: Sequence[tuple[str, str]],
+    ) -> dict[tuple[str, str], SkippedChunkRecord]:
+        if not identities:
+            return {}
+        try:
+            async with DatabaseManager.get_async_session_factory()() as session:
+                records = (await session.scalars(self._skipped_chunks_query(identities))).all()
+        except ProgrammingError as exc:
+            raise self._schema_error(exc) from exc
+        return {(record.doc_id, record.chunk_id): record for record in records}
+
+    @staticmethod
+    def _skipped_chunks_query(identities: Sequence[tuple[str, str]]):
+        return select(SkippedChunkRecord).where(
+            tuple_(SkippedChunkRecord.doc_id, SkippedChunkRecord.chunk_id).in_(
+                [(str(doc_id), str(chunk_id)) for doc_id, chunk_id in identities]
+            )
+        )
+
+    def chunk_embed_texts(self, identities: Sequence[tuple[str, str]]) -> dict[tuple[str, str], str]:
+        """Side-stored embed texts for (doc_id, chunk_id) pairs; absent pairs embed their content."""
+        if not identities:
+            return {}
+        query = select(ChunkEmbedTextRecord).where(
+            tuple_(ChunkEmbedTextRecord.doc_id, ChunkEmbedTextRecord.chunk_id).in_(
+                [(str(doc_id), str(chunk_id)) for doc_id, chunk_id in identities]
+            )
+        )
+        try:
+            with DatabaseManager.get_session_factory()() as session:
+                records = session.scalars(query).all()
+        except ProgrammingError as exc:
+            raise self._schema_error(exc) from exc
+        return {(record.doc_id, record.chunk_id): record.embed_text for record in records}
+
+    @staticmethod
+    def _side_stored_embed_texts(chunks: Sequence[IndexChunk]) -> list[IndexChunk]:
+        # Qdrant payloads omit embed_text; it is kept here only when the content alone is not it.
+        return [chunk for chunk in chunks if not chunk.skip_indexing and chunk.embed_text != chunk.content]
+
     @staticmethod
     def _schema_error(exc: ProgrammingError) -> RuntimeError:
         return RuntimeError(
@@ -139,3 +468,20 @@ class PostgresArtifactStore:
             skip_reason=chunk.skip_reason,
             metadata_json=chunk.metadata,
         )
+
+    @staticmethod
+    def _skipped_row(doc_id: str, chunk: IndexChunk, now: datetime) -> dict[str, Any]:
+        # ORM bulk inserts take attribute names, so the "metadata" column is metadata_json.
+        return {
+            "doc_id": doc_id,
+            "chunk_id": chunk.chunk_id,
+            "chunk_index": chunk.chunk_index,
+            "chunk_type": chunk.chunk_type,
+            "content": chunk.content,
+            "embed_text": chunk.embed_text,
+            "prev_chunk_id": chunk.prev_chunk_id,
+            "next_chunk_id": chunk.next_chunk_id,
+            "skip_reason": chunk.skip_reason,
+            "metadata_json": chunk.metadata,
+            "created_at": now,
+        }
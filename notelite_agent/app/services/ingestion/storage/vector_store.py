@@ -4,20 +4,34 @@ import logging
 import time
 from datetime import datetime, timezone
 import uuid
+import weakref
 from collections.abc import Mapping, Sequence
 from typing import Any, List
 
 from llama_index.core import Document as LlamaDocument
 from llama_index.core import Settings
-from qdrant_client import models
+from qdrant_client import AsyncQdrantClient, models
 
-from app.core.config import QDRANT_COLLECTION
+from app.core.config import (
+    INCREMENTAL_INGESTION,
+    INGESTION_EMBED_BATCH_SIZE,
+    QDRANT_COLLECTION,
+    QDRANT_UPSERT_BATCH_SIZE,
+)
+from app.services.ingestion.processors.fingerprints import payload_fingerprint, text_fingerprint
 from app.services.ingestion.processors.ingest.models import IndexChunk, QuestionDocument, SummaryArtifacts, SummaryDocument
 from app.db.qdrant import QdrantClientManager
 from app.core.embeddings import (
     EmbeddingBatch,
+    RemoteEmbeddingService,
     SharedEmbeddingClient,
 )
+from app.services.ingestion.storage.collection_routing import (
+    CollectionRouting,
+    EmbeddingTarget,
+    collection_routing,
+)
+from app.services.ingestion.storage.collection_settings import STORAGE_SETTINGS, TENANT_FIELD, VectorStorageSettings
 
 
 log = logging.getLogger(__name__)
@@ -25,6 +39,9 @@ log = logging.getLogger(__name__)
 CHUNK_COLLECTION = QDRANT_COLLECTION
 SUMMARY_COLLECTION = f"{QDRANT_COLLECTION}_summaries"
 QUESTIONS_COLLECTION = f"{QDRANT_COLLECTION}_questions"
+# Logical names; the physical collection behind each depends on the routing
+# (``collection_routing``): the name itself, or ``{name}_vN`` after a re-embedding.
+COLLECTIONS = (CHUNK_COLLECTION, SUMMARY_COLLECTION, QUESTIONS_COLLECTION)
 
 DENSE_VECTOR = "dense"
 SPARSE_VECTOR = "sparse"
@@ -33,71 +50,287 @@ QUESTIONS_VECTOR = "questions"
 PAYLOAD_INDEXES = (
     ("doc_id", models.PayloadSchemaType.KEYWORD),
     ("chunk_id", models.PayloadSchemaType.KEYWORD),
-    ("metadata.user_id", models.PayloadSchemaType.KEYWORD),
+    (TENANT_FIELD, models.PayloadSchemaType.KEYWORD),
     ("metadata.doc_id", models.PayloadSchemaType.KEYWORD),
 )
+# Bump when COLLECTIONS or PAYLOAD_INDEXES change. Collections carry the version
+# they were bootstrapped with in their Qdrant metadata, so a process only
+# re-ensures indexes on collections that are behind.
+COLLECTION_SCHEMA_VERSION = 1
+# Physical collections bootstrapped by this process, per Qdrant client. Every
+# store shares the process-wide client, so after startup ingestion does no
+# schema round trips.
+_BOOTSTRAPPED_COLLECTIONS: weakref.WeakKeyDictionary[Any, set[str]] = weakref.WeakKeyDictionary()
+
+# Point payload fields that change on every write without changing the chunk;
+# excluded from the point fingerprint so unchanged chunks are not rewritten.
+VOLATILE_PAYLOAD_FIELDS = ("created_at",)
+VOLATILE_METADATA_FIELDS = ("indexed_at", "embedding_dim")
+# Note-level metadata repeated on every chunk that retrieval never reads.
+UNSTORED_METADATA_FIELDS = ("description",)
+
+# Chunk searches skip the text and bookkeeping fields; ``hydrate_chunks`` loads
+# the text of the candidates that survive fusion with one retrieve. The legacy
+# ``text``/``embed_text`` fields only exist on points written before the compact
+# schema.
+CHUNK_TEXT_FIELDS = ("content", "text", "keywords", "entities")
+CHUNK_SEARCH_PAYLOAD = models.PayloadSelectorExclude(
+    exclude=[*CHUNK_TEXT_FIELDS, "embed_text", "fingerprint", "embed_hash"]
+)
+CHUNK_CONTEXT_PAYLOAD = models.PayloadSelectorExclude(exclude=["embed_text", "fingerprint", "embed_hash"])
+# Summary and question hits only contribute their document ids.
+DOC_ID_PAYLOAD = ["doc_id", "metadata.doc_id"]
+# Set on documents built from a search hit whose text has not been loaded yet.
+TEXT_PENDING = "text_pending"
+EXISTING_POINTS_PAGE_SIZE = 256
 
 
 class QdrantVectorStore:
     """Small Qdrant wrapper for vector storage and retrieval."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        routing: CollectionRouting | None = None,
+        storage_settings: VectorStorageSettings | None = None,
+    ):
         self.client = QdrantClientManager.get_client()
-        self.embedding_client = SharedEmbeddingClient()
+        # One routing snapshot per store: embeddings and collections always match.
+        self.routing = routing or collection_routing()
+        self.embedding_client = self.embedding_client_for(self.routing.active)
+        self._storage_settings = storage_settings
+        self._shadow_embedding_client: SharedEmbeddingClient | None = None
+        self._async_client: AsyncQdrantClient | None = None
         self.events = []
 
+    @staticmethod
+    def embedding_client_for(target: EmbeddingTarget) -> SharedEmbeddingClient:
+        if target.is_default_service:
+            return SharedEmbeddingClient()
+        return SharedEmbeddingClient(
+            remote_service=RemoteEmbeddingService(base_url=target.base_url, model=target.model)
+        )
+
+    @property
+    def active_target(self) -> EmbeddingTarget:
+        return self.routing.active
+
+    @property
+    def shadow_target(self) -> EmbeddingTarget | None:
+        return self.routing.shadow
+
+    @property
+    def storage_settings(self) -> VectorStorageSettings:
+        return self._storage_settings or STORAGE_SETTINGS
+
+    def _search_params(self, vector_name: str) -> models.SearchParams | None:
+        # Quantization and HNSW only exist for the dense vectors.
+        return None if vector_name == SPARSE_VECTOR else self.storage_settings.search_params()
+
+    def collection(self, logical_name: str) -> str:
+        """Physical collection currently serving ``logical_name``."""
+        return self.routing.active.collection(logical_name)
+
+    @property
+    def shadow_embedding_client(self) -> SharedEmbeddingClient:
+        if self._shadow_embedding_client is None:
+            self._shadow_embedding_client = self.embedding_client_for(self.shadow_target)
+        return self._shadow_embedding_client
+
+    @property
+    def async_client(self) -> AsyncQdrantClient:
+        """Shared async client for the event-loop retrieval path, created on first use."""
+        if self._async_client is None:
+            self._async_client = QdrantClientManager.get_async_client()
+        return self._async_client
+
     def ensure_collections(self) -> None:
-        for collection_name in (CHUNK_COLLECTION, SUMMARY_COLLECTION, QUESTIONS_COLLECTION):
+        """Create the active collections and bring their indexes to the current schema.
+
+        Runs at API and worker startup; afterwards it is a set lookup, so
+        ingestion can keep calling it for free.
+        """
+        bootstrapped = self._bootstrapped_collections()
+        for logical_name in COLLECTIONS:
+            collection_name = self.collection(logical_name)
+            if collection_name in bootstrapped:
+                continue
             if not self._collection_exists(collection_name):
-                self._create_collection(collection_name)
-            self._ensure_payload_indexes(collection_name)
+                self._create_collection(collection_name, logical_name)
+                self._ensure_payload_indexes(collection_name)
+            elif not self._schema_current(collection_name):
+                # The marker records the tenant layout, so it is only stamped
+                # together with the HNSW config that layout implies.
+                self._ensure_payload_indexes(collection_name)
+                self.client.update_collection(
+                    collection_name=collection_name,
+                    hnsw_config=self.storage_settings.hnsw_config(),
+                    metadata=self._schema_marker(),
+                )
+            bootstrapped.add(collection_name)
+
+    def _bootstrapped_collections(self) -> set[str]:
+        try:
+            return _BOOTSTRAPPED_COLLECTIONS.setdefault(self.client, set())
+        except TypeError:
+            # No client, or one that cannot be weakly referenced: nothing is cached.
+            return set()
+
+    def _schema_marker(self) -> dict[str, Any]:
+        return {
+            "schema_version": COLLECTION_SCHEMA_VERSION,
+            "tenant_index": self.storage_settings.multitenancy,
+        }
+
+    def _schema_current(self, collection_name: str) -> bool:
+        metadata = self.client.get_collection(collection_name).config.metadata or {}
+        return all(metadata.get(key) == value for key, value in self._schema_marker().items())
 
     def validate_collection_dimensions(self) -> None:
-        expected = self._embedding_dimension()
-        for name in (CHUNK_COLLECTION, SUMMARY_COLLECTION, QUESTIONS_COLLECTION):
-            if not self._collection_exists(name): continue
-            info = self.client.get_collection(name)
-            vectors = info.config.params.vectors
-            dense = vectors.get(DENSE_VECTOR) if isinstance(vectors, dict) else vectors
-            if dense.size != expected:
-                raise RuntimeError(f"Qdrant collection {name} dimension {dense.size} does not match embedding dimension {expected}")
+        """Check the active (and, mid-migration, shadow) collections against their embedding service."""
+        targets = [(self.active_target, self.embedding_client)]
+        if self.shadow_target is not None:
+            targets.append((self.shadow_target, self.shadow_embedding_client))
+        for target, embedding_client in targets:
+            expected = self._embedding_dimension(embedding_client)
+            for name in (target.collection(logical_name) for logical_name in COLLECTIONS):
+                if not self._collection_exists(name):
+                    continue
+                info = self.client.get_collection(name)
+                vectors = info.config.params.vectors
+                dense = vectors.get(DENSE_VECTOR) if isinstance(vectors, dict) else vectors
+                if dense.size != expected:
+                    raise RuntimeError(f"Qdrant collection {name} dimension {dense.size} does not match embedding dimension {expected}")
+
+    def create_collection_set(self, target: EmbeddingTarget, embedding_client: SharedEmbeddingClient) -> None:
+        """Create ``target``'s collections from scratch, sized for ``embedding_client``."""
+        for logical_name in COLLECTIONS:
+            collection_name = target.collection(logical_name)
+            self._bootstrapped_collections().discard(collection_name)
+            if self._collection_exists(collection_name):
+                self.client.delete_collection(collection_name)
+            self._create_collection(collection_name, logical_name, embedding_client)
+            self._ensure_payload_indexes(collection_name)
+            self._bootstrapped_collections().add(collection_name)
+
+    def apply_tenant_layout(self) -> list[str]:
+        """Switch existing collections to (or from) the tenant layout in place.
+
+        Re-creates the ``metadata.user_id`` index with the current tenant flag
+        and updates the HNSW config; Qdrant rebuilds the affected segments in
+        the background while they keep serving searches. Returns the
+        collections updated (active and, mid-migration, shadow).
+        """
+        settings = self.storage_settings
+        targets = [self.active_target] + ([self.shadow_target] if self.shadow_target is not None else [])
+        updated = []
+        for target in targets:
+            for logical_name in COLLECTIONS:
+                collection_name = target.collection(logical_name)
+                if not self._collection_exists(collection_name):
+                    continue
+                self.client.create_payload_index(
+                    collection_name=collection_name,
+                    field_name=TENANT_FIELD,
+                    field_schema=settings.payload_index_schema(TENANT_FIELD, models.PayloadSchemaType.KEYWORD),
+                )
+                self.client.update_collection(
+                    collection_name=collection_name,
+                    hnsw_config=settings.hnsw_config(),
+                    metadata=self._schema_marker(),
+                )
+                updated.append(collection_name)
+                self.events.append(
+                    f"tenant layout applied: collection={collection_name} multitenancy={settings.multitenancy}"
+                )
+        return updated
+
+    def drop_collection_set(self, target: EmbeddingTarget) -> None:
+        for logical_name in COLLECTIONS:
+            collection_name = target.collection(logical_name)
+            self._bootstrapped_collections().discard(collection_name)
+            if self._collection_exists(collection_name):
+                self.client.delete_collection(collection_name)
+                self.events.append(f"Dropped Qdrant collection {collection_name}")
+
+    def count_points(self, target: EmbeddingTarget) -> int:
+        """Approximate point count of ``target``'s collections."""
+        return sum(
+            self.client.count(collection_name=collection_name, exact=False).count
+            for collection_name in (target.collection(logical_name) for logical_name in COLLECTIONS)
+            if self._collection_exists(collection_name)
+        )
+
+    def point_aliases(self, target: EmbeddingTarget) -> None:
+        """Point each logical name's Qdrant alias at ``target``'s collection in one atomic request.
+
+        Names still held by the unversioned collections are skipped until
+        those are dropped (``finalize_migration``), so the first migration's
+        cutover moves no alias; see docs/embedding-migration.md.
+        """
+        physical = {collection.name for collection in self.client.get_collections().collections}
+        aliases = {alias.alias_name for alias in self.client.get_aliases().aliases}
+        operations = []
+        for logical_name in COLLECTIONS:
+            if logical_name in physical or target.collection(logical_name) == logical_name:
+                continue
+            if logical_name in aliases:
+                operations.append(models.DeleteAliasOperation(
+                    delete_alias=models.DeleteAlias(alias_name=logical_name)
+                ))
+            operations.append(models.CreateAliasOperation(
+                create_alias=models.CreateAlias(collection_name=target.collection(logical_name), alias_name=logical_name)
+            ))
+        if operations:
+            self.client.update_collection_aliases(change_aliases_operations=operations)
+            self.events.append(f"Qdrant aliases updated: {len(operations)} operations")
 
     def get_collections(self) -> List[str]:
         return self.client.get_collections()
 
     def _collection_exists(self, collection_name: str) -> bool:
+        if collection_name in self._bootstrapped_collections():
+            return True
         return bool(self.client and self.client.collection_exists(collection_name))
 
-    def _embedding_dimension(self) -> int:
-        if not self.embedding_client.use_remote and not getattr(Settings, "embed_model", None):
+    def _embedding_dimension(self, embedding_client: SharedEmbeddingClient | None = None) -> int:
+        embedding_client = embedding_client or self.embedding_client
+        if not embedding_client.use_remote and not getattr(Settings, "embed_model", None):
             raise RuntimeError("LlamaIndex settings must be initialized before Qdrant setup.")
-        dimension = self.embedding_client.dimension()
-        self._drain_embedding_events()
+        dimension = embedding_client.dimension()
+        self.events.extend(embedding_client.events)
+        embedding_client.events = []
         return dimension
 
-    def _create_collection(self, collection_name: str) -> None:
-        curr_vector_size = self._embedding_dimension()
-        vectors_config = {
-            DENSE_VECTOR: models.VectorParams(
-                size=curr_vector_size,
-                distance=models.Distance.COSINE,
-            )
-        }
-        if collection_name == SUMMARY_COLLECTION:
-            vectors_config[QUESTIONS_VECTOR] = models.VectorParams(
-                size=curr_vector_size,
-                distance=models.Distance.COSINE,
-            )
+    def _create_collection(
+        self,
+        collection_name: str,
+        logical_name: str | None = None,
+        embedding_client: SharedEmbeddingClient | None = None,
+        settings: VectorStorageSettings | None = None,
+    ) -> None:
+        settings = settings or self.storage_settings
+        curr_vector_size = self._embedding_dimension(embedding_client)
+        vectors_config = {DENSE_VECTOR: settings.dense_vector_params(curr_vector_size)}
+        if (logical_name or collection_name) == SUMMARY_COLLECTION:
+            vectors_config[QUESTIONS_VECTOR] = settings.dense_vector_params(curr_vector_size)
 
         self.client.create_collection(
             collection_name=collection_name,
             vectors_config=vectors_config,
-            sparse_vectors_config={
-                SPARSE_VECTOR: models.SparseVectorParams(modifier=models.Modifier.IDF),
-            },
+            sparse_vectors_config={SPARSE_VECTOR: settings.sparse_vector_params()},
+            hnsw_config=settings.hnsw_config(),
+            quantization_config=settings.quantization_config(),
+            on_disk_payload=settings.payload_on_disk,
+            metadata=self._schema_marker(),
+        )
+        self.events.append(
+            f"Created Qdrant collection {collection_name} with vector size {curr_vector_size} "
+            f"quantization={settings.quantization} vectors_on_disk={settings.vectors_on_disk}"
+        )
+        log.info(
+            "Created Qdrant collection %s with vector size %d (quantization=%s, vectors_on_disk=%s)",
+            collection_name, curr_vector_size, settings.quantization, settings.vectors_on_disk,
         )
-        self.events.append(f"Created Qdrant collection {collection_name} with vector size {curr_vector_size}")
-        log.info("Created Qdrant collection %s with vector size %d", collection_name, curr_vector_size)
 
     def _ensure_payload_indexes(self, collection_name: str) -> None:
         for field_name, schema_type in PAYLOAD_INDEXES:
@@ -105,7 +338,7 @@ class QdrantVectorStore:
                 self.client.create_payload_index(
                     collection_name=collection_name,
                     field_name=field_name,
-                    field_schema=schema_type,
+                    field_schema=self.storage_settings.payload_index_schema(field_name, schema_type),
                 )
             except Exception:
                 log.debug("Payload index already exists or could not be created: %s", field_name)
@@ -121,6 +354,10 @@ class QdrantVectorStore:
         except (TypeError, ValueError):
             return str(uuid.uuid5(uuid.NAMESPACE_DNS, str(raw_id)))
 
+    @classmethod
+    def chunk_point_id(cls, doc_id: Any, chunk_id: Any) -> str:
+        return cls.point_id(f"{doc_id}-{chunk_id}")
+
     @staticmethod
     def sparse_vector(sparse_embedding: Any) -> models.SparseVector:
         if isinstance(sparse_embedding, Mapping):
@@ -169,98 +406,455 @@ class QdrantVectorStore:
 
         return models.Filter(must=conditions) if conditions else None
 
-    def delete_document(self, doc_id: str) -> None:
-        point_filter = self.build_filter({"doc_id": doc_id})
+    def delete_document(
+        self,
+        doc_id: str,
+        collections: Sequence[str] = COLLECTIONS,
+    ) -> None:
+        self._delete_by_filter(self.build_filter({"doc_id": doc_id}), collections)
+        self.events.append(f"document vectors deleted: {doc_id}")
+
+    def delete_documents(
+        self,
+        doc_ids: Sequence[str],
+        collections: Sequence[str] = COLLECTIONS,
+    ) -> None:
+        """Delete several documents' points with one filtered delete per collection."""
+        if not doc_ids:
+            return
+        self._delete_by_filter(self.build_filter(doc_ids=doc_ids), collections)
+        self.events.append(f"document vectors deleted: {len(doc_ids)} documents")
+
+    def _delete_by_filter(self, point_filter: models.Filter, collections: Sequence[str]) -> None:
         selector = models.FilterSelector(filter=point_filter)
+        for logical_name in collections:
+            for collection_name in self._write_collections(logical_name):
+                if not self._collection_exists(collection_name):
+                    log.info("Skipping Qdrant delete; collection does not exist: %s", collection_name)
+                    continue
+                self.client.delete(
+                    collection_name=collection_name,
+                    points_selector=selector,
+                )
 
-        for collection_name in (CHUNK_COLLECTION, SUMMARY_COLLECTION, QUESTIONS_COLLECTION):
-            if not self._collection_exists(collection_name):
-                log.info("Skipping Qdrant delete; collection does not exist: %s", collection_name)
-                continue
-            self.client.delete(
-                collection_name=collection_name,
-                points_selector=selector,
-            )
-        self.events.append(f"document vectors deleted: {doc_id}")
+    def _write_collections(self, logical_name: str) -> list[str]:
+        """The active collection, plus the shadow one while a re-embedding runs."""
+        names = [self.collection(logical_name)]
+        if self.shadow_target is not None:
+            names.append(self.shadow_target.collection(logical_name))
+        return names
 
-    def upsert_index_chunks(self, chunks: Sequence[IndexChunk]) -> None:
-        """Embed and store application-owned index chunks."""
+    def upsert_index_chunks(
+        self,
+        chunks: Sequence[IndexChunk],
+        existing: Mapping[str, Mapping[str, Any]] | None = None,
+    ) -> None:
+        """Embed and store application-owned index chunks.
+
+        ``existing`` maps point ids already stored for the document to their
+        ``fingerprint``/``embed_hash`` payload. Points with an identical fingerprint
+        are left untouched, and changed points whose embed text was embedded before
+        reuse the stored vectors instead of calling the embedding service.
+        """
         indexable = [chunk for chunk in chunks if not chunk.skip_indexing]
         if not indexable:
             self.events.append("chunk vector upsert skipped: no indexable chunks")
             return
 
-        embeddings = self.embed_texts([chunk.embed_text for chunk in indexable])
-        indexed_at = datetime.now(timezone.utc).isoformat()
+        existing = existing or {}
         embedding_model = self.embedding_client.remote_service.model
+        pending = []
+        for chunk in indexable:
+            point_id = self.chunk_point_id(chunk.document_id, chunk.chunk_id)
+            payload = self._chunk_payload(chunk, embedding_model)
+            if existing.get(point_id, {}).get("fingerprint") == payload["fingerprint"]:
+                continue
+            pending.append((point_id, chunk, payload))
+        unchanged = len(indexable) - len(pending)
+        if unchanged:
+            self.events.append(f"chunk vectors unchanged: {unchanged}")
+        if not pending:
+            self._log_skipped_chunks(chunks, indexable)
+            return
+
+        vectors = self._reusable_vectors(
+            [payload["embed_hash"] for _point_id, _chunk, payload in pending], existing
+        )
+        to_embed = [chunk for _point_id, chunk, payload in pending if payload["embed_hash"] not in vectors]
+        if to_embed:
+            embeddings = self.embed_texts([chunk.embed_text for chunk in to_embed])
+            for index, chunk in enumerate(to_embed):
+                vectors[text_fingerprint(chunk.embed_text, embedding_model)] = {
+                    DENSE_VECTOR: embeddings.dense[index],
+                    SPARSE_VECTOR: self.sparse_vector(embeddings.sparse[index]),
+                }
+        reused = len(pending) - len(to_embed)
+        if reused:
+            self.events.append(f"chunk vectors reused: {reused}")
+
+        indexed_at = datetime.now(timezone.utc).isoformat()
         points = []
-        for index, chunk in enumerate(indexable):
-            metadata = dict(chunk.metadata)
-            metadata.update({
-                "doc_id": chunk.document_id,
-                "prev_chunk_id": chunk.prev_chunk_id,
-                "next_chunk_id": chunk.next_chunk_id,
-                "embedding_model": embedding_model,
-                "embedding_dim": len(embeddings.dense[index]),
+        for point_id, _chunk, payload in pending:
+            vector = vectors[payload["embed_hash"]]
+            payload["metadata"].update({
+                "embedding_dim": len(vector[DENSE_VECTOR]),
                 "indexed_at": indexed_at,
             })
-            points.append(models.PointStruct(
-                id=self.point_id(f"{chunk.document_id}-{chunk.chunk_id}"),
-                vector={
-                    DENSE_VECTOR: embeddings.dense[index],
-                    SPARSE_VECTOR: self.sparse_vector(embeddings.sparse[index]),
-                },
-                payload={
-                    "doc_id": chunk.document_id, "chunk_id": chunk.chunk_id, "note_id": metadata.get("note_id", ""),
-                    "folder_id": metadata.get("folder_id", ""), "chunk_index": chunk.chunk_index,
-                    "total_chunks": chunk.total_chunks, "chunk_type": chunk.chunk_type,
-                    "content": chunk.content, "embed_text": chunk.embed_text,
-                    "skip_indexing": False, "skip_reason": "",
-                    "keywords": chunk.keywords, "entities": chunk.entities,
-                    "text": chunk.content, "created_at": int(time.time()), "metadata": metadata,
-                },
-            ))
-        self.client.upsert(collection_name=CHUNK_COLLECTION, points=points)
+            payload["created_at"] = int(time.time())
+            points.append(models.PointStruct(id=point_id, vector=vector, payload=payload))
+        self._upsert_points(
+            CHUNK_COLLECTION, points, embed_texts={point_id: chunk.embed_text for point_id, chunk, _payload in pending}
+        )
         self.events.append(f"chunk vectors upserted: {len(points)}")
+        self._log_skipped_chunks(chunks, indexable)
+
+    def _upsert_points(
+        self,
+        logical_name: str,
+        points: Sequence[models.PointStruct],
+        embed_texts: Mapping[str, str] | None = None,
+    ) -> None:
+        """Write points in upserts of at most QDRANT_UPSERT_BATCH_SIZE.
+
+        While a re-embedding runs, the points are also re-embedded with the
+        shadow target's service and written to its collection; ``embed_texts``
+        (point id -> text) supplies embed texts the payloads do not carry.
+        """
+        self.upsert_physical(self.collection(logical_name), points)
+        if self.shadow_target is not None:
+            shadow_points = self.retarget_points(
+                [(point.id, point.payload) for point in points],
+                self.shadow_target,
+                self.shadow_embedding_client,
+                embed_texts=embed_texts,
+            )
+            self.upsert_physical(self.shadow_target.collection(logical_name), shadow_points)
+
+    def upsert_physical(self, collection_name: str, points: Sequence[models.PointStruct]) -> None:
+        batch_size = max(1, QDRANT_UPSERT_BATCH_SIZE)
+        for start in range(0, len(points), batch_size):
+            self.client.upsert(collection_name=collection_name, points=list(points[start:start + batch_size]))
+
+    def insert_physical(self, collection_name: str, points: Sequence[models.PointStruct]) -> None:
+        """Like ``upsert_physical``, but Qdrant leaves points that already exist untouched."""
+        batch_size = max(1, QDRANT_UPSERT_BATCH_SIZE)
+        for start in range(0, len(points), batch_size):
+            self.client.upsert(
+                collection_name=collection_name,
+                points=list(points[start:start + batch_size]),
+                update_mode=models.UpdateMode.INSERT_ONLY,
+            )
+
+    def retarget_points(
+        self,
+        records: Sequence[tuple[Any, Mapping[str, Any]]],
+        target: EmbeddingTarget,
+        embedding_client: SharedEmbeddingClient,
+        embed_texts: Mapping[str, str] | None = None,
+    ) -> list[models.PointStruct]:
+        """Re-embed ``(point_id, payload)`` records from their embed text for ``target``.
+
+        Chunk payloads get the target model's ``embed_hash``, ``fingerprint``,
+        and ``embedding_model`` so diff-aware re-ingestion keeps working after
+        the cutover. Payloads are copied, never mutated.
+        """
+        if not records:
+            return []
+        texts = self._embed_texts_of(records, embed_texts or {})
+        batch_size = max(1, INGESTION_EMBED_BATCH_SIZE)
+        dense, sparse = [], []
+        for start in range(0, len(texts), batch_size):
+            part = embedding_client.embed_documents(texts[start:start + batch_size])
+            dense.extend(part.dense)
+            sparse.extend(part.sparse)
+        self.events.extend(embedding_client.events)
+        embedding_client.events = []
+        return [
+            models.PointStruct(
+                id=point_id,
+                vector={DENSE_VECTOR: dense[index], SPARSE_VECTOR: self.sparse_vector(sparse[index])},
+                payload=self._retarget_payload(payload or {}, target.model, len(dense[index]), texts[index]),
+            )
+            for index, (point_id, payload) in enumerate(records)
+        ]
+
+    def _embed_texts_of(
+        self,
+        records: Sequence[tuple[Any, Mapping[str, Any]]],
+        embed_texts: Mapping[str, str],
+    ) -> list[str]:
+        """Embed text per record: given, legacy payload field, side store, else the content."""
+        side_stored = [
+            (str(payload["doc_id"]), str(payload["chunk_id"]))
+            for point_id, payload in records
+            if payload.get("embed_text_external") and not payload.get("embed_text")
+            and self.point_id(point_id) not in embed_texts
+        ]
+        stored = self.side_stored_embed_texts(side_stored) if side_stored else {}
+        texts = []
+        for point_id, payload in records:
+            payload = payload or {}
+            text = (
+                embed_texts.get(self.point_id(point_id))
+                or payload.get("embed_text")
+                or stored.get((str(payload.get("doc_id")), str(payload.get("chunk_id"))))
+                or payload.get("content")
+                or payload.get("text")
+            )
+            texts.append(str(text or ""))
+        return texts
+
+    @staticmethod
+    def side_stored_embed_texts(identities: Sequence[tuple[str, str]]) -> dict[tuple[str, str], str]:
+        # Imported here: the artifact store pulls in the database layer, which
+        # the retrieval-only users of this module do not otherwise need.
+        from app.services.ingestion.storage.postgres_store import PostgresArtifactStore
+
+        return PostgresArtifactStore().chunk_embed_texts(identities)
+
+    @staticmethod
+    def _retarget_payload(payload: Mapping[str, Any], model: str, dimension: int, embed_text: str) -> dict[str, Any]:
+        payload = dict(payload)
+        metadata = dict(payload.get("metadata") or {})
+        if "fingerprint" not in payload:
+            if "embedding_model" in metadata:
+                metadata["embedding_model"] = model
+                payload["metadata"] = metadata
+            return payload
+        volatile = {field_name: payload.pop(field_name) for field_name in VOLATILE_PAYLOAD_FIELDS if field_name in payload}
+        volatile_metadata = {field_name: metadata.pop(field_name) for field_name in VOLATILE_METADATA_FIELDS if field_name in metadata}
+        payload.pop("fingerprint", None)
+        payload.pop("embed_hash", None)
+        metadata["embedding_model"] = model
+        payload["metadata"] = metadata
+        payload["fingerprint"] = payload_fingerprint(payload)
+        payload["embed_hash"] = text_fingerprint(embed_text, model)
+        payload.update(volatile)
+        payload["metadata"] = {**metadata, **volatile_metadata, "embedding_dim": dimension}
+        return payload
+
+    def _log_skipped_chunks(self, chunks: Sequence[IndexChunk], indexable: Sequence[IndexChunk]) -> None:
         skipped = len(chunks) - len(indexable)
         if skipped:
             self.events.append(f"chunk vectors skipped: {skipped}")
 
+    @staticmethod
+    def _chunk_payload(chunk: IndexChunk, embedding_model: str) -> dict[str, Any]:
+        """Build a compact chunk point payload, minus the volatile per-write fields.
+
+        Identity fields live once in ``metadata`` (``doc_id``/``chunk_id`` are
+        also top level for the payload indexes). The embed text is not stored:
+        it equals the content unless ``embed_text_external`` is set, in which
+        case PostgreSQL holds it (``agent_chunk_embed_texts``).
+        """
+        metadata = dict(chunk.metadata)
+        metadata.update({
+            "doc_id": chunk.document_id,
+            "prev_chunk_id": chunk.prev_chunk_id,
+            "next_chunk_id": chunk.next_chunk_id,
+            "embedding_model": embedding_model,
+        })
+        for field_name in (*VOLATILE_METADATA_FIELDS, *UNSTORED_METADATA_FIELDS):
+            metadata.pop(field_name, None)
+        payload = {
+            "doc_id": chunk.document_id, "chunk_id": chunk.chunk_id, "chunk_index": chunk.chunk_index,
+            "total_chunks": chunk.total_chunks, "chunk_type": chunk.chunk_type,
+            "content": chunk.content, "keywords": chunk.keywords, "entities": chunk.entities,
+            "metadata": metadata,
+        }
+        if chunk.embed_text != chunk.content:
+            payload["embed_text_external"] = True
+        payload["fingerprint"] = payload_fingerprint(payload)
+        payload["embed_hash"] = text_fingerprint(chunk.embed_text, embedding_model)
+        return payload
+
+    def _reusable_vectors(
+        self,
+        embed_hashes: Sequence[str],
+        existing: Mapping[str, Mapping[str, Any]],
+    ) -> dict[str, dict[str, Any]]:
+        """Fetch stored vectors for embed hashes already present in ``existing``."""
+        wanted = set(embed_hashes)
+        source_ids: dict[str, str] = {}
+        for point_id, stored in existing.items():
+            embed_hash = stored.get("embed_hash")
+            if embed_hash in wanted and embed_hash not in source_ids:
+                source_ids[embed_hash] = point_id
+        if not source_ids:
+            return {}
+
+        records = self.client.retrieve(
+            collection_name=self.collection(CHUNK_COLLECTION),
+            ids=list(source_ids.values()),
+            with_payload=["embed_hash"],
+            with_vectors=[DENSE_VECTOR, SPARSE_VECTOR],
+        )
+        vectors = {}
+        for record in records:
+            vector = record.vector if isinstance(record.vector, Mapping) else {}
+            embed_hash = (record.payload or {}).get("embed_hash")
+            if embed_hash and DENSE_VECTOR in vector and SPARSE_VECTOR in vector:
+                vectors[embed_hash] = {
+                    DENSE_VECTOR: vector[DENSE_VECTOR],
+                    SPARSE_VECTOR: vector[SPARSE_VECTOR],
+                }
+        return vectors
+
+    def existing_chunk_points(self, doc_id: str) -> dict[str, dict[str, Any]]:
+        """Return ``point_id -> {fingerprint, embed_hash}`` for the document's chunk points."""
+        return self._scroll_chunk_points(self.build_filter({"doc_id": doc_id}))
+
+    def existing_chunk_points_bulk(self, doc_ids: Sequence[str]) -> dict[str, dict[str, Any]]:
+        """``existing_chunk_points`` for several documents in one paginated scroll."""
+        if not doc_ids:
+            return {}
+        return self._scroll_chunk_points(self.build_filter(doc_ids=doc_ids))
+
+    def _scroll_chunk_points(self, point_filter: models.Filter) -> dict[str, dict[str, Any]]:
+        points: dict[str, dict[str, Any]] = {}
+        offset = None
+        while True:
+            records, offset = self.client.scroll(
+                collection_name=self.collection(CHUNK_COLLECTION),
+                scroll_filter=point_filter,
+                limit=EXISTING_POINTS_PAGE_SIZE,
+                offset=offset,
+                with_payload=["fingerprint", "embed_hash"],
+                with_vectors=False,
+            )
+            for record in records:
+                points[str(record.id)] = dict(record.payload or {})
+            if offset is None:
+                return points
+
     def upsert_summary_artifacts(self, artifacts: SummaryArtifacts) -> None:
         """Embed and store application-owned summary and question artifacts."""
         if artifacts.summary is not None:
             summary = artifacts.summary
             embeddings = self.embed_texts([summary.embed_text])
-            self.client.upsert(collection_name=SUMMARY_COLLECTION, points=[models.PointStruct(
-                id=self.point_id(summary.summary_id),
-                vector={DENSE_VECTOR: embeddings.dense[0], SPARSE_VECTOR: self.sparse_vector(embeddings.sparse[0])},
-                payload={
-                    "text": summary.content, "content": summary.content, "embed_text": summary.embed_text,
-                    "keywords": summary.keywords, "entities": summary.entities,
-                    "created_at": int(time.time()), "metadata": summary.metadata,
-                },
-            )])
+            self._upsert_points(
+                SUMMARY_COLLECTION, [self._summary_point(summary, embeddings, 0)], self._summary_embed_texts([summary])
+            )
             self.events.append("summary vector upserted")
         if artifacts.questions:
             embeddings = self.embed_texts([question.embed_text for question in artifacts.questions])
-            points = [models.PointStruct(
-                id=self.point_id(question.question_id),
-                vector={DENSE_VECTOR: embeddings.dense[index], SPARSE_VECTOR: self.sparse_vector(embeddings.sparse[index])},
-                payload={
-                    "text": question.content, "content": question.content, "embed_text": question.embed_text,
-                    "created_at": int(time.time()), "metadata": question.metadata,
-                },
-            ) for index, question in enumerate(artifacts.questions)]
-            self.client.upsert(collection_name=QUESTIONS_COLLECTION, points=points)
+            points = [
+                self._question_point(question, embeddings, index)
+                for index, question in enumerate(artifacts.questions)
+            ]
+            self._upsert_points(QUESTIONS_COLLECTION, points, self._question_embed_texts(artifacts.questions))
             self.events.append(f"question vectors upserted: {len(points)}")
 
+    def upsert_summary_artifacts_bulk(self, artifacts: Sequence[SummaryArtifacts]) -> None:
+        """``upsert_summary_artifacts`` for many documents with shared embed and upsert batches."""
+        summaries = [item.summary for item in artifacts if item.summary is not None]
+        questions = [question for item in artifacts for question in item.questions]
+        texts = [summary.embed_text for summary in summaries] + [question.embed_text for question in questions]
+        if not texts:
+            return
+        embeddings = self.embed_texts(texts)
+        if summaries:
+            self._upsert_points(SUMMARY_COLLECTION, [
+                self._summary_point(summary, embeddings, index) for index, summary in enumerate(summaries)
+            ], self._summary_embed_texts(summaries))
+            self.events.append(f"summary vectors upserted: {len(summaries)}")
+        if questions:
+            offset = len(summaries)
+            self._upsert_points(QUESTIONS_COLLECTION, [
+                self._question_point(question, embeddings, offset + index)
+                for index, question in enumerate(questions)
+            ], self._question_embed_texts(questions))
+            self.events.append(f"question vectors upserted: {len(questions)}")
+
+    def _summary_embed_texts(self, summaries: Sequence[SummaryDocument]) -> dict[str, str]:
+        return {self.point_id(summary.summary_id): summary.embed_text for summary in summaries}
+
+    def _question_embed_texts(self, questions: Sequence[QuestionDocument]) -> dict[str, str]:
+        return {self.point_id(question.question_id): question.embed_text for question in questions}
+
+    def _summary_point(self, summary: SummaryDocument, embeddings: EmbeddingBatch, index: int) -> models.PointStruct:
+        return models.PointStruct(
+            id=self.point_id(summary.summary_id),
+            vector={DENSE_VECTOR: embeddings.dense[index], SPARSE_VECTOR: self.sparse_vector(embeddings.sparse[index])},
+            payload={
+                "content": summary.content, "keywords": summary.keywords, "entities": summary.entities,
+                "created_at": int(time.time()), "metadata": summary.metadata,
+            },
+        )
+
+    def _question_point(self, question: QuestionDocument, embeddings: EmbeddingBatch, index: int) -> models.PointStruct:
+        return models.PointStruct(
+            id=self.point_id(question.question_id),
+            vector={DENSE_VECTOR: embeddings.dense[index], SPARSE_VECTOR: self.sparse_vector(embeddings.sparse[index])},
+            payload={
+                "content": question.content, "created_at": int(time.time()), "metadata": question.metadata,
+            },
+        )
+
     def replace_index_chunks(self, doc_id: str, chunks: Sequence[IndexChunk]) -> None:
+        """Make the document's chunk points match ``chunks``.
+
+        With ``INCREMENTAL_INGESTION`` only changed points are upserted and only
+        point ids that no longer exist are deleted; otherwise every point of the
+        document is deleted and re-embedded. Summary and question points are
+        always cleared here and rewritten by the summary stage.
+        """
         self.events = ["chunk vector ingestion started"]
         self.ensure_collections()
-        self.delete_document(doc_id)
-        self.upsert_index_chunks(chunks)
+        if not INCREMENTAL_INGESTION:
+            self.delete_document(doc_id)
+            self.upsert_index_chunks(chunks)
+            self.events.append("chunk vector ingestion completed")
+            return
+
+        existing = self.existing_chunk_points(doc_id)
+        self.delete_document(doc_id, collections=(SUMMARY_COLLECTION, QUESTIONS_COLLECTION))
+        self.upsert_index_chunks(chunks, existing=existing)
+        self._delete_removed_points(existing, chunks)
         self.events.append("chunk vector ingestion completed")
 
+    def replace_index_chunks_bulk(self, documents: Mapping[str, Sequence[IndexChunk]]) -> None:
+        """``replace_index_chunks`` for many documents at once.
+
+        One scroll reads the stored fingerprints of every document, the changed
+        chunks of all documents share embedding requests and point upserts, and
+        deletes are issued once per collection.
+        """
+        self.events = [f"bulk chunk vector ingestion started: {len(documents)} documents"]
+        if not documents:
+            return
+        self.ensure_collections()
+        doc_ids = list(documents)
+        chunks = [chunk for document_chunks in documents.values() for chunk in document_chunks]
+        if not INCREMENTAL_INGESTION:
+            self.delete_documents(doc_ids)
+            self.upsert_index_chunks(chunks)
+            self.events.append("bulk chunk vector ingestion completed")
+            return
+
+        existing = self.existing_chunk_points_bulk(doc_ids)
+        self.delete_documents(doc_ids, collections=(SUMMARY_COLLECTION, QUESTIONS_COLLECTION))
+        self.upsert_index_chunks(chunks, existing=existing)
+        self._delete_removed_points(existing, chunks)
+        self.events.append("bulk chunk vector ingestion completed")
+
+    def _delete_removed_points(
+        self, existing: Mapping[str, Mapping[str, Any]], chunks: Sequence[IndexChunk]
+    ) -> None:
+        current_ids = {
+            self.chunk_point_id(chunk.document_id, chunk.chunk_id)
+            for chunk in chunks
+            if not chunk.skip_indexing
+        }
+        removed = [point_id for point_id in existing if point_id not in current_ids]
+        if removed:
+            for collection_name in self._write_collections(CHUNK_COLLECTION):
+                self.client.delete(
+                    collection_name=collection_name,
+                    points_selector=models.PointIdsList(points=removed),
+                )
+            self.events.append(f"chunk vectors deleted: {len(removed)}")
+
     @staticmethod
     def build_identity_filter(
         identities: Sequence[tuple[str, str]] | None,
@@ -297,19 +891,121 @@ class QdrantVectorStore:
         doc_ids: Sequence[str] | None = None,
         identities: Sequence[tuple[str, str]] | None = None,
     ) -> list[tuple[LlamaDocument, float]]:
-        metadata_query_filter = self.build_filter(metadata_filter, doc_ids)
-        identity_query_filter = self.build_identity_filter(identities)
-        query_filter = self._combine_filters(metadata_query_filter, identity_query_filter)
-
         points = self.client.query_points(
-            collection_name=collection_name,
+            collection_name=self.collection(collection_name),
             query=vector,
             using=vector_name,
             limit=limit,
-            query_filter=query_filter,
+            query_filter=self._search_filter(metadata_filter, doc_ids, identities),
+            search_params=self._search_params(vector_name),
+            with_payload=CHUNK_SEARCH_PAYLOAD if collection_name == CHUNK_COLLECTION else DOC_ID_PAYLOAD,
         ).points
         return [self._point_to_document(point) for point in points]
 
+    async def _asearch_vector(
+        self,
+        collection_name: str,
+        vector: Any,
+        vector_name: str,
+        *,
+        limit: int,
+        metadata_filter: Mapping[str, Any] | None = None,
+        doc_ids: Sequence[str] | None = None,
+        identities: Sequence[tuple[str, str]] | None = None,
+    ) -> list[tuple[LlamaDocument, float]]:
+        response = await self.async_client.query_points(
+            collection_name=self.collection(collection_name),
+            query=vector,
+            using=vector_name,
+            limit=limit,
+            query_filter=self._search_filter(metadata_filter, doc_ids, identities),
+            search_params=self._search_params(vector_name),
+            with_payload=CHUNK_SEARCH_PAYLOAD if collection_name == CHUNK_COLLECTION else DOC_ID_PAYLOAD,
+        )
+        return [self._point_to_document(point) for point in response.points]
+
+    def search_chunks(
+        self,
+        queries: Mapping[str, tuple[str, Any]],
+        *,
+        limit: int,
+        metadata_filter: Mapping[str, Any] | None = None,
+        doc_ids: Sequence[str] | None = None,
+        identities: Sequence[tuple[str, str]] | None = None,
+    ) -> dict[str, list[tuple[LlamaDocument, float]]]:
+        """Run several chunk searches sharing one filter as a single batch request.
+
+        ``queries`` maps a result name to ``(vector_name, vector)``; results are
+        returned per name so client-side fusion keeps its per-source weights.
+        """
+        if not queries:
+            return {}
+        responses = self.client.query_batch_points(
+            collection_name=self.collection(CHUNK_COLLECTION),
+            requests=self._chunk_batch_requests(
+                queries, limit, self._search_filter(metadata_filter, doc_ids, identities)
+            ),
+        )
+        return self._batch_results(queries, responses)
+
+    async def asearch_chunks(
+        self,
+        queries: Mapping[str, tuple[str, Any]],
+        *,
+        limit: int,
+        metadata_filter: Mapping[str, Any] | None = None,
+        doc_ids: Sequence[str] | None = None,
+        identities: Sequence[tuple[str, str]] | None = None,
+    ) -> dict[str, list[tuple[LlamaDocument, float]]]:
+        if not queries:
+            return {}
+        responses = await self.async_client.query_batch_points(
+            collection_name=self.collection(CHUNK_COLLECTION),
+            requests=self._chunk_batch_requests(
+                queries, limit, self._search_filter(metadata_filter, doc_ids, identities)
+            ),
+        )
+        return self._batch_results(queries, responses)
+
+    def _chunk_batch_requests(
+        self,
+        queries: Mapping[str, tuple[str, Any]],
+        limit: int,
+        query_filter: models.Filter | None,
+    ) -> list[models.QueryRequest]:
+        return [
+            models.QueryRequest(
+                query=self.sparse_vector(vector) if vector_name == SPARSE_VECTOR else vector,
+                using=vector_name,
+                limit=limit,
+                filter=query_filter,
+                params=self._search_params(vector_name),
+                with_payload=CHUNK_SEARCH_PAYLOAD,
+            )
+            for vector_name, vector in queries.values()
+        ]
+
+    def _batch_results(
+        self,
+        queries: Mapping[str, tuple[str, Any]],
+        responses: Sequence[Any],
+    ) -> dict[str, list[tuple[LlamaDocument, float]]]:
+        return {
+            name: [self._point_to_document(point) for point in response.points]
+            for name, response in zip(queries, responses)
+        }
+
+    def _search_filter(
+        self,
+        metadata_filter: Mapping[str, Any] | None,
+        doc_ids: Sequence[str] | None,
+        identities: Sequence[tuple[str, str]] | None,
+    ) -> models.Filter | None:
+        return self._combine_filters(
+            self.build_filter(metadata_filter, doc_ids),
+            self.build_identity_filter(identities),
+        )
+
     @staticmethod
     def _combine_filters(*filters: models.Filter | None) -> models.Filter | None:
         active_filters = [query_filter for query_filter in filters if query_filter is not None]
@@ -336,32 +1032,164 @@ class QdrantVectorStore:
     def search_question_dense(self, vector: list[float], **kwargs) -> list[tuple[LlamaDocument, float]]:
         return self._search_vector(QUESTIONS_COLLECTION, vector, DENSE_VECTOR, **kwargs)
 
+    async def asearch_chunk_dense(self, vector: list[float], **kwargs) -> list[tuple[LlamaDocument, float]]:
+        return await self._asearch_vector(CHUNK_COLLECTION, vector, DENSE_VECTOR, **kwargs)
+
+    async def asearch_chunk_sparse(self, vector: Any, **kwargs) -> list[tuple[LlamaDocument, float]]:
+        return await self._asearch_vector(
+            CHUNK_COLLECTION,
+            self.sparse_vector(vector),
+            SPARSE_VECTOR,
+            **kwargs,
+        )
+
+    async def asearch_summary_dense(self, vector: list[float], **kwargs) -> list[tuple[LlamaDocument, float]]:
+        return await self._asearch_vector(SUMMARY_COLLECTION, vector, DENSE_VECTOR, **kwargs)
+
+    async def asearch_question_dense(self, vector: list[float], **kwargs) -> list[tuple[LlamaDocument, float]]:
+        return await self._asearch_vector(QUESTIONS_COLLECTION, vector, DENSE_VECTOR, **kwargs)
+
     def fetch_neighbor(self, doc_id: str | None, chunk_id: str | None) -> LlamaDocument | None:
         if not doc_id or not chunk_id:
             return None
 
         points, _next_page = self.client.scroll(
-            collection_name=CHUNK_COLLECTION,
-            scroll_filter=models.Filter(must=[
-                models.FieldCondition(
-                    key="doc_id",
-                    match=models.MatchValue(value=str(doc_id)),
-                ),
-                models.FieldCondition(
-                    key="chunk_id",
-                    match=models.MatchValue(value=str(chunk_id)),
-                ),
-            ]),
+            collection_name=self.collection(CHUNK_COLLECTION),
+            scroll_filter=self._neighbor_filter(doc_id, chunk_id),
             limit=1,
-            with_payload=True,
+            with_payload=CHUNK_CONTEXT_PAYLOAD,
             with_vectors=False,
         )
         if not points:
             return None
         return self._point_to_document(points[0])[0]
 
+    def fetch_chunks(
+        self,
+        identities: Sequence[tuple[str, str]],
+    ) -> dict[tuple[str, str], LlamaDocument]:
+        """Fetch many chunks by (doc_id, chunk_id) with one retrieve by point id."""
+        point_identities = self._chunk_point_identities(identities)
+        if not point_identities:
+            return {}
+        records = self.client.retrieve(
+            collection_name=self.collection(CHUNK_COLLECTION),
+            ids=list(point_identities),
+            with_payload=CHUNK_CONTEXT_PAYLOAD,
+            with_vectors=False,
+        )
+        return self._fetched_chunks(point_identities, records)
+
+    async def afetch_chunks(
+        self,
+        identities: Sequence[tuple[str, str]],
+    ) -> dict[tuple[str, str], LlamaDocument]:
+        point_identities = self._chunk_point_identities(identities)
+        if not point_identities:
+            return {}
+        records = await self.async_client.retrieve(
+            collection_name=self.collection(CHUNK_COLLECTION),
+            ids=list(point_identities),
+            with_payload=CHUNK_CONTEXT_PAYLOAD,
+            with_vectors=False,
+        )
+        return self._fetched_chunks(point_identities, records)
+
+    def hydrate_chunks(self, hits: Sequence[tuple[LlamaDocument, float]]) -> int:
+        """Load text, keywords, and entities for search hits returned without them.
+
+        One retrieve by point id covers every pending hit; documents are filled
+        in place. Returns how many were hydrated.
+        """
+        pending = self._pending_documents(hits)
+        if not pending:
+            return 0
+        records = self.client.retrieve(
+            collection_name=self.collection(CHUNK_COLLECTION),
+            ids=list(pending),
+            with_payload=list(CHUNK_TEXT_FIELDS),
+            with_vectors=False,
+        )
+        return self._hydrate(pending, records)
+
+    async def ahydrate_chunks(self, hits: Sequence[tuple[LlamaDocument, float]]) -> int:
+        pending = self._pending_documents(hits)
+        if not pending:
+            return 0
+        records = await self.async_client.retrieve(
+            collection_name=self.collection(CHUNK_COLLECTION),
+            ids=list(pending),
+            with_payload=list(CHUNK_TEXT_FIELDS),
+            with_vectors=False,
+        )
+        return self._hydrate(pending, records)
+
+    @staticmethod
+    def _pending_documents(hits: Sequence[tuple[LlamaDocument, float]]) -> dict[str, list[LlamaDocument]]:
+        pending: dict[str, list[LlamaDocument]] = {}
+        for document, _score in hits:
+            if document.metadata.get(TEXT_PENDING):
+                pending.setdefault(document.id_, []).append(document)
+        return pending
+
+    def _hydrate(self, pending: Mapping[str, Sequence[LlamaDocument]], records: Sequence[Any]) -> int:
+        hydrated = 0
+        for record in records:
+            payload = record.payload or {}
+            for document in pending.get(self.point_id(record.id), ()):
+                document.set_content(payload.get("content", payload.get("text", "")))
+                document.metadata["keywords"] = payload.get("keywords", [])
+                document.metadata["entities"] = payload.get("entities", [])
+                document.metadata.pop(TEXT_PENDING, None)
+                hydrated += 1
+        return hydrated
+
+    def _chunk_point_identities(
+        self,
+        identities: Sequence[tuple[str, str]],
+    ) -> dict[str, tuple[str, str]]:
+        return {
+            self.chunk_point_id(doc_id, chunk_id): (str(doc_id), str(chunk_id))
+            for doc_id, chunk_id in identities
+            if doc_id and chunk_id
+        }
+
+    def _fetched_chunks(
+        self,
+        point_identities: Mapping[str, tuple[str, str]],
+        records: Sequence[Any],
+    ) -> dict[tuple[str, str], LlamaDocument]:
+        return {
+            point_identities[self.point_id(record.id)]: self._point_to_document(record)[0]
+            for record in records
+            if self.point_id(record.id) in point_identities
+        }
+
+    @staticmethod
+    def _neighbor_filter(doc_id: str, chunk_id: str) -> models.Filter:
+        return models.Filter(must=[
+            models.FieldCondition(
+                key="doc_id",
+                match=models.MatchValue(value=str(doc_id)),
+            ),
+            models.FieldCondition(
+                key="chunk_id",
+                match=models.MatchValue(value=str(chunk_id)),
+            ),
+        ])
+
     def embed_texts(self, texts: Sequence[str]) -> EmbeddingBatch:
-        embeddings = self.embedding_client.embed_documents(texts)
+        """Embed document texts, at most INGESTION_EMBED_BATCH_SIZE per request."""
+        batch_size = max(1, INGESTION_EMBED_BATCH_SIZE)
+        if len(texts) <= batch_size:
+            embeddings = self.embedding_client.embed_documents(texts)
+        else:
+            dense, sparse = [], []
+            for start in range(0, len(texts), batch_size):
+                part = self.embedding_client.embed_documents(texts[start:start + batch_size])
+                dense.extend(part.dense)
+                sparse.extend(part.sparse)
+            embeddings = EmbeddingBatch(dense=dense, sparse=sparse)
         self._drain_embedding_events()
         return embeddings
 
@@ -375,6 +1203,11 @@ class QdrantVectorStore:
         self._drain_embedding_events()
         return embeddings
 
+    async def aembed_query_texts(self, texts: Sequence[str]) -> EmbeddingBatch:
+        embeddings = await self.embedding_client.aembed_queries(texts)
+        self._drain_embedding_events()
+        return embeddings
+
     def embed_dense_queries(self, texts: Sequence[str]) -> list[list[float]]:
         embeddings = self.embedding_client.embed_dense_queries(texts)
         self._drain_embedding_events()
@@ -404,6 +1237,9 @@ class QdrantVectorStore:
                 "created_at": payload.get("created_at"),
             }
         )
+        if "content" not in payload and "text" not in payload and payload.get("chunk_id") is not None:
+            # Chunk search hit fetched without its text; see hydrate_chunks.
+            metadata[TEXT_PENDING] = True
         return (
             LlamaDocument(
                 id_=str(point.id),
@@ -0,0 +1,34 @@
+import logging
+from typing import Optional
+
+from redis.exceptions import RedisError
+
+from app.core.config import INGESTION_DISPATCH_KEY_PREFIX
+from app.db.redis import redis_client
+
+
+log = logging.getLogger(__name__)
+
+
+def latest_dispatch_seq(note_id: str) -> Optional[int]:
+    try:
+        value = redis_client().get(f"{INGESTION_DISPATCH_KEY_PREFIX}{note_id}")
+        return int(value) if value is not None else None
+    except (RedisError, ValueError) as exc:
+        log.warning("dispatch sequence check failed note_id=%s: %s", note_id, exc)
+        return None
+
+
+def is_superseded_dispatch(payload: dict) -> bool:
+    """True when the backend has dispatched a newer upsert for this note.
+
+    Tasks without a dispatch_seq (older producers, reconciliation, Redis
+    outages at dispatch time) or with an unreadable marker are never skipped
+    here; the version checks still apply to them.
+    """
+    dispatch_seq = payload.get("dispatch_seq")
+    note_id = payload.get("note_id")
+    if dispatch_seq is None or not note_id:
+        return False
+    latest = latest_dispatch_seq(str(note_id))
+    return latest is not None and int(dispatch_seq) < latest
@@ -1,4 +1,6 @@
 import logging
+import uuid
+from collections.abc import Iterable, Sequence
 from typing import Optional
 
 from sqlalchemy import text
@@ -20,6 +22,64 @@ def fetch_note_version(note_id: str, user_id: str, db: Session) -> Optional[int]
         return None
 
 
+_NOTE_VERSIONS_SQL = text("""
+    SELECT n.id::text AS note_id, n.user_id::text AS user_id, n.version AS version
+    FROM notes n
+    JOIN unnest(CAST(:note_ids AS uuid[]), CAST(:user_ids AS uuid[])) AS k(note_id, user_id)
+      ON n.id = k.note_id AND n.user_id = k.user_id
+""")
+
+
+def note_key(note_id: str, user_id: str) -> Optional[tuple[str, str]]:
+    """Canonical ``(note_id, user_id)`` uuid strings; None when either is not a uuid."""
+    try:
+        return str(uuid.UUID(str(note_id))), str(uuid.UUID(str(user_id)))
+    except ValueError:
+        return None
+
+
+def fetch_note_versions(
+    keys: Iterable[tuple[str, str]], db: Session
+) -> Optional[dict[tuple[str, str], int]]:
+    """Versions for many ``note_key`` pairs in one query; None when the query fails.
+
+    Missing notes are absent from the result.
+    """
+    keys = list(dict.fromkeys(keys))
+    if not keys:
+        return {}
+    try:
+        rows = db.execute(
+            _NOTE_VERSIONS_SQL,
+            {"note_ids": [note_id for note_id, _ in keys], "user_ids": [user_id for _, user_id in keys]},
+        ).mappings().all()
+    except Exception as exc:
+        log.warning("pg version check failed notes=%d: %s", len(keys), exc)
+        db.rollback()
+        return None
+    return {(row["note_id"], row["user_id"]): int(row["version"]) for row in rows}
+
+
+def stale_ingestions(payloads: Sequence[dict], db: Session) -> list[bool]:
+    """``is_stale_ingestion`` for a batch of versioned upserts, with a single version query.
+
+    Ids that are not uuids cannot match a note, so they count as not found
+    without being sent to (and failing) the batch query.
+    """
+    keys = [note_key(payload["note_id"], payload["user_id"]) for payload in payloads]
+    versions = fetch_note_versions((key for key in keys if key is not None), db) or {}
+    stale = []
+    for payload, key in zip(payloads, keys):
+        db_version = versions.get(key)
+        if db_version is None:
+            log.info(
+                "ingestion.skip note_id=%s user_id=%s reason=note_not_found",
+                payload["note_id"], payload["user_id"],
+            )
+        stale.append(db_version is None or payload["version"] < db_version)
+    return stale
+
+
 def is_stale_ingestion(payload: dict, db: Session) -> bool:
     user_id = payload["user_id"]
     note_id = payload["note_id"]
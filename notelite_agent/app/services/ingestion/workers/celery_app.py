@@ -1,11 +1,15 @@
+import logging
+
 from celery import Celery
 from celery.signals import worker_process_init
 
+from app.db.user_settings import start_user_settings_listener
 from app.logger import setup_logging
 
 from app.core.config import (
     CELERY_RESULT_BACKEND,
     CONVERSATION_QUEUE,
+    INGESTION_BACKFILL_QUEUE,
     INGESTION_QUEUE,
     INGESTION_TASK_STRING,
     MESSAGE_BROKER_URL,
@@ -13,8 +17,12 @@ from app.core.config import (
 )
 
 CONVERSATION_TASK = "tasks.persist_message"
+BULK_INGESTION_TASK = "tasks.ingest_bulk"
+REEMBED_TASK = "tasks.reembed_collections"
 RECONCILE_TASK = "tasks.reconcile_index"
 
+log = logging.getLogger(__name__)
+
 celery_app = Celery(
     "tasks",
     broker=MESSAGE_BROKER_URL,
@@ -29,14 +37,23 @@ celery_app.conf.update(
     task_send_sent_event=True,
     broker_connection_retry_on_startup=True,
     task_ignore_result=False,
+    # Ingestion tasks may also be published to INGESTION_DELETE_QUEUE or
+    # INGESTION_BACKFILL_QUEUE by the producer (see workers/lanes.py). The worker
+    # polls its -Q queues in the listed order instead of round-robin, and takes
+    # one task at a time so a prefetched backfill never holds up a live edit.
     task_routes={
         INGESTION_TASK_STRING: {"queue": INGESTION_QUEUE},
+        BULK_INGESTION_TASK: {"queue": INGESTION_BACKFILL_QUEUE},
+        REEMBED_TASK: {"queue": INGESTION_BACKFILL_QUEUE},
         CONVERSATION_TASK: {"queue": CONVERSATION_QUEUE},
-        RECONCILE_TASK: {"queue": INGESTION_QUEUE},
+        RECONCILE_TASK: {"queue": INGESTION_BACKFILL_QUEUE},
     },
+    broker_transport_options={"queue_order_strategy": "priority"},
+    worker_prefetch_multiplier=1,
     imports=(
         "app.services.ingestion.workers.ingestion_tasks",
         "app.services.ingestion.workers.reconciliation",
+        "app.services.ingestion.workers.reembedding",
     ),
     # Driven by the embedded beat (-B) in the single agent-celery worker; if the
     # worker is ever scaled out, move beat to a dedicated process so the schedule
@@ -53,3 +70,28 @@ celery_app.conf.update(
 @worker_process_init.connect
 def configure_worker_logging(**_kwargs) -> None:
     setup_logging(service="agent-celery")
+
+
+@worker_process_init.connect
+def start_settings_listener(**_kwargs) -> None:
+    start_user_settings_listener()
+
+
+@worker_process_init.connect
+def preload_nlp_models(**_kwargs) -> None:
+    """Load the spaCy pipelines before the first task instead of inside it."""
+    from app.services.ingestion.processors import nlp_models
+
+    nlp_models.preload()
+
+
+@worker_process_init.connect
+def bootstrap_collections(**_kwargs) -> None:
+    """Create and index the Qdrant collections once per worker process, not per note."""
+    from app.services.ingestion.storage.vector_store import QdrantVectorStore
+
+    try:
+        QdrantVectorStore().ensure_collections()
+    except Exception:
+        # Ingestion retries the bootstrap on its first note.
+        log.warning("Qdrant collection bootstrap failed at worker start", exc_info=True)
@@ -1,14 +1,21 @@
 import logging
 import uuid
 
+from celery.exceptions import Ignore
 from structlog.contextvars import bind_contextvars, clear_contextvars
 
-from app.core.config import INGESTION_TASK_STRING
+from app.core.config import (
+    INGESTION_BACKFILL_QUEUE,
+    INGESTION_QUEUE,
+    INGESTION_TASK_STRING,
+    INGESTION_USER_DEFER_SECONDS,
+)
 from app.core.settings import init_llama_index_settings
 from app.logger import logger
 from app.shared.http import TransientHTTPError, is_transient_http_error
 from app.services.ingestion.orchestrator import IngestionOrchestrator
-from app.services.ingestion.workers.celery_app import CONVERSATION_TASK, celery_app
+from app.services.ingestion.workers.celery_app import BULK_INGESTION_TASK, CONVERSATION_TASK, celery_app
+from app.services.ingestion.workers.lanes import acquire_user_slot, record_lane_wait, release_user_slot
 
 log = logging.getLogger(__name__)
 
@@ -32,13 +39,32 @@ def _bind_task_trace(trace_id: str | None) -> None:
     retry_backoff=True,
 )
 def ingest_in_background(self, data=None, **kwargs):
-    # trace_id rides in the payload (dict form or kwargs, depending on the
-    # producer); pop it before the orchestrator sees the payload.
+    # trace_id and enqueued_at ride in the payload (dict form or kwargs, depending
+    # on the producer); pop them before the orchestrator sees the payload.
     trace_id = kwargs.pop("trace_id", None)
+    enqueued_at = kwargs.pop("enqueued_at", None)
     if isinstance(data, dict):
         trace_id = data.pop("trace_id", None) or trace_id
+        enqueued_at = data.pop("enqueued_at", None) or enqueued_at
     _bind_task_trace(trace_id)
 
+    lane = (self.request.delivery_info or {}).get("routing_key") or INGESTION_QUEUE
+    user_id = IngestionOrchestrator._payload(data, **kwargs).get("user_id")
+    slot = acquire_user_slot(lane, user_id)
+    if not slot.run:
+        # Re-published under the same id, so GET /status/{job_id} follows the
+        # real run. Not self.retry(): deferrals must not use up max_retries.
+        ingest_in_background.apply_async(
+            args=(data,),
+            kwargs={**kwargs, "trace_id": trace_id, "enqueued_at": enqueued_at},
+            queue=lane,
+            task_id=self.request.id,
+            countdown=INGESTION_USER_DEFER_SECONDS,
+        )
+        logger.info("ingestion.deferred", lane=lane, reason="user_fair_share")
+        raise Ignore()
+    record_lane_wait(lane, enqueued_at)
+
     init_llama_index_settings()
     try:
         return IngestionOrchestrator().run(data, **kwargs)
@@ -52,6 +78,43 @@ def ingest_in_background(self, data=None, **kwargs):
             note_id=payload.get("note_id"),
         )
         raise
+    finally:
+        release_user_slot(slot)
+
+
+@celery_app.task(
+    name=BULK_INGESTION_TASK,
+    acks_late=True,
+    bind=True,
+    autoretry_for=(ConnectionError, TimeoutError, OSError),
+    max_retries=5,
+    retry_backoff=True,
+)
+def ingest_bulk(self, payloads: list[dict], trace_id: str | None = None, enqueued_at: float | None = None):
+    """Ingest a batch of notes (imports, re-embedding, reconciliation) in one task.
+
+    Runs on the backfill lane without a fair-share slot: a batch is already
+    one bounded unit of work, and retries are safe because the version guard
+    and replace semantics make re-ingesting a note idempotent.
+    """
+    # Per-note trace_id/enqueued_at (e.g. reconciliation payloads) are transport
+    # fields; the batch-level values are used instead.
+    payloads = [
+        {key: value for key, value in payload.items() if key not in ("trace_id", "enqueued_at")}
+        for payload in payloads
+    ]
+    _bind_task_trace(trace_id)
+    lane = (self.request.delivery_info or {}).get("routing_key") or INGESTION_BACKFILL_QUEUE
+    record_lane_wait(lane, enqueued_at)
+
+    init_llama_index_settings()
+    try:
+        return IngestionOrchestrator().run_bulk(payloads)
+    except Exception as exc:
+        if is_transient_http_error(exc):
+            raise self.retry(exc=exc) from exc
+        logger.exception("ingestion.bulk_failed", notes=len(payloads))
+        raise
 
 
 @celery_app.task(
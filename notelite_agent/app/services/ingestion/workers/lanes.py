@@ -0,0 +1,178 @@
+"""Ingestion priority lanes and per-user fair share.
+
+Producers pick a lane by queue: live edits go to INGESTION_QUEUE, deletes to
+INGESTION_DELETE_QUEUE, reconciliation repairs to INGESTION_BACKFILL_QUEUE.
+The worker consumes them in that order (``queue_order_strategy=priority``).
+
+Within a lane, a user already holding INGESTION_USER_MAX_ACTIVE workers gets
+their next task deferred by INGESTION_USER_DEFER_SECONDS while another user's
+task is waiting, so one heavy user cannot monopolize the workers. Waiting
+users are read from the oldest messages in the lane's broker list, whoever
+published them; the user's own backlog does not count. With no other user
+queued the task just runs. Every Redis failure fails open; a slot is only
+released when acquiring it actually incremented the counter, and the release
+never takes the counter below zero.
+
+Workers record queue wait per lane in Redis because only the API process
+exposes /metrics; ``IngestionLaneCollector`` reports it there together with
+the lane depths.
+"""
+from __future__ import annotations
+
+import base64
+import json
+import logging
+import time
+from dataclasses import dataclass
+from typing import Iterator
+
+from prometheus_client.core import GaugeMetricFamily, SummaryMetricFamily
+from prometheus_client.registry import Collector
+from redis.exceptions import RedisError
+
+from app.core.config import (
+    INGESTION_BACKFILL_QUEUE,
+    INGESTION_DELETE_QUEUE,
+    INGESTION_QUEUE,
+    INGESTION_USER_MAX_ACTIVE,
+)
+from app.db.redis import redis_client
+
+
+log = logging.getLogger(__name__)
+
+LANES = (INGESTION_QUEUE, INGESTION_DELETE_QUEUE, INGESTION_BACKFILL_QUEUE)
+
+_ACTIVE_KEY = "ingestion:active:{lane}:{user_id}"
+_WAIT_KEY = "ingestion:lane_wait"
+# Bounds a slot leaked by a killed worker; longer than any single ingestion.
+_ACTIVE_TTL_SECONDS = 30 * 60
+# Oldest queued messages inspected for another user's task.
+_PEEK_LIMIT = 50
+# DECR that never leaves the counter below zero (a missing or expired key is
+# dropped rather than turned into -1) and keeps the TTL on what remains.
+_RELEASE_SCRIPT = """
+local active = redis.call('DECR', KEYS[1])
+if active <= 0 then
+    redis.call('DEL', KEYS[1])
+else
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+return active
+"""
+
+
+@dataclass(frozen=True)
+class UserSlot:
+    """Outcome of ``acquire_user_slot``: ``run`` False means defer the task;
+    ``key`` is set only while the counter holds a slot to release."""
+
+    run: bool
+    key: str | None = None
+
+
+def acquire_user_slot(lane: str, user_id: str | None) -> UserSlot:
+    """Claim one of the user's worker slots in ``lane``."""
+    if INGESTION_USER_MAX_ACTIVE <= 0 or not user_id:
+        return UserSlot(run=True)
+    key = _ACTIVE_KEY.format(lane=lane, user_id=user_id)
+    client = redis_client()
+    try:
+        with client.pipeline() as pipeline:
+            pipeline.incr(key)
+            pipeline.expire(key, _ACTIVE_TTL_SECONDS)
+            active, _ = pipeline.execute()
+    except RedisError as exc:
+        log.warning("ingestion fair-share check failed lane=%s: %s", lane, exc)
+        return UserSlot(run=True)
+    # From here the counter includes this task: every exit that runs it must
+    # hand back the key so the finally-release gives the slot back.
+    try:
+        if active <= INGESTION_USER_MAX_ACTIVE or not _other_user_waiting(client, lane, user_id):
+            return UserSlot(run=True, key=key)
+        _decrement(client, key)
+        return UserSlot(run=False)
+    except RedisError as exc:
+        log.warning("ingestion fair-share check failed lane=%s: %s", lane, exc)
+        return UserSlot(run=True, key=key)
+
+
+def _other_user_waiting(client, lane: str, user_id: str) -> bool:
+    # kombu LPUSHes and RPOPs, so the oldest messages sit at the tail.
+    return any(_queued_user(raw) != user_id for raw in client.lrange(lane, -_PEEK_LIMIT, -1))
+
+
+def _queued_user(raw: bytes) -> str | None:
+    """user_id of a queued ingestion message; None when it has none or cannot be read."""
+    try:
+        message = json.loads(raw)
+        body = message["body"]
+        if message.get("properties", {}).get("body_encoding") == "base64":
+            body = base64.b64decode(body)
+        args, kwargs, _embed = json.loads(body)
+    except (ValueError, KeyError, TypeError):
+        return None
+    payload = args[0] if args and isinstance(args[0], dict) else kwargs
+    user_id = payload.get("user_id") if isinstance(payload, dict) else None
+    return str(user_id) if user_id is not None else None
+
+
+def release_user_slot(slot: UserSlot) -> None:
+    if slot.key is None:
+        return
+    try:
+        _decrement(redis_client(), slot.key)
+    except RedisError as exc:
+        log.warning("ingestion fair-share release failed key=%s: %s", slot.key, exc)
+
+
+def _decrement(client, key: str) -> None:
+    client.eval(_RELEASE_SCRIPT, 1, key, _ACTIVE_TTL_SECONDS)
+
+
+def record_lane_wait(lane: str, enqueued_at: float | None) -> None:
+    """Add the time since ``enqueued_at`` (epoch seconds) to the lane's wait totals."""
+    if enqueued_at is None:
+        return
+    wait = max(0.0, time.time() - float(enqueued_at))
+    try:
+        with redis_client().pipeline() as pipeline:
+            pipeline.hincrbyfloat(_WAIT_KEY, f"{lane}:sum", wait)
+            pipeline.hincrby(_WAIT_KEY, f"{lane}:count", 1)
+            pipeline.execute()
+    except RedisError as exc:
+        log.warning("ingestion lane wait not recorded lane=%s: %s", lane, exc)
+
+
+class IngestionLaneCollector(Collector):
+    """Scrape-time lane depth (broker list length) and cumulative queue wait."""
+
+    def collect(self) -> Iterator[GaugeMetricFamily | SummaryMetricFamily]:
+        depth = GaugeMetricFamily(
+            "ingestion_lane_depth", "Tasks waiting in each ingestion lane.", labels=["lane"]
+        )
+        wait = SummaryMetricFamily(
+            "ingestion_lane_wait_seconds",
+            "Time ingestion tasks waited in their lane before a worker started them.",
+            labels=["lane"],
+        )
+        client = redis_client()
+        try:
+            with client.pipeline() as pipeline:
+                for lane in LANES:
+                    pipeline.llen(lane)
+                pipeline.hgetall(_WAIT_KEY)
+                *depths, totals = pipeline.execute()
+        except RedisError as exc:
+            log.warning("ingestion lane metrics unavailable: %s", exc)
+            return
+        totals = {key.decode(): float(value) for key, value in totals.items()}
+        for lane, lane_depth in zip(LANES, depths):
+            depth.add_metric([lane], lane_depth)
+            wait.add_metric(
+                [lane],
+                count_value=totals.get(f"{lane}:count", 0.0),
+                sum_value=totals.get(f"{lane}:sum", 0.0),
+            )
+        yield depth
+        yield wait
@@ -9,23 +9,25 @@ its indexing fails permanently. This task repairs both directions of drift:
 - documents whose note is gone, or whose note's content is now empty, get a
   delete enqueued.
 
-Every repair goes through the normal ingestion task, so the version guard and
-idempotent replacement make reconciliation safe to run at any time — a repair
-racing a newer live edit is simply skipped by the guard.
+Re-ingests go out as bulk ingestion tasks and deletes through the normal
+ingestion task; both apply the version guard and idempotent replacement, so
+reconciliation is safe to run at any time — a repair racing a newer live edit
+is simply skipped by the guard.
 """
 from __future__ import annotations
 
+import time
 import uuid
 from typing import Any
 
 from sqlalchemy import text
 from structlog.contextvars import bind_contextvars, clear_contextvars
 
-from app.core.config import RECONCILE_BATCH_LIMIT
+from app.core.config import INGESTION_BACKFILL_QUEUE, INGESTION_BULK_MAX_NOTES, RECONCILE_BATCH_LIMIT
 from app.db.postgres import DatabaseManager
 from app.logger import logger
 from app.services.ingestion.workers.celery_app import RECONCILE_TASK, celery_app
-from app.services.ingestion.workers.ingestion_tasks import ingest_in_background
+from app.services.ingestion.workers.ingestion_tasks import ingest_bulk, ingest_in_background
 
 
 _STALE_NOTES_SQL = text("""
@@ -73,6 +75,15 @@ def find_orphan_documents(session, limit: int) -> list[dict[str, Any]]:
     return [dict(row) for row in rows]
 
 
+def interleave_by_user(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Round-robin rows across users, keeping each user's own order."""
+    by_user: dict[str, list[dict[str, Any]]] = {}
+    for row in rows:
+        by_user.setdefault(row["user_id"], []).append(row)
+    queues = list(by_user.values())
+    return [queue[index] for index in range(max(map(len, queues), default=0)) for queue in queues if index < len(queue)]
+
+
 def upsert_payload(row: dict[str, Any], trace_id: str) -> dict[str, Any]:
     """Same shape the backend's _dispatch_ingest sends, minus timestamps
     (celery's JSON serializer rejects datetimes; the store falls back cleanly)."""
@@ -90,6 +101,7 @@ def upsert_payload(row: dict[str, Any], trace_id: str) -> dict[str, Any]:
         "text": row["text"],
         "version": row["version"],
         "trace_id": trace_id,
+        "enqueued_at": time.time(),
     }
 
 
@@ -104,6 +116,7 @@ def delete_payload(row: dict[str, Any], trace_id: str) -> dict[str, Any]:
         "tenant_id": row["user_id"],
         "role": "user",
         "trace_id": trace_id,
+        "enqueued_at": time.time(),
     }
 
 
@@ -118,10 +131,19 @@ def reconcile_index(limit: int | None = None) -> dict[str, int]:
         stale_notes = find_stale_notes(session, batch_limit)
         orphan_documents = find_orphan_documents(session, batch_limit)
 
-    for row in stale_notes:
-        ingest_in_background.delay(upsert_payload(row, trace_id))
-    for row in orphan_documents:
-        ingest_in_background.delay(delete_payload(row, trace_id))
+    # Repairs go to the backfill lane, interleaved by user so one user's large
+    # backlog does not sit in front of everyone else's. Re-ingests are batched
+    # so their embedding requests and storage writes are shared.
+    payloads = [upsert_payload(row, trace_id) for row in interleave_by_user(stale_notes)]
+    batch_size = max(1, INGESTION_BULK_MAX_NOTES)
+    for start in range(0, len(payloads), batch_size):
+        ingest_bulk.apply_async(
+            args=(payloads[start:start + batch_size],),
+            kwargs={"trace_id": trace_id, "enqueued_at": time.time()},
+            queue=INGESTION_BACKFILL_QUEUE,
+        )
+    for row in interleave_by_user(orphan_documents):
+        ingest_in_background.apply_async(args=(delete_payload(row, trace_id),), queue=INGESTION_BACKFILL_QUEUE)
 
     result = {"reingest_enqueued": len(stale_notes), "delete_enqueued": len(orphan_documents)}
     logger.info("reconciliation.completed", **result, batch_limit=batch_limit)
@@ -0,0 +1,93 @@
+"""Background copy for a blue/green re-embedding (see storage/embedding_migration.py)."""
+from __future__ import annotations
+
+import time
+import uuid
+from dataclasses import asdict
+
+from structlog.contextvars import bind_contextvars, clear_contextvars
+
+from app.core.config import EMBEDDING_MIGRATION_THROTTLE_SECONDS, EMBEDDING_ROUTING_REFRESH_SECONDS
+from app.logger import logger
+from app.shared.http import is_transient_http_error
+from app.services.ingestion.storage.embedding_migration import migration_progress, reembed_next_page
+from app.services.ingestion.storage.collection_routing import MIGRATION_RUNNING, load_state, save_state
+from app.services.ingestion.workers.celery_app import REEMBED_TASK, celery_app
+
+
+_PROGRESS_LOG_EVERY = 10
+
+
+@celery_app.task(
+    name=REEMBED_TASK,
+    acks_late=True,
+    bind=True,
+    autoretry_for=(ConnectionError, TimeoutError, OSError),
+    max_retries=5,
+    retry_backoff=True,
+)
+def reembed_collections(self, trace_id: str | None = None, chain: str | None = None, pages: int = 0) -> dict:
+    """Copy one page of the active collections into the shadow set, then queue the next.
+
+    Each task is short, so ``acks_late`` never outlives the broker's visibility
+    timeout. Safe to enqueue again at any time: a call without ``chain`` claims
+    the copy and resumes from the checkpointed cursor, and any older chain
+    stops at its next page. Exits immediately unless a migration is running.
+    """
+    clear_contextvars()
+    trace_id = trace_id or str(uuid.uuid4())
+    bind_contextvars(trace_id=trace_id)
+
+    state = load_state()
+    if state.get("status") != MIGRATION_RUNNING:
+        return asdict(migration_progress())
+    if chain is None:
+        chain = uuid.uuid4().hex
+        save_state({"copy_chain": chain})
+    elif state.get("copy_chain") != chain:
+        logger.info("embedding_migration.copy_superseded", pages=pages)
+        return asdict(migration_progress())
+
+    def queue_next(countdown: float, pages: int) -> None:
+        reembed_collections.apply_async(
+            kwargs={"trace_id": trace_id, "chain": chain, "pages": pages}, countdown=countdown
+        )
+
+    # Start copying only once every process double-writes, so a write made on
+    # the pre-migration routing can never land behind the copy's cursor.
+    wait = float(state.get("started_at") or 0) + EMBEDDING_ROUTING_REFRESH_SECONDS - time.time()
+    if wait > 0:
+        queue_next(wait, pages)
+        return asdict(migration_progress())
+
+    try:
+        finished = reembed_next_page()
+    except Exception as exc:
+        if is_transient_http_error(exc):
+            raise self.retry(exc=exc) from exc
+        logger.exception("embedding_migration.copy_failed", pages=pages)
+        raise
+
+    progress = migration_progress()
+    if finished:
+        logger.info(
+            "embedding_migration.copy_finished",
+            pages=pages,
+            status=progress.status,
+            migrated=progress.migrated,
+            total=progress.total,
+            points_per_second=progress.points_per_second,
+        )
+        return asdict(progress)
+
+    pages += 1
+    if pages % _PROGRESS_LOG_EVERY == 0:
+        logger.info(
+            "embedding_migration.progress",
+            migrated=progress.migrated,
+            total=progress.total,
+            percent=progress.percent,
+            eta_seconds=progress.eta_seconds,
+        )
+    queue_next(EMBEDDING_MIGRATION_THROTTLE_SECONDS, pages)
+    return asdict(progress)
@@ -0,0 +1,151 @@
+"""Per-user search latency and recall of the shared layout against the tenant layout, for thousands of users.
+
+Needs a running Qdrant server; ``--url :memory:`` only smoke-tests the script,
+since local mode ignores HNSW and tenant indexes. Run from notelite_agent/:
+
+    python -m app.services.tests.bench_tenant_search [--url http://localhost:6333] [--tenants 5000]
+
+The corpus is fixed: ``--points`` unit vectors spread over ``--tenants`` users
+with Zipf-like sizes (a few heavy users, a long tail of small ones), each user
+writing around a handful of seeded topic centres. Every query is scoped to one
+user with the same ``metadata.user_id`` filter retrieval uses, and exact top-k
+comes from brute force over that user's points. Both layouts are built from
+``VectorStorageSettings``: ``shared`` is the default global graph with a plain
+keyword index, ``tenant`` the ``QDRANT_MULTITENANCY`` layout.
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+
+import numpy as np
+from qdrant_client import QdrantClient, models
+
+from app.services.ingestion.storage.collection_settings import TENANT_FIELD, VectorStorageSettings
+from app.services.ingestion.storage.vector_store import QdrantVectorStore
+
+LAYOUTS = {
+    "shared": VectorStorageSettings(),
+    "tenant": VectorStorageSettings(multitenancy=True),
+}
+
+
+def _user(tenant: int) -> str:
+    return f"user-{tenant}"
+
+
+def _corpus(
+    points: int, tenants: int, queries: int, dim: int, seed: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Vectors, their tenant, held-out queries and the tenant each query is scoped to."""
+    rng = np.random.default_rng(seed)
+    weights = 1.0 / np.arange(1, tenants + 1) ** 0.8
+    sizes = np.maximum(1, np.round(weights / weights.sum() * points)).astype(int)
+    owners = np.repeat(np.arange(tenants), sizes)
+    topics = rng.normal(size=(tenants, 4, dim))
+
+    def draw(tenant_ids: np.ndarray) -> np.ndarray:
+        centres = topics[tenant_ids, rng.integers(4, size=len(tenant_ids))]
+        vectors = centres + rng.normal(scale=0.6, size=centres.shape)
+        return (vectors / np.linalg.norm(vectors, axis=1, keepdims=True)).astype(np.float32)
+
+    # Queries sample users by activity, so heavy users are searched more often.
+    query_owners = rng.choice(owners, size=queries)
+    return draw(owners), owners, draw(query_owners), query_owners
+
+
+def _build(client: QdrantClient, name: str, settings: VectorStorageSettings, vectors: np.ndarray, owners: np.ndarray) -> float:
+    if client.collection_exists(name):
+        client.delete_collection(name)
+    client.create_collection(
+        collection_name=name,
+        vectors_config=settings.dense_vector_params(vectors.shape[1]),
+        hnsw_config=settings.hnsw_config(),
+        # Build the HNSW index at benchmark sizes instead of falling back to a full scan.
+        optimizers_config=models.OptimizersConfigDiff(indexing_threshold=1000),
+    )
+    client.create_payload_index(
+        collection_name=name,
+        field_name=TENANT_FIELD,
+        field_schema=settings.payload_index_schema(TENANT_FIELD, models.PayloadSchemaType.KEYWORD),
+    )
+    started = time.perf_counter()
+    for start in range(0, len(vectors), 512):
+        stop = min(start + 512, len(vectors))
+        client.upsert(
+            collection_name=name,
+            points=models.Batch(
+                ids=list(range(start, stop)),
+                vectors=vectors[start:stop].tolist(),
+                payloads=[{"metadata": {"user_id": _user(int(owner))}} for owner in owners[start:stop]],
+            ),
+        )
+    while client.get_collection(name).status != models.CollectionStatus.GREEN:
+        time.sleep(0.5)
+    return time.perf_counter() - started
+
+
+def _truth(vectors: np.ndarray, owners: np.ndarray, query: np.ndarray, tenant: int, k: int) -> set[int]:
+    ids = np.flatnonzero(owners == tenant)
+    scores = vectors[ids] @ query
+    return set(ids[np.argsort(-scores)[:k]].tolist())
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://localhost:6333", help="Qdrant URL, or :memory: for a smoke run")
+    parser.add_argument("--tenants", type=int, default=5000)
+    parser.add_argument("--points", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--keep", action="store_true", help="keep the benchmark collections")
+    args = parser.parse_args()
+
+    client = QdrantClient(location=args.url, timeout=300)
+    vectors, owners, queries, query_owners = _corpus(args.points, args.tenants, args.queries, args.dim, args.seed)
+    sizes = np.bincount(owners, minlength=args.tenants)
+    heavy = sizes >= np.quantile(sizes, 0.99)
+    truths = [_truth(vectors, owners, query, int(tenant), args.k) for query, tenant in zip(queries, query_owners)]
+    print(
+        f"corpus: {len(vectors)} x {args.dim}d over {args.tenants} users "
+        f"(largest {sizes.max()}, median {int(np.median(sizes))}), {args.queries} user-scoped queries"
+    )
+    print(f"{'layout':>7} {'recall':>7} {'p50 ms':>7} {'p95 ms':>7} {'heavy p95':>9} {'build s':>7}")
+
+    for label, settings in LAYOUTS.items():
+        name = f"bench_tenant_{label}"
+        build_seconds = _build(client, name, settings, vectors, owners)
+        recalls, latencies, heavy_latencies = [], [], []
+        for query, tenant, expected in zip(queries, query_owners, truths):
+            started = time.perf_counter()
+            points = client.query_points(
+                collection_name=name,
+                query=query.tolist(),
+                query_filter=QdrantVectorStore.build_filter({"user_id": _user(int(tenant))}),
+                limit=args.k,
+                search_params=settings.search_params(),
+            ).points
+            elapsed = (time.perf_counter() - started) * 1000
+            latencies.append(elapsed)
+            if heavy[tenant]:
+                heavy_latencies.append(elapsed)
+            recalls.append(len({point.id for point in points} & expected) / min(args.k, len(expected)))
+        heavy_p95 = _percentile(heavy_latencies, 0.95) if heavy_latencies else float("nan")
+        print(
+            f"{label:>7} {statistics.fmean(recalls):>7.3f} {_percentile(latencies, 0.5):>7.2f} "
+            f"{_percentile(latencies, 0.95):>7.2f} {heavy_p95:>9.2f} {build_seconds:>7.1f}"
+        )
+        if not args.keep:
+            client.delete_collection(name)
+
+
+if __name__ == "__main__":
+    main()
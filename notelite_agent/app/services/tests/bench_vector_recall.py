@@ -0,0 +1,135 @@
+"""Recall@k and latency of quantized / on-disk / HNSW-tuned collections against the current layout.
+
+Needs a running Qdrant server; ``--url :memory:`` only smoke-tests the script,
+since local mode ignores quantization and HNSW. Run from notelite_agent/:
+
+    python -m app.services.tests.bench_vector_recall [--url http://localhost:6333] [--points 20000]
+
+The corpus is fixed: ``--points`` unit vectors drawn around ``--clusters``
+seeded centres (embedding-like: dense neighbourhoods, cosine distance), with
+held-out queries drawn the same way. Exact top-k comes from brute force, so
+the float32 in-memory baseline is measured too rather than assumed perfect.
+Each variant gets its own throwaway collection built from the same
+``VectorStorageSettings`` the ingestion collections use.
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+from dataclasses import replace
+
+import numpy as np
+from qdrant_client import QdrantClient, models
+
+from app.services.ingestion.storage.collection_settings import VectorStorageSettings
+
+VARIANTS = {
+    "float32": VectorStorageSettings(),
+    "scalar": VectorStorageSettings(quantization="scalar"),
+    "scalar-on-disk": VectorStorageSettings(quantization="scalar", vectors_on_disk=True, payload_on_disk=True),
+    "binary": VectorStorageSettings(quantization="binary", oversampling=3.0),
+    "scalar-no-rescore": VectorStorageSettings(quantization="scalar", rescore=False),
+}
+BYTES_PER_DIMENSION = {"none": 4.0, "scalar": 1.0, "binary": 1 / 8}
+
+
+def _corpus(points: int, queries: int, dim: int, clusters: int, seed: int) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    centres = rng.normal(size=(clusters, dim))
+
+    def draw(count: int) -> np.ndarray:
+        vectors = centres[rng.integers(clusters, size=count)] + rng.normal(scale=0.6, size=(count, dim))
+        return (vectors / np.linalg.norm(vectors, axis=1, keepdims=True)).astype(np.float32)
+
+    return draw(points), draw(queries)
+
+
+def _build(client: QdrantClient, name: str, settings: VectorStorageSettings, vectors: np.ndarray) -> float:
+    if client.collection_exists(name):
+        client.delete_collection(name)
+    client.create_collection(
+        collection_name=name,
+        vectors_config=settings.dense_vector_params(vectors.shape[1]),
+        hnsw_config=settings.hnsw_config(),
+        quantization_config=settings.quantization_config(),
+        on_disk_payload=settings.payload_on_disk,
+        # Build the HNSW index at benchmark sizes instead of falling back to a full scan.
+        optimizers_config=models.OptimizersConfigDiff(indexing_threshold=1000),
+    )
+    started = time.perf_counter()
+    for start in range(0, len(vectors), 512):
+        client.upsert(
+            collection_name=name,
+            points=models.Batch(
+                ids=list(range(start, min(start + 512, len(vectors)))),
+                vectors=vectors[start:start + 512].tolist(),
+            ),
+        )
+    while client.get_collection(name).status != models.CollectionStatus.GREEN:
+        time.sleep(0.5)
+    return time.perf_counter() - started
+
+
+def _measure(
+    client: QdrantClient,
+    name: str,
+    settings: VectorStorageSettings,
+    queries: np.ndarray,
+    truth: np.ndarray,
+    k: int,
+) -> tuple[float, float, float]:
+    recalls, latencies = [], []
+    for query, expected in zip(queries, truth):
+        started = time.perf_counter()
+        points = client.query_points(
+            collection_name=name,
+            query=query.tolist(),
+            limit=k,
+            search_params=settings.search_params(),
+        ).points
+        latencies.append((time.perf_counter() - started) * 1000)
+        recalls.append(len({point.id for point in points} & set(expected.tolist())) / k)
+    latencies.sort()
+    return statistics.fmean(recalls), latencies[len(latencies) // 2], latencies[int(len(latencies) * 0.95)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://localhost:6333", help="Qdrant URL, or :memory: for a smoke run")
+    parser.add_argument("--points", type=int, default=20000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--dim", type=int, default=768)
+    parser.add_argument("--clusters", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--hnsw-ef", type=int, nargs="+", default=[64, 128])
+    parser.add_argument("--hnsw-m", type=int, default=16)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--keep", action="store_true", help="keep the benchmark collections")
+    args = parser.parse_args()
+
+    client = QdrantClient(location=args.url, timeout=120)
+    vectors, queries = _corpus(args.points, args.queries, args.dim, args.clusters, args.seed)
+    truth = np.argsort(-(queries @ vectors.T), axis=1)[:, :args.k]
+    print(f"corpus: {args.points} x {args.dim}d, {args.queries} queries, recall@{args.k} vs brute force")
+    print(f"{'variant':>18} {'hnsw_ef':>7} {'recall':>7} {'p50 ms':>7} {'p95 ms':>7} {'dense RAM MB':>12} {'build s':>7}")
+
+    for label, settings in VARIANTS.items():
+        settings = replace(settings, hnsw_m=args.hnsw_m)
+        name = f"bench_recall_{label.replace('-', '_')}"
+        build_seconds = _build(client, name, settings, vectors)
+        ram_bytes = 0.0 if settings.vectors_on_disk else args.points * args.dim * 4.0
+        if settings.quantization != "none" and settings.quantization_always_ram:
+            ram_bytes += args.points * args.dim * BYTES_PER_DIMENSION[settings.quantization]
+        for hnsw_ef in args.hnsw_ef:
+            recall, p50, p95 = _measure(client, name, replace(settings, hnsw_ef=hnsw_ef), queries, truth, args.k)
+            print(
+                f"{label:>18} {hnsw_ef:>7} {recall:>7.3f} {p50:>7.2f} {p95:>7.2f} "
+                f"{ram_bytes / 2**20:>12.1f} {build_seconds:>7.1f}"
+            )
+        if not args.keep:
+            client.delete_collection(name)
+
+
+if __name__ == "__main__":
+    main()
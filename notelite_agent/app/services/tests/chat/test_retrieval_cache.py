@@ -0,0 +1,98 @@
+from llama_index.core import Document
+
+from app.services.chat.pipeline import retrieval_pipeline
+from app.services.chat.pipeline.retrieval_cache import RetrievalCache
+from app.services.chat.pipeline.retrieval_pipeline import PreparedQuery, QueryEmbeddings, run_retrieval
+
+
+class _Postgres:
+    def __init__(self, generation):
+        self.generation = generation
+
+    def index_generation(self, user_id):
+        return self.generation
+
+
+def _pipeline(monkeypatch, cache):
+    seed = (Document(text="body", metadata={"doc_id": "doc", "chunk_id": "0"}), 1.0)
+    embedded = []
+    monkeypatch.setattr(retrieval_pipeline, "default_retrieval_cache", lambda: cache)
+    monkeypatch.setattr(
+        retrieval_pipeline,
+        "preprocess_query",
+        lambda query, *args: PreparedQuery(query, query),
+    )
+    monkeypatch.setattr(retrieval_pipeline, "generate_hyde", lambda prepared: (None, "disabled"))
+    monkeypatch.setattr(
+        retrieval_pipeline,
+        "embed_query",
+        lambda store, prepared, hyde: embedded.append(prepared.search_query)
+        or QueryEmbeddings([0.1], {"indices": [], "values": []}),
+    )
+    monkeypatch.setattr(
+        retrieval_pipeline,
+        "multi_collection_search",
+        lambda *args: (
+            {"chunk_dense_original": [seed]},
+            {"source_errors": {}, "summary_doc_ids": [], "date_identity_count": 0},
+        ),
+    )
+    monkeypatch.setattr(retrieval_pipeline, "rerank", lambda query, fused, top_k: fused)
+    monkeypatch.setattr(
+        retrieval_pipeline,
+        "assemble_context",
+        lambda *args: (["body"], [{"note_id": "note"}], {"expanded_context_count": 1}),
+    )
+    return embedded
+
+
+def test_repeated_query_is_served_from_cache(monkeypatch):
+    embedded = _pipeline(monkeypatch, RetrievalCache(max_entries=8))
+    postgres = _Postgres(generation=3)
+
+    first = run_retrieval(object(), "What is Qdrant?", "user", 5, "user", postgres=postgres)
+    first.references[0]["note_id"] = "mutated"
+    second = run_retrieval(object(), "what  is qdrant?", "user", 5, "user", postgres=postgres)
+
+    assert embedded == ["What is Qdrant?"]
+    assert second.context_texts == ["body"]
+    assert second.references == [{"note_id": "note"}]
+    assert second.diagnostics["cache"] == "hit"
+    assert "retrieval cache hit" in second.events
+
+
+def test_index_generation_bump_invalidates_user_entries(monkeypatch):
+    embedded = _pipeline(monkeypatch, RetrievalCache(max_entries=8))
+    postgres = _Postgres(generation=1)
+
+    run_retrieval(object(), "query", "user", 5, "user", postgres=postgres)
+    postgres.generation = 2
+    run_retrieval(object(), "query", "user", 5, "user", postgres=postgres)
+    run_retrieval(object(), "query", "user", 8, "user", postgres=postgres)
+
+    assert embedded == ["query", "query", "query"]
+
+
+def test_unreadable_generation_disables_caching(monkeypatch):
+    cache = RetrievalCache(max_entries=8)
+    embedded = _pipeline(monkeypatch, cache)
+
+    run_retrieval(object(), "query", "user", 5, "user", postgres=_Postgres(generation=None))
+    run_retrieval(object(), "query", "user", 5, "user", postgres=_Postgres(generation=None))
+
+    assert len(embedded) == 2
+    assert len(cache) == 0
+
+
+def test_key_records_the_hyde_mode_the_path_actually_used(monkeypatch):
+    cache = RetrievalCache(max_entries=8)
+    _pipeline(monkeypatch, cache)
+    monkeypatch.setattr(retrieval_pipeline, "HYDE_SPECULATIVE", True)
+
+    monkeypatch.setattr(retrieval_pipeline, "HYDE_ENABLED", False)
+    run_retrieval(object(), "query", "user", 5, "user", postgres=_Postgres(generation=1))
+    # The sync path never runs HyDE speculatively, even when that is configured.
+    monkeypatch.setattr(retrieval_pipeline, "HYDE_ENABLED", True)
+    run_retrieval(object(), "query", "user", 5, "user", postgres=_Postgres(generation=1))
+
+    assert [key[-1] for key in cache._entries] == ["off", "sequential"]
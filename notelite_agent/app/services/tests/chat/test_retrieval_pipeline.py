@@ -1,8 +1,13 @@
+import asyncio
+
 from llama_index.core import Document
 
 from app.services.chat.pipeline import retrieval_pipeline
 from app.services.chat.pipeline.retrieval_pipeline import (
     PreparedQuery,
+    aassemble_context,
+    amulti_collection_search,
+    arun_retrieval,
     assemble_context,
     QueryEmbeddings,
     generate_hyde,
@@ -14,9 +19,20 @@ from app.services.chat.schema import ChatRequest
 
 
 class FakePostgres:
+    generation = None
+
     def user_timezone(self, user_id):
         return "UTC"
 
+    async def auser_timezone(self, user_id):
+        return "UTC"
+
+    def index_generation(self, user_id):
+        return self.generation
+
+    async def aindex_generation(self, user_id):
+        return self.generation
+
 
 def hit(doc_id: str, chunk_id: str):
     return (
@@ -164,18 +180,28 @@ def test_context_limits_seeds_and_expands_only_top_small_fragment(monkeypatch):
     third = document("3", "third seed", 3)
 
     class Store:
-        def fetch_neighbor(self, doc_id, chunk_id):
-            return {"0": neighbor, "2": second}.get(str(chunk_id))
+        def __init__(self):
+            self.requests = []
+
+        def fetch_chunks(self, identities):
+            self.requests.append(list(identities))
+            chunks = {"0": neighbor, "2": second}
+            return {
+                (doc_id, chunk_id): chunks[chunk_id]
+                for doc_id, chunk_id in identities
+                if chunk_id in chunks
+            }
 
     class Postgres:
-        def skipped_chunk(self, doc_id, chunk_id):
-            return None
+        def skipped_chunks(self, identities):
+            return {}
 
         def summaries(self, doc_ids, limit):
             return []
 
+    store = Store()
     contexts, references, diagnostics = assemble_context(
-        Store(),
+        store,
         Postgres(),
         [(first, 1.0), (second, 0.9), (third, 0.8)],
     )
@@ -187,3 +213,189 @@ def test_context_limits_seeds_and_expands_only_top_small_fragment(monkeypatch):
     assert [chunk["score"] for chunk in references[0]["chunks"]] == [None, 1.0, 0.9]
     assert diagnostics["context_seed_count"] == 2
     assert diagnostics["neighbor_count"] == 2
+    assert store.requests == [[("doc", "0"), ("doc", "2")]]
+
+def test_async_search_batches_chunk_queries_and_reports_failures():
+    summary = hit("doc", "summary")
+    running = 0
+    peak = 0
+    batches = []
+
+    async def search(hits):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return hits
+
+    class Store:
+        async def asearch_chunks(self, queries, **kwargs):
+            batches.append(list(queries))
+            if kwargs.get("doc_ids"):
+                raise RuntimeError("qdrant unavailable")
+            return await search({"chunk_dense_original": [hit("doc", "0")], "chunk_sparse_bm25": []})
+
+        async def asearch_summary_dense(self, vector, **kwargs):
+            return await search([summary])
+
+        async def asearch_question_dense(self, vector, **kwargs):
+            return await search([])
+
+    sources, diagnostics = asyncio.run(amulti_collection_search(
+        Store(),
+        PreparedQuery("q", "q"),
+        QueryEmbeddings([0.1], {"indices": [], "values": []}),
+        {"user_id": "u"},
+        FakePostgres(),
+    ))
+
+    assert peak == 3
+    assert batches == [
+        ["chunk_dense_original", "chunk_sparse_bm25"],
+        ["chunk_filtered_dense", "chunk_filtered_sparse"],
+    ]
+    assert diagnostics["summary_doc_ids"] == ["doc"]
+    assert diagnostics["source_errors"] == {
+        "chunk_filtered_dense": "RuntimeError",
+        "chunk_filtered_sparse": "RuntimeError",
+    }
+    assert len(sources["chunk_dense_original"]) == 1
+    assert sources["chunk_filtered_sparse"] == []
+
+def test_sync_search_batches_chunk_queries(monkeypatch):
+    class Store:
+        def __init__(self):
+            self.batches = []
+
+        def search_chunks(self, queries, **kwargs):
+            self.batches.append(list(queries))
+            return {name: [hit("doc", name)] for name in queries}
+
+        def search_summary_dense(self, vector, **kwargs):
+            return []
+
+        def search_question_dense(self, vector, **kwargs):
+            return []
+
+    store = Store()
+    sources, diagnostics = retrieval_pipeline.multi_collection_search(
+        store,
+        PreparedQuery("q", "q"),
+        QueryEmbeddings([0.1], {"indices": [], "values": []}, hyde_dense=[0.2]),
+        {"user_id": "u"},
+        FakePostgres(),
+    )
+
+    assert store.batches == [["chunk_dense_original", "chunk_sparse_bm25", "chunk_dense_hyde"]]
+    assert set(sources) == {"chunk_dense_original", "chunk_sparse_bm25", "chunk_dense_hyde"}
+    assert diagnostics["source_errors"] == {}
+
+def test_async_context_matches_sync_assembly():
+    def document(chunk_id, text, previous=None, next_id=None):
+        return Document(
+            text=text,
+            metadata={
+                "doc_id": "doc",
+                "chunk_id": chunk_id,
+                "note_id": "note",
+                "prev_chunk_id": previous,
+                "next_chunk_id": next_id,
+            },
+        )
+
+    seed = document("1", "small fragment", previous="0", next_id="2")
+    neighbors = {"0": document("0", "previous")}
+    skipped = type("Skipped", (), {"content": "skipped tail", "metadata_json": {}, "chunk_id": "2"})()
+
+    class Store:
+        def fetch_chunks(self, identities):
+            return {identity: neighbors[identity[1]] for identity in identities if identity[1] in neighbors}
+
+        async def afetch_chunks(self, identities):
+            return self.fetch_chunks(identities)
+
+    class Postgres:
+        def skipped_chunks(self, identities):
+            assert identities == [("doc", "2")]
+            return {("doc", "2"): skipped}
+
+        async def askipped_chunks(self, identities):
+            return self.skipped_chunks(identities)
+
+        def summaries(self, doc_ids, limit):
+            return []
+
+        async def asummaries(self, doc_ids, limit):
+            return []
+
+    expected = assemble_context(Store(), Postgres(), [(seed, 1.0)])
+    actual = asyncio.run(aassemble_context(Store(), Postgres(), [(seed, 1.0)]))
+
+    assert actual == expected
+    assert actual[0] == ["previous", "small fragment", "skipped tail"]
+
+def _speculative_retrieval(monkeypatch, hyde_delay):
+    searched = []
+
+    async def agenerate_hyde(prepared):
+        await asyncio.sleep(hyde_delay)
+        return "hypothetical passage", "completed"
+
+    class Store:
+        async def aembed_query_texts(self, texts):
+            return type("Batch", (), {
+                "dense": [[float(len(text))] for text in texts],
+                "sparse": [{"indices": [], "values": []} for _text in texts],
+            })()
+
+        async def asearch_chunks(self, queries, **kwargs):
+            searched.append(queries["chunk_dense_original"][1])
+            return {name: [hit("doc", "0")] for name in queries}
+
+        async def asearch_chunk_dense(self, vector, **kwargs):
+            searched.append(vector)
+            return [hit("doc", str(len(searched)))]
+
+        async def asearch_summary_dense(self, vector, **kwargs):
+            return []
+
+        async def asearch_question_dense(self, vector, **kwargs):
+            return []
+
+    async def apreprocess_query(*args):
+        return PreparedQuery("query", "query")
+
+    async def arerank(query, fused, top_k):
+        return fused[:top_k]
+
+    async def aassemble_context(store, postgres, seeds):
+        return ["body"], [], {"expanded_context_count": 1}
+
+    monkeypatch.setattr(retrieval_pipeline, "HYDE_SPECULATIVE", True)
+    monkeypatch.setattr(retrieval_pipeline, "HYDE_ENABLED", True)
+    monkeypatch.setattr(retrieval_pipeline, "agenerate_hyde", agenerate_hyde)
+    monkeypatch.setattr(retrieval_pipeline, "apreprocess_query", apreprocess_query)
+    monkeypatch.setattr(retrieval_pipeline, "arerank", arerank)
+    monkeypatch.setattr(retrieval_pipeline, "aassemble_context", aassemble_context)
+    monkeypatch.setattr(retrieval_pipeline, "HYDE_SPECULATIVE_BUDGET_MS", 50)
+
+    result = asyncio.run(arun_retrieval(Store(), "query", "user", 5, "user", postgres=FakePostgres()))
+    return result, searched
+
+def test_speculative_hyde_merges_when_within_budget(monkeypatch):
+    result, searched = _speculative_retrieval(monkeypatch, hyde_delay=0)
+
+    assert searched[-1] == [float(len("hypothetical passage"))]
+    assert result.diagnostics["hyde_status"] == "speculative:completed"
+    assert result.diagnostics["search"]["speculative_hyde"]["merged"] is True
+    assert "chunk_dense_hyde" in result.diagnostics["rrf"]["source_counts"]
+    assert "retrieval hyde speculative:completed merged=True" in result.events
+
+def test_speculative_hyde_is_dropped_when_late(monkeypatch):
+    result, searched = _speculative_retrieval(monkeypatch, hyde_delay=1)
+
+    assert searched == [[5.0]]
+    assert result.diagnostics["hyde_status"] == "speculative:late"
+    assert result.diagnostics["search"]["speculative_hyde"] == {"status": "late", "merged": False}
+    assert "chunk_dense_hyde" not in result.diagnostics["rrf"]["source_counts"]
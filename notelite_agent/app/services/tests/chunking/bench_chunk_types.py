@@ -0,0 +1,85 @@
+"""CPU cost of chunk type classification: per-rule line splitting, the shared-lines engine, and the cache.
+
+Run from notelite_agent/:
+
+    python -m app.services.tests.chunking.bench_chunk_types [--repeat N]
+
+The corpus is every stress-test case plus every chunk ``split_into_typed_chunks``
+emits for it. ``per-rule`` gives each rule its own ``ChunkLines``, so every
+predicate re-splits the text as the rules did before the engine; ``engine``
+shares one split across the rules; ``cached`` is ``classify_chunk_type`` itself.
+The last rows time a full ``split_into_typed_chunks`` pass with a cold and a
+warm classification cache.
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+
+from app.services.ingestion.processors.chunking.chunk_classifier import split_into_typed_chunks
+from app.services.ingestion.processors.chunking.chunk_type_rules import ChunkLines
+from app.services.ingestion.processors.chunking.chunk_types import (
+    CHUNK_TYPE_RULES,
+    ChunkType,
+    classify_chunk_type,
+)
+from app.services.tests.chunking.chunk_test_data_stress import TEST_CASES
+
+
+def _per_rule(chunk: str) -> ChunkType:
+    text = chunk.strip()
+    if not text:
+        return ChunkType.CONTENT
+    for rule in CHUNK_TYPE_RULES:
+        if rule.matches(ChunkLines(text)):
+            return rule.chunk_type
+    return ChunkType.CONTENT
+
+
+def _best_of(runs: int, repeat: int, action: Callable[[], None], cold: bool = False) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        if cold:
+            classify_chunk_type.cache_clear()
+        started = time.process_time()
+        for _ in range(repeat):
+            action()
+        best = min(best, time.process_time() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20, help="passes over the corpus per timed run")
+    parser.add_argument("--runs", type=int, default=5, help="timed runs; the fastest is reported")
+    args = parser.parse_args()
+
+    documents = [case["text"] for case in TEST_CASES]
+    corpus = documents + [chunk for text in documents for chunk, _ in split_into_typed_chunks(text)]
+    engine = classify_chunk_type.__wrapped__
+    assert [_per_rule(text) for text in corpus] == [engine(text) for text in corpus]
+
+    def classify_all(classify: Callable[[str], ChunkType]) -> Callable[[], None]:
+        return lambda: [classify(text) for text in corpus]
+
+    def split_all() -> None:
+        for text in documents:
+            split_into_typed_chunks(text)
+
+    calls = len(corpus) * args.repeat
+    rows = [
+        ("per-rule", _best_of(args.runs, args.repeat, classify_all(_per_rule)), calls),
+        ("engine", _best_of(args.runs, args.repeat, classify_all(engine)), calls),
+        ("cached", _best_of(args.runs, args.repeat, classify_all(classify_chunk_type), cold=True), calls),
+        ("split cold", _best_of(args.runs, 1, split_all, cold=True), len(documents)),
+        ("split warm", _best_of(args.runs, 1, split_all), len(documents)),
+    ]
+    print(f"corpus: {len(documents)} stress documents, {len(corpus)} texts to classify")
+    print(f"{'mode':>10} {'total ms':>9} {'us/call':>8}")
+    for label, seconds, count in rows:
+        print(f"{label:>10} {seconds * 1000:>9.1f} {seconds / count * 1e6:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""CPU cost of token counting across ingestion stages, with and without the shared cache.
+
+Run from notelite_agent/:
+
+    python -m app.services.tests.chunking.bench_token_counts [--repeat N]
+
+The note is every stress-test case concatenated ``--repeat`` times. Each run
+chunks it, then repeats the counts the downstream stages make on the same
+text (orchestrator, chunk builder, keyword batching, summary grouping).
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+from app.services.ingestion.processors.chunking.chunk_processor import ChunkProcessor
+from app.services.ingestion.processors.keywords.keyword_batcher import (
+    KeywordBatchItem,
+    build_keyword_batches,
+)
+from app.services.ingestion.processors.summary.summary_processor import SummaryProcessor
+from app.services.tests.chunking.chunk_test_data_stress import TEST_CASES
+from app.shared.utils import count_tokens, token_count_cache
+
+
+def _large_note(repeat: int) -> str:
+    sections = [
+        f"# Section {round_index}.{case_index}\n\n{case['text']}"
+        for round_index in range(repeat)
+        for case_index, case in enumerate(TEST_CASES)
+    ]
+    return "\n\n".join(sections)
+
+
+def _ingest_counts(note: str) -> tuple[float, float]:
+    chunking_start = time.process_time()
+    count_tokens(note)
+    chunks = ChunkProcessor().process(note)
+    downstream_start = time.process_time()
+    texts = [chunk.content for chunk in chunks]
+    for text in texts:
+        count_tokens(text)
+    build_keyword_batches(
+        [KeywordBatchItem(chunk.chunk_id, chunk.chunk_type, chunk.content) for chunk in chunks],
+        max_chunks=12,
+        max_tokens=6000,
+    )
+    SummaryProcessor().group_chunks(texts)
+    sum(count_tokens(text) for text in texts)
+    finished = time.process_time()
+    return downstream_start - chunking_start, finished - downstream_start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    note = _large_note(args.repeat)
+    cache = token_count_cache()
+    configured_entries = cache.max_entries
+    print(f"note: {len(note)} chars, {len(TEST_CASES) * args.repeat} sections")
+
+    cache.max_entries = 0
+    _ingest_counts(note)  # load models and warm the chunkers outside the timing
+    results = {}
+    for label, max_entries in (("uncached", 0), ("cached", configured_entries)):
+        cache.clear()
+        cache.max_entries = max_entries
+        results[label] = _ingest_counts(note)
+        chunking, downstream = results[label]
+        print(
+            f"{label:>8}: chunking {chunking * 1000:8.1f} ms cpu, "
+            f"downstream counts {downstream * 1000:8.1f} ms cpu, "
+            f"hits={cache.hits} misses={cache.misses}"
+        )
+    cache.max_entries = configured_entries
+
+    saved = sum(results["uncached"]) - sum(results["cached"])
+    print(f"   saved: {saved * 1000:8.1f} ms cpu ({saved / max(sum(results['uncached']), 1e-9):.0%})")
+
+
+if __name__ == "__main__":
+    main()
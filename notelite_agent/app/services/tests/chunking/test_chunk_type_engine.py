@@ -0,0 +1,41 @@
+from app.services.ingestion.processors.chunking.chunk_type_rules import (
+    ChunkLines,
+    faq,
+    glossary,
+    is_glossary_type,
+    is_list_type,
+    without_leading_heading,
+)
+from app.services.ingestion.processors.chunking.chunk_types import CHUNK_TYPE_RULES, ChunkType, classify_chunk_type
+from app.services.tests.chunking.chunk_test_data_stress import TEST_CASES
+
+
+def test_engine_matches_rules_evaluated_one_by_one():
+    for case in TEST_CASES:
+        text = case["text"].strip()
+        expected = next(
+            (rule.chunk_type for rule in CHUNK_TYPE_RULES if rule.matches(ChunkLines(text))),
+            ChunkType.CONTENT,
+        )
+
+        assert classify_chunk_type.__wrapped__(case["text"]) == expected
+
+
+def test_chunk_lines_body_skips_leading_headings():
+    text = "# Title\n## Part\n\n- one\n- two"
+    lines = ChunkLines(text)
+
+    assert lines.body == without_leading_heading(text) == "- one\n- two"
+    assert lines.target_rows == ["- one", "- two"]
+    assert is_list_type(text, lines.body)
+
+
+def test_dependent_rule_reads_memoized_result():
+    text = "API: Application Programming Interface\nSDK: Software Development Kit"
+    assert ChunkLines(text).check(glossary) is True
+
+    lines = ChunkLines(text)
+    lines._results[faq] = True
+
+    assert glossary(lines) is False
+    assert is_glossary_type(text, text) is True
@@ -0,0 +1,124 @@
+import numpy as np
+
+from app.services.ingestion.processors.chunking.chunk_processor import ChunkProcessor
+from app.services.ingestion.processors.chunking.semantic_chunker import SemanticChunker
+from app.services.ingestion.processors.chunking.semantic_splitter import (
+    SemanticSplitter,
+    breakpoint_groups,
+    neighbour_distances,
+    sentence_pieces,
+    sentence_windows,
+)
+
+
+TOPICS = {"cat": [1.0, 0.0, 0.0], "rain": [0.0, 1.0, 0.0], "tax": [0.0, 0.0, 1.0]}
+
+
+def _topic_embed(calls: list[list[str]]):
+    def embed(texts: list[str]) -> list[list[float]]:
+        calls.append(texts)
+        return [
+            np.sum([np.multiply(text.count(word), vector) for word, vector in TOPICS.items()], axis=0).tolist()
+            for text in texts
+        ]
+
+    return embed
+
+
+def _section(topic_a: str, topic_b: str, size: int = 4) -> list[str]:
+    return [f"The {topic_a} note number {i}." for i in range(size)] + [
+        f"The {topic_b} note number {i}." for i in range(size)
+    ]
+
+
+def test_sentence_windows_include_neighbours():
+    assert sentence_windows(["a", "b", "c"], buffer_size=1) == ["a b", "a b c", "b c"]
+
+
+def test_sentence_pieces_keep_the_whitespace_between_sentences():
+    text = "First one.\nSecond one.\n\nThird  one."
+
+    pieces = sentence_pieces(text, ["First one.", "Second one.", "Third  one."])
+
+    assert pieces == ["First one.\n", "Second one.\n\n", "Third  one."]
+    assert sentence_windows(pieces) == ["First one. Second one.", "First one. Second one. Third  one.", "Second one. Third  one."]
+    assert sentence_pieces(text, ["Missing.", "Third  one."]) == ["Missing. ", "Third  one. "]
+
+
+def test_neighbour_distances_match_pairwise_cosine():
+    vectors = np.random.default_rng(3).normal(size=(6, 4))
+
+    expected = [
+        1 - vectors[i] @ vectors[i + 1] / (np.linalg.norm(vectors[i]) * np.linalg.norm(vectors[i + 1]))
+        for i in range(5)
+    ]
+
+    assert np.allclose(neighbour_distances(vectors), expected)
+
+
+def test_breakpoint_groups_without_distances_keep_one_group():
+    assert breakpoint_groups(["Only one."], np.array([]), 95) == ["Only one."]
+    assert breakpoint_groups([], np.array([]), 95) == []
+
+
+def test_splitter_breaks_each_section_at_its_topic_change_with_one_embedding_call():
+    calls: list[list[str]] = []
+    splitter = SemanticSplitter(_topic_embed(calls), breakpoint_percentile=95)
+
+    groups = splitter.split([_section("cat", "rain"), _section("rain", "tax", size=3)])
+
+    assert len(calls) == 1 and len(calls[0]) == 14
+    assert [len(group) for group in groups] == [2, 2]
+    assert "rain" not in groups[0][0] and "cat" not in groups[0][1]
+    assert "tax" not in groups[1][0] and "rain" not in groups[1][1]
+
+
+def test_prepared_prose_is_split_without_further_embedding_calls(monkeypatch):
+    from app.services.ingestion.processors.chunking import semantic_chunker
+
+    monkeypatch.setattr(semantic_chunker, "MAX_CHUNK_SIZE", 64)
+    monkeypatch.setattr(SemanticChunker, "_remote_disabled_until", 0.0)
+    calls: list[list[str]] = []
+    chunker = SemanticChunker()
+    chunker._splitter = SemanticSplitter(_topic_embed(calls), breakpoint_percentile=95)
+    first = " ".join(_section("cat", "rain"))
+    second = " ".join(_section("rain", "tax"))
+
+    chunker.prepare([first, second, "Too short."])
+    parts = [chunker.split_prose(first), chunker.split_prose(second), chunker.split_prose("Too short.")]
+
+    assert len(calls) == 1
+    assert [len(part) for part in parts] == [2, 2, 1]
+    assert "semantic chunking embedded: 16 sentences from 2 sections" in chunker.events
+
+
+def test_semantic_parts_keep_the_original_line_breaks(monkeypatch):
+    from app.services.ingestion.processors.chunking import semantic_chunker
+
+    monkeypatch.setattr(semantic_chunker, "MAX_CHUNK_SIZE", 64)
+    monkeypatch.setattr(SemanticChunker, "_remote_disabled_until", 0.0)
+    chunker = SemanticChunker()
+    chunker._splitter = SemanticSplitter(_topic_embed([]), breakpoint_percentile=95)
+    cats, rain = _section("cat", "rain")[:4], _section("cat", "rain")[4:]
+    text = "\n".join(cats) + "\n\n" + "\n".join(rain)
+
+    parts = chunker.split_prose(text)
+
+    assert parts == ["\n".join(cats), "\n".join(rain)]
+
+
+def test_chunk_processor_embeds_all_headed_sections_in_one_request(monkeypatch):
+    from app.services.ingestion.processors.chunking import semantic_chunker
+
+    monkeypatch.setattr(semantic_chunker, "MAX_CHUNK_SIZE", 64)
+    monkeypatch.setattr(SemanticChunker, "_remote_disabled_until", 0.0)
+    calls: list[list[str]] = []
+    processor = ChunkProcessor()
+    processor.semantic_chunker._splitter = SemanticSplitter(_topic_embed(calls), breakpoint_percentile=95)
+    text = f"# Pets\n\n{' '.join(_section('cat', 'rain'))}\n\n# Money\n\n{' '.join(_section('rain', 'tax'))}"
+
+    chunks = processor.process(text)
+
+    assert len(calls) == 1
+    assert any(chunk.content.startswith("# Pets\n\nThe cat") for chunk in chunks)
+    assert not any("cat" in chunk.content and "rain" in chunk.content for chunk in chunks)
@@ -0,0 +1,73 @@
+import random
+
+from app.services.ingestion.processors.chunking import token_budget, window_chunker
+from app.services.ingestion.processors.chunking.validators import is_table_rowish_chunk
+from app.services.ingestion.processors.chunking.window_chunker import WindowChunker
+
+
+def _table(rows: int, indent_every: int = 0) -> str:
+    rng = random.Random(rows)
+    lines = ["| Date | Account | Amount | Memo |", "|---|---|---|---|"]
+    for index in range(rows):
+        line = f"| 2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d} | ACC-{rng.randint(100, 999)} | {rng.random() * 1e4:.2f} | paid, ok: {index} |"
+        if indent_every and index % indent_every == 0:
+            line = f"  {line}"
+        lines.append(line if index % 3 else line.rstrip(" |"))
+    return "\n".join(lines)
+
+
+def _joined_table_rows(chunker: WindowChunker, text: str) -> list[str]:
+    """Reference packing that re-counts every candidate window."""
+    parts: list[str] = []
+    current: list[str] = []
+    header_context = chunker._table_header_context(text)
+    for line in [line.rstrip() for line in text.splitlines() if line.strip()]:
+        candidate_lines = [*current, line]
+        if current and not token_budget.within_chunk_budget("\n".join(candidate_lines).strip()):
+            parts.append("\n".join(current).strip())
+            current = [*header_context]
+            if line not in current:
+                current.append(line)
+            continue
+        current = candidate_lines
+    if current:
+        parts.append("\n".join(current).strip())
+    output: list[str] = []
+    for part in parts:
+        if token_budget.within_chunk_budget(part) or is_table_rowish_chunk(part):
+            output.append(part)
+        else:
+            output.extend(chunker._merge_sentence_windows(chunker._split_sentences(part)))
+    return output
+
+
+def test_table_rows_match_joined_window_counts(monkeypatch):
+    chunker = WindowChunker()
+    for size in (24, 64, 200):
+        monkeypatch.setattr(window_chunker, "MAX_CHUNK_SIZE", size)
+        monkeypatch.setattr(token_budget, "MAX_CHUNK_SIZE", size)
+        for text in (_table(300), _table(120, indent_every=7)):
+            assert chunker._split_table_rows(text) == _joined_table_rows(chunker, text)
+
+
+def test_table_rows_encode_each_row_a_bounded_number_of_times(monkeypatch):
+    calls = []
+
+    def counting_encode(text):
+        calls.append(text)
+        return token_budget.encode(text)
+
+    monkeypatch.setattr(window_chunker, "encode", counting_encode)
+    parts = WindowChunker()._split_table_rows(_table(10000))
+
+    assert len(parts) > 100
+    assert all(part.startswith("| Date | Account") for part in parts)
+    assert len(calls) <= 2 * 10002
+
+
+def test_hard_split_slices_one_encoding(monkeypatch):
+    monkeypatch.setattr(window_chunker, "MAX_CHUNK_SIZE", 16)
+    monkeypatch.setattr(token_budget, "MAX_CHUNK_SIZE", 16)
+    text = " ".join(f"word{index}" for index in range(60))
+
+    assert WindowChunker()._hard_split(text) == token_budget.split_by_token_window(text, overlap_tokens=0)
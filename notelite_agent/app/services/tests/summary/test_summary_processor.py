@@ -1,6 +1,11 @@
+import threading
+import time
+
 from app.services.ingestion.processors.summary.summary_processor import SummaryProcessor
 from app.services.ingestion.processors.summary.summary_helpers import repair_summary_format
 
+_MODULE = "app.services.ingestion.processors.summary.summary_processor"
+
 
 def test_direct_summary_repairs_useful_list_output(monkeypatch):
     monkeypatch.setattr(
@@ -37,3 +42,66 @@ def test_summary_format_repair_drops_incomplete_trailing_clause():
     assert repair_summary_format(
         "The release completed successfully. The team assigned follow-up work, and draft"
     ) == "The release completed successfully."
+
+
+def _group_llm(delays):
+    def call(messages, **kwargs):
+        text = messages[-1]["content"]
+        delay = delays.get(text, 0)
+        if callable(delay):
+            delay()
+        else:
+            time.sleep(delay)
+        if text == "skip me":
+            return "SKIP"
+        if text == "broken":
+            raise RuntimeError("boom")
+        return f"The group about {text} was summarized in full."
+    return call
+
+
+def _hierarchical(monkeypatch, texts, delays, concurrency=4, deadline=5.0):
+    monkeypatch.setattr(f"{_MODULE}.SUMMARY_GROUP_CONCURRENCY", concurrency)
+    monkeypatch.setattr(f"{_MODULE}.SUMMARY_DEADLINE_SECONDS", deadline)
+    monkeypatch.setattr(f"{_MODULE}.llm_call_general", _group_llm(delays))
+    processor = SummaryProcessor()
+    processor.group_chunks = lambda chunks: [[chunk] for chunk in chunks]
+    return processor.summarize_hierarchical(texts)
+
+
+def test_group_summaries_run_concurrently_and_keep_order(monkeypatch):
+    # alpha and gamma only get past the barrier if both calls are in flight at once.
+    barrier = threading.Barrier(2, timeout=2)
+    result = _hierarchical(
+        monkeypatch,
+        ["alpha", "skip me", "broken", "gamma"],
+        {"alpha": barrier.wait, "gamma": barrier.wait},
+    )
+
+    assert not barrier.broken
+    assert result.api_calls == 5
+    group_events = [event for event in result.events if ": group " in event and "api call" not in event]
+    assert group_events == [
+        "summary skipped: group 2",
+        "summary failed: group 3 (RuntimeError)",
+    ]
+    api_call_groups = [event.split(",")[0] for event in result.events if "api call: group" in event]
+    assert api_call_groups == [f"summary api call: group {index}" for index in range(1, 5)]
+
+
+def test_groups_past_the_document_deadline_are_reported_failed(monkeypatch):
+    result = _hierarchical(
+        monkeypatch,
+        ["alpha", "slow", "slower", "queued"],
+        {"slow": 0.5, "slower": 0.5},
+        concurrency=2,
+        deadline=0.1,
+    )
+
+    assert result.events[-4:-1] == [
+        "summary failed: group 2 (deadline)",
+        "summary failed: group 3 (deadline)",
+        "summary failed: group 4 (deadline)",
+    ]
+    assert result.summary == "The group about alpha was summarized in full."
+    assert result.api_calls == 3
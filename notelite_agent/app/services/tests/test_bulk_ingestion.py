@@ -0,0 +1,246 @@
+"""Bulk ingestion: batched freshness checks, embeddings, and storage writes."""
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from app.core.embeddings import EmbeddingBatch
+from app.services.ingestion.orchestrator import IngestionOrchestrator
+from app.services.ingestion.processors.ingest import IndexChunk
+from app.services.ingestion.storage.collection_routing import CollectionRouting
+from app.services.ingestion.storage.vector_store import CHUNK_COLLECTION, QdrantVectorStore
+from app.services.ingestion.validators.request_version_validator import stale_ingestions
+
+
+class _BulkFakeClient:
+    """In-memory stand-in for the Qdrant calls of bulk replaces; scrolls may match several documents."""
+
+    def __init__(self):
+        self.points = {}
+        self.deleted = []
+        self.upsert_sizes = []
+        self.metadata = {}
+
+    def collection_exists(self, collection_name):
+        return True
+
+    def get_collection(self, collection_name):
+        return SimpleNamespace(config=SimpleNamespace(metadata=self.metadata))
+
+    def update_collection(self, *, collection_name, metadata, hnsw_config=None):
+        self.metadata = metadata
+
+    def create_payload_index(self, **kwargs):
+        pass
+
+    def scroll(self, *, collection_name, scroll_filter, limit, offset, with_payload, with_vectors):
+        match = scroll_filter.must[0].match
+        doc_ids = set(getattr(match, "any", None) or [match.value])
+        records = [
+            SimpleNamespace(id=point_id, payload={key: point.payload[key] for key in with_payload})
+            for point_id, point in self.points.items()
+            if point.payload["doc_id"] in doc_ids
+        ]
+        return records, None
+
+    def retrieve(self, *, collection_name, ids, with_payload, with_vectors):
+        return [
+            SimpleNamespace(
+                id=point_id,
+                payload={"embed_hash": self.points[point_id].payload["embed_hash"]},
+                vector=self.points[point_id].vector,
+            )
+            for point_id in ids
+        ]
+
+    def upsert(self, *, collection_name, points):
+        if collection_name == CHUNK_COLLECTION:
+            self.upsert_sizes.append(len(points))
+            self.points.update({point.id: point for point in points})
+
+    def delete(self, *, collection_name, points_selector):
+        if collection_name == CHUNK_COLLECTION and hasattr(points_selector, "points"):
+            self.deleted.append(list(points_selector.points))
+            for point_id in points_selector.points:
+                self.points.pop(point_id, None)
+
+
+class _FakeEmbeddingClient:
+    def __init__(self):
+        self.remote_service = SimpleNamespace(model="test-embedding-model")
+        self.events = []
+        self.texts = []
+
+    def embed_documents(self, texts):
+        self.texts.extend(texts)
+        return EmbeddingBatch(
+            dense=[[0.1, 0.2] for _ in texts],
+            sparse=[{"indices": [1], "values": [1.0]} for _ in texts],
+        )
+
+
+def _chunks(doc_id, *texts):
+    return [
+        IndexChunk(str(index), doc_id, index, len(texts), "content", text, text)
+        for index, text in enumerate(texts)
+    ]
+
+
+def _bulk_store():
+    store = QdrantVectorStore.__new__(QdrantVectorStore)
+    store.routing = CollectionRouting()
+    store._storage_settings = None
+    store.client = _BulkFakeClient()
+    store.embedding_client = _FakeEmbeddingClient()
+    store._shadow_embedding_client = None
+    store._async_client = None
+    store.events = []
+    return store
+
+
+def test_bulk_replace_shares_one_embed_pass_and_batches_upserts(monkeypatch):
+    monkeypatch.setattr("app.services.ingestion.storage.vector_store.QDRANT_UPSERT_BATCH_SIZE", 2)
+    store = _bulk_store()
+    store.replace_index_chunks("a", _chunks("a", "alpha", "beta"))
+    store.replace_index_chunks("b", _chunks("b", "gamma", "delta", "omega"))
+    store.embedding_client.texts = []
+    store.client.upsert_sizes = []
+
+    store.replace_index_chunks_bulk({
+        "a": _chunks("a", "alpha", "beta edited", "new tail"),
+        "b": _chunks("b", "gamma", "delta"),
+    })
+
+    # total_chunks changed for both documents, so every point is rewritten, but
+    # only the two new embed texts are embedded, in one call across documents.
+    assert store.embedding_client.texts == ["beta edited", "new tail"]
+    assert "chunk vectors reused: 3" in store.events
+    assert store.client.upsert_sizes == [2, 2, 1]
+    assert store.client.deleted == [[store.point_id("b-2")]]
+
+
+def test_embed_texts_splits_large_batches(monkeypatch):
+    monkeypatch.setattr("app.services.ingestion.storage.vector_store.INGESTION_EMBED_BATCH_SIZE", 2)
+    store = _bulk_store()
+    calls = []
+    embed_documents = store.embedding_client.embed_documents
+    store.embedding_client.embed_documents = lambda texts: calls.append(list(texts)) or embed_documents(texts)
+
+    embeddings = store.embed_texts(["a", "b", "c", "d", "e"])
+
+    assert calls == [["a", "b"], ["c", "d"], ["e"]]
+    assert len(embeddings.dense) == len(embeddings.sparse) == 5
+
+
+def test_stale_ingestions_uses_one_query_and_skips_non_uuid_ids():
+    note, user = "11111111-1111-1111-1111-111111111111", "22222222-2222-2222-2222-222222222222"
+    other = "33333333-3333-3333-3333-333333333333"
+    db = MagicMock()
+    db.execute.return_value.mappings.return_value.all.return_value = [
+        {"note_id": note, "user_id": user, "version": 4},
+        {"note_id": other, "user_id": user, "version": 2},
+    ]
+
+    stale = stale_ingestions([
+        {"note_id": note.upper(), "user_id": user, "version": 4},
+        {"note_id": other, "user_id": user, "version": 1},
+        {"note_id": "not-a-uuid", "user_id": user, "version": 1},
+    ], db)
+
+    assert stale == [False, True, True]
+    db.execute.assert_called_once()
+    params = db.execute.call_args.args[1]
+    assert params["note_ids"] == [note, other]
+
+
+def _bulk_payload(note_id, version=1):
+    return {"user_id": "u", "folder_id": "f", "note_id": note_id, "text": f"text {note_id}", "version": version}
+
+
+def _orchestrator():
+    orchestrator = IngestionOrchestrator.__new__(IngestionOrchestrator)
+    orchestrator.chunk_processor = MagicMock(events=[])
+    orchestrator.chunk_processor.process.return_value = ["chunk"]
+    orchestrator.keyword_processor = MagicMock(
+        events=[],
+        api_calls=0,
+        api_call_counts={
+            "keyword_extraction": 0,
+            "keyword_extraction_retries": 0,
+            "keyword_dedup": 0,
+            "entity_dedup": 0,
+        },
+    )
+    orchestrator.keyword_processor.process.return_value = (["chunk"], [], [])
+    summary = MagicMock(events=[], summary="s", questions=[], summary_api_calls=0, question_api_calls=0)
+    orchestrator.summarization_pipeline = MagicMock(summary_ms=1.0, questions_ms=1.0)
+    orchestrator.summarization_pipeline.run.return_value = summary
+    orchestrator._vector_store = MagicMock(events=[])
+    orchestrator.postgres_store = MagicMock()
+    orchestrator.postgres_store.user_timezone.return_value = "UTC"
+    return orchestrator
+
+
+def run_bulk(orchestrator, payloads, stale_checks):
+    with patch("app.services.ingestion.orchestrator.DatabaseManager"), \
+         patch("app.services.ingestion.orchestrator.stale_ingestions", side_effect=stale_checks) as stale, \
+         patch("app.services.ingestion.orchestrator.ChunkBuilder") as chunk_builder, \
+         patch("app.services.ingestion.orchestrator.SummaryBuilder") as summary_builder, \
+         patch("app.services.ingestion.orchestrator.DateExtractor") as date_extractor:
+        chunk_builder.return_value.build.return_value = ["chunk"]
+        summary_builder.side_effect = lambda payload, doc_id, *args: MagicMock(
+            build=MagicMock(return_value=f"artifacts {doc_id}")
+        )
+        date_extractor.return_value = MagicMock(events=[])
+        date_extractor.return_value.extract.return_value = []
+        return orchestrator.run_bulk(payloads), stale
+
+
+def test_run_bulk_batches_checks_and_writes():
+    orchestrator = _orchestrator()
+
+    result, stale = run_bulk(
+        orchestrator,
+        [_bulk_payload("n1"), _bulk_payload("n2"), _bulk_payload("n3"), _bulk_payload("n1", version=2)],
+        [[False, False, True], [False, False]],
+    )
+
+    assert stale.call_count == 2
+    pre_pipeline = stale.call_args_list[0].args[0]
+    assert [(payload["note_id"], payload["version"]) for payload in pre_pipeline] == [
+        ("n1", 2), ("n2", 1), ("n3", 1),
+    ]
+    orchestrator._vector_store.replace_index_chunks_bulk.assert_called_once_with(
+        {"u-n1": ["chunk"], "u-n2": ["chunk"]}
+    )
+    orchestrator._vector_store.upsert_summary_artifacts_bulk.assert_called_once_with(
+        ["artifacts u-n1", "artifacts u-n2"]
+    )
+    [documents] = orchestrator.postgres_store.replace_documents.call_args.args
+    assert [document.doc_id for document in documents] == ["u-n1", "u-n2"]
+    orchestrator._vector_store.replace_index_chunks.assert_not_called()
+    orchestrator.postgres_store.replace_document.assert_not_called()
+
+    assert result["processed"] == 2
+    assert sorted((item["note_id"], item["reason"]) for item in result["skipped"]) == [
+        ("n1", "duplicate_in_batch"), ("n3", "stale_version"),
+    ]
+    assert result["notes_per_second"] > 0
+
+
+def test_run_bulk_drops_notes_that_went_stale_during_the_pipeline():
+    orchestrator = _orchestrator()
+
+    result, _stale = run_bulk(orchestrator, [_bulk_payload("n1"), _bulk_payload("n2")], [[False, False], [True, False]])
+
+    assert result["processed"] == 1
+    assert result["skipped"][0]["stage"] == "pre_write"
+    orchestrator._vector_store.replace_index_chunks_bulk.assert_called_once_with({"u-n2": ["chunk"]})
+
+
+def test_run_bulk_isolates_invalid_payloads():
+    orchestrator = _orchestrator()
+    invalid = {"user_id": "u", "note_id": "n9", "text": "no folder"}
+
+    result, _stale = run_bulk(orchestrator, [_bulk_payload("n1"), invalid], [[False], [False]])
+
+    assert result["processed"] == 1
+    assert result["failed"] == [{"note_id": "n9", "error": "Missing required fields: folder_id"}]
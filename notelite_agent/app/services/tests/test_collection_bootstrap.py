@@ -0,0 +1,107 @@
+"""One-time, versioned collection bootstrap: ingestion does no schema round trips."""
+from types import SimpleNamespace
+
+from app.core.embeddings import EmbeddingBatch
+from app.services.ingestion.processors.ingest import IndexChunk
+from app.services.ingestion.storage.collection_routing import CollectionRouting
+from app.services.ingestion.storage.vector_store import (
+    COLLECTION_SCHEMA_VERSION, COLLECTIONS, PAYLOAD_INDEXES, QdrantVectorStore,
+)
+
+
+class _CountingClient:
+    """Qdrant stand-in that records the schema calls and keeps no points."""
+
+    def __init__(self, metadata=None):
+        self.collection_metadata = {name: dict(metadata or {}) for name in COLLECTIONS}
+        self.schema_calls = []
+
+    def collection_exists(self, collection_name):
+        self.schema_calls.append(("collection_exists", collection_name))
+        return True
+
+    def get_collection(self, collection_name):
+        self.schema_calls.append(("get_collection", collection_name))
+        return SimpleNamespace(config=SimpleNamespace(metadata=self.collection_metadata[collection_name]))
+
+    def update_collection(self, *, collection_name, metadata, hnsw_config=None):
+        self.collection_metadata[collection_name] = metadata
+
+    def create_payload_index(self, **kwargs):
+        self.schema_calls.append(("create_payload_index", kwargs["collection_name"]))
+
+    def scroll(self, **kwargs):
+        return [], None
+
+    def upsert(self, **kwargs):
+        pass
+
+    def delete(self, **kwargs):
+        pass
+
+
+class _FakeEmbeddingClient:
+    def __init__(self):
+        self.remote_service = SimpleNamespace(model="test-embedding-model")
+        self.events = []
+
+    def embed_documents(self, texts):
+        return EmbeddingBatch(
+            dense=[[0.1, 0.2] for _ in texts],
+            sparse=[{"indices": [1], "values": [1.0]} for _ in texts],
+        )
+
+
+def _store(client):
+    store = QdrantVectorStore.__new__(QdrantVectorStore)
+    store.routing = CollectionRouting()
+    store._storage_settings = None
+    store.client = client
+    store.embedding_client = _FakeEmbeddingClient()
+    store._shadow_embedding_client = None
+    store._async_client = None
+    store.events = []
+    return store
+
+
+def _chunks():
+    return [IndexChunk("0", "doc", 0, 1, "content", "Body", "Body")]
+
+
+def test_bootstrap_runs_once_and_ingestion_does_no_schema_round_trips():
+    client = _CountingClient()
+    _store(client).ensure_collections()
+
+    creates = [call for call in client.schema_calls if call[0] == "create_payload_index"]
+    assert len(creates) == len(COLLECTIONS) * len(PAYLOAD_INDEXES)
+    assert all(
+        metadata["schema_version"] == COLLECTION_SCHEMA_VERSION for metadata in client.collection_metadata.values()
+    )
+
+    client.schema_calls = []
+    store = _store(client)
+    store.replace_index_chunks("doc", _chunks())
+    store.delete_document("doc")
+
+    assert client.schema_calls == []
+
+
+def test_collections_at_the_current_schema_version_skip_index_creation():
+    client = _CountingClient(metadata={"schema_version": COLLECTION_SCHEMA_VERSION, "tenant_index": False})
+
+    _store(client).ensure_collections()
+
+    assert {call for call, _name in client.schema_calls} == {"collection_exists", "get_collection"}
+
+
+def test_dropped_collections_are_bootstrapped_again():
+    client = _CountingClient()
+    store = _store(client)
+    store.ensure_collections()
+    client.delete_collection = lambda name: None
+    store.drop_collection_set(SimpleNamespace(collection=lambda logical_name: logical_name))
+
+    client.schema_calls = []
+    store.ensure_collections()
+
+    assert ("collection_exists", COLLECTIONS[0]) in client.schema_calls
@@ -0,0 +1,70 @@
+from unittest.mock import MagicMock
+
+import pytest
+from qdrant_client import models
+
+from app.services.ingestion.storage.collection_routing import CollectionRouting
+from app.services.ingestion.storage.collection_settings import VectorStorageSettings
+from app.services.ingestion.storage.vector_store import (
+    DENSE_VECTOR, QUESTIONS_VECTOR, SPARSE_VECTOR, SUMMARY_COLLECTION, QdrantVectorStore,
+)
+
+
+def _store(settings):
+    store = QdrantVectorStore.__new__(QdrantVectorStore)
+    store.routing = CollectionRouting()
+    store.client = MagicMock()
+    store.embedding_client = MagicMock(use_remote=True, events=[], dimension=MagicMock(return_value=4))
+    store._storage_settings = settings
+    store._shadow_embedding_client = None
+    store._async_client = None
+    store.events = []
+    return store
+
+
+def test_default_settings_keep_the_current_layout():
+    settings = VectorStorageSettings()
+
+    assert settings.quantization_config() is None
+    assert settings.search_params() is None
+    assert settings.dense_vector_params(4).on_disk is False
+
+
+def test_unknown_quantization_is_rejected():
+    with pytest.raises(ValueError):
+        VectorStorageSettings(quantization="int4")
+
+
+def test_create_collection_applies_quantization_on_disk_and_hnsw():
+    settings = VectorStorageSettings(
+        quantization="scalar", vectors_on_disk=True, payload_on_disk=True, hnsw_m=32, hnsw_ef_construct=200,
+    )
+    store = _store(settings)
+
+    store._create_collection("notes_v2_summaries", logical_name=SUMMARY_COLLECTION)
+
+    kwargs = store.client.create_collection.call_args.kwargs
+    assert set(kwargs["vectors_config"]) == {DENSE_VECTOR, QUESTIONS_VECTOR}
+    assert all(params.on_disk for params in kwargs["vectors_config"].values())
+    assert kwargs["sparse_vectors_config"][SPARSE_VECTOR].index.on_disk is True
+    assert kwargs["quantization_config"].scalar.type == models.ScalarType.INT8
+    assert (kwargs["hnsw_config"].m, kwargs["hnsw_config"].ef_construct) == (32, 200)
+    assert kwargs["on_disk_payload"] is True
+
+
+def test_dense_searches_rescore_quantized_candidates_but_sparse_do_not():
+    settings = VectorStorageSettings(quantization="binary", oversampling=3.0, hnsw_ef=128)
+    store = _store(settings)
+    store.collection = lambda logical_name: logical_name
+    store.client.query_batch_points.return_value = [MagicMock(points=[]), MagicMock(points=[])]
+
+    store.search_chunks(
+        {"dense": (DENSE_VECTOR, [0.1, 0.2]), "sparse": (SPARSE_VECTOR, {"indices": [1], "values": [1.0]})},
+        limit=5,
+    )
+
+    dense_request, sparse_request = store.client.query_batch_points.call_args.kwargs["requests"]
+    assert dense_request.params.hnsw_ef == 128
+    assert dense_request.params.quantization.rescore is True
+    assert dense_request.params.quantization.oversampling == 3.0
+    assert sparse_request.params is None
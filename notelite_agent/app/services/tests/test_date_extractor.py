@@ -0,0 +1,92 @@
+"""Date extraction: batched annotation, absolute-date fast path, cached dateparser lookups."""
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from zoneinfo import ZoneInfo
+
+import dateparser
+import pytest
+
+from app.services.ingestion.processors import date_extractor, nlp_models
+from app.services.ingestion.processors.date_extractor import DateExtractor
+from app.services.ingestion.processors.ingest import IndexChunk
+
+
+class _DateNlp:
+    """Labels every phrase listed in ``spans`` as DATE wherever it appears."""
+
+    max_length = 10_000
+
+    def __init__(self, *spans):
+        self.spans = spans
+        self.pipe_options = []
+
+    def pipe(self, texts, **options):
+        self.pipe_options.append(options)
+        for text in texts:
+            yield SimpleNamespace(ents=[
+                SimpleNamespace(text=span, label_="DATE") for span in self.spans if span in text
+            ])
+
+
+def _chunks(*contents):
+    return [IndexChunk(str(index), "doc", index, len(contents), "content", content, content)
+            for index, content in enumerate(contents)]
+
+
+@pytest.fixture
+def parses(monkeypatch):
+    calls = []
+    original = dateparser.parse
+    monkeypatch.setattr(date_extractor.dateparser, "parse", lambda text, settings: calls.append(text) or original(text, settings=settings))
+    date_extractor._parse_date.cache_clear()
+    yield calls
+    date_extractor._parse_date.cache_clear()
+
+
+def _extractor(monkeypatch, nlp):
+    monkeypatch.setattr(nlp_models, "_pipelines", {"ner": nlp})
+    return DateExtractor()
+
+
+@pytest.mark.parametrize("text", [
+    "2024-03-03", "2024/3/3", "2024-03-03T10:30:15", "March 3, 2024", "March 3rd, 2024",
+    "Mar. 3 2024", "3 March 2024", "3rd of March 2024", "Sept 3, 2024",
+])
+def test_fast_path_matches_dateparser(text):
+    timezone_info = ZoneInfo("America/New_York")
+    expected = dateparser.parse(text, settings={
+        "TIMEZONE": "America/New_York", "RETURN_AS_TIMEZONE_AWARE": True,
+    }).astimezone(timezone.utc)
+
+    assert date_extractor._parse_absolute_date(text, timezone_info) == expected
+
+
+def test_absolute_dates_skip_dateparser_and_phrases_are_parsed_once(monkeypatch, parses):
+    extractor = _extractor(monkeypatch, _DateNlp("March 3, 2024", "Feb 30, 2024", "last week"))
+    created_at = datetime(2024, 3, 10, 20, 45, tzinfo=timezone.utc)
+
+    dates = extractor.extract(_chunks(
+        "Restored on March 3, 2024, see last week.", "Feb 30, 2024 never happened, unlike last week.",
+    ), created_at, "America/New_York")
+    extractor.extract(_chunks("Again last week."), created_at, "America/New_York")
+
+    assert parses == ["last week"]
+    assert [(date["chunk_id"], date["date_text"]) for date in dates] == [
+        ("0", "March 3, 2024"), ("0", "last week"), ("1", "last week"),
+    ]
+    # Relative phrases resolve against the start of the creation day in the user's timezone.
+    assert dates[1]["date_value"] == datetime(2024, 3, 3, 5, tzinfo=timezone.utc)
+    assert "date parsing: fast_path=2 dateparser=2" in extractor.events
+
+
+def test_large_documents_fan_out_to_worker_processes(monkeypatch):
+    nlp = _DateNlp()
+    extractor = _extractor(monkeypatch, nlp)
+    monkeypatch.setattr(date_extractor, "DATE_EXTRACTION_PROCESSES", 4)
+    monkeypatch.setattr(date_extractor, "DATE_EXTRACTION_PARALLEL_MIN_CHUNKS", 3)
+
+    extractor.extract(_chunks("a", "b"), datetime.now(timezone.utc), "UTC")
+    extractor.extract(_chunks("c", "d", "e"), datetime.now(timezone.utc), "UTC")
+
+    assert [options.get("n_process") for options in nlp.pipe_options] == [None, 4]
+    assert all(options["batch_size"] == date_extractor.DATE_EXTRACTION_BATCH_SIZE for options in nlp.pipe_options)
@@ -0,0 +1,73 @@
+import numpy as np
+
+from app.core.embeddings import EmbeddingBatch, EmbeddingCache, SharedEmbeddingClient
+
+
+class _FakeRemoteService:
+    model = "test-embedding-model"
+    enabled = True
+
+    def __init__(self):
+        self.hybrid_calls = []
+        self.dense_calls = []
+
+    def embed_hybrid(self, texts):
+        self.hybrid_calls.append(list(texts))
+        return EmbeddingBatch(
+            dense=[[float(len(text)), 0.5] for text in texts],
+            sparse=[{"indices": [len(text)], "values": [1.0]} for text in texts],
+        )
+
+    def embed_dense(self, texts):
+        self.dense_calls.append(list(texts))
+        return [[float(len(text)), 0.25] for text in texts]
+
+
+def _client(monkeypatch, cache):
+    monkeypatch.setattr("app.core.embeddings.client.is_enabled", lambda flag: True)
+    return SharedEmbeddingClient(_FakeRemoteService(), cache=cache)
+
+
+def test_shared_client_fetches_only_misses_in_one_batch(monkeypatch):
+    client = _client(monkeypatch, EmbeddingCache(max_entries=10))
+    client.embed_documents(["alpha", "beta"])
+    client.events = []
+
+    batch = client.embed_documents(["beta", "gamma", "gamma", "alpha"])
+
+    assert client.remote_service.hybrid_calls == [["alpha", "beta"], ["gamma"]]
+    assert batch.dense == [[4.0, 0.5], [5.0, 0.5], [5.0, 0.5], [5.0, 0.5]]
+    assert batch.sparse[0] == {"indices": [4], "values": [1.0]}
+    assert client.events[0] == "embedding cache documents: hits=2 misses=1"
+
+
+def test_dense_and_hybrid_entries_are_cached_separately(monkeypatch):
+    client = _client(monkeypatch, EmbeddingCache(max_entries=10))
+    client.embed_queries(["query"])
+
+    assert client.embed_dense_queries(["query"]) == [[5.0, 0.25]]
+    assert client.remote_service.dense_calls == [["query"]]
+
+
+def test_lru_tier_is_bounded(monkeypatch):
+    cache = EmbeddingCache(max_entries=2)
+    client = _client(monkeypatch, cache)
+    client.embed_dense_documents(["a", "b", "c"])
+
+    assert len(cache) == 2
+    client.embed_dense_documents(["a"])
+    assert client.remote_service.dense_calls[-1] == ["a"]
+
+
+def test_disk_tier_survives_a_new_process_cache(monkeypatch, tmp_path):
+    client = _client(monkeypatch, EmbeddingCache(max_entries=10, directory=tmp_path, dtype="float16"))
+    client.embed_documents(["persisted"])
+
+    fresh = _client(monkeypatch, EmbeddingCache(max_entries=10, directory=tmp_path, dtype="float16"))
+    batch = fresh.embed_documents(["persisted"])
+
+    assert fresh.remote_service.hybrid_calls == []
+    assert batch.dense == [[9.0, 0.5]]
+    assert batch.sparse == [{"indices": [9], "values": [1.0]}]
+    blob = np.load(next(tmp_path.rglob("*.npz")))
+    assert blob["dense"].dtype == np.float16
@@ -0,0 +1,130 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.core.embeddings import EmbeddingBatch, EmbeddingCache, EmbeddingDispatcher, SharedEmbeddingClient
+
+
+class _FakeRemoteService:
+    timeout = 1.0
+    enabled = True
+    model = "fake-model"
+
+    def __init__(self, delay=0.0, error: Exception | None = None):
+        self.calls = []
+        self.delay = delay
+        self.error = error
+        self.lock = threading.Lock()
+
+    def embed_hybrid(self, texts):
+        with self.lock:
+            self.calls.append(list(texts))
+        time.sleep(self.delay(texts) if callable(self.delay) else self.delay)
+        if self.error:
+            raise self.error
+        return EmbeddingBatch(
+            dense=[[float(len(text))] for text in texts],
+            sparse=[{"indices": [len(text)], "values": [1.0]} for text in texts],
+        )
+
+
+def test_concurrent_requests_are_coalesced_and_fanned_back():
+    service = _FakeRemoteService()
+    dispatcher = EmbeddingDispatcher(service, window_ms=50, max_texts=64)
+    texts = [["a"], ["bb", "ccc"], ["dddd"], ["eeeee"]]
+
+    with ThreadPoolExecutor(len(texts)) as pool:
+        results = list(pool.map(dispatcher.embed_hybrid, texts))
+
+    assert len(service.calls) == 1
+    assert sorted(service.calls[0]) == ["a", "bb", "ccc", "dddd", "eeeee"]
+    assert [result.dense for result in results] == [[[1.0]], [[2.0], [3.0]], [[4.0]], [[5.0]]]
+    assert results[1].sparse == [{"indices": [2], "values": [1.0]}, {"indices": [3], "values": [1.0]}]
+
+
+def test_batches_respect_max_texts():
+    service = _FakeRemoteService()
+    dispatcher = EmbeddingDispatcher(service, window_ms=50, max_texts=3)
+
+    with ThreadPoolExecutor(5) as pool:
+        list(pool.map(dispatcher.embed_hybrid, [["x"]] * 5))
+
+    assert all(len(call) <= 3 for call in service.calls)
+    assert sum(len(call) for call in service.calls) == 5
+
+
+def test_large_requests_bypass_the_queue():
+    service = _FakeRemoteService()
+    dispatcher = EmbeddingDispatcher(service, window_ms=1000, max_texts=2)
+
+    started = time.monotonic()
+    result = dispatcher.embed_hybrid(["a", "b", "c"])
+
+    assert time.monotonic() - started < 0.5
+    assert service.calls == [["a", "b", "c"]]
+    assert len(result.dense) == 3
+
+
+def test_errors_propagate_to_every_waiting_caller():
+    dispatcher = EmbeddingDispatcher(_FakeRemoteService(error=RuntimeError("boom")), window_ms=20)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        dispatcher.embed_hybrid(["a"])
+
+
+def test_request_timeout_raises():
+    dispatcher = EmbeddingDispatcher(_FakeRemoteService(delay=0.3), window_ms=1)
+
+    with pytest.raises(TimeoutError):
+        dispatcher.embed_hybrid(["a"], timeout=0.05)
+
+
+def test_a_slow_batch_does_not_hold_back_the_next_window():
+    release = threading.Event()
+
+    def delay(texts):
+        if texts == ["slow"]:
+            release.wait(5)
+        return 0.0
+
+    service = _FakeRemoteService(delay=delay)
+    dispatcher = EmbeddingDispatcher(service, window_ms=1, max_texts=64, max_in_flight=2)
+
+    with ThreadPoolExecutor(1) as pool:
+        slow = pool.submit(dispatcher.embed_hybrid, ["slow"])
+        while not service.calls:
+            time.sleep(0.001)
+        fast = dispatcher.embed_hybrid(["fast"], timeout=1.0)
+        release.set()
+
+        assert fast.dense == [[4.0]]
+        assert slow.result(timeout=1.0).dense == [[4.0]]
+    assert service.calls == [["slow"], ["fast"]]
+
+
+def test_async_queries_join_the_same_batches_as_sync_ones(monkeypatch):
+    monkeypatch.setattr("app.core.embeddings.client.is_enabled", lambda flag: True)
+    service = _FakeRemoteService()
+    dispatcher = EmbeddingDispatcher(service, window_ms=100, max_texts=64)
+    client = SharedEmbeddingClient(service, cache=EmbeddingCache(max_entries=10), dispatcher=dispatcher)
+
+    async def queries():
+        return await asyncio.gather(client.aembed_queries(["a"]), client.aembed_queries(["bb"]))
+
+    with ThreadPoolExecutor(1) as pool:
+        sync = pool.submit(dispatcher.embed_hybrid, ["ccc"])
+        first, second = asyncio.run(queries())
+
+    assert len(service.calls) == 1
+    assert sorted(service.calls[0]) == ["a", "bb", "ccc"]
+    assert (first.dense, second.dense, sync.result().dense) == ([[1.0]], [[2.0]], [[3.0]])
+
+
+def test_async_request_timeout_raises():
+    dispatcher = EmbeddingDispatcher(_FakeRemoteService(delay=0.3), window_ms=1)
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(dispatcher.aembed_hybrid(["a"], timeout=0.05))
@@ -0,0 +1,347 @@
+"""Blue/green re-embedding: shadow collections, double writes, copy, cutover."""
+from types import SimpleNamespace
+
+import pytest
+from qdrant_client import models
+from redis.exceptions import RedisError
+
+from app.core.embeddings import EmbeddingBatch
+from app.services.ingestion.processors.ingest import IndexChunk
+from app.services.ingestion.storage import collection_routing, embedding_migration
+from app.services.ingestion.storage.collection_routing import EmbeddingTarget
+from app.services.ingestion.storage.vector_store import (
+    CHUNK_COLLECTION, COLLECTIONS, DENSE_VECTOR, QdrantVectorStore,
+)
+from app.services.ingestion.workers import reembedding
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.hashes = {}
+
+    def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    def hset(self, key, mapping):
+        self.hashes.setdefault(key, {}).update(mapping)
+
+
+class _FakeQdrant:
+    """In-memory collections, aliases, and the point calls the migration uses."""
+
+    def __init__(self):
+        self.collections = {}
+        self.metadata = {}
+        self.aliases = {}
+
+    def collection_exists(self, name):
+        return name in self.collections
+
+    def create_collection(self, collection_name, **kwargs):
+        self.collections[collection_name] = {}
+        self.metadata[collection_name] = kwargs.get("metadata") or {}
+
+    def get_collection(self, name):
+        return SimpleNamespace(config=SimpleNamespace(metadata=self.metadata[name]))
+
+    def delete_collection(self, name):
+        self.collections.pop(name)
+
+    def create_payload_index(self, **kwargs):
+        pass
+
+    def get_collections(self):
+        return SimpleNamespace(collections=[SimpleNamespace(name=name) for name in self.collections])
+
+    def get_aliases(self):
+        return SimpleNamespace(aliases=[SimpleNamespace(alias_name=alias) for alias in self.aliases])
+
+    def update_collection_aliases(self, change_aliases_operations):
+        for operation in change_aliases_operations:
+            if getattr(operation, "delete_alias", None):
+                self.aliases.pop(operation.delete_alias.alias_name)
+            else:
+                self.aliases[operation.create_alias.alias_name] = operation.create_alias.collection_name
+
+    def count(self, collection_name, exact):
+        return SimpleNamespace(count=len(self.collections[collection_name]))
+
+    def upsert(self, *, collection_name, points, update_mode=None):
+        existing = self.collections[collection_name]
+        if update_mode == models.UpdateMode.INSERT_ONLY:
+            points = [point for point in points if str(point.id) not in existing]
+        existing.update({str(point.id): point for point in points})
+
+    def delete(self, *, collection_name, points_selector):
+        points = self.collections[collection_name]
+        if hasattr(points_selector, "points"):
+            for point_id in points_selector.points:
+                points.pop(str(point_id), None)
+            return
+        doc_id = points_selector.filter.must[0].match.value
+        for point_id in [key for key, point in points.items() if point.payload["metadata"]["doc_id"] == doc_id]:
+            del points[point_id]
+
+    def scroll(self, *, collection_name, limit, offset=None, with_payload=True, with_vectors=False, scroll_filter=None):
+        ids = sorted(self.collections[collection_name])
+        start = ids.index(offset) if offset is not None else 0
+        page = [self.collections[collection_name][point_id] for point_id in ids[start:start + limit]]
+        if scroll_filter is not None:
+            doc_id = scroll_filter.must[0].match.value
+            page = [point for point in page if point.payload["metadata"]["doc_id"] == doc_id]
+        next_offset = ids[start + limit] if start + limit < len(ids) else None
+        return [SimpleNamespace(id=point.id, payload=point.payload) for point in page], next_offset
+
+    def retrieve(self, *, collection_name, ids, **kwargs):
+        points = self.collections[collection_name]
+        return [points[str(point_id)] for point_id in ids if str(point_id) in points]
+
+
+class _FakeEmbeddingClient:
+    def __init__(self, model, dimension):
+        self.remote_service = SimpleNamespace(model=model)
+        self.model = model
+        self.size = dimension
+        self.use_remote = True
+        self.events = []
+        self.texts = []
+
+    def dimension(self):
+        return self.size
+
+    def embed_documents(self, texts):
+        self.texts.extend(texts)
+        return EmbeddingBatch(
+            dense=[[float(len(text))] * self.size for text in texts],
+            sparse=[{"indices": [1], "values": [1.0]} for _ in texts],
+        )
+
+
+OLD = EmbeddingTarget(version=None, model="old-model", base_url="http://old")
+
+
+@pytest.fixture
+def env(monkeypatch):
+    redis = _FakeRedis()
+    qdrant = _FakeQdrant()
+    clients = {"old-model": _FakeEmbeddingClient("old-model", 2), "new-model": _FakeEmbeddingClient("new-model", 3)}
+    redis.hashes[collection_routing.EMBEDDING_ROUTING_KEY] = {
+        "active_version": "", "active_model": OLD.model, "active_base_url": OLD.base_url,
+    }
+    monkeypatch.setattr(collection_routing, "redis_client", lambda: redis)
+    monkeypatch.setattr(QdrantVectorStore, "embedding_client_for", staticmethod(lambda target: clients[target.model]))
+    monkeypatch.setattr(embedding_migration, "EMBEDDING_MIGRATION_BATCH_SIZE", 2)
+    collection_routing.invalidate_routing()
+
+    def store():
+        vector_store = QdrantVectorStore.__new__(QdrantVectorStore)
+        vector_store.client = qdrant
+        vector_store.routing = collection_routing.routing_from_state(collection_routing.load_state())
+        vector_store._storage_settings = None
+        vector_store.embedding_client = clients[vector_store.routing.active.model]
+        vector_store._shadow_embedding_client = None
+        vector_store._async_client = None
+        vector_store.events = []
+        return vector_store
+
+    return SimpleNamespace(redis=redis, qdrant=qdrant, clients=clients, store=store)
+
+
+def _chunks(doc_id, *texts):
+    return [IndexChunk(str(index), doc_id, index, len(texts), "content", text, text) for index, text in enumerate(texts)]
+
+
+def test_full_migration_double_writes_copies_and_cuts_over(env, monkeypatch):
+    live = env.store()
+    live.ensure_collections()
+    live.replace_index_chunks("doc-a", _chunks("doc-a", "alpha", "beta", "gamma"))
+
+    progress = embedding_migration.start_migration("new-model", store=env.store())
+    assert (progress.status, progress.target_version, progress.total) == ("running", 2, 3)
+    shadow_chunks = f"{CHUNK_COLLECTION}_v2"
+    assert all(f"{name}_v2" in env.qdrant.collections for name in COLLECTIONS)
+
+    # A note ingested mid-migration lands in both sets, each with its own model.
+    writer = env.store()
+    assert writer.shadow_target.version == 2
+    writer.replace_index_chunks("doc-b", _chunks("doc-b", "delta"))
+    point_id = writer.chunk_point_id("doc-b", "0")
+    assert len(env.qdrant.collections[CHUNK_COLLECTION][point_id].vector[DENSE_VECTOR]) == 2
+    shadow_point = env.qdrant.collections[shadow_chunks][point_id]
+    assert len(shadow_point.vector[DENSE_VECTOR]) == 3
+    assert shadow_point.payload["metadata"]["embedding_model"] == "new-model"
+
+    env.clients["new-model"].texts = []
+    pages = 0
+    while not embedding_migration.reembed_next_page(store=env.store()):
+        pages += 1
+    assert pages >= 2
+    # Only the points the double write did not already cover were re-embedded.
+    assert sorted(env.clients["new-model"].texts) == ["alpha", "beta", "gamma"]
+    assert set(env.qdrant.collections[shadow_chunks]) == set(env.qdrant.collections[CHUNK_COLLECTION])
+
+    progress = embedding_migration.migration_progress()
+    assert (progress.status, progress.migrated, progress.percent, progress.eta_seconds) == ("ready", 4, 100.0, 0.0)
+
+    progress = embedding_migration.cutover(store=env.store())
+    assert (progress.status, progress.active_version, progress.active_model) == ("completed", 2, "new-model")
+    reader = env.store()
+    assert reader.shadow_target is None
+    assert reader.collection(CHUNK_COLLECTION) == shadow_chunks
+    assert env.qdrant.aliases == {}  # the unversioned collections still own the names
+
+    monkeypatch.setattr(embedding_migration, "EMBEDDING_ROUTING_REFRESH_SECONDS", 0)
+    embedding_migration.finalize_migration(store=env.store())
+    assert CHUNK_COLLECTION not in env.qdrant.collections
+    assert env.qdrant.aliases == {name: f"{name}_v2" for name in COLLECTIONS}
+
+
+def test_copied_chunk_payloads_keep_diff_aware_reingestion_working(env):
+    live = env.store()
+    live.ensure_collections()
+    live.replace_index_chunks("doc-a", _chunks("doc-a", "alpha", "beta"))
+    embedding_migration.start_migration("new-model", store=env.store())
+    while not embedding_migration.reembed_next_page(store=env.store()):
+        pass
+    embedding_migration.cutover(store=env.store())
+
+    env.clients["new-model"].texts = []
+    after = env.store()
+    after.replace_index_chunks("doc-a", _chunks("doc-a", "alpha", "beta"))
+
+    assert env.clients["new-model"].texts == []
+    assert "chunk vectors unchanged: 2" in after.events
+
+
+def test_copy_never_overwrites_a_double_write_that_lands_after_the_presence_check(env, monkeypatch):
+    live = env.store()
+    live.ensure_collections()
+    live.replace_index_chunks("doc-a", _chunks("doc-a", "alpha"))
+    embedding_migration.start_migration("new-model", store=env.store())
+    point_id = live.chunk_point_id("doc-a", "0")
+    shadow_chunks = f"{CHUNK_COLLECTION}_v2"
+    retrieve = env.qdrant.retrieve
+
+    def retrieve_then_double_write(**kwargs):
+        found = retrieve(**kwargs)
+        if kwargs["collection_name"] == shadow_chunks:
+            env.store().replace_index_chunks("doc-a", _chunks("doc-a", "alpha edited"))
+        return found
+
+    monkeypatch.setattr(env.qdrant, "retrieve", retrieve_then_double_write)
+    embedding_migration.reembed_next_page(store=env.store())
+
+    assert env.qdrant.collections[shadow_chunks][point_id].payload["content"] == "alpha edited"
+
+
+def test_copy_does_not_bring_back_a_point_deleted_after_the_scroll(env, monkeypatch):
+    live = env.store()
+    live.ensure_collections()
+    live.replace_index_chunks("doc-a", _chunks("doc-a", "alpha"))
+    embedding_migration.start_migration("new-model", store=env.store())
+    retarget_points = QdrantVectorStore.retarget_points
+
+    def retarget_then_delete(self, records, *args, **kwargs):
+        points = retarget_points(self, records, *args, **kwargs)
+        if records:
+            env.store().delete_document("doc-a")
+        return points
+
+    monkeypatch.setattr(QdrantVectorStore, "retarget_points", retarget_then_delete)
+    embedding_migration.reembed_next_page(store=env.store())
+
+    assert env.qdrant.collections[CHUNK_COLLECTION] == {}
+    assert env.qdrant.collections[f"{CHUNK_COLLECTION}_v2"] == {}
+
+
+def test_copy_task_does_one_page_and_queues_the_next(env, monkeypatch):
+    env.store().ensure_collections()
+    env.store().replace_index_chunks("doc-a", _chunks("doc-a", "alpha", "beta", "gamma"))
+    embedding_migration.start_migration("new-model", store=env.store())
+    queued = []
+    monkeypatch.setattr(reembedding, "reembed_next_page", lambda: embedding_migration.reembed_next_page(store=env.store()))
+    monkeypatch.setattr(reembedding.reembed_collections, "apply_async", lambda **options: queued.append(options))
+    monkeypatch.setattr(reembedding, "EMBEDDING_ROUTING_REFRESH_SECONDS", 60)
+
+    # Too early: every process may not double-write yet, so wait without copying.
+    reembedding.reembed_collections(trace_id="t-1")
+    assert env.clients["new-model"].texts == []
+    assert 0 < queued[-1]["countdown"] <= 60
+    chain = queued[-1]["kwargs"]["chain"]
+
+    monkeypatch.setattr(reembedding, "EMBEDDING_ROUTING_REFRESH_SECONDS", 0)
+    while len(queued) < 10 and embedding_migration.migration_progress().status == "running":
+        reembedding.reembed_collections(**queued[-1]["kwargs"])
+    assert embedding_migration.migration_progress().status == "ready"
+    assert all(options["kwargs"] == {"trace_id": "t-1", "chain": chain, "pages": index} for index, options in enumerate(queued))
+    assert [options["countdown"] for options in queued[1:]] == [reembedding.EMBEDDING_MIGRATION_THROTTLE_SECONDS] * (len(queued) - 1)
+
+
+def test_resumed_copy_supersedes_the_running_chain(env, monkeypatch):
+    env.store().ensure_collections()
+    embedding_migration.start_migration("new-model", store=env.store())
+    pages = []
+    monkeypatch.setattr(reembedding, "reembed_next_page", lambda: pages.append(1) or False)
+    monkeypatch.setattr(reembedding.reembed_collections, "apply_async", lambda **options: None)
+    monkeypatch.setattr(reembedding, "EMBEDDING_ROUTING_REFRESH_SECONDS", 0)
+
+    reembedding.reembed_collections()
+    stale = collection_routing.load_state()["copy_chain"]
+    reembedding.reembed_collections()  # POST /migration/resume
+    reembedding.reembed_collections(chain=stale, pages=1)
+
+    assert len(pages) == 2
+
+
+def test_steps_out_of_order_are_rejected(env):
+    with pytest.raises(embedding_migration.MigrationError):
+        embedding_migration.cutover(store=env.store())
+    env.store().ensure_collections()
+    embedding_migration.start_migration("new-model", store=env.store())
+    with pytest.raises(embedding_migration.MigrationError):
+        embedding_migration.start_migration("new-model", store=env.store())
+    with pytest.raises(embedding_migration.MigrationError):
+        embedding_migration.cutover(store=env.store())
+
+    progress = embedding_migration.abort_migration()
+    assert progress.status == "aborted"
+    assert env.store().shadow_target is None
+    with pytest.raises(embedding_migration.MigrationError):
+        embedding_migration.start_migration("new-model", store=env.store())
+
+
+def test_progress_reports_rate_and_eta():
+    progress = embedding_migration.MigrationProgress.from_state({
+        "status": "running", "active_model": "old-model", "target_version": "2", "target_model": "new-model",
+        "total": "1000", "migrated": "250", "started_at": "100", "updated_at": "150",
+    })
+
+    assert (progress.percent, progress.points_per_second, progress.eta_seconds) == (25.0, 5.0, 150.0)
+
+
+def test_routing_keeps_last_known_value_when_redis_fails(monkeypatch):
+    state = {"active_version": "2", "active_model": "new-model", "active_base_url": "http://new", "status": "completed"}
+    monkeypatch.setattr(collection_routing, "load_state", lambda: state)
+    monkeypatch.setattr(collection_routing, "EMBEDDING_ROUTING_REFRESH_SECONDS", 0)
+    collection_routing.invalidate_routing()
+    assert collection_routing.collection_routing().active.version == 2
+
+    def fail():
+        raise RedisError("down")
+
+    monkeypatch.setattr(collection_routing, "load_state", fail)
+    assert collection_routing.collection_routing().active.collection("notes") == "notes_v2"
+    collection_routing.invalidate_routing()
+
+
+def test_routing_is_not_guessed_before_the_first_read(monkeypatch):
+    def fail():
+        raise RedisError("down")
+
+    monkeypatch.setattr(collection_routing, "_cached", None)
+    monkeypatch.setattr(collection_routing, "load_state", fail)
+
+    with pytest.raises(collection_routing.RoutingUnavailable):
+        collection_routing.collection_routing()
+    # A ConnectionError, so the ingestion tasks' autoretry_for retries it.
+    assert issubclass(collection_routing.RoutingUnavailable, ConnectionError)
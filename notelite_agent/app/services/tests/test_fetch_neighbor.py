@@ -1,5 +1,6 @@
 from types import SimpleNamespace
 
+from app.services.ingestion.storage.collection_routing import CollectionRouting
 from app.services.ingestion.storage.vector_store import QdrantVectorStore
 
 
@@ -15,7 +16,10 @@ class FakeClient:
 
 def store_with_points(points):
     store = QdrantVectorStore.__new__(QdrantVectorStore)
+    store.routing = CollectionRouting()
     store.client = FakeClient(points)
+    store._shadow_embedding_client = None
+    store._async_client = None
     return store
 
 
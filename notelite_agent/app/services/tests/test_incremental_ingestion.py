@@ -0,0 +1,177 @@
+from types import SimpleNamespace
+
+from app.core.embeddings import EmbeddingBatch
+from app.services.ingestion.processors.chunking import TextChunk
+from app.services.ingestion.processors.ingest import IndexChunk
+from app.services.ingestion.processors.keywords.entity_extractor import EntityMention
+from app.services.ingestion.processors.keywords.keyword_batcher import KeywordBatchResult
+from app.services.ingestion.processors.keywords.keyword_processor import KeywordProcessor
+from app.services.ingestion.storage.collection_routing import CollectionRouting
+from app.services.ingestion.storage.vector_store import (
+    CHUNK_COLLECTION, DENSE_VECTOR, SPARSE_VECTOR, QdrantVectorStore,
+)
+
+
+class _FakeClient:
+    """In-memory stand-in for the Qdrant calls used by replace_index_chunks."""
+
+    def __init__(self):
+        self.points = {}
+        self.upserted = []
+        self.deleted = []
+        self.metadata = {}
+
+    def collection_exists(self, collection_name):
+        return True
+
+    def get_collection(self, collection_name):
+        return SimpleNamespace(config=SimpleNamespace(metadata=self.metadata))
+
+    def update_collection(self, *, collection_name, metadata, hnsw_config=None):
+        self.metadata = metadata
+
+    def create_payload_index(self, **kwargs):
+        pass
+
+    def scroll(self, *, collection_name, scroll_filter, limit, offset, with_payload, with_vectors):
+        doc_id = scroll_filter.must[0].match.value
+        records = [
+            SimpleNamespace(id=point_id, payload={key: point.payload[key] for key in with_payload})
+            for point_id, point in self.points.items()
+            if point.payload["doc_id"] == doc_id
+        ]
+        return records, None
+
+    def retrieve(self, *, collection_name, ids, with_payload, with_vectors):
+        return [
+            SimpleNamespace(
+                id=point_id,
+                payload={"embed_hash": self.points[point_id].payload["embed_hash"]},
+                vector=self.points[point_id].vector,
+            )
+            for point_id in ids
+        ]
+
+    def upsert(self, *, collection_name, points):
+        if collection_name == CHUNK_COLLECTION:
+            self.upserted.append([point.id for point in points])
+            self.points.update({point.id: point for point in points})
+
+    def delete(self, *, collection_name, points_selector):
+        if collection_name == CHUNK_COLLECTION and hasattr(points_selector, "points"):
+            self.deleted.append(list(points_selector.points))
+            for point_id in points_selector.points:
+                self.points.pop(point_id, None)
+
+
+class _FakeEmbeddingClient:
+    def __init__(self):
+        self.remote_service = SimpleNamespace(model="test-embedding-model")
+        self.events = []
+        self.texts = []
+
+    def embed_documents(self, texts):
+        self.texts.extend(texts)
+        return EmbeddingBatch(
+            dense=[[0.1, 0.2] for _ in texts],
+            sparse=[{"indices": [1], "values": [1.0]} for _ in texts],
+        )
+
+
+def _store():
+    store = QdrantVectorStore.__new__(QdrantVectorStore)
+    store.routing = CollectionRouting()
+    store._storage_settings = None
+    store.client = _FakeClient()
+    store.embedding_client = _FakeEmbeddingClient()
+    store._shadow_embedding_client = None
+    store._async_client = None
+    store.events = []
+    return store
+
+
+def _chunks(*texts):
+    return [
+        IndexChunk(
+            str(index), "doc", index, len(texts), "content", text, text,
+            prev_chunk_id=str(index - 1) if index else None,
+            next_chunk_id=str(index + 1) if index + 1 < len(texts) else None,
+        )
+        for index, text in enumerate(texts)
+    ]
+
+
+def test_replace_index_chunks_upserts_only_changed_points():
+    store = _store()
+    store.replace_index_chunks("doc", _chunks("alpha", "beta", "gamma"))
+    store.embedding_client.texts = []
+
+    store.replace_index_chunks("doc", _chunks("alpha", "beta edited", "gamma"))
+
+    assert store.embedding_client.texts == ["beta edited"]
+    assert store.client.upserted[-1] == [store.point_id("doc-1")]
+    assert store.client.deleted == []
+    assert "chunk vectors unchanged: 2" in store.events
+
+
+def test_replace_index_chunks_reuses_vectors_and_deletes_only_removed_ids():
+    store = _store()
+    store.replace_index_chunks("doc", _chunks("alpha", "beta", "gamma"))
+    store.embedding_client.texts = []
+
+    # Dropping the first chunk shifts every id and adjacency link, but the
+    # embed texts are unchanged, so no embedding call is needed.
+    store.replace_index_chunks("doc", _chunks("beta", "gamma"))
+
+    assert store.embedding_client.texts == []
+    assert "chunk vectors reused: 2" in store.events
+    assert store.client.deleted == [[store.point_id("doc-2")]]
+    assert sorted(point.payload["content"] for point in store.client.points.values()) == ["beta", "gamma"]
+    point = store.client.points[store.point_id("doc-0")]
+    assert point.vector[DENSE_VECTOR] == [0.1, 0.2]
+    assert point.vector[SPARSE_VECTOR].indices == [1]
+
+
+def test_keyword_processor_reuses_cached_terms_by_fingerprint(monkeypatch):
+    extracted = []
+    monkeypatch.setattr(
+        "app.services.ingestion.processors.keywords.keyword_processor.extract_keywords_batched",
+        lambda items, **kwargs: (
+            extracted.extend(item.chunk_id for item in items)
+            or KeywordBatchResult(
+                keywords_by_chunk={item.chunk_id: ["collection recovery"] for item in items},
+                api_calls=1 if items else 0,
+                retries=0,
+                events=[],
+            )
+        ),
+    )
+    entity_texts = []
+    monkeypatch.setattr(
+        "app.services.ingestion.processors.keywords.keyword_processor.extract_entity_mentions_batch",
+        lambda texts: entity_texts.extend(texts) or [[EntityMention("Qdrant", "PRODUCT")] for _text in texts],
+    )
+    monkeypatch.setattr(
+        "app.services.ingestion.processors.keywords.keyword_processor.llm_call_general",
+        lambda messages, **kwargs: "",
+    )
+    chunks = [
+        TextChunk(content="Qdrant collection recovery completed after the restart.", chunk_id="0"),
+        TextChunk(content="Qdrant snapshots were restored from the nightly backup.", chunk_id="1"),
+    ]
+
+    processor = KeywordProcessor(use_llm_dedup=False)
+    processor.process(chunks)
+    cached = dict(processor.chunk_terms)
+    extracted.clear()
+    entity_texts.clear()
+
+    edited = [chunks[0], TextChunk(content="Qdrant snapshots were restored from the weekly backup.", chunk_id="1")]
+    results, _top_keywords, _top_entities = processor.process(edited, cached_terms=cached)
+
+    assert extracted == ["1"]
+    assert len(entity_texts) == 1
+    assert results[0].keywords == cached[next(iter(cached))].keywords
+    assert results[0].entities == ["Qdrant"]
+    assert "keyword cache reused: 1 chunks" in processor.events
+    assert len(processor.chunk_terms) == 2
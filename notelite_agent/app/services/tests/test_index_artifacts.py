@@ -7,6 +7,7 @@ from app.services.ingestion.processors.ingest import (
 from app.services.ingestion.processors.keywords.keyword_processor import ChunkKeywordResult
 from app.services.ingestion.processors.summary.summarization_pipeline import SummarizationPipeline
 from app.services.ingestion.processors.summary.summary_processor import SummaryResult
+from app.services.ingestion.storage.collection_routing import CollectionRouting
 from app.services.ingestion.storage.vector_store import (
     CHUNK_COLLECTION, QUESTIONS_COLLECTION, SUMMARY_COLLECTION, QdrantVectorStore,
 )
@@ -117,8 +118,11 @@ class _FakeEmbeddingClient:
 
 def _store():
     store = QdrantVectorStore.__new__(QdrantVectorStore)
+    store.routing = CollectionRouting()
     store.client = _FakeClient()
     store.embedding_client = _FakeEmbeddingClient()
+    store._shadow_embedding_client = None
+    store._async_client = None
     store.events = []
     return store
 
@@ -136,7 +140,9 @@ def test_vector_store_converts_internal_artifacts_at_boundary():
     assert point.payload["doc_id"] == "doc"
     assert point.payload["chunk_id"] == "0"
     assert point.payload["content"] == "Original content"
-    assert point.payload["embed_text"] == "Enriched content"
+    # Compact schema: the embed text lives in PostgreSQL, the content only once.
+    assert "embed_text" not in point.payload and "text" not in point.payload
+    assert point.payload["embed_text_external"] is True
 
     artifacts = SummaryBuilder({}, "doc").build(DocumentSummary(
         summary="Summary text.", questions=["What happened?"]
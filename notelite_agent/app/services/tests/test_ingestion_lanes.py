@@ -0,0 +1,133 @@
+import base64
+import json
+from unittest.mock import MagicMock, patch
+
+from celery import states
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.services.ingestion.workers import ingestion_tasks, lanes
+
+
+def _message(user_id: str) -> bytes:
+    """A queued task as kombu's Redis transport stores it."""
+    body = json.dumps([[{"action": "upsert", "user_id": user_id}], {}, {}]).encode()
+    return json.dumps({
+        "body": base64.b64encode(body).decode(),
+        "headers": {},
+        "properties": {"body_encoding": "base64"},
+    }).encode()
+
+
+def _redis(active: int, queued: list[bytes]):
+    client = MagicMock()
+    client.pipeline.return_value.__enter__.return_value.execute.return_value = [active, True]
+    client.lrange.return_value = queued
+    return client
+
+
+KEY = "ingestion:active:ingestion:u1"
+
+
+def test_user_under_the_cap_runs():
+    client = _redis(active=1, queued=[_message("u2")])
+    with patch.object(lanes, "redis_client", return_value=client):
+        assert lanes.acquire_user_slot("ingestion", "u1") == lanes.UserSlot(run=True, key=KEY)
+    client.eval.assert_not_called()
+
+
+def test_user_over_the_cap_yields_while_another_user_waits():
+    client = _redis(active=2, queued=[_message("u1"), _message("u2")])
+    with patch.object(lanes, "redis_client", return_value=client):
+        assert lanes.acquire_user_slot("ingestion", "u1") == lanes.UserSlot(run=False)
+    client.eval.assert_called_once_with(lanes._RELEASE_SCRIPT, 1, KEY, lanes._ACTIVE_TTL_SECONDS)
+
+
+def test_user_over_the_cap_runs_when_the_lane_is_otherwise_empty():
+    with patch.object(lanes, "redis_client", return_value=_redis(active=2, queued=[])):
+        assert lanes.acquire_user_slot("ingestion", "u1").run
+
+
+def test_own_queued_tasks_do_not_count_as_others_waiting():
+    with patch.object(lanes, "redis_client", return_value=_redis(active=2, queued=[_message("u1")] * 2)):
+        assert lanes.acquire_user_slot("ingestion", "u1").run
+
+
+def test_unreadable_queued_message_counts_as_another_user():
+    with patch.object(lanes, "redis_client", return_value=_redis(active=2, queued=[b"not json"])):
+        assert not lanes.acquire_user_slot("ingestion", "u1").run
+
+
+def test_redis_outage_fails_open_without_holding_a_slot():
+    client = MagicMock()
+    client.pipeline.side_effect = RedisConnectionError("down")
+    with patch.object(lanes, "redis_client", return_value=client):
+        slot = lanes.acquire_user_slot("ingestion", "u1")
+        lanes.release_user_slot(slot)
+
+    assert slot == lanes.UserSlot(run=True)
+    client.eval.assert_not_called()
+
+
+def test_redis_failure_after_the_increment_still_releases_the_slot():
+    client = _redis(active=2, queued=[])
+    client.lrange.side_effect = RedisConnectionError("down")
+    with patch.object(lanes, "redis_client", return_value=client):
+        slot = lanes.acquire_user_slot("ingestion", "u1")
+        lanes.release_user_slot(slot)
+
+    assert slot == lanes.UserSlot(run=True, key=KEY)
+    client.eval.assert_called_once_with(lanes._RELEASE_SCRIPT, 1, KEY, lanes._ACTIVE_TTL_SECONDS)
+
+
+def test_task_that_failed_open_does_not_release_a_slot():
+    client = MagicMock()
+    client.pipeline.side_effect = RedisConnectionError("down")
+    with patch.object(lanes, "redis_client", return_value=client), \
+         patch.object(ingestion_tasks, "record_lane_wait"), \
+         patch.object(ingestion_tasks, "init_llama_index_settings"), \
+         patch.object(ingestion_tasks, "IngestionOrchestrator") as orchestrator:
+        orchestrator._payload.return_value = {"user_id": "u1"}
+        ingestion_tasks.ingest_in_background.apply(kwargs={"action": "upsert", "user_id": "u1"})
+
+    orchestrator.return_value.run.assert_called_once()
+    client.eval.assert_not_called()
+    client.decr.assert_not_called()
+
+
+def test_deferred_task_is_republished_under_its_id_after_a_delay():
+    with patch.object(ingestion_tasks, "acquire_user_slot", return_value=lanes.UserSlot(run=False)), \
+         patch.object(ingestion_tasks, "IngestionOrchestrator") as orchestrator, \
+         patch.object(ingestion_tasks.ingest_in_background, "apply_async") as apply_async:
+        orchestrator._payload.return_value = {"user_id": "u1"}
+        result = ingestion_tasks.ingest_in_background.apply(
+            kwargs={"action": "upsert", "user_id": "u1", "trace_id": "t", "enqueued_at": 10.0},
+            task_id="job-1",
+        )
+
+    assert result.state == states.IGNORED
+    orchestrator.return_value.run.assert_not_called()
+    requeued = apply_async.call_args.kwargs
+    assert requeued["queue"] == "ingestion"
+    assert requeued["task_id"] == "job-1"
+    assert requeued["countdown"] == ingestion_tasks.INGESTION_USER_DEFER_SECONDS
+    assert requeued["kwargs"] == {"action": "upsert", "user_id": "u1", "trace_id": "t", "enqueued_at": 10.0}
+
+
+def test_collector_reports_depth_and_wait_per_lane():
+    client = MagicMock()
+    client.pipeline.return_value.__enter__.return_value.execute.return_value = [
+        3, 0, 120,
+        {b"ingestion:sum": b"4.5", b"ingestion:count": b"3"},
+    ]
+    with patch.object(lanes, "redis_client", return_value=client):
+        depth, wait = list(lanes.IngestionLaneCollector().collect())
+
+    assert {sample.labels["lane"]: sample.value for sample in depth.samples} == {
+        lanes.INGESTION_QUEUE: 3,
+        lanes.INGESTION_DELETE_QUEUE: 0,
+        lanes.INGESTION_BACKFILL_QUEUE: 120,
+    }
+    ingestion_wait = {
+        sample.name: sample.value for sample in wait.samples if sample.labels["lane"] == lanes.INGESTION_QUEUE
+    }
+    assert ingestion_wait == {"ingestion_lane_wait_seconds_count": 3.0, "ingestion_lane_wait_seconds_sum": 4.5}
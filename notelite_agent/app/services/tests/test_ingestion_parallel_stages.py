@@ -0,0 +1,95 @@
+import time
+from unittest.mock import MagicMock, patch
+
+from app.services.ingestion.orchestrator import IngestionOrchestrator
+
+
+def make_orchestrator():
+    orchestrator = IngestionOrchestrator.__new__(IngestionOrchestrator)
+    orchestrator.chunk_processor = MagicMock(events=[])
+    orchestrator.chunk_processor.process.return_value = ["chunk"]
+    orchestrator.keyword_processor = MagicMock(
+        events=[],
+        api_calls=0,
+        api_call_counts={
+            "keyword_extraction": 0,
+            "keyword_extraction_retries": 0,
+            "keyword_dedup": 0,
+            "entity_dedup": 0,
+        },
+    )
+    orchestrator.keyword_processor.process.return_value = (["chunk"], [], [])
+    summary = MagicMock(events=[], summary="s", questions=[], summary_api_calls=0, question_api_calls=0)
+    orchestrator.summarization_pipeline = MagicMock(summary_ms=1.0, questions_ms=1.0)
+    orchestrator.summarization_pipeline.run.return_value = summary
+    orchestrator._vector_store = MagicMock(events=[])
+    orchestrator.postgres_store = MagicMock()
+    orchestrator.postgres_store.user_timezone.return_value = "UTC"
+    return orchestrator
+
+
+def run_with_staleness(orchestrator, stale_sequence):
+    orchestrator._is_stale_upsert = MagicMock(side_effect=stale_sequence)
+    with patch("app.services.ingestion.orchestrator.ChunkBuilder") as chunk_builder, \
+         patch("app.services.ingestion.orchestrator.SummaryBuilder") as summary_builder, \
+         patch("app.services.ingestion.orchestrator.DateExtractor") as date_extractor:
+        chunk_builder.return_value = MagicMock(events=[])
+        chunk_builder.return_value.build.return_value = []
+        summary_builder.return_value = MagicMock(events=[])
+        date_extractor.return_value = MagicMock(events=[])
+        date_extractor.return_value.extract.return_value = []
+        return orchestrator.run({"user_id": "u", "folder_id": "f", "note_id": "n", "text": "hello", "version": 1})
+
+
+def _slow(value, seconds=0.15):
+    def call(*args, **kwargs):
+        time.sleep(seconds)
+        return value
+    return call
+
+
+def test_parallel_stages_overlap_and_report_it(monkeypatch):
+    monkeypatch.setattr("app.services.ingestion.orchestrator.INGESTION_PARALLEL_STAGES", True)
+    orchestrator = make_orchestrator()
+    summary = orchestrator.summarization_pipeline.run.return_value
+    orchestrator.summarization_pipeline.run.side_effect = _slow(summary)
+    orchestrator._vector_store.replace_index_chunks.side_effect = _slow(None)
+    orchestrator.postgres_store.user_timezone.side_effect = _slow("UTC")
+
+    started = time.perf_counter()
+    result = run_with_staleness(orchestrator, [False, False, False])
+    elapsed = time.perf_counter() - started
+
+    assert result["status"] == "processed"
+    assert elapsed < 0.4
+    stages_ms = result["stages_ms"]
+    assert stages_ms["chunk_indexing"] >= 150
+    assert stages_ms["date_extraction"] >= 150
+    assert stages_ms["overlap"] >= 200
+    orchestrator.postgres_store.replace_document.assert_called_once()
+
+
+def test_parallel_stale_chunk_write_skips_every_write_and_the_llm_stages(monkeypatch):
+    monkeypatch.setattr("app.services.ingestion.orchestrator.INGESTION_PARALLEL_STAGES", True)
+    orchestrator = make_orchestrator()
+
+    result = run_with_staleness(orchestrator, [False, True])
+
+    assert result["status"] == "skipped"
+    assert result["stage"] == "pre_chunk_write"
+    orchestrator.summarization_pipeline.run.assert_not_called()
+    orchestrator.postgres_store.user_timezone.assert_not_called()
+    orchestrator._vector_store.replace_index_chunks.assert_not_called()
+    orchestrator._vector_store.upsert_summary_artifacts.assert_not_called()
+    orchestrator.postgres_store.replace_document.assert_not_called()
+
+
+def test_sequential_mode_reports_no_overlap(monkeypatch):
+    monkeypatch.setattr("app.services.ingestion.orchestrator.INGESTION_PARALLEL_STAGES", False)
+    orchestrator = make_orchestrator()
+    orchestrator._vector_store.replace_index_chunks.side_effect = _slow(None, 0.05)
+
+    result = run_with_staleness(orchestrator, [False, False, False])
+
+    assert result["stages_ms"]["overlap"] == 0.0
+    assert result["stages_ms"]["document_ingestion"] >= result["stages_ms"]["chunk_indexing"] >= 50
@@ -44,7 +44,7 @@ def payload():
     return {"user_id": "u", "folder_id": "f", "note_id": "n", "text": "hello", "version": 1}
 
 
-def run_with_staleness(orchestrator, stale_sequence):
+def run_with_staleness(orchestrator, stale_sequence, **payload_fields):
     orchestrator._is_stale_upsert = MagicMock(side_effect=stale_sequence)
     with patch("app.services.ingestion.orchestrator.ChunkBuilder") as chunk_builder, \
          patch("app.services.ingestion.orchestrator.SummaryBuilder") as summary_builder, \
@@ -54,7 +54,7 @@ def run_with_staleness(orchestrator, stale_sequence):
         summary_builder.return_value = MagicMock(events=[])
         date_extractor.return_value = MagicMock(events=[])
         date_extractor.return_value.extract.return_value = []
-        return orchestrator.run(payload())
+        return orchestrator.run({**payload(), **payload_fields})
 
 
 def test_stale_before_chunk_write_skips_all_writes():
@@ -92,3 +92,32 @@ def test_current_version_writes_normally():
     orchestrator._vector_store.replace_index_chunks.assert_called_once()
     orchestrator._vector_store.upsert_summary_artifacts.assert_called_once()
     orchestrator.postgres_store.replace_document.assert_called_once()
+
+
+def test_superseded_dispatch_exits_before_chunking():
+    orchestrator = make_orchestrator()
+    redis = MagicMock()
+    redis.get.return_value = b"3"
+
+    with patch("app.services.ingestion.validators.dispatch_sequence.redis_client", return_value=redis):
+        result = run_with_staleness(orchestrator, [False, False, False], dispatch_seq=2)
+
+    assert result["status"] == "skipped"
+    assert result["reason"] == "superseded_dispatch"
+    redis.get.assert_called_once_with("ingestion:dispatch:n")
+    orchestrator.chunk_processor.process.assert_not_called()
+    orchestrator._is_stale_upsert.assert_not_called()
+
+
+def test_latest_dispatch_or_unreadable_marker_is_processed():
+    from redis.exceptions import ConnectionError as RedisConnectionError
+
+    for marker in (b"2", RedisConnectionError("down")):
+        orchestrator = make_orchestrator()
+        redis = MagicMock()
+        redis.get.side_effect = [marker]
+
+        with patch("app.services.ingestion.validators.dispatch_sequence.redis_client", return_value=redis):
+            result = run_with_staleness(orchestrator, [False, False, False], dispatch_seq=2)
+
+        assert result["status"] == "processed"
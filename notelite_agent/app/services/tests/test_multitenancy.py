@@ -0,0 +1,94 @@
+from unittest.mock import MagicMock
+
+from qdrant_client import models
+
+from app.services.ingestion.storage.collection_routing import CollectionRouting, EmbeddingTarget
+from app.services.ingestion.storage.collection_settings import TENANT_FIELD, VectorStorageSettings
+from app.services.ingestion.storage.vector_store import (
+    CHUNK_COLLECTION, COLLECTION_SCHEMA_VERSION, COLLECTIONS, QdrantVectorStore,
+)
+
+
+def _store(settings):
+    store = QdrantVectorStore.__new__(QdrantVectorStore)
+    store.routing = CollectionRouting()
+    store.client = MagicMock()
+    store.embedding_client = MagicMock(use_remote=True, events=[], dimension=MagicMock(return_value=4))
+    store._storage_settings = settings
+    store._shadow_embedding_client = None
+    store._async_client = None
+    store.events = []
+    return store
+
+
+def _index_schemas(store):
+    return {
+        call.kwargs["field_name"]: call.kwargs["field_schema"]
+        for call in store.client.create_payload_index.call_args_list
+    }
+
+
+def test_default_layout_keeps_a_global_graph_and_plain_user_index():
+    store = _store(VectorStorageSettings())
+
+    store._create_collection(CHUNK_COLLECTION)
+    store._ensure_payload_indexes(CHUNK_COLLECTION)
+
+    hnsw = store.client.create_collection.call_args.kwargs["hnsw_config"]
+    assert (hnsw.m, hnsw.payload_m) == (16, None)
+    assert _index_schemas(store)[TENANT_FIELD] == models.PayloadSchemaType.KEYWORD
+
+
+def test_multitenancy_builds_per_tenant_graphs_on_a_tenant_index():
+    store = _store(VectorStorageSettings(multitenancy=True, tenant_payload_m=24))
+
+    store._create_collection(CHUNK_COLLECTION)
+    store._ensure_payload_indexes(CHUNK_COLLECTION)
+
+    hnsw = store.client.create_collection.call_args.kwargs["hnsw_config"]
+    assert (hnsw.m, hnsw.payload_m) == (0, 24)
+    schemas = _index_schemas(store)
+    assert schemas[TENANT_FIELD].is_tenant is True
+    assert schemas["metadata.doc_id"] == models.PayloadSchemaType.KEYWORD
+
+
+def test_tenant_layout_is_applied_in_place_to_active_and_shadow_sets():
+    store = _store(VectorStorageSettings(multitenancy=True))
+    store.routing = CollectionRouting(
+        active=EmbeddingTarget(version=None, model="old", base_url="http://old"),
+        shadow=EmbeddingTarget(version=2, model="new", base_url="http://new"),
+    )
+    store.client.collection_exists.return_value = True
+
+    updated = store.apply_tenant_layout()
+
+    assert updated == list(COLLECTIONS) + [f"{name}_v2" for name in COLLECTIONS]
+    assert all(call.kwargs["hnsw_config"].m == 0 for call in store.client.update_collection.call_args_list)
+    assert all(
+        call.kwargs["field_name"] == TENANT_FIELD and call.kwargs["field_schema"].is_tenant
+        for call in store.client.create_payload_index.call_args_list
+    )
+    store.client.create_collection.assert_not_called()
+
+
+def test_startup_applies_the_full_tenant_layout_to_a_collection_marked_without_it():
+    store = _store(VectorStorageSettings(multitenancy=True))
+    store.client.collection_exists.return_value = True
+    store.client.get_collection.return_value.config.metadata = {
+        "schema_version": COLLECTION_SCHEMA_VERSION,
+        "tenant_index": False,
+    }
+
+    store.ensure_collections()
+
+    assert _index_schemas(store)[TENANT_FIELD].is_tenant is True
+    updates = store.client.update_collection.call_args_list
+    assert len(updates) == len(COLLECTIONS)
+    assert all(call.kwargs["hnsw_config"].m == 0 for call in updates)
+    assert all(call.kwargs["metadata"]["tenant_index"] is True for call in updates)
+
+
+def test_user_scoped_search_filters_on_the_tenant_key():
+    query_filter = QdrantVectorStore.build_filter({"user_id": "u"})
+
+    assert query_filter.must[0].key == TENANT_FIELD
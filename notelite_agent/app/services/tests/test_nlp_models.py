@@ -0,0 +1,86 @@
+"""Shared spaCy pipelines: one load per process, one annotation pass per text."""
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import spacy
+
+from app.services.ingestion.processors import nlp_models
+from app.services.ingestion.processors.date_extractor import DateExtractor
+from app.services.ingestion.processors.ingest import IndexChunk
+from app.services.ingestion.processors.keywords.entity_extractor import extract_entity_mentions_batch
+
+
+class _Nlp:
+    max_length = 1000
+
+    def __init__(self):
+        self.piped = []
+
+    def pipe(self, texts, **options):
+        texts = list(texts)
+        self.piped.append(texts)
+        for text in texts:
+            yield SimpleNamespace(ents=[
+                SimpleNamespace(text="Qdrant", label_="PRODUCT"),
+                SimpleNamespace(text="March 3, 2024", label_="DATE"),
+            ] if "Qdrant" in text else [])
+
+
+def test_pipelines_load_once_without_unused_components(monkeypatch):
+    loads = []
+    monkeypatch.setattr(nlp_models, "_pipelines", {})
+    monkeypatch.setattr(spacy, "load", lambda name, exclude: loads.append((name, exclude)) or _Nlp())
+
+    first, second = nlp_models.ner_pipeline(), nlp_models.ner_pipeline()
+
+    assert first is second
+    assert loads == [(nlp_models.NER_MODEL, list(nlp_models.NER_EXCLUDED_COMPONENTS))]
+
+
+def test_annotate_pipes_each_distinct_text_once():
+    nlp = _Nlp()
+
+    first = nlp_models.annotate(["Qdrant restored", "nothing here", "Qdrant restored"], nlp)
+    again = nlp_models.annotate(["Qdrant restored", "new text"], nlp)
+
+    assert nlp.piped == [["Qdrant restored", "nothing here"], ["new text"]]
+    assert first[0] == first[2] == again[0]
+    assert first[1] == ()
+
+
+def test_date_extraction_reuses_the_entity_pass(monkeypatch):
+    nlp = _Nlp()
+    monkeypatch.setattr(nlp_models, "_pipelines", {"ner": nlp})
+    content = "Qdrant snapshots were restored on March 3, 2024."
+
+    mentions = extract_entity_mentions_batch([content])
+    dates = DateExtractor().extract(
+        [IndexChunk("0", "doc", 0, 1, "content", content, content)],
+        datetime(2024, 3, 10, tzinfo=timezone.utc),
+        "UTC",
+    )
+
+    assert [mention.text for mention in mentions[0]] == ["Qdrant"]
+    assert [date["date_text"] for date in dates] == ["March 3, 2024"]
+    assert len(nlp.piped) == 1
+
+
+def test_date_extraction_is_skipped_without_a_model(monkeypatch):
+    monkeypatch.setattr(nlp_models, "_pipelines", {"ner": False})
+    extractor = DateExtractor()
+
+    assert extractor.extract([], datetime.now(timezone.utc), "UTC") == []
+    assert extractor.events == ["date extraction skipped: spaCy model unavailable"]
+
+
+def test_annotate_falls_back_in_process_when_workers_cannot_start():
+    class DaemonNlp(_Nlp):
+        def pipe(self, texts, **options):
+            if options.get("n_process", 1) > 1:
+                raise AssertionError("daemonic processes are not allowed to have children")
+            return super().pipe(texts, **options)
+
+    nlp = DaemonNlp()
+
+    assert nlp_models.annotate(["Qdrant"], nlp, n_process=4)[0][0].label == "PRODUCT"
+    assert nlp.piped == [["Qdrant"]]
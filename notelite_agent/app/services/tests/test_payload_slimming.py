@@ -0,0 +1,178 @@
+"""Compact chunk payloads, slim search selectors, and lazy text hydration."""
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from app.core.embeddings import EmbeddingBatch
+from app.services.chat.pipeline import retrieval_pipeline
+from app.services.chat.pipeline.retrieval_pipeline import PreparedQuery, QueryEmbeddings, run_retrieval
+from app.services.ingestion.processors.ingest import IndexChunk
+from app.services.ingestion.storage.collection_routing import CollectionRouting, EmbeddingTarget
+from app.services.ingestion.storage.postgres_store import PostgresArtifactStore
+from app.services.ingestion.storage.vector_store import (
+    CHUNK_COLLECTION, CHUNK_SEARCH_PAYLOAD, DENSE_VECTOR, TEXT_PENDING, QdrantVectorStore,
+)
+
+
+class _FakePostgres:
+    def user_timezone(self, user_id):
+        return "UTC"
+
+    def index_generation(self, user_id):
+        return None
+
+
+class _FakeEmbeddingClient:
+    def __init__(self):
+        self.events = []
+        self.texts = []
+
+    def embed_documents(self, texts):
+        self.texts.extend(texts)
+        return EmbeddingBatch(
+            dense=[[0.1, 0.2] for _ in texts],
+            sparse=[{"indices": [1], "values": [1.0]} for _ in texts],
+        )
+
+
+def _chunk(chunk_id, content, embed_text=None):
+    return IndexChunk(
+        chunk_id, "doc", int(chunk_id), 2, "content", content, embed_text or content,
+        keywords=["kw"], metadata={"note_id": "n", "folder_id": "f", "user_id": "u", "description": "note blurb"},
+    )
+
+
+def test_chunk_payload_stores_each_field_once():
+    plain = QdrantVectorStore._chunk_payload(_chunk("0", "Body"), "model")
+    headed = QdrantVectorStore._chunk_payload(_chunk("1", "Body", "Heading\n\nBody"), "model")
+
+    for dropped in ("text", "embed_text", "note_id", "folder_id", "skip_indexing", "skip_reason"):
+        assert dropped not in plain
+    assert "description" not in plain["metadata"]
+    assert plain["metadata"]["note_id"] == "n"
+    assert "embed_text_external" not in plain
+    assert headed["embed_text_external"] is True
+    assert headed["embed_hash"] != plain["embed_hash"]
+
+
+def test_postgres_side_stores_only_embed_texts_that_differ_from_content():
+    chunks = [
+        _chunk("0", "Body"),
+        _chunk("1", "Body", "Heading\n\nBody"),
+        IndexChunk("2", "doc", 2, 3, "code", "x", "y", skip_indexing=True, skip_reason="structural:code"),
+    ]
+
+    assert [chunk.chunk_id for chunk in PostgresArtifactStore._side_stored_embed_texts(chunks)] == ["1"]
+
+
+def _hit_point(point_id, chunk_id):
+    return SimpleNamespace(id=point_id, score=1.0, payload={"doc_id": "doc", "chunk_id": chunk_id, "metadata": {}})
+
+
+def test_search_hits_are_hydrated_with_one_retrieve():
+    store = QdrantVectorStore.__new__(QdrantVectorStore)
+    store.client = MagicMock()
+    store._storage_settings = None
+    store.collection = lambda logical_name: logical_name
+    store._shadow_embedding_client = None
+    store._async_client = None
+    first, second = store.point_id("p1"), store.point_id("p2")
+    store.client.query_batch_points.return_value = [
+        SimpleNamespace(points=[_hit_point(first, "0"), _hit_point(second, "1")]),
+        SimpleNamespace(points=[_hit_point(first, "0")]),
+    ]
+    store.client.retrieve.return_value = [
+        SimpleNamespace(id=first, payload={"content": "first text", "keywords": ["a"], "entities": []}),
+        SimpleNamespace(id=second, payload={"content": "second text", "keywords": [], "entities": ["B"]}),
+    ]
+
+    results = store.search_chunks({"dense": (DENSE_VECTOR, [0.1]), "hyde": (DENSE_VECTOR, [0.2])}, limit=5)
+
+    request = store.client.query_batch_points.call_args.kwargs["requests"][0]
+    assert request.with_payload == CHUNK_SEARCH_PAYLOAD
+    hits = results["dense"] + results["hyde"]
+    assert all(document.metadata[TEXT_PENDING] for document, _score in hits)
+
+    assert store.hydrate_chunks(hits) == 3
+    store.client.retrieve.assert_called_once()
+    assert sorted(store.client.retrieve.call_args.kwargs["ids"]) == sorted([first, second])
+    assert [document.text for document, _score in hits] == ["first text", "second text", "first text"]
+    assert hits[0][0].metadata["keywords"] == ["a"]
+    assert not any(TEXT_PENDING in document.metadata for document, _score in hits)
+    assert store.hydrate_chunks(hits) == 0
+
+
+def test_re_embedding_resolves_side_stored_embed_texts(monkeypatch):
+    store = QdrantVectorStore.__new__(QdrantVectorStore)
+    store.routing = CollectionRouting()
+    store._storage_settings = None
+    store.client = MagicMock()
+    store._shadow_embedding_client = None
+    store._async_client = None
+    store.events = []
+    lookups = []
+    monkeypatch.setattr(
+        QdrantVectorStore, "side_stored_embed_texts",
+        staticmethod(lambda identities: lookups.append(list(identities)) or {("doc", "1"): "Heading\n\nBody"}),
+    )
+    records = [
+        ("p0", QdrantVectorStore._chunk_payload(_chunk("0", "Body"), "model")),
+        ("p1", QdrantVectorStore._chunk_payload(_chunk("1", "Body", "Heading\n\nBody"), "model")),
+        ("p2", {"embed_text": "legacy embed text", "content": "legacy"}),
+    ]
+    client = _FakeEmbeddingClient()
+    target = EmbeddingTarget(version=2, model="new-model", base_url="http://new")
+
+    points = store.retarget_points(records, target, client)
+
+    assert client.texts == ["Body", "Heading\n\nBody", "legacy embed text"]
+    assert lookups == [[("doc", "1")]]
+    assert points[1].payload["embed_hash"] != points[0].payload["embed_hash"]
+
+    client.texts = []
+    store.retarget_points(records[1:2], target, client, embed_texts={store.point_id("p1"): "in memory"})
+    assert client.texts == ["in memory"]
+    assert len(lookups) == 1
+
+
+def _pending_hit(index):
+    document = SimpleNamespace(id_=f"p{index}", metadata={TEXT_PENDING: True})
+    return document, 1.0 / (index + 1)
+
+
+def _pipeline(monkeypatch, fused, reranker_enabled):
+    for name, value in {
+        "preprocess_query": lambda *args: PreparedQuery("query", "query"),
+        "generate_hyde": lambda prepared: (None, "disabled"),
+        "embed_query": lambda *args: QueryEmbeddings([0.1], {"indices": [], "values": []}),
+        "multi_collection_search": lambda *args: ({"chunk_dense_original": fused}, {
+            "source_errors": {}, "summary_doc_ids": [], "date_identity_count": 0,
+        }),
+        "weighted_rrf": lambda sources: (fused, {"source_counts": {}}),
+        "rerank": lambda query, chunks, top_k: chunks[:top_k],
+        "rerank_enabled": lambda: reranker_enabled,
+        "assemble_context": lambda *args: ([], [], {"expanded_context_count": 0}),
+        "default_retrieval_cache": lambda: None,
+    }.items():
+        monkeypatch.setattr(retrieval_pipeline, name, value)
+
+
+def test_pipeline_hydrates_only_the_top_k_without_a_reranker(monkeypatch):
+    fused = [_pending_hit(index) for index in range(6)]
+    store = MagicMock()
+    store.hydrate_chunks.return_value = 2
+    _pipeline(monkeypatch, fused, reranker_enabled=False)
+
+    result = run_retrieval(store, "query", "user", 2, "user", postgres=_FakePostgres())
+
+    assert store.hydrate_chunks.call_args.args[0] == fused[:2]
+    assert "retrieval hydrate completed: chunks=2" in result.events
+
+
+def test_pipeline_hydrates_every_candidate_for_the_reranker(monkeypatch):
+    fused = [_pending_hit(index) for index in range(6)]
+    store = MagicMock()
+    _pipeline(monkeypatch, fused, reranker_enabled=True)
+
+    run_retrieval(store, "query", "user", 2, "user", postgres=_FakePostgres())
+
+    assert store.hydrate_chunks.call_args.args[0] == fused
@@ -48,23 +48,56 @@ def test_reconcile_enqueues_repairs_for_both_drift_directions():
     with patch.object(reconciliation, "DatabaseManager"), \
          patch.object(reconciliation, "find_stale_notes", return_value=[stale_note_row()]), \
          patch.object(reconciliation, "find_orphan_documents", return_value=[orphan_row()]), \
+         patch.object(reconciliation, "ingest_bulk") as bulk, \
          patch.object(reconciliation, "ingest_in_background") as ingest:
         result = reconciliation.reconcile_index(limit=10)
 
     assert result == {"reingest_enqueued": 1, "delete_enqueued": 1}
-    actions = [call.args[0]["action"] for call in ingest.delay.call_args_list]
-    assert actions == ["upsert", "delete"]
+    [bulk_call] = bulk.apply_async.call_args_list
+    [delete_call] = ingest.apply_async.call_args_list
+    assert [payload["action"] for payload in bulk_call.kwargs["args"][0]] == ["upsert"]
+    assert delete_call.kwargs["args"][0]["action"] == "delete"
+    calls = [bulk_call, delete_call]
+    assert {call.kwargs["queue"] for call in calls} == {reconciliation.INGESTION_BACKFILL_QUEUE}
     # One trace id ties the whole sweep together.
-    trace_ids = {call.args[0]["trace_id"] for call in ingest.delay.call_args_list}
+    trace_ids = {bulk_call.kwargs["kwargs"]["trace_id"], delete_call.kwargs["args"][0]["trace_id"]}
     assert len(trace_ids) == 1
 
 
+def test_reingests_are_batched_into_bulk_tasks(monkeypatch):
+    monkeypatch.setattr(reconciliation, "INGESTION_BULK_MAX_NOTES", 2)
+    rows = [{**stale_note_row(), "note_id": f"n{index}"} for index in range(5)]
+    with patch.object(reconciliation, "DatabaseManager"), \
+         patch.object(reconciliation, "find_stale_notes", return_value=rows), \
+         patch.object(reconciliation, "find_orphan_documents", return_value=[]), \
+         patch.object(reconciliation, "ingest_bulk") as bulk:
+        reconciliation.reconcile_index(limit=10)
+
+    batches = [call.kwargs["args"][0] for call in bulk.apply_async.call_args_list]
+    assert [[payload["note_id"] for payload in batch] for batch in batches] == [
+        ["n0", "n1"], ["n2", "n3"], ["n4"],
+    ]
+
+
 def test_reconcile_with_no_drift_enqueues_nothing():
     with patch.object(reconciliation, "DatabaseManager"), \
          patch.object(reconciliation, "find_stale_notes", return_value=[]), \
          patch.object(reconciliation, "find_orphan_documents", return_value=[]), \
+         patch.object(reconciliation, "ingest_bulk") as bulk, \
          patch.object(reconciliation, "ingest_in_background") as ingest:
         result = reconciliation.reconcile_index()
 
     assert result == {"reingest_enqueued": 0, "delete_enqueued": 0}
-    ingest.delay.assert_not_called()
+    bulk.apply_async.assert_not_called()
+    ingest.apply_async.assert_not_called()
+
+
+def test_repairs_are_interleaved_across_users():
+    rows = [
+        {**stale_note_row(), "user_id": user_id, "note_id": note_id}
+        for user_id, note_id in [("heavy", "1"), ("heavy", "2"), ("heavy", "3"), ("light", "4")]
+    ]
+
+    ordered = reconciliation.interleave_by_user(rows)
+
+    assert [row["note_id"] for row in ordered] == ["1", "4", "2", "3"]
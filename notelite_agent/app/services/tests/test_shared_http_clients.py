@@ -1,4 +1,6 @@
 """Every remote HTTP surface must reuse one connection pool per module."""
+import asyncio
+
 import httpx
 
 from app.core.embeddings import remote as embeddings_remote
@@ -13,6 +15,18 @@ def test_each_module_reuses_one_client():
         assert isinstance(first, httpx.Client)
 
 
+def test_async_pools_are_closed_at_shutdown():
+    async def open_and_close(module):
+        first = module._async_http_client()
+        assert module._async_http_client() is first
+        await module.aclose_async_http_client()
+        assert asyncio.get_running_loop() not in module._async_http
+        return first
+
+    for module in (shared_llm, embeddings_remote, reranker):
+        assert asyncio.run(open_and_close(module)).is_closed
+
+
 def test_embedding_instances_share_the_pool_across_timeouts():
     """The semantic chunker builds a service with a shorter timeout; timeouts
     are per-request, so it must not fork its own pool."""
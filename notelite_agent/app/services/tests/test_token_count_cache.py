@@ -0,0 +1,45 @@
+from app.services.ingestion.processors.chunking.chunk_processor import ChunkProcessor
+from app.services.ingestion.processors.summary.summary_processor import SummaryProcessor
+from app.shared.utils import TokenCountCache, enc, token_count_cache
+
+
+def test_cached_counts_match_the_encoder_and_hit_on_repeat():
+    cache = TokenCountCache(max_entries=10)
+    text = "Qdrant p99 search improved after HNSW tuning."
+
+    assert cache.count(text) == len(enc.encode(text))
+    assert cache.count(text) == len(enc.encode(text))
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_cache_is_bounded_and_evicts_least_recently_used():
+    cache = TokenCountCache(max_entries=2)
+    cache.count("alpha")
+    cache.count("beta")
+    cache.count("alpha")
+    cache.count("gamma")
+
+    assert len(cache) == 2
+    cache.count("beta")
+    assert cache.misses == 4
+
+
+def test_disabled_cache_still_counts():
+    cache = TokenCountCache(max_entries=0)
+
+    assert cache.count("hello world") == 2
+    assert len(cache) == 0
+
+
+def test_chunks_carry_token_counts_reused_downstream():
+    cache = token_count_cache()
+    chunks = ChunkProcessor().process(
+        "# Release\n\nThe v2.1.0 release went out without issues.\n\n"
+        "# Search\n\nQdrant p99 search improved after HNSW tuning."
+    )
+    for chunk in chunks:
+        assert chunk.metadata["token_count"] == len(enc.encode(chunk.content))
+
+    misses = cache.misses
+    SummaryProcessor().group_chunks([chunk.content for chunk in chunks])
+    assert cache.misses - misses <= 2  # only the system prompt and separator are new
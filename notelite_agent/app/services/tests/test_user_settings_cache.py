@@ -0,0 +1,77 @@
+import time
+from unittest.mock import MagicMock
+
+from app.db import user_settings
+from app.db.user_settings import UserSettingsCache
+from app.services.ingestion.storage.postgres_store import PostgresArtifactStore
+
+USER_ID = "6f1c1a52-8f1e-4a5b-9a51-2d8f3c1b7e10"
+
+
+def _session_factory(monkeypatch, timezone="Europe/Berlin"):
+    session = MagicMock()
+    session.__enter__.return_value = session
+    session.execute.return_value.scalar_one_or_none.return_value = timezone
+    factory = MagicMock(return_value=session)
+    monkeypatch.setattr(
+        "app.services.ingestion.storage.postgres_store.DatabaseManager.get_session_factory",
+        lambda: factory,
+    )
+    return session
+
+
+def test_user_timezone_is_cached_until_invalidated(monkeypatch):
+    cache = UserSettingsCache(ttl_seconds=60)
+    monkeypatch.setattr(user_settings, "_cache", cache)
+    session = _session_factory(monkeypatch)
+    store = PostgresArtifactStore()
+
+    assert store.user_timezone(USER_ID) == "Europe/Berlin"
+    assert store.user_timezone(USER_ID) == "Europe/Berlin"
+    assert session.execute.call_count == 1
+    assert str(session.execute.call_args.args[1]["user_id"]) == USER_ID
+
+    cache.invalidate(USER_ID)
+    store.user_timezone(USER_ID)
+    assert session.execute.call_count == 2
+
+
+def test_non_uuid_user_ids_skip_the_query(monkeypatch):
+    monkeypatch.setattr(user_settings, "_cache", UserSettingsCache(ttl_seconds=60))
+    session = _session_factory(monkeypatch)
+
+    assert PostgresArtifactStore().user_timezone("legacy-user") == "UTC"
+    session.execute.assert_not_called()
+
+
+def test_lookup_failures_fall_back_to_utc_without_caching(monkeypatch):
+    monkeypatch.setattr(user_settings, "_cache", UserSettingsCache(ttl_seconds=60))
+    session = _session_factory(monkeypatch)
+    found = session.execute.return_value
+    session.execute.side_effect = [RuntimeError("connection reset"), found]
+    store = PostgresArtifactStore()
+
+    assert store.user_timezone(USER_ID) == "UTC"
+    assert store.user_timezone(USER_ID) == "Europe/Berlin"
+    assert store.user_timezone(USER_ID) == "Europe/Berlin"
+    assert session.execute.call_count == 2
+    session.rollback.assert_called_once()
+
+
+def test_missing_row_caches_utc(monkeypatch):
+    monkeypatch.setattr(user_settings, "_cache", UserSettingsCache(ttl_seconds=60))
+    session = _session_factory(monkeypatch, timezone=None)
+    store = PostgresArtifactStore()
+
+    assert store.user_timezone(USER_ID) == "UTC"
+    assert store.user_timezone(USER_ID) == "UTC"
+    assert session.execute.call_count == 1
+
+
+def test_expired_entries_are_reloaded():
+    cache = UserSettingsCache(ttl_seconds=0.01)
+    cache.put(USER_ID, "timezone", "Asia/Tokyo")
+
+    assert cache.get(USER_ID, "timezone") == "Asia/Tokyo"
+    time.sleep(0.02)
+    assert cache.get(USER_ID, "timezone") is None
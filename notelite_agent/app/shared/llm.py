@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import weakref
 from collections.abc import Sequence
 from typing import Any
 
@@ -28,6 +30,28 @@ def _http_client() -> httpx.Client:
     return _http
 
 
+# Async pools are per event loop: httpx.AsyncClient connections belong to the
+# loop that opened them.
+_async_http: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _async_http_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _async_http.get(loop)
+    if client is None:
+        client = _async_http[loop] = httpx.AsyncClient(timeout=DEFAULT_TIMEOUT)
+    return client
+
+
+async def aclose_async_http_client() -> None:
+    """Close the running loop's async pool; called from the API lifespan shutdown."""
+    client = _async_http.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
 def llm_call_direct(prompt: str) -> str:
     return llm_call_general([{"role": "user", "content": prompt}])
 
@@ -40,24 +64,51 @@ def llm_call_general(
     temperature: float = DEFAULT_TEMPERATURE,
     timeout: float = DEFAULT_TIMEOUT,
 ) -> str:
-    body = {
-        "model": model,
-        "messages": [_message_to_dict(m) for m in messages],
-        "max_tokens": max_tokens,
-        "temperature": temperature,
-        "stream": False,
-    }
-
     response = _http_client().post(
         _chat_completions_url(),
         headers=_headers(),
-        json=body,
+        json=_request_body(messages, model, max_tokens, temperature),
         timeout=timeout,
     )
     response.raise_for_status()
+    return _response_content(response.json(), model, max_tokens)
+
+
+async def allm_call_general(
+    messages: Sequence[ChatMessage | dict[str, Any]],
+    *,
+    model: str = LLM_SUMMARIZER_MODEL,
+    max_tokens: int = DEFAULT_MAX_TOKENS,
+    temperature: float = DEFAULT_TEMPERATURE,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> str:
+    """Event-loop variant of ``llm_call_general``."""
+    response = await _async_http_client().post(
+        _chat_completions_url(),
+        headers=_headers(),
+        json=_request_body(messages, model, max_tokens, temperature),
+        timeout=timeout,
+    )
+    response.raise_for_status()
+    return _response_content(response.json(), model, max_tokens)
+
+
+def _request_body(
+    messages: Sequence[ChatMessage | dict[str, Any]],
+    model: str,
+    max_tokens: int,
+    temperature: float,
+) -> dict[str, Any]:
+    return {
+        "model": model,
+        "messages": [_message_to_dict(m) for m in messages],
+        "max_tokens": max_tokens,
+        "temperature": temperature,
+        "stream": False,
+    }
 
-    data = response.json()
 
+def _response_content(data: dict[str, Any], model: str, max_tokens: int) -> str:
     usage = data.get("usage") or {}
     choices = data.get("choices") or []
     finish_reason = (choices[0] or {}).get("finish_reason") if choices else None
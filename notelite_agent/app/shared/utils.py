@@ -1,10 +1,56 @@
+import hashlib
 import os
+import threading
+from collections import OrderedDict
+
 import tiktoken
 
 enc = tiktoken.get_encoding("cl100k_base")
 
-def count_tokens(text):
-    return len(enc.encode(text))
+
+class TokenCountCache:
+    """Bounded, thread-safe LRU of cl100k token counts keyed by a digest of the text.
+
+    The same chunk text is counted by chunking, chunk building, keyword
+    batching, and summarization; keying by a 16-byte digest keeps every entry
+    small regardless of how large the note is.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[bytes, int] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def count(self, text: str) -> int:
+        if self.max_entries <= 0:
+            return len(enc.encode(text))
+        key = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached
+        tokens = len(enc.encode(text))
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = tokens
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return tokens
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
 
 def build_llm_messages(system_prompt: str, text:str):
     return [
@@ -16,4 +62,16 @@ def require_env(key: str, default:str=None) -> str:
     value = os.getenv(key, default)
     if value is None:
         raise RuntimeError(f"Missing required environment variable: {key}")
-    return value
\ No newline at end of file
+    return value
+
+
+# Read here rather than in app.core.config, which imports this module.
+_token_counts = TokenCountCache(int(require_env("TOKEN_COUNT_CACHE_SIZE", "50000")))
+
+
+def token_count_cache() -> TokenCountCache:
+    return _token_counts
+
+
+def count_tokens(text):
+    return _token_counts.count(text)